@@ -18,13 +18,10 @@ else:
 from ansible.errors import AnsibleActionFail
 from ansible_collections.cisco.dnac.plugins.plugin_utils.dnac import (
     DNACSDK,
+    DNACObject,
     dnac_argument_spec,
-    dnac_compare_equality,
     get_dict_result,
 )
-from ansible_collections.cisco.dnac.plugins.plugin_utils.exceptions import (
-    InconsistentParameters,
-)
 
 # Get common arguments specification
 argument_spec = dnac_argument_spec()
@@ -69,7 +66,37 @@ mutually_exclusive = []
 required_together = []
 
 
-class ConfigurationTemplate(object):
+class ConfigurationTemplate(DNACObject):
+    obj_params = [
+        ("tags", "tags"),
+        ("author", "author"),
+        ("composite", "composite"),
+        ("containingTemplates", "containingTemplates"),
+        ("createTime", "createTime"),
+        ("customParamsOrder", "customParamsOrder"),
+        ("description", "description"),
+        ("deviceTypes", "deviceTypes"),
+        ("failurePolicy", "failurePolicy"),
+        ("id", "id"),
+        ("language", "language"),
+        ("lastUpdateTime", "lastUpdateTime"),
+        ("latestVersionTime", "latestVersionTime"),
+        ("name", "name"),
+        ("parentTemplateId", "parentTemplateId"),
+        ("projectId", "projectId"),
+        ("projectName", "projectName"),
+        ("rollbackTemplateContent", "rollbackTemplateContent"),
+        ("rollbackTemplateParams", "rollbackTemplateParams"),
+        ("softwareType", "softwareType"),
+        ("softwareVariant", "softwareVariant"),
+        ("softwareVersion", "softwareVersion"),
+        ("templateContent", "templateContent"),
+        ("templateParams", "templateParams"),
+        ("validationErrors", "validationErrors"),
+        ("version", "version"),
+        ("templateId", "template_id"),
+    ]
+
     def __init__(self, params, dnac):
         self.dnac = dnac
         self.new_object = dict(
@@ -195,69 +222,18 @@ class ConfigurationTemplate(object):
             result = None
         return result
 
-    def exists(self):
-        prev_obj = None
-        id_exists = False
-        name_exists = False
-        o_id = self.new_object.get("id")
-        o_id = o_id or self.new_object.get("template_id")
-        name = self.new_object.get("name")
-        if o_id:
-            prev_obj = self.get_object_by_id(o_id)
-            id_exists = prev_obj is not None and isinstance(prev_obj, dict)
-        if not id_exists and name:
-            prev_obj = self.get_object_by_name(name)
-            name_exists = prev_obj is not None and isinstance(prev_obj, dict)
-        if name_exists:
-            _id = prev_obj.get("id")
-            _id = _id or prev_obj.get("templateId")
-            if id_exists and name_exists and o_id != _id:
-                raise InconsistentParameters("The 'id' and 'name' params don't refer to the same object")
-            if _id:
-                self.new_object.update(dict(id=_id))
-                self.new_object.update(dict(template_id=_id))
-            if _id:
-                prev_obj = self.get_object_by_id(_id)
-        it_exists = prev_obj is not None and isinstance(prev_obj, dict)
-        return (it_exists, prev_obj)
+    def get_requested_id(self):
+        return self.new_object.get("id") or self.new_object.get("template_id")
+
+    def get_object_id(self, obj):
+        return obj.get("id") or obj.get("templateId")
 
-    def requires_update(self, current_obj):
-        requested_obj = self.new_object
+    def set_object_id(self, id):
+        self.new_object.update(dict(id=id))
+        self.new_object.update(dict(template_id=id))
 
-        obj_params = [
-            ("tags", "tags"),
-            ("author", "author"),
-            ("composite", "composite"),
-            ("containingTemplates", "containingTemplates"),
-            ("createTime", "createTime"),
-            ("customParamsOrder", "customParamsOrder"),
-            ("description", "description"),
-            ("deviceTypes", "deviceTypes"),
-            ("failurePolicy", "failurePolicy"),
-            ("id", "id"),
-            ("language", "language"),
-            ("lastUpdateTime", "lastUpdateTime"),
-            ("latestVersionTime", "latestVersionTime"),
-            ("name", "name"),
-            ("parentTemplateId", "parentTemplateId"),
-            ("projectId", "projectId"),
-            ("projectName", "projectName"),
-            ("rollbackTemplateContent", "rollbackTemplateContent"),
-            ("rollbackTemplateParams", "rollbackTemplateParams"),
-            ("softwareType", "softwareType"),
-            ("softwareVariant", "softwareVariant"),
-            ("softwareVersion", "softwareVersion"),
-            ("templateContent", "templateContent"),
-            ("templateParams", "templateParams"),
-            ("validationErrors", "validationErrors"),
-            ("version", "version"),
-            ("templateId", "template_id"),
-        ]
-        # Method 1. Params present in request (Ansible) obj are the same as the current (ISE) params
-        # If any does not have eq params, it requires update
-        return any(not dnac_compare_equality(current_obj.get(dnac_param),
-                                             requested_obj.get(ansible_param))
-                   for (dnac_param, ansible_param) in obj_params)
+    def create(self):
+        self.dnac.fail_json("Object does not exists, plugin only has update")
 
     def update(self):
         id = self.new_object.get("id")
@@ -330,25 +306,7 @@ class ActionModule(ActionBase):
 
         state = self._task.args.get("state")
 
-        response = None
-        if state == "present":
-            (obj_exists, prev_obj) = obj.exists()
-            if obj_exists:
-                if obj.requires_update(prev_obj):
-                    response = obj.update()
-                    dnac.object_updated()
-                else:
-                    response = prev_obj
-                    dnac.object_already_present()
-            else:
-                dnac.fail_json("Object does not exists, plugin only has update")
-        elif state == "absent":
-            (obj_exists, prev_obj) = obj.exists()
-            if obj_exists:
-                response = obj.delete()
-                dnac.object_deleted()
-            else:
-                dnac.object_already_absent()
+        response = obj.apply_state(state)
 
         self._result.update(dict(dnac_response=response))
         self._result.update(dnac.exit_json())
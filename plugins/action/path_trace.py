@@ -18,11 +18,8 @@ else:
 from ansible.errors import AnsibleActionFail
 from ansible_collections.cisco.dnac.plugins.plugin_utils.dnac import (
     DNACSDK,
+    DNACObject,
     dnac_argument_spec,
-    dnac_compare_equality,
-)
-from ansible_collections.cisco.dnac.plugins.plugin_utils.exceptions import (
-    InconsistentParameters,
 )
 
 # Get common arguments specification
@@ -50,7 +47,21 @@ mutually_exclusive = []
 required_together = []
 
 
-class PathTrace(object):
+class PathTrace(DNACObject):
+    obj_params = [
+        ("controlPath", "controlPath"),
+        ("destIP", "destIP"),
+        ("destPort", "destPort"),
+        ("inclusions", "inclusions"),
+        ("periodicRefresh", "periodicRefresh"),
+        ("protocol", "protocol"),
+        ("sourceIP", "sourceIP"),
+        ("sourcePort", "sourcePort"),
+        ("flowAnalysisId", "flow_analysis_id"),
+    ]
+    # A path trace cannot be changed once created
+    updatable = False
+
     def __init__(self, params, dnac):
         self.dnac = dnac
         self.new_object = dict(
@@ -146,51 +157,15 @@ class PathTrace(object):
             result = None
         return result
 
-    def exists(self):
-        prev_obj = None
-        id_exists = False
-        name_exists = False
-        o_id = self.new_object.get("id")
-        o_id = o_id or self.new_object.get("flow_analysis_id")
-        name = self.new_object.get("name")
-        if o_id:
-            prev_obj = self.get_object_by_id(o_id)
-            id_exists = prev_obj is not None and isinstance(prev_obj, dict)
-        if not id_exists and name:
-            prev_obj = self.get_object_by_name(name)
-            name_exists = prev_obj is not None and isinstance(prev_obj, dict)
-        if name_exists:
-            _id = prev_obj.get("id")
-            _id = _id or prev_obj.get("flowAnalysisId")
-            if id_exists and name_exists and o_id != _id:
-                raise InconsistentParameters("The 'id' and 'name' params don't refer to the same object")
-            if _id:
-                self.new_object.update(dict(id=_id))
-                self.new_object.update(dict(flow_analysis_id=_id))
-            if _id:
-                prev_obj = self.get_object_by_id(_id)
-        it_exists = prev_obj is not None and isinstance(prev_obj, dict)
-        return (it_exists, prev_obj)
+    def get_requested_id(self):
+        return self.new_object.get("id") or self.new_object.get("flow_analysis_id")
 
-    def requires_update(self, current_obj):
-        requested_obj = self.new_object
+    def get_object_id(self, obj):
+        return obj.get("id") or obj.get("flowAnalysisId")
 
-        obj_params = [
-            ("controlPath", "controlPath"),
-            ("destIP", "destIP"),
-            ("destPort", "destPort"),
-            ("inclusions", "inclusions"),
-            ("periodicRefresh", "periodicRefresh"),
-            ("protocol", "protocol"),
-            ("sourceIP", "sourceIP"),
-            ("sourcePort", "sourcePort"),
-            ("flowAnalysisId", "flow_analysis_id"),
-        ]
-        # Method 1. Params present in request (Ansible) obj are the same as the current (ISE) params
-        # If any does not have eq params, it requires update
-        return any(not dnac_compare_equality(current_obj.get(dnac_param),
-                                             requested_obj.get(ansible_param))
-                   for (dnac_param, ansible_param) in obj_params)
+    def set_object_id(self, id):
+        self.new_object.update(dict(id=id))
+        self.new_object.update(dict(flow_analysis_id=id))
 
     def create(self):
         result = self.dnac.exec(
@@ -201,6 +176,9 @@ class PathTrace(object):
         )
         return result
 
+    def update(self):
+        return None
+
     def delete(self):
         id = self.new_object.get("id")
         id = id or self.new_object.get("flow_analysis_id")
@@ -260,26 +238,7 @@ class ActionModule(ActionBase):
 
         state = self._task.args.get("state")
 
-        response = None
-        if state == "present":
-            (obj_exists, prev_obj) = obj.exists()
-            if obj_exists:
-                if obj.requires_update(prev_obj):
-                    response = prev_obj
-                    dnac.object_present_and_different()
-                else:
-                    response = prev_obj
-                    dnac.object_already_present()
-            else:
-                response = obj.create()
-                dnac.object_created()
-        elif state == "absent":
-            (obj_exists, prev_obj) = obj.exists()
-            if obj_exists:
-                response = obj.delete()
-                dnac.object_deleted()
-            else:
-                dnac.object_already_absent()
+        response = obj.apply_state(state)
 
         self._result.update(dict(dnac_response=response))
         self._result.update(dnac.exit_json())
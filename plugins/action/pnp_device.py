@@ -18,13 +18,10 @@ else:
 from ansible.errors import AnsibleActionFail
 from ansible_collections.cisco.dnac.plugins.plugin_utils.dnac import (
     DNACSDK,
+    DNACObject,
     dnac_argument_spec,
-    dnac_compare_equality,
     get_dict_result,
 )
-from ansible_collections.cisco.dnac.plugins.plugin_utils.exceptions import (
-    InconsistentParameters,
-)
 
 # Get common arguments specification
 argument_spec = dnac_argument_spec()
@@ -52,7 +49,20 @@ mutually_exclusive = []
 required_together = []
 
 
-class PnpDevice(object):
+class PnpDevice(DNACObject):
+    obj_params = [
+        ("_id", "_id"),
+        ("deviceInfo", "deviceInfo"),
+        ("runSummaryList", "runSummaryList"),
+        ("systemResetWorkflow", "systemResetWorkflow"),
+        ("systemWorkflow", "systemWorkflow"),
+        ("tenantId", "tenantId"),
+        ("version", "version"),
+        ("workflow", "workflow"),
+        ("workflowParameters", "workflowParameters"),
+        ("id", "id"),
+    ]
+
     def __init__(self, params, dnac):
         self.dnac = dnac
         self.new_object = dict(
@@ -175,53 +185,15 @@ class PnpDevice(object):
             result = None
         return result
 
-    def exists(self):
-        id_exists = False
-        name_exists = False
-        prev_obj = None
-        o_id = self.new_object.get("id")
+    def get_requested_id(self):
+        return self.new_object.get("id") or self.new_object.get("_id")
+
+    def get_requested_name(self):
         name = self.new_object.get("name")
-        o_id = o_id or self.new_object.get("_id")
         device_info = self.new_object.get('deviceInfo')
         if device_info and isinstance(device_info, dict) and device_info.get('name'):
             name = name or device_info.get('name')
-        if o_id:
-            prev_obj = self.get_object_by_id(o_id)
-            id_exists = prev_obj is not None and isinstance(prev_obj, dict)
-        if not id_exists and name:
-            prev_obj = self.get_object_by_name(name)
-            name_exists = prev_obj is not None and isinstance(prev_obj, dict)
-        if name_exists:
-            _id = prev_obj.get("id")
-            if id_exists and name_exists and o_id != _id:
-                raise InconsistentParameters("The 'id' and 'name' params don't refer to the same object")
-            if _id:
-                self.new_object.update(dict(id=_id))
-            if _id:
-                prev_obj = self.get_object_by_id(_id)
-        it_exists = prev_obj is not None and isinstance(prev_obj, dict)
-        return (it_exists, prev_obj)
-
-    def requires_update(self, current_obj):
-        requested_obj = self.new_object
-
-        obj_params = [
-            ("_id", "_id"),
-            ("deviceInfo", "deviceInfo"),
-            ("runSummaryList", "runSummaryList"),
-            ("systemResetWorkflow", "systemResetWorkflow"),
-            ("systemWorkflow", "systemWorkflow"),
-            ("tenantId", "tenantId"),
-            ("version", "version"),
-            ("workflow", "workflow"),
-            ("workflowParameters", "workflowParameters"),
-            ("id", "id"),
-        ]
-        # Method 1. Params present in request (Ansible) obj are the same as the current (DNAC) params
-        # If any does not have eq params, it requires update
-        return any(not dnac_compare_equality(current_obj.get(dnac_param),
-                                             requested_obj.get(ansible_param))
-                   for (dnac_param, ansible_param) in obj_params)
+        return name
 
     def create(self):
         result = self.dnac.exec(
@@ -316,28 +288,7 @@ class ActionModule(ActionBase):
 
         state = self._task.args.get("state")
 
-        response = None
-
-        if state == "present":
-            (obj_exists, prev_obj) = obj.exists()
-            if obj_exists:
-                if obj.requires_update(prev_obj):
-                    response = obj.update()
-                    dnac.object_updated()
-                else:
-                    response = prev_obj
-                    dnac.object_already_present()
-            else:
-                response = obj.create()
-                dnac.object_created()
-
-        elif state == "absent":
-            (obj_exists, prev_obj) = obj.exists()
-            if obj_exists:
-                response = obj.delete()
-                dnac.object_deleted()
-            else:
-                dnac.object_already_absent()
+        response = obj.apply_state(state)
 
         self._result.update(dict(dnac_response=response))
         self._result.update(dnac.exit_json())
@@ -31,8 +31,14 @@ argument_spec.update(dict(
     saveFile=dict(type="bool"),
     filename=dict(type="str"),
     headers=dict(type="dict"),
+    stream=dict(type="bool", default=False),
+    compress=dict(type="bool", default=False),
+    checksum=dict(type="str"),
 ))
 
+# Path streamed to disk when 'stream' is set
+DOWNLOAD_PATH = "/dna/intent/api/v1/data/reports/{reportId}/executions/{executionId}"
+
 required_if = []
 required_one_of = []
 mutually_exclusive = []
@@ -88,6 +94,20 @@ class ActionModule(ActionBase):
         dnac = DNACSDK(params=self._task.args)
 
         id = self._task.args.get("executionId")
+        if id and self._task.args.get("stream"):
+            response = dnac.download(
+                family="reports",
+                resource_path=DOWNLOAD_PATH,
+                path_params=dict(reportId=self._task.args.get("reportId"), executionId=id),
+                dirpath=self._task.args.get("dirPath"),
+                filename=self._task.args.get("filename"),
+                compress=self._task.args.get("compress"),
+                checksum=self._task.args.get("checksum"),
+                headers=self._task.args.get("headers"),
+            )
+            self._result.update(dict(dnac_response=response))
+            self._result.update(dnac.exit_json())
+            return self._result
         if id:
             download_response = dnac.exec(
                 family="reports",
@@ -20,7 +20,6 @@ from ansible_collections.cisco.dnac.plugins.plugin_utils.dnac import (
     DNACSDK,
     dnac_argument_spec,
 )
-import os
 
 # Get common arguements specification
 argument_spec = dnac_argument_spec()
@@ -75,9 +74,6 @@ class ActionModule(ActionBase):
             third_party_application_type=params.get(
                 "thirdPartyApplicationType"),
             file_path=params.get("filePath"),
-            multipart_fields={'file': (os.path.basename(params.get(
-                "filePath")), open(params.get("filePath"), 'rb'))},
-            multipart_monitor_callback=None
         )
         return new_object
 
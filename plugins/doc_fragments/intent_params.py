@@ -95,6 +95,58 @@ options:
         description: Determines the mode of the file. Set to True for 'append' mode. Set to False for 'write' mode.
         type: bool
         default: True
+    dnac_task_timeout:
+        description:
+          - Maximum time in seconds to wait for a Cisco Catalyst Center task or API execution to complete.
+          - The module fails with a timeout message once this deadline expires.
+          - When not set, it defaults to 1200 seconds, or 3600 seconds for the swim_intent and
+            provision_intent modules whose image distribution, activation and provisioning tasks run longer.
+        type: int
+    dnac_poll_interval:
+        description:
+          - Initial time in seconds between two status polls of a Cisco Catalyst Center task.
+          - The interval grows exponentially with random jitter while the task is running, up to 30 seconds,
+            or 60 seconds for the swim_intent and provision_intent modules.
+        type: int
+        default: 2
+    dnac_token_cache:
+        description:
+          - Flag to reuse Cisco DNA Center authentication tokens across tasks and hosts.
+          - Tokens are stored in C(~/.ansible/cisco_dnac_tokens.json), readable only by its owner, keyed by a digest
+            of the host, port, credentials and version, and are reused until shortly before they expire.
+        type: bool
+        default: false
+    dnac_pool_maxsize:
+        description:
+          - Maximum number of HTTP connections to Cisco DNA Center kept alive and reused by the SDK session.
+        type: int
+        default: 10
+    dnac_timeout:
+        description:
+          - Timeout in seconds of a single HTTP request to Cisco DNA Center.
+        type: int
+        default: 60
+    dnac_max_retries:
+        description:
+          - Number of times a request answered with HTTP 429 or 503 is sent again before the error is reported.
+        type: int
+        default: 3
+    dnac_retry_backoff:
+        description:
+          - Backoff factor in seconds between two attempts of a retried request, the wait doubles on every attempt.
+          - A C(Retry-After) header sent by Cisco DNA Center takes precedence.
+        type: float
+        default: 1.0
+    dnac_api_rate_limit:
+        description:
+          - Maximum number of requests per second sent to Cisco DNA Center, unlimited when not set.
+          - The limit is shared by every task and forked worker of the run talking to the same Cisco DNA Center.
+        type: float
+    dnac_api_family_rate_limits:
+        description:
+          - Maximum number of requests per second for specific SDK API families, on top of I(dnac_api_rate_limit).
+          - 'For example C({"devices": 5, "software_image_management_swim": 1}).'
+        type: dict
     validate_response_schema:
         description:
           - Flag for Cisco DNA Center SDK to enable the validation of request bodies against a JSON schema.
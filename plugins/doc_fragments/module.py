@@ -49,6 +49,58 @@ options:
           - Flag for Cisco DNA Center SDK to enable debugging.
         type: bool
         default: false
+    dnac_token_cache:
+        description:
+          - Flag to reuse Cisco DNA Center authentication tokens across tasks and hosts.
+          - Tokens are stored in C(~/.ansible/cisco_dnac_tokens.json), readable only by its owner, keyed by a digest
+            of the host, port, credentials and version, and are reused until shortly before they expire.
+        type: bool
+        default: false
+    dnac_pool_maxsize:
+        description:
+          - Maximum number of HTTP connections to Cisco DNA Center kept alive and reused by the SDK session.
+        type: int
+        default: 10
+    dnac_timeout:
+        description:
+          - Timeout in seconds of a single HTTP request to Cisco DNA Center.
+        type: int
+        default: 60
+    dnac_max_retries:
+        description:
+          - Number of times a request answered with HTTP 429 or 503 is sent again before the error is reported.
+        type: int
+        default: 3
+    dnac_retry_backoff:
+        description:
+          - Backoff factor in seconds between two attempts of a retried request, the wait doubles on every attempt.
+          - A C(Retry-After) header sent by Cisco DNA Center takes precedence.
+        type: float
+        default: 1.0
+    dnac_api_rate_limit:
+        description:
+          - Maximum number of requests per second sent to Cisco DNA Center, unlimited when not set.
+          - The limit is shared by every task and forked worker of the run talking to the same Cisco DNA Center.
+        type: float
+    dnac_api_family_rate_limits:
+        description:
+          - Maximum number of requests per second for specific SDK API families, on top of I(dnac_api_rate_limit).
+          - 'For example C({"devices": 5, "software_image_management_swim": 1}).'
+        type: dict
+    dnac_cache:
+        description:
+          - Flag to share the responses of read requests between the tasks of a playbook run.
+          - Any other request of an API family drops the cached responses of that family.
+          - Only the modules of this collection that are not intent modules share the cache. Changes made by the
+            intent modules, or outside of the playbook, are not seen by the cached responses until I(dnac_cache_ttl)
+            expires, so do not enable it for plays that read back what an intent module just changed.
+        type: bool
+        default: false
+    dnac_cache_ttl:
+        description:
+          - Time in seconds a cached response is reused when I(dnac_cache) is enabled.
+        type: int
+        default: 300
     validate_response_schema:
         description:
           - Flag for Cisco DNA Center SDK to enable the validation of request bodies against a JSON schema.
@@ -14,6 +14,16 @@ else:
     DNAC_SDK_IS_INSTALLED = True
 from ansible.module_utils._text import to_native
 from ansible.module_utils.common import validation
+from ansible_collections.cisco.dnac.plugins.module_utils.exceptions import (
+    DnacConnectionError,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.dnac_session import (
+    RateLimiter,
+    TokenCache,
+    UploadFile,
+    build_requests_session,
+    enable_token_cache,
+)
 from abc import ABCMeta, abstractmethod
 try:
     import logging
@@ -21,12 +31,31 @@ except ImportError:
     LOGGING_IN_STANDARD = False
 else:
     LOGGING_IN_STANDARD = True
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import os.path
 import copy
 import json
 # import datetime
-import inspect
+import random
 import re
+import sys
+import threading
+import time
+
+# Defaults used when polling Catalyst Center for task or API execution completion
+DNAC_TASK_TIMEOUT = 1200
+DNAC_LONG_TASK_TIMEOUT = 3600
+DNAC_POLL_INTERVAL = 2
+DNAC_POLL_MAX_INTERVAL = 30
+DNAC_LONG_POLL_MAX_INTERVAL = 60
+DNAC_POLL_BACKOFF = 1.5
+DNAC_POLL_JITTER = 0.2
+
+# Default number of items requested per page when walking a paged API
+DNAC_PAGE_SIZE = 500
+
+# Default number of independent lookups run at the same time by 'fetch_concurrently'
+DNAC_FETCH_WORKERS = 4
 
 
 class DnacBase():
@@ -36,6 +65,12 @@ class DnacBase():
     __metaclass__ = ABCMeta
     __is_log_init = False
 
+    # Polling defaults, modules driving long-running tasks (SWIM, provisioning) raise them
+    task_timeout = DNAC_TASK_TIMEOUT
+    poll_max_interval = DNAC_POLL_MAX_INTERVAL
+    # Lookups run at the same time by 'fetch_concurrently', 1 runs them one after the other in declaration order
+    fetch_workers = DNAC_FETCH_WORKERS
+
     def __init__(self, module):
         self.module = module
         self.params = module.params
@@ -65,6 +100,13 @@ class DnacBase():
                                         'parsed': self.verify_diff_parsed
                                         }
         self.dnac_log = dnac_params.get("dnac_log")
+        self.dnac_task_timeout = dnac_params.get("dnac_task_timeout") or self.task_timeout
+        self.dnac_poll_interval = dnac_params.get("dnac_poll_interval") or DNAC_POLL_INTERVAL
+        self.poll_stats = {"tasks": 0, "polls": 0, "wait_time": 0.0, "timeouts": 0}
+        self.site_tree = None
+        self.log_buffer = threading.local()
+        self.snapshot = {}
+        self.planned_keys = set()
 
         if self.dnac_log and not DnacBase.__is_log_init:
             self.dnac_log_level = dnac_params.get("dnac_log_level") or 'WARNING'
@@ -81,7 +123,7 @@ class DnacBase():
             # If dnac_log is False, return an empty logger
             self.logger = logging.getLogger('empty_logger')
 
-        self.log('Dnac parameters: {0}'.format(dnac_params), "DEBUG")
+        self.log('Dnac parameters: {0}', "DEBUG", args=(dnac_params,))
         self.supported_states = ["merged", "deleted", "replaced", "overridden", "gathered", "rendered", "parsed"]
         self.result = {"changed": False, "diff": [], "response": [], "warnings": []}
 
@@ -201,31 +243,46 @@ class DnacBase():
         if not os.path.exists(log_directory):
             raise FileNotFoundError("The directory for log file '{0}' does not exist.".format(dnac_log_file_path))
 
-    def log(self, message, level="WARNING", frameIncrement=0):
+    def log(self, message, level="WARNING", frameIncrement=0, args=None):
         """Logs formatted messages with specified log level and incrementing the call stack frame
         Args:
             self (obj, required): An instance of the DnacBase Class.
-            message (str, required): The log message to be recorded.
+            message (str or callable, required): The log message to be recorded, or a callable returning it.
             level (str, optional): The log level, default is "info".
                                    The log level can be one of 'DEBUG', 'INFO', 'WARNING', 'ERROR', or 'CRITICAL'.
+            args (tuple, optional): Arguments formatted into 'message' with str.format.
+        Description:
+            Nothing is evaluated unless the record is emitted: a callable message is only called, 'args' only
+            formatted and the caller frame only looked up when logging is enabled for 'level'. Large payloads
+            should therefore be passed through 'args' or a callable rather than formatted by the caller.
         """
 
-        if self.dnac_log:
-            # of.write("---- %s ---- %s@%s ---- %s \n" % (d, info.lineno, info.function, msg))
-            # message = "Module: " + self.__class__.__name__ + ", " + message
-            class_name = self.__class__.__name__
-            callerframerecord = inspect.stack()[1 + frameIncrement]
-            frame = callerframerecord[0]
-            info = inspect.getframeinfo(frame)
-            log_message = " %s: %s: %s: %s \n" % (class_name, info.function, info.lineno, message)
-            log_method = getattr(self.logger, level.lower())
-            log_method(log_message)
+        if not self.dnac_log or not self.logger.isEnabledFor(logging.getLevelName(level.upper())):
+            return
+
+        if callable(message):
+            message = message()
+        if args is not None:
+            message = message.format(*args)
+
+        class_name = self.__class__.__name__
+        frame = sys._getframe(1 + frameIncrement)
+        log_message = " %s: %s: %s: %s \n" % (class_name, frame.f_code.co_name, frame.f_lineno, message)
+
+        # Records of a lookup run by 'fetch_concurrently' are held back and written in declaration order
+        records = getattr(self.log_buffer, "records", None)
+        if records is not None:
+            records.append((level, log_message))
+            return
+
+        log_method = getattr(self.logger, level.lower())
+        log_method(log_message)
 
     def check_return_status(self):
         """API to check the return status value and exit/fail the module"""
 
         # self.log("status: {0}, msg:{1}".format(self.status, self.msg), frameIncrement=1)
-        self.log("status: {0}, msg: {1}".format(self.status, self.msg), "DEBUG")
+        self.log("status: {0}, msg: {1}", "DEBUG", args=(self.status, self.msg))
         if "failed" in self.status:
             self.module.fail_json(msg=self.msg, response=[])
         elif "exited" in self.status:
@@ -266,7 +323,16 @@ class DnacBase():
                        "dnac_log": params.get("dnac_log"),
                        "dnac_log_level": params.get("dnac_log_level"),
                        "dnac_log_file_path": params.get("dnac_log_file_path"),
-                       "dnac_log_append": params.get("dnac_log_append")
+                       "dnac_log_append": params.get("dnac_log_append"),
+                       "dnac_task_timeout": params.get("dnac_task_timeout"),
+                       "dnac_poll_interval": params.get("dnac_poll_interval"),
+                       "dnac_token_cache": params.get("dnac_token_cache"),
+                       "dnac_pool_maxsize": params.get("dnac_pool_maxsize"),
+                       "dnac_timeout": params.get("dnac_timeout"),
+                       "dnac_max_retries": params.get("dnac_max_retries"),
+                       "dnac_retry_backoff": params.get("dnac_retry_backoff"),
+                       "dnac_api_rate_limit": params.get("dnac_api_rate_limit"),
+                       "dnac_api_family_rate_limits": params.get("dnac_api_family_rate_limits")
                        }
         return dnac_params
 
@@ -290,14 +356,623 @@ class DnacBase():
             params={"task_id": task_id}
         )
 
-        self.log('Task Details: {0}'.format(str(response)), 'DEBUG')
-        self.log("Retrieving task details by the API 'get_task_by_id' using task ID: {0}, Response: {1}".format(task_id, response), "DEBUG")
+        self.log("Retrieving task details by the API 'get_task_by_id' using task ID: {0}, Response: {1}", "DEBUG", args=(task_id, response))
 
         if response and isinstance(response, dict):
             result = response.get('response')
 
         return result
 
+    def paginate(self, family, function, params=None, page_size=DNAC_PAGE_SIZE, items_key="response",
+                 offset_start=1, offset_param="offset", limit_param="limit", prefetch=False):
+        """
+        Iterate over every item of a paged Cisco Catalyst Center API, one page at a time.
+        Args:
+            self (object): An instance of a class that provides access to Cisco Catalyst Center.
+            family (str): The SDK API family, for example 'devices', 'device_onboarding_pnp', 'sites' or 'task'.
+            function (str): The SDK function of that family returning one page of items.
+            params (dict, optional): Filters sent with every page request.
+            page_size (int, optional): Number of items requested per page.
+            items_key (str, optional): Key of the response holding the items of the page, None when
+                                       the API returns the list of items itself.
+            offset_start (int, optional): Offset of the first item, 1 for most Catalyst Center APIs, 0 for some.
+            offset_param (str, optional): Name of the offset parameter of the API.
+            limit_param (str, optional): Name of the page size parameter of the API.
+            prefetch (bool, optional): Request the next page in the background while the current one is consumed.
+        Returns:
+            generator: Yields the items of every page in order, stopping after the first page shorter
+                       than 'page_size'.
+        Description:
+            Pages are requested lazily, so a caller that stops iterating early does not read the remaining pages.
+            With 'prefetch' the request for the next page overlaps with the processing of the current one,
+            at the cost of one extra request when the last page is exactly full.
+        """
+
+        def get_page(offset):
+            page_params = dict(params or {})
+            page_params[offset_param] = offset
+            page_params[limit_param] = page_size
+            response = self.dnac._exec(
+                family=family,
+                function=function,
+                params=page_params
+            )
+            items = response.get(items_key) if items_key and isinstance(response, dict) else response
+            self.log("Received {0} item(s) from '{1}' at offset {2}", "DEBUG", args=(len(items or []), function, offset))
+            return items or []
+
+        offset = offset_start
+        if not prefetch:
+            while True:
+                items = get_page(offset)
+                for item in items:
+                    yield item
+
+                if len(items) < page_size:
+                    return
+                offset += page_size
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page = executor.submit(get_page, offset)
+            while True:
+                items = next_page.result()
+                if len(items) == page_size:
+                    offset += page_size
+                    next_page = executor.submit(get_page, offset)
+
+                for item in items:
+                    yield item
+
+                if len(items) < page_size:
+                    return
+
+    def get_site_tree(self, refresh=False):
+        """
+        Return the site hierarchy of Cisco Catalyst Center, loaded once per run.
+        Args:
+            self (object): An instance of a class that provides access to Cisco Catalyst Center.
+            refresh (bool, optional): Load the hierarchy again even if it was already loaded.
+        Returns:
+            SiteTree: Every site of Cisco Catalyst Center, indexed by name hierarchy, id, type and parent.
+        Description:
+            The sites are read page by page with 'sites/get_site' on the first call and reused by the next ones,
+            so resolving any number of site names, types or subtrees costs a handful of requests instead of one
+            'get_site' request per lookup. Modules that create, update or delete sites keep the tree current
+            with 'refresh_site' and 'SiteTree.remove'.
+        """
+
+        if self.site_tree is not None and not refresh:
+            return self.site_tree
+
+        try:
+            sites = list(self.paginate("sites", "get_site", prefetch=True))
+        except Exception as e:
+            error_message = "Error while fetching the site hierarchy from Cisco Catalyst Center: {0}".format(str(e))
+            self.log(error_message, "CRITICAL")
+            raise Exception(error_message)
+
+        self.site_tree = SiteTree(sites)
+        self.log("Loaded {0} site(s) of Cisco Catalyst Center".format(len(self.site_tree)), "INFO")
+
+        return self.site_tree
+
+    def refresh_site(self, site_name):
+        """
+        Read one site again by name into the site tree, after it was created or updated.
+        Args:
+            self (object): An instance of a class that provides access to Cisco Catalyst Center.
+            site_name (str): The name hierarchy of the site.
+        Returns:
+            dict: The current details of the site, or None when it does not exist.
+        """
+
+        site_tree = self.get_site_tree()
+        response = None
+        try:
+            response = self.dnac._exec(
+                family="sites",
+                function='get_site',
+                params={"name": site_name},
+            )
+        except Exception as e:
+            self.log("Site '{0}' was not found in Cisco Catalyst Center: {1}".format(site_name, str(e)), "DEBUG")
+
+        sites = response.get("response") if isinstance(response, dict) else None
+        if not sites:
+            site = site_tree.get(site_name)
+            if site:
+                site_tree.remove(site.get("id"))
+            return None
+
+        site_tree.add(sites[0])
+        return sites[0]
+
+    def get_site_id(self, site_name):
+        """
+        Get the site id from the site name hierarchy.
+        Args:
+            self (object): An instance of a class that provides access to Cisco Catalyst Center.
+            site_name (str): The name hierarchy of the site.
+        Returns:
+            str or None: The Site Id if found, or None if not found.
+        """
+
+        site_id = self.get_site_tree().get_id(site_name)
+        if site_id is None:
+            self.log("Failed to retrieve the site ID for the site name: {0}".format(site_name), "ERROR")
+            return None
+
+        self.log("Site ID for site name '{0}': {1}", "DEBUG", args=(site_name, site_id))
+        return site_id
+
+    def get_site_type(self, site_name):
+        """
+        Get the type of a site from the site name hierarchy.
+        Args:
+            self (object): An instance of a class that provides access to Cisco Catalyst Center.
+            site_name (str): The name hierarchy of the site.
+        Returns:
+            str or None: The type of the site (area, building or floor), or None if the site is not found.
+        """
+
+        site = self.get_site_tree().get(site_name)
+        if site is None:
+            self.log("Site '{0}' not found".format(site_name), "INFO")
+            return None
+
+        site_type = SiteTree.site_type(site)
+        self.log("Site type for site name '{0}': {1}", "DEBUG", args=(site_name, site_type))
+        return site_type
+
+    def fetch_concurrently(self, lookups, max_workers=None):
+        """
+        Run the independent lookups of a 'get_have' phase concurrently, respecting their dependencies.
+        Args:
+            self (object): An instance of a class that provides access to Cisco Catalyst Center.
+            lookups (list): Tuples (name, fetch, depends_on) in the order the lookups would run one after the other.
+                            'fetch' is called with a dictionary of the results finished so far, which holds the
+                            results of all the lookups named in 'depends_on', and returns the result of the lookup.
+                            'depends_on' may be omitted when the lookup depends on no other lookup.
+            max_workers (int, optional): Maximum number of lookups running at the same time.
+                                         Defaults to 'fetch_workers'.
+        Returns:
+            dict: The result of every lookup keyed by its name.
+        Description:
+            A lookup starts on a thread pool as soon as the lookups it depends on have finished, so on a high
+            latency link the time spent approaches that of the longest chain of dependent lookups rather than the
+            sum of all of them. Log records emitted by a lookup are held back and written in the declaration order
+            of the lookups once all of them finished, so the log reads the same as if they had run one after the
+            other. When a lookup raises, no further lookup is started and the error of the first failed lookup in
+            declaration order is raised once the running lookups finished. Lookups must raise, e.g. DnacLookupError,
+            rather than call 'fail_json' from their worker thread, and leave failing the module to the caller.
+        """
+
+        lookups = [(lookup[0], lookup[1], tuple(lookup[2]) if len(lookup) > 2 else ()) for lookup in lookups]
+        names = [name for (name, fetch, depends_on) in lookups]
+        for (name, fetch, depends_on) in lookups:
+            unknown = [dependency for dependency in depends_on if dependency not in names]
+            if unknown:
+                raise ValueError("Lookup '{0}' depends on unknown lookup(s): {1}".format(
+                    name, ", ".join(str(dependency) for dependency in unknown)))
+
+        results = {}
+        errors = {}
+        records = dict((name, []) for name in names)
+        pending = list(lookups)
+        running = {}
+
+        def run(name, fetch, available):
+            self.log_buffer.records = records[name]
+            try:
+                return fetch(available)
+            finally:
+                self.log_buffer.records = None
+
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=max(max_workers or self.fetch_workers, 1)) as executor:
+            while pending or running:
+                if not errors:
+                    for lookup in list(pending):
+                        (name, fetch, depends_on) = lookup
+                        if all(dependency in results for dependency in depends_on):
+                            pending.remove(lookup)
+                            running[executor.submit(run, name, fetch, dict(results))] = name
+
+                if not running:
+                    if pending and not errors:
+                        raise ValueError("Lookups with circular dependencies: {0}".format(
+                            ", ".join(str(name) for (name, fetch, depends_on) in pending)))
+                    break
+
+                done = wait(running, return_when=FIRST_COMPLETED)[0]
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except BaseException as e:
+                        errors[name] = e
+
+        for name in names:
+            for (level, log_message) in records[name]:
+                getattr(self.logger, level.lower())(log_message)
+
+        self.log("Fetched {0} lookup(s) in {1:.2f}s", "DEBUG", args=(len(results), time.time() - start_time))
+        for name in names:
+            if name in errors:
+                raise errors[name]
+
+        return results
+
+    def get_plan_lookups(self, config):
+        """
+        Declare the reads one playbook entry needs before its diff can be computed.
+        Args:
+            self (object): An instance of a class that provides access to Cisco Catalyst Center.
+            config (dict): One entry of the validated playbook configuration.
+        Returns:
+            list: Lookups as taken by 'fetch_concurrently', named by a hashable key that identifies the read,
+                  such as ("global_pool",) or ("project_details", "Onboarding Configuration"). Entries that need
+                  the same read declare the same key. Modules that do not plan their reads return no lookup.
+        """
+
+        return []
+
+    def plan(self, configs):
+        """
+        Read once, ahead of the main loop, what all the playbook entries need.
+        Args:
+            self (object): An instance of a class that provides access to Cisco Catalyst Center.
+            configs (list): The validated playbook configuration.
+        Returns:
+            self: The current object, with the reads stored in 'self.snapshot'.
+        Description:
+            This is the first of the two phases of a module run. The lookups of all entries, as declared by
+            'get_plan_lookups', are deduplicated by key and fetched concurrently, so a read shared by many entries,
+            such as the project list or the global pools, is made once instead of once per entry. The second phase
+            is the usual loop of 'get_have', 'get_want' and 'get_diff_<state>' per entry, which take the reads from
+            the snapshot through 'get_planned'.
+            A read that fails here is left out of the snapshot, so the entry that needs it reads it again and
+            handles the error as it would have without planning.
+        """
+
+        lookups = {}
+        declared = 0
+        for config in configs:
+            for lookup in self.get_plan_lookups(config):
+                declared += 1
+                lookups.setdefault(lookup[0], lookup)
+
+        if not lookups:
+            return self
+
+        failed = object()
+
+        def planned(key, fetch, depends_on):
+            def run(results):
+                if any(results.get(dependency) is failed for dependency in depends_on):
+                    return failed
+
+                try:
+                    return fetch(results)
+                except Exception as e:
+                    self.log("Planned read {0} failed, it is read again when needed: {1}", "WARNING", args=(key, e))
+                    return failed
+
+            return run
+
+        planned_lookups = []
+        for lookup in lookups.values():
+            depends_on = tuple(lookup[2]) if len(lookup) > 2 else ()
+            planned_lookups.append((lookup[0], planned(lookup[0], lookup[1], depends_on), depends_on))
+
+        results = self.fetch_concurrently(planned_lookups)
+        self.planned_keys.update(lookups)
+        self.snapshot.update((key, value) for (key, value) in results.items() if value is not failed)
+        self.log("Planned {0} read(s) for {1} playbook entries, {2} shared read(s) skipped", "INFO",
+                 args=(len(lookups), len(configs), declared - len(lookups)))
+        return self
+
+    def get_planned(self, key, fetch):
+        """
+        Return a read from the snapshot of 'plan', or read it now.
+        Args:
+            self (object): An instance of a class that provides access to Cisco Catalyst Center.
+            key (tuple): The key the read was planned under.
+            fetch (callable): Called without arguments to read the value when it is not in the snapshot.
+        Returns:
+            A copy of the planned value, so that an entry cannot change what the next one reads, or the value
+            returned by 'fetch'.
+        Description:
+            A planned key that was forgotten after a change is read again here and kept, so the entries that
+            follow read the value after the change. Keys that were never planned are not kept.
+        """
+
+        if key in self.snapshot:
+            return copy.deepcopy(self.snapshot[key])
+
+        value = fetch()
+        if key in self.planned_keys:
+            self.snapshot[key] = value
+            return copy.deepcopy(value)
+
+        return value
+
+    def forget_planned(self, *keys):
+        """
+        Drop reads that a change made out of date from the snapshot of 'plan'.
+        Args:
+            self (object): An instance of a class that provides access to Cisco Catalyst Center.
+            *keys (tuple): Keys to drop. A key also drops every longer key it starts with, so ("template", "P")
+                           drops the planned details of all the templates of project "P". Without keys the whole
+                           snapshot is dropped.
+        """
+
+        if not keys:
+            self.snapshot.clear()
+            return
+
+        for planned_key in list(self.snapshot):
+            if any(planned_key[:len(key)] == key for key in keys):
+                del self.snapshot[planned_key]
+
+    def poll_until(self, fetch, predicate, timeout=None, poll_interval=None, description="task", fail_on_timeout=True):
+        """
+        Poll Cisco Catalyst Center until a condition holds or the deadline expires.
+        Args:
+            self (object): An instance of a class that provides access to Cisco Catalyst Center.
+            fetch (callable): Called without arguments on every poll, returns the latest status.
+            predicate (callable): Called with the latest status, returns True once polling can stop.
+            timeout (int, optional): Seconds to wait before giving up. Defaults to 'dnac_task_timeout'.
+            poll_interval (int, optional): Initial seconds between polls. Defaults to 'dnac_poll_interval'.
+            description (str, optional): Label of the awaited operation used in logs and messages.
+            fail_on_timeout (bool, optional): Whether an expired deadline marks the module as failed.
+        Returns:
+            The last status returned by 'fetch' once 'predicate' holds, or None if the deadline expired.
+        Description:
+            Polls start fast and the interval grows exponentially up to 'poll_max_interval' seconds, so
+            short tasks finish quickly while long SWIM or provisioning tasks are polled sparingly. Each
+            interval is randomised by DNAC_POLL_JITTER so that parallel playbooks do not poll in lock-step.
+            When the deadline expires and 'fail_on_timeout' is set, 'self.status' is set to 'failed' and
+            'self.msg' describes the timeout.
+            Poll count and wait time are accumulated in 'self.result["poll_stats"]'.
+        """
+
+        timeout = timeout or self.dnac_task_timeout
+        interval = poll_interval or self.dnac_poll_interval
+        start_time = time.time()
+        deadline = start_time + timeout
+        polls = 0
+        status = None
+        done = False
+
+        while True:
+            polls += 1
+            status = fetch()
+            if status is not None and predicate(status):
+                done = True
+                break
+
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+
+            self.log("Waiting for {0}, poll {1}, next poll in {2:.1f}s: {3}", "DEBUG",
+                     args=(description, polls, interval, status))
+            delay = interval * random.uniform(1 - DNAC_POLL_JITTER, 1 + DNAC_POLL_JITTER)
+            time.sleep(min(delay, remaining))
+            interval = min(interval * DNAC_POLL_BACKOFF, self.poll_max_interval)
+
+        elapsed = time.time() - start_time
+        self.update_poll_stats(1, polls, elapsed, 0 if done else 1)
+
+        if not done:
+            timeout_msg = "Timed out after {0} seconds waiting for {1}, last status: {2}".format(
+                timeout, description, status)
+            if not fail_on_timeout:
+                self.log(timeout_msg, "WARNING")
+                return None
+
+            self.msg = timeout_msg
+            self.log(self.msg, "ERROR")
+            self.status = "failed"
+            return None
+
+        self.log("Finished waiting for {0} after {1} poll(s) in {2:.2f}s", "DEBUG", args=(description, polls, elapsed))
+        return status
+
+    def update_poll_stats(self, tasks, polls, elapsed, timeouts):
+        """
+        Accumulate polling statistics and publish them in 'self.result["poll_stats"]'.
+        Args:
+            self (object): An instance of a class that provides access to Cisco Catalyst Center.
+            tasks (int): Number of awaited operations.
+            polls (int): Number of status requests sent while waiting.
+            elapsed (float): Wall-clock seconds spent waiting.
+            timeouts (int): Number of awaited operations that hit the deadline.
+        """
+
+        self.poll_stats["tasks"] += tasks
+        self.poll_stats["polls"] += polls
+        self.poll_stats["wait_time"] = round(self.poll_stats["wait_time"] + elapsed, 3)
+        self.poll_stats["timeouts"] += timeouts
+        self.result["poll_stats"] = dict(self.poll_stats)
+
+    def run_tasks(self, items, submit, predicate=None, max_concurrency=None, timeout=None, poll_interval=None,
+                  on_complete=None, fail_on_timeout=False):
+        """
+        Trigger one Cisco Catalyst Center task per item with a bounded number in flight and wait for all of them.
+        Args:
+            self (object): An instance of a class that provides access to Cisco Catalyst Center.
+            items (list): Hashable work items, for example device IDs or tuples of device IDs.
+            submit (callable): Called with one item, triggers its operation and returns the task ID,
+                               or None when nothing was triggered for that item.
+            predicate (callable, optional): Called with the details of one task, returns True once that task is done.
+                                            Defaults to the task having failed or ended.
+            max_concurrency (int, optional): Maximum number of tasks in flight at once. Unbounded when not set.
+            timeout (int, optional): Seconds each task may run before it is given up. Defaults to 'dnac_task_timeout'.
+            poll_interval (int, optional): Initial seconds between polling rounds. Defaults to 'dnac_poll_interval'.
+            on_complete (callable, optional): Called with the item and task details as soon as its task is done.
+            fail_on_timeout (bool, optional): Whether tasks given up at their deadline mark the module as failed.
+        Returns:
+            dict: Task details keyed by item, None for the items that were not triggered or did not finish in time.
+        Description:
+            Items are submitted in order until 'max_concurrency' tasks are in flight, and each finished task frees
+            a slot that is filled right away with the next item, so the wall-clock time approaches that of the
+            slowest task rather than the sum of all of them. Every task backs off on its own schedule the same way
+            as in 'poll_until', and each wake-up only requests the status of the tasks that are due.
+        """
+
+        if predicate is None:
+            predicate = is_task_finished
+
+        timeout = timeout or self.dnac_task_timeout
+        base_interval = poll_interval or self.dnac_poll_interval
+        queue = list(dict.fromkeys(items))
+        results = dict((item, None) for item in queue)
+        in_flight = {}
+        timed_out = []
+        submitted = 0
+        polls = 0
+        start_time = time.time()
+
+        while True:
+            while queue and (not max_concurrency or len(in_flight) < max_concurrency):
+                item = queue.pop(0)
+                task_id = submit(item)
+                if not task_id:
+                    continue
+
+                submitted += 1
+                now = time.time()
+                delay = base_interval * random.uniform(1 - DNAC_POLL_JITTER, 1 + DNAC_POLL_JITTER)
+                # item, deadline, time of the next poll, current interval of this task
+                in_flight[task_id] = (item, now + timeout, now + delay, base_interval)
+
+            if not in_flight:
+                break
+
+            next_poll = min(min(task_next_poll, task_deadline)
+                            for (item, task_deadline, task_next_poll, interval) in in_flight.values())
+            self.log("Waiting for {0} task(s) in flight, {1} queued, next poll in {2:.1f}s", "DEBUG",
+                     args=(len(in_flight), len(queue), next_poll - time.time()))
+            time.sleep(max(0, next_poll - time.time()))
+
+            for task_id in list(in_flight):
+                item, task_deadline, task_next_poll, interval = in_flight[task_id]
+                if time.time() < min(task_next_poll, task_deadline):
+                    continue
+
+                polls += 1
+                task_details = self.get_task_details(task_id)
+                if task_details is not None and predicate(task_details):
+                    del in_flight[task_id]
+                    results[item] = task_details
+                    self.log("Task '{0}' finished after {1:.2f}s", "DEBUG", args=(task_id, time.time() - start_time))
+                    if on_complete:
+                        on_complete(item, task_details)
+                elif time.time() >= task_deadline:
+                    del in_flight[task_id]
+                    timed_out.append(task_id)
+                else:
+                    interval = min(interval * DNAC_POLL_BACKOFF, self.poll_max_interval)
+                    delay = interval * random.uniform(1 - DNAC_POLL_JITTER, 1 + DNAC_POLL_JITTER)
+                    in_flight[task_id] = (item, task_deadline, time.time() + delay, interval)
+
+        elapsed = time.time() - start_time
+        self.update_poll_stats(submitted, polls, elapsed, len(timed_out))
+
+        if timed_out:
+            timeout_msg = "Timed out after {0} seconds waiting for task(s): {1}".format(timeout, ", ".join(timed_out))
+            if fail_on_timeout:
+                self.msg = timeout_msg
+                self.log(self.msg, "ERROR")
+                self.status = "failed"
+            else:
+                self.log(timeout_msg, "WARNING")
+
+        return results
+
+    def wait_for_tasks(self, task_ids, predicate=None, timeout=None, poll_interval=None, on_complete=None,
+                       fail_on_timeout=False):
+        """
+        Wait for several already triggered Cisco Catalyst Center tasks in a single polling loop.
+        Args:
+            self (object): An instance of a class that provides access to Cisco Catalyst Center.
+            task_ids (list): The unique identifiers of the tasks to wait for.
+            predicate (callable, optional): Called with the details of one task, returns True once that task is done.
+                                            Defaults to the task having failed or ended.
+            timeout (int, optional): Seconds to wait for the tasks. Defaults to 'dnac_task_timeout'.
+            poll_interval (int, optional): Initial seconds between polling rounds. Defaults to 'dnac_poll_interval'.
+            on_complete (callable, optional): Called with the task ID and task details as soon as a task is done.
+            fail_on_timeout (bool, optional): Whether tasks still pending at the deadline mark the module as failed.
+        Returns:
+            dict: Task details keyed by task ID, None for the tasks still pending when the deadline expired.
+        """
+
+        return self.run_tasks(
+            [task_id for task_id in task_ids if task_id],
+            lambda task_id: task_id,
+            predicate=predicate,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            on_complete=on_complete,
+            fail_on_timeout=fail_on_timeout
+        )
+
+    def wait_for_task(self, task_id, predicate=None, timeout=None, poll_interval=None, fail_on_timeout=True):
+        """
+        Wait for a Cisco Catalyst Center task to satisfy a predicate.
+        Args:
+            self (object): An instance of a class that provides access to Cisco Catalyst Center.
+            task_id (str): The unique identifier of the task to wait for.
+            predicate (callable, optional): Called with the task details, returns True once waiting can stop.
+                                            Defaults to the task having failed or ended.
+            timeout (int, optional): Seconds to wait before giving up. Defaults to 'dnac_task_timeout'.
+            poll_interval (int, optional): Initial seconds between polls. Defaults to 'dnac_poll_interval'.
+            fail_on_timeout (bool, optional): Whether an expired deadline marks the module as failed.
+        Returns:
+            dict or None: The task details once the predicate holds, or None if the deadline expired.
+        """
+
+        if predicate is None:
+            predicate = is_task_finished
+
+        return self.poll_until(
+            lambda: self.get_task_details(task_id),
+            predicate,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            description="task '{0}'".format(task_id),
+            fail_on_timeout=fail_on_timeout
+        )
+
+    def wait_for_execution(self, execution_id, predicate=None, timeout=None, poll_interval=None, fail_on_timeout=True):
+        """
+        Wait for a Cisco Catalyst Center business API execution to satisfy a predicate.
+        Args:
+            self (object): An instance of a class that provides access to Cisco Catalyst Center.
+            execution_id (str): The unique identifier of the API execution to wait for.
+            predicate (callable, optional): Called with the execution details, returns True once waiting can stop.
+                                            Defaults to the execution having succeeded or failed.
+            timeout (int, optional): Seconds to wait before giving up. Defaults to 'dnac_task_timeout'.
+            poll_interval (int, optional): Initial seconds between polls. Defaults to 'dnac_poll_interval'.
+            fail_on_timeout (bool, optional): Whether an expired deadline marks the module as failed.
+        Returns:
+            dict or None: The execution details once the predicate holds, or None if the deadline expired.
+        """
+
+        if predicate is None:
+            predicate = is_execution_finished
+
+        return self.poll_until(
+            lambda: self.get_execution_details(execution_id),
+            predicate,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            description="API execution '{0}'".format(execution_id),
+            fail_on_timeout=fail_on_timeout
+        )
+
     def check_task_response_status(self, response, validation_string, data=False):
         """
         Get the site id from the site name.
@@ -328,26 +1003,26 @@ class DnacBase():
             return self
 
         task_id = response.get("taskId")
-        while True:
-            task_details = self.get_task_details(task_id)
-            self.log('Getting task details from task ID {0}: {1}'.format(task_id, task_details), "DEBUG")
-
-            if task_details.get("isError") is True:
-                if task_details.get("failureReason"):
-                    self.msg = str(task_details.get("failureReason"))
-                else:
-                    self.msg = str(task_details.get("progress"))
-                self.status = "failed"
-                break
+        task_details = self.wait_for_task(
+            task_id,
+            lambda details: details.get("isError") is True or
+            validation_string in (details.get("progress") or "").lower()
+        )
+        if task_details is None:
+            return self
 
-            if validation_string in task_details.get("progress").lower():
-                self.result['changed'] = True
-                if data is True:
-                    self.msg = task_details.get("data")
-                self.status = "success"
-                break
+        if task_details.get("isError") is True:
+            if task_details.get("failureReason"):
+                self.msg = str(task_details.get("failureReason"))
+            else:
+                self.msg = str(task_details.get("progress"))
+            self.status = "failed"
+            return self
 
-            self.log("progress set to {0} for taskid: {1}".format(task_details.get('progress'), task_id), "DEBUG")
+        self.result['changed'] = True
+        if data is True:
+            self.msg = task_details.get("data")
+        self.status = "success"
 
         return self
 
@@ -368,13 +1043,13 @@ class DnacBase():
             response (dict) - Status for API execution
         """
 
-        self.log("Execution Id: {0}".format(execid), "DEBUG")
+        self.log("Execution Id: {0}", "DEBUG", args=(execid,))
         response = self.dnac._exec(
             family="task",
             function='get_business_api_execution_details',
             params={"execution_id": execid}
         )
-        self.log("Response for the current execution: {0}".format(response))
+        self.log("Response for the current execution: {0}", args=(response,))
         return response
 
     def check_execution_response_status(self, response):
@@ -399,18 +1074,18 @@ class DnacBase():
             return self
 
         executionid = response.get("executionId")
-        while True:
-            execution_details = self.get_execution_details(executionid)
-            if execution_details.get("status") == "SUCCESS":
-                self.result['changed'] = True
-                self.msg = "Successfully executed"
-                self.status = "success"
-                break
+        execution_details = self.wait_for_execution(executionid)
+        if execution_details is None:
+            return self
 
-            if execution_details.get("bapiError"):
-                self.msg = execution_details.get("bapiError")
-                self.status = "failed"
-                break
+        if execution_details.get("status") == "SUCCESS":
+            self.result['changed'] = True
+            self.msg = "Successfully executed"
+            self.status = "success"
+        else:
+            self.msg = execution_details.get("bapiError") or \
+                "Execution '{0}' ended with status '{1}'".format(executionid, execution_details.get("status"))
+            self.status = "failed"
 
         return self
 
@@ -449,7 +1124,7 @@ class DnacBase():
             for key, value in config.items():
                 new_key = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', key).lower()
                 if new_key != key:
-                    self.log("{0} will be deprecated soon. Please use {1}.".format(key, new_key), "DEBUG")
+                    self.log("{0} will be deprecated soon. Please use {1}.", "DEBUG", args=(key, new_key))
                 new_value = self.camel_to_snake_case(value)
                 new_config[new_key] = new_value
         elif isinstance(config, list):
@@ -459,6 +1134,28 @@ class DnacBase():
         return new_config
 
 
+def is_task_finished(task_details):
+    """Return True once a task from 'get_task_by_id' has failed or ended."""
+    return task_details.get("isError") is True or task_details.get("endTime") is not None
+
+
+def task_progress_contains(*markers):
+    """Build a predicate that holds once a task has failed or its progress contains one of the markers."""
+
+    def predicate(task_details):
+        if task_details.get("isError"):
+            return True
+        progress = task_details.get("progress") or ""
+        return any(marker in progress for marker in markers)
+
+    return predicate
+
+
+def is_execution_finished(execution_details):
+    """Return True once a business API execution has succeeded or failed."""
+    return execution_details.get("status") in ("SUCCESS", "FAILURE") or bool(execution_details.get("bapiError"))
+
+
 def is_list_complex(x):
     return isinstance(x[0], dict) or isinstance(x[0], list)
 
@@ -467,49 +1164,97 @@ def has_diff_elem(ls1, ls2):
     return any((elem not in ls1 for elem in ls2))
 
 
-def compare_list(list1, list2):
-    len_list1 = len(list1)
-    len_list2 = len(list2)
-    if len_list1 != len_list2:
-        return False
+def canonicalize(value):
+    """
+    Return a hashable form of a JSON-like value, equal for values that compare equal.
+
+    Dicts become frozensets of their items, so key order does not matter, and lists become
+    tuples, keeping their order. Scalars are returned as they are, Python already hashes the
+    numbers that compare equal, like 1 and 1.0, to the same value.
+    """
+
+    if isinstance(value, dict):
+        return (dict, frozenset((key, canonicalize(item)) for (key, item) in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (list, tuple(canonicalize(item) for item in value))
+    return value
+
+
+def compare_list_difference(list1, list2, path=()):
+    """
+    Return the path of the first element of 'list2' missing from 'list1', None when the lists are equal.
 
-    if len_list1 == 0:
-        return True
+    Lists of scalars are compared as sets. Lists of dicts or lists are compared as multisets of
+    their canonical forms, in linear time whatever their size, their elements have to be equal.
+    """
 
-    attempt_std_cmp = list1 == list2
-    if attempt_std_cmp:
-        return True
+    if len(list1) != len(list2):
+        return path
 
-    if not is_list_complex(list1) and not is_list_complex(list2):
-        return set(list1) == set(list2)
+    if len(list1) == 0 or list1 == list2:
+        return None
 
-    # Compare normally if it exceeds expected size * 2 (len_list1==len_list2)
-    MAX_SIZE_CMP = 100
-    # Fail fast if elem not in list, thanks to any and generators
-    if len_list1 > MAX_SIZE_CMP:
-        return attempt_std_cmp
-    else:
-        # not changes 'has diff elem' to list1 != list2 ':lists are not equal'
-        return not (has_diff_elem(list1, list2)) or not (has_diff_elem(list2, list1))
+    try:
+        if not is_list_complex(list1) and not is_list_complex(list2):
+            elements = set(list1)
+            for (index, elem) in enumerate(list2):
+                if elem not in elements:
+                    return path + (index,)
+            return None if set(list2) == elements else path
+
+        counts = {}
+        for elem in list1:
+            key = canonicalize(elem)
+            counts[key] = counts.get(key, 0) + 1
+        for (index, elem) in enumerate(list2):
+            key = canonicalize(elem)
+            if not counts.get(key):
+                return path + (index,)
+            counts[key] -= 1
+    except TypeError:
+        # Unhashable values, compare them by containment
+        if has_diff_elem(list1, list2) and has_diff_elem(list2, list1):
+            return path
+
+    return None
 
 
-def fn_comp_key(k, dict1, dict2):
-    return dnac_compare_equality(dict1.get(k), dict2.get(k))
+def compare_list(list1, list2):
+    return compare_list_difference(list1, list2) is None
 
 
-def dnac_compare_equality(current_value, requested_value):
-    # print("dnac_compare_equality", current_value, requested_value)
-    if requested_value is None:
-        return True
-    if current_value is None:
-        return True
+def dnac_compare_difference(current_value, requested_value, strict=False, path=()):
+    """
+    Return the path of the first difference between two values, None when they are equal.
+
+    The path is a tuple of the dict keys and list indexes leading to the difference, () when the
+    values themselves differ. Unless 'strict' is set, a value that is None on either side matches
+    anything, like dnac_compare_equality; with 'strict' it only matches None, like
+    dnac_compare_equality2. Every key is visited once and the comparison stops at the first difference.
+    """
+
+    if current_value is None or requested_value is None:
+        if strict and (current_value is not None or requested_value is not None):
+            return path
+        return None
     if isinstance(current_value, dict) and isinstance(requested_value, dict):
-        all_dict_params = list(current_value.keys()) + list(requested_value.keys())
-        return not any((not fn_comp_key(param, current_value, requested_value) for param in all_dict_params))
+        keys = list(current_value)
+        keys.extend(key for key in requested_value if key not in current_value)
+        for key in keys:
+            difference = dnac_compare_difference(current_value.get(key), requested_value.get(key), strict, path + (key,))
+            if difference is not None:
+                return difference
+        return None
     elif isinstance(current_value, list) and isinstance(requested_value, list):
-        return compare_list(current_value, requested_value)
-    else:
-        return current_value == requested_value
+        return compare_list_difference(current_value, requested_value, path)
+    elif current_value != requested_value:
+        return path
+
+    return None
+
+
+def dnac_compare_equality(current_value, requested_value):
+    return dnac_compare_difference(current_value, requested_value) is None
 
 
 def simple_cmp(obj1, obj2):
@@ -538,6 +1283,266 @@ def get_dict_result(result, key, value, cmp_fn=simple_cmp):
     return result
 
 
+class IndexedResult(object):
+    """
+    A list of objects returned by Cisco Catalyst Center with hash indexes built on demand.
+
+    Each index maps the values of one key, or of a tuple of keys, to the positions of the
+    objects holding them. It is built on the first lookup by that key and reused by the next
+    ones, so looking up m objects in a response of n objects costs O(n + m) instead of O(n * m).
+    Lookups fall back to a linear scan when the key holds unhashable values.
+    """
+
+    def __init__(self, result):
+        self.result = result
+        self.indexes = {}
+
+    def get_index(self, key):
+        """
+        Return the index of 'key', a key name or a tuple of key names, or None when it cannot be built.
+        """
+
+        if key in self.indexes:
+            return self.indexes.get(key)
+
+        index = {}
+        try:
+            for (position, item) in enumerate(self.result):
+                if not isinstance(item, dict):
+                    continue
+                if isinstance(key, tuple):
+                    value = tuple(item.get(name) for name in key)
+                else:
+                    value = item.get(key)
+                index.setdefault(value, []).append(position)
+        except TypeError:
+            index = None
+
+        self.indexes[key] = index
+        return index
+
+    def get(self, key, value):
+        """
+        Same lookup as get_dict_result(result, key, value), through the index of 'key'.
+
+        The first object whose 'key' equals 'value' or is not set is returned, None when there is none.
+        """
+
+        if not isinstance(self.result, list):
+            return get_dict_result(self.result, key, value)
+
+        index = self.get_index(key)
+        try:
+            positions = index.get(value, [])[:1] + index.get(None, [])[:1]
+        except (AttributeError, TypeError):
+            return get_dict_result(self.result, key, value)
+
+        if not positions:
+            return None
+
+        return self.result[min(positions)]
+
+    def find_all(self, keys, values):
+        """
+        Return the objects whose 'keys' equal 'values', in the order of the response.
+
+        Args:
+            keys (tuple): Names of the keys to match, e.g. ("description", "username").
+            values (tuple): Values of the keys, in the same order.
+        Returns:
+            list: The matching objects, empty when none matches.
+        """
+
+        if not isinstance(self.result, list):
+            return []
+
+        index = self.get_index(tuple(keys))
+        try:
+            positions = index.get(tuple(values), [])
+        except (AttributeError, TypeError):
+            return [item for item in self.result if isinstance(item, dict)
+                    and all(item.get(key) == value for (key, value) in zip(keys, values))]
+
+        return [self.result[position] for position in positions]
+
+
+class SiteTree(object):
+    """
+    The site hierarchy of Cisco Catalyst Center, indexed by name hierarchy, id, type and parent.
+
+    It is built from the sites returned by 'sites/get_site', every site keeping the details the API
+    returned for it, so looking up a site or walking its ancestors and descendants needs no request.
+    Name hierarchies are matched exactly first and case-insensitively next, as the API does.
+    """
+
+    def __init__(self, sites=None):
+        self.sites = {}
+        self.names = {}
+        self.lower_names = {}
+        self.children = {}
+        for site in sites or []:
+            self.add(site)
+
+    def __len__(self):
+        return len(self.sites)
+
+    @staticmethod
+    def site_type(site):
+        """
+        Return the type of a site (area, building or floor) from its 'Location' additional info, None when unset.
+        """
+
+        for info in site.get("additionalInfo") or []:
+            if info.get("nameSpace") == "Location":
+                return (info.get("attributes") or {}).get("type")
+
+        return None
+
+    def add(self, site):
+        """
+        Add a site to the tree, replacing the site with the same id if there is one.
+        """
+
+        site_id = site.get("id")
+        if site_id in self.sites:
+            self.unindex(self.sites[site_id])
+
+        self.sites[site_id] = site
+        name = site.get("siteNameHierarchy")
+        if name:
+            self.names[name] = site_id
+            self.lower_names.setdefault(name.lower(), site_id)
+        self.children.setdefault(site.get("parentId"), [])
+        if site_id not in self.children[site.get("parentId")]:
+            self.children[site.get("parentId")].append(site_id)
+
+    def unindex(self, site):
+        """
+        Drop a site from the name and parent indexes.
+        """
+
+        name = site.get("siteNameHierarchy")
+        if name:
+            self.names.pop(name, None)
+            if self.lower_names.get(name.lower()) == site.get("id"):
+                self.lower_names.pop(name.lower())
+        siblings = self.children.get(site.get("parentId"), [])
+        if site.get("id") in siblings:
+            siblings.remove(site.get("id"))
+
+    def remove(self, site_id):
+        """
+        Remove a site and all its descendants from the tree, returning the removed sites.
+        """
+
+        site = self.sites.get(site_id)
+        if site is None:
+            return []
+
+        removed = [site] + self.get_descendants(site_id)
+        for item in removed:
+            self.unindex(item)
+            self.sites.pop(item.get("id"), None)
+            self.children.pop(item.get("id"), None)
+
+        return removed
+
+    def get(self, name):
+        """
+        Return the site whose name hierarchy is 'name', for example 'Global/USA/San Jose/BLD23', None when absent.
+        """
+
+        if not name:
+            return None
+
+        site_id = self.names.get(name)
+        if site_id is None:
+            site_id = self.lower_names.get(name.lower())
+
+        return self.sites.get(site_id)
+
+    def get_by_id(self, site_id):
+        """
+        Return the site with the given id, None when absent.
+        """
+
+        return self.sites.get(site_id)
+
+    def get_id(self, name):
+        """
+        Return the id of the site whose name hierarchy is 'name', None when absent.
+        """
+
+        site = self.get(name)
+        return site.get("id") if site else None
+
+    def get_type(self, name):
+        """
+        Return the type of the site whose name hierarchy is 'name', None when absent.
+        """
+
+        site = self.get(name)
+        return self.site_type(site) if site else None
+
+    def get_parent(self, site_id):
+        """
+        Return the parent of a site, None for the root or an unknown site.
+        """
+
+        site = self.sites.get(site_id)
+        return self.sites.get(site.get("parentId")) if site else None
+
+    def get_children(self, site_id):
+        """
+        Return the direct children of a site.
+        """
+
+        return [self.sites[child_id] for child_id in self.children.get(site_id, []) if child_id in self.sites]
+
+    def get_ancestors(self, site_id):
+        """
+        Return the ancestors of a site, from its parent up to the root of the hierarchy.
+        """
+
+        ancestors = []
+        seen = set([site_id])
+        parent = self.get_parent(site_id)
+        while parent is not None and parent.get("id") not in seen:
+            ancestors.append(parent)
+            seen.add(parent.get("id"))
+            parent = self.get_parent(parent.get("id"))
+
+        return ancestors
+
+    def get_descendants(self, site_id):
+        """
+        Return the descendants of a site level by level, so that every site comes after its parent.
+        Reverse the list to visit the deepest sites first, e.g. to delete a subtree.
+        """
+
+        descendants = []
+        seen = set([site_id])
+        level = [site_id]
+        while level:
+            next_level = []
+            for parent_id in level:
+                for child in self.get_children(parent_id):
+                    if child.get("id") not in seen:
+                        seen.add(child.get("id"))
+                        descendants.append(child)
+                        next_level.append(child.get("id"))
+            level = next_level
+
+        return descendants
+
+    def find_by_type(self, site_type):
+        """
+        Return every site of the given type (area, building or floor).
+        """
+
+        return [site for site in self.sites.values() if self.site_type(site) == site_type]
+
+
 def dnac_argument_spec():
     argument_spec = dict(
         dnac_host=dict(type="str", required=True),
@@ -549,6 +1554,27 @@ def dnac_argument_spec():
         dnac_debug=dict(type="bool", default=False),
         validate_response_schema=dict(type="bool", default=True),
     )
+    argument_spec.update(dnac_intent_argument_spec())
+    return argument_spec
+
+
+def dnac_intent_argument_spec():
+    """
+    Return the options of the intent modules tuning the task polling, the HTTP session and the request rate.
+    The modules merge them into their own argument spec, documented by the intent_params doc fragment.
+    """
+
+    argument_spec = dict(
+        dnac_task_timeout=dict(type="int"),
+        dnac_poll_interval=dict(type="int", default=DNAC_POLL_INTERVAL),
+        dnac_token_cache=dict(type="bool", default=False),
+        dnac_pool_maxsize=dict(type="int", default=10),
+        dnac_timeout=dict(type="int", default=60),
+        dnac_max_retries=dict(type="int", default=3),
+        dnac_retry_backoff=dict(type="float", default=1.0),
+        dnac_api_rate_limit=dict(type="float"),
+        dnac_api_family_rate_limits=dict(type="dict"),
+    )
     return argument_spec
 
 
@@ -787,6 +1813,12 @@ class DNACSDK(object):
     def __init__(self, params):
         self.result = dict(changed=False, result="")
         self.validate_response_schema = params.get("validate_response_schema")
+        self.rate_limiter = RateLimiter(
+            params.get("dnac_host"),
+            params.get("dnac_port"),
+            rate=params.get("dnac_api_rate_limit"),
+            family_rates=params.get("dnac_api_family_rate_limits"),
+        )
         if DNAC_SDK_IS_INSTALLED:
             self.api = api.DNACenterAPI(
                 username=params.get("dnac_username"),
@@ -797,7 +1829,21 @@ class DNACSDK(object):
                 version=params.get("dnac_version"),
                 verify=params.get("dnac_verify"),
                 debug=params.get("dnac_debug"),
+                single_request_timeout=params.get("dnac_timeout"),
+                session=build_requests_session(
+                    pool_maxsize=params.get("dnac_pool_maxsize"),
+                    max_retries=params.get("dnac_max_retries"),
+                    retry_backoff=params.get("dnac_retry_backoff"),
+                ),
             )
+            if params.get("dnac_token_cache"):
+                enable_token_cache(self.api, TokenCache(
+                    params.get("dnac_host"),
+                    params.get("dnac_port"),
+                    params.get("dnac_username"),
+                    params.get("dnac_password"),
+                    params.get("dnac_version"),
+                ))
             if params.get("dnac_debug") and LOGGING_IN_STANDARD:
                 logging.getLogger('dnacentersdk').addHandler(logging.StreamHandler())
         else:
@@ -840,12 +1886,17 @@ class DNACSDK(object):
         return os.path.basename(file_path)
 
     def _exec(self, family, function, params=None, op_modifies=False, **kwargs):
+        family_name = family
         try:
             family = getattr(self.api, family)
             func = getattr(family, function)
         except Exception as e:
             self.fail_json(msg=e)
 
+        if self.rate_limiter.enabled():
+            self.rate_limiter.acquire(family_name)
+
+        uploads = []
         try:
             if params:
                 file_paths_params = kwargs.get('file_paths', [])
@@ -854,9 +1905,9 @@ class DNACSDK(object):
                     multipart_fields = {}
                     for (key, value) in file_paths_params:
                         if isinstance(params.get(key), str) and self.is_file(params[key]):
-                            file_name = self.extract_file_name(params[key])
-                            file_path = params[key]
-                            multipart_fields[value] = (file_name, open(file_path, 'rb'))
+                            upload = UploadFile(params[key])
+                            uploads.append(upload)
+                            multipart_fields[value] = (upload.file_name, upload)
 
                     params.setdefault("multipart_fields", multipart_fields)
                     params.setdefault("multipart_monitor_callback", None)
@@ -868,12 +1919,17 @@ class DNACSDK(object):
             else:
                 response = func()
         except exceptions.dnacentersdkException as e:
-            self.fail_json(
-                msg=(
-                    "An error occured when executing operation."
-                    " The error was: {error}"
-                ).format(error=to_native(e))
-            )
+            msg = (
+                "An error occured when executing operation."
+                " The error was: {error}"
+            ).format(error=to_native(e))
+            # The SDK wraps the socket and requests errors, they leave the request unanswered
+            if isinstance(getattr(e, "__context__", None), (IOError, OSError)):
+                raise DnacConnectionError(msg)
+            self.fail_json(msg=msg)
+        finally:
+            for upload in uploads:
+                upload.close()
         return response
 
     def fail_json(self, msg, **kwargs):
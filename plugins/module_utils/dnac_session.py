@@ -0,0 +1,420 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2024, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Helpers shared by the DNACSDK wrappers of the action plugins and the intent modules."""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import base64
+import errno
+import hashlib
+import json
+import os
+import tempfile
+import time
+import weakref
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    HTTPAdapter = object
+    REQUESTS_IS_INSTALLED = False
+else:
+    REQUESTS_IS_INSTALLED = True
+try:
+    import fcntl
+except ImportError:
+    HAS_FCNTL = False
+else:
+    HAS_FCNTL = True
+
+# Location of the token cache shared by every task and host of a run
+DNAC_TOKEN_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".ansible", "cisco_dnac_tokens.json")
+# Lifetime assumed for tokens whose expiry cannot be read, Catalyst Center tokens are valid for one hour
+DNAC_TOKEN_LIFETIME = 3600
+# Cached tokens are not handed out during the last seconds of their lifetime
+DNAC_TOKEN_EXPIRY_MARGIN = 60
+# Responses retried by the HTTP session, Catalyst Center answers them when it throttles or is busy
+DNAC_RETRY_STATUS_CODES = (429, 503)
+# Directory holding the request budget shared by the processes of a run, one file per Catalyst Center
+DNAC_RATE_LIMIT_DIR = os.path.join(os.path.expanduser("~"), ".ansible", "tmp")
+# Largest read of an uploaded file, bounds the memory used by multipart uploads
+DNAC_UPLOAD_CHUNK_SIZE = 1024 * 1024
+# Seconds between two progress messages of an upload
+DNAC_UPLOAD_PROGRESS_INTERVAL = 10
+# Suffix of the sidecar file caching the checksums of a local file next to it
+DNAC_CHECKSUM_SIDECAR_SUFFIX = ".dnac_checksums.json"
+
+
+def get_token_expiry(token):
+    """
+    Return the expiry time of a Catalyst Center token as a Unix timestamp.
+
+    The token is a JWT, its 'exp' claim is used when it can be decoded, otherwise the token
+    is assumed to be valid for DNAC_TOKEN_LIFETIME seconds from now.
+    """
+
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload.encode("ascii")))["exp"])
+    except Exception:
+        return time.time() + DNAC_TOKEN_LIFETIME
+
+
+class CachedToken(object):
+    """Stand-in for the SDK authentication response, only 'Token' is read from it."""
+
+    def __init__(self, token):
+        self.Token = token
+
+
+class TokenCache(object):
+    """
+    Catalyst Center tokens persisted in a file readable only by its owner.
+
+    Entries are keyed by a digest of the host, port, username, password and API version, so
+    the credentials themselves are never written, and a token is only reused by tasks that
+    would have been issued the same token.
+    """
+
+    def __init__(self, host, port, username, password, version, path=None):
+        self.path = path or DNAC_TOKEN_CACHE_PATH
+        identity = json.dumps([host, str(port), username, password, version])
+        self.key = hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def load(self):
+        try:
+            with open(self.path) as cache_file:
+                entries = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return {}
+
+        return entries if isinstance(entries, dict) else {}
+
+    def save(self, entries):
+        directory = os.path.dirname(self.path)
+        try:
+            if not os.path.isdir(directory):
+                os.makedirs(directory, 0o700)
+            # mkstemp creates the file with 0600 permissions, the rename keeps concurrent readers consistent
+            (handle, temp_path) = tempfile.mkstemp(dir=directory, prefix=".dnac_tokens")
+            with os.fdopen(handle, "w") as cache_file:
+                json.dump(entries, cache_file)
+            os.rename(temp_path, self.path)
+        except (IOError, OSError):
+            # The cache only saves authentication requests, failing to write it is not an error
+            pass
+
+    def get(self):
+        """Return the cached token when it is still valid, None otherwise."""
+
+        entry = self.load().get(self.key)
+        if entry and entry.get("expires", 0) - DNAC_TOKEN_EXPIRY_MARGIN > time.time():
+            return entry.get("token")
+
+        return None
+
+    def set(self, token):
+        now = time.time()
+        entries = dict(
+            (key, entry) for (key, entry) in self.load().items()
+            if isinstance(entry, dict) and entry.get("expires", 0) > now
+        )
+        entries[self.key] = {"token": token, "expires": get_token_expiry(token)}
+        self.save(entries)
+
+
+def enable_token_cache(dnac_api, token_cache):
+    """
+    Make a DNACenterAPI instance authenticate through a TokenCache.
+
+    The first authentication of the session is served from the cache when it holds a valid token.
+    Any later authentication, which the SDK performs when Catalyst Center rejects the token, asks
+    Catalyst Center for a new token, and every token obtained that way is written to the cache.
+    """
+
+    authentication_api = dnac_api.authentication.authentication_api
+    state = {"use_cache": True}
+
+    def cached_authentication_api(*args, **kwargs):
+        if state.pop("use_cache", False):
+            token = token_cache.get()
+            if token:
+                return CachedToken(token)
+
+        response = authentication_api(*args, **kwargs)
+        token_cache.set(response.Token)
+        return response
+
+    dnac_api.authentication.authentication_api = cached_authentication_api
+
+
+class StreamOnceHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter sending a streamed request body, e.g. a multipart upload, at most once.
+
+    A streamed body cannot be rewound, so it is sent through an adapter without status retries, and
+    a request reusing a body that was already sent, as the SDK does after a connection error, fails
+    instead of sending what is left of the body. The caller has to build a new body to try again.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(StreamOnceHTTPAdapter, self).__init__(*args, **kwargs)
+        self.stream_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=kwargs.get("pool_maxsize", 10))
+        self.sent_bodies = weakref.WeakSet()
+
+    def send(self, request, **kwargs):
+        if not hasattr(request.body, "read"):
+            return super(StreamOnceHTTPAdapter, self).send(request, **kwargs)
+
+        if request.body in self.sent_bodies:
+            raise requests.exceptions.RequestException(
+                "The streamed body of {0} {1} was already sent, it is not sent again".format(request.method, request.url),
+                request=request)
+        self.sent_bodies.add(request.body)
+        return self.stream_adapter.send(request, **kwargs)
+
+    def close(self):
+        super(StreamOnceHTTPAdapter, self).close()
+        self.stream_adapter.close()
+
+
+def build_requests_session(pool_maxsize=None, max_retries=None, retry_backoff=None):
+    """
+    Build the requests session handed to DNACenterAPI.
+
+    The HTTPS adapter keeps up to 'pool_maxsize' connections alive per host, so parallel waits and
+    bulk lookups reuse warm connections, and retries requests answered with 429 or 503 up to
+    'max_retries' times. The wait between attempts honors the 'Retry-After' header and otherwise
+    grows exponentially from 'retry_backoff' seconds. Streamed uploads are sent only once, see
+    StreamOnceHTTPAdapter. Returns None when requests is not available,
+    letting the SDK build its default session.
+    """
+
+    if not REQUESTS_IS_INSTALLED:
+        return None
+
+    retry_params = dict(
+        total=max_retries or 0,
+        connect=0,
+        read=0,
+        status=max_retries or 0,
+        status_forcelist=DNAC_RETRY_STATUS_CODES,
+        backoff_factor=retry_backoff or 0,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    try:
+        # Catalyst Center did not process throttled requests, so every method can be retried
+        retry = Retry(allowed_methods=None, **retry_params)
+    except TypeError:
+        # urllib3 < 1.26
+        retry = Retry(method_whitelist=None, **retry_params)
+
+    adapter = StreamOnceHTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize or 10, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+class RateLimiter(object):
+    """
+    Token buckets limiting the requests sent to one Catalyst Center.
+
+    Every request takes a token from the bucket shared by all API families, refilled at 'rate' requests
+    per second, and from the bucket of its family when 'family_rates' has one. A bucket holds at most
+    one second worth of tokens, which is the largest burst allowed. The buckets live in a file locked
+    while they are updated, so the forked workers of a run share the same budget and their aggregate
+    load stays under the configured rates. Without fcntl the buckets are only shared within the process.
+    """
+
+    def __init__(self, host, port, rate=None, family_rates=None, path=None):
+        self.rates = dict((family, float(family_rate)) for (family, family_rate) in (family_rates or {}).items()
+                          if family_rate)
+        if rate:
+            self.rates[None] = float(rate)
+        file_name = "cisco_dnac_rate_{0}.json".format(hashlib.sha256("{0}:{1}".format(host, port).encode("utf-8")).hexdigest()[:16])
+        self.path = path or os.path.join(DNAC_RATE_LIMIT_DIR, file_name)
+        self.buckets = {}
+
+    def enabled(self):
+        return bool(self.rates)
+
+    def take(self, buckets, families, now):
+        """Take a token from the buckets of 'families', or return the seconds to wait before one is available."""
+
+        wait = 0
+        for family in families:
+            rate = self.rates[family]
+            (tokens, updated) = buckets.get(str(family), (max(rate, 1), now))
+            tokens = min(max(rate, 1), tokens + (now - updated) * rate)
+            buckets[str(family)] = (tokens, now)
+            if tokens < 1:
+                wait = max(wait, (1 - tokens) / rate)
+
+        if wait:
+            return wait
+
+        for family in families:
+            (tokens, updated) = buckets[str(family)]
+            buckets[str(family)] = (tokens - 1, updated)
+
+        return 0
+
+    def take_shared(self, families, now):
+        try:
+            directory = os.path.dirname(self.path)
+            if not os.path.isdir(directory):
+                os.makedirs(directory, 0o700)
+            handle = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        except OSError as e:
+            if e.errno not in (errno.EACCES, errno.EPERM, errno.EROFS, errno.ENOENT):
+                raise
+            return self.take(self.buckets, families, now)
+
+        with os.fdopen(handle, "r+") as state_file:
+            fcntl.flock(state_file, fcntl.LOCK_EX)
+            try:
+                buckets = json.loads(state_file.read() or "{}")
+            except ValueError:
+                buckets = {}
+            wait = self.take(buckets, families, now)
+            state_file.seek(0)
+            state_file.truncate()
+            json.dump(buckets, state_file)
+
+        return wait
+
+    def acquire(self, family):
+        """Block until a request of the API 'family' fits in the configured rates."""
+
+        families = [bucket for bucket in (None, family) if bucket in self.rates]
+        if not families:
+            return
+
+        while True:
+            if HAS_FCNTL:
+                wait = self.take_shared(families, time.time())
+            else:
+                wait = self.take(self.buckets, families, time.time())
+            if not wait:
+                return
+            time.sleep(wait)
+
+
+class UploadFile(object):
+    """
+    File object streamed by the multipart encoder of the SDK.
+
+    Reads are capped to 'chunk_size' bytes, so an upload never holds more than one chunk of the
+    file in memory whatever its size. The SHA-256 of the file is computed from the chunks as they
+    are sent, so the file is read only once, and 'callback', when given, is called with the
+    UploadFile after every chunk to report the progress.
+    """
+
+    def __init__(self, file_path, chunk_size=DNAC_UPLOAD_CHUNK_SIZE, callback=None):
+        self.file_path = file_path
+        self.file_name = os.path.basename(file_path)
+        self.size = os.path.getsize(file_path)
+        self.chunk_size = chunk_size
+        self.callback = callback
+        self.bytes_read = 0
+        self.digest = hashlib.sha256()
+        self.started = time.time()
+        # Time of the last progress report
+        self.reported = self.started
+        self.file = open(file_path, "rb")
+
+    @property
+    def len(self):
+        # Bytes left to send, read by the multipart encoder to compute the Content-Length
+        return self.size - self.bytes_read
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self.chunk_size:
+            size = self.chunk_size
+        chunk = self.file.read(size)
+        self.bytes_read += len(chunk)
+        self.digest.update(chunk)
+        if self.callback:
+            self.callback(self)
+        return chunk
+
+    def close(self):
+        self.file.close()
+
+    def elapsed(self):
+        return time.time() - self.started
+
+    def throughput(self):
+        """Return the average upload rate in bytes per second."""
+
+        elapsed = self.elapsed()
+        return self.bytes_read / elapsed if elapsed > 0 else 0
+
+    def summary(self):
+        """Return the upload details reported in the task result."""
+
+        summary = dict(
+            file_name=self.file_name,
+            size=self.size,
+            bytes_sent=self.bytes_read,
+            seconds=round(self.elapsed(), 3),
+            throughput=int(self.throughput()),
+        )
+        if self.bytes_read == self.size:
+            summary["sha256"] = self.digest.hexdigest()
+        return summary
+
+
+def get_file_checksums(file_path, chunk_size=DNAC_UPLOAD_CHUNK_SIZE):
+    """
+    Return the MD5 and SHA-512 checksums of a file, the digests Catalyst Center keeps for its images.
+
+    Both digests are computed in a single read of the file, one chunk at a time. They are cached in
+    a sidecar file next to it, keyed by the path, size and modification time of the file, so an
+    unchanged file is only read once across runs. MD5 is left out where it is not available, e.g.
+    on FIPS enabled systems.
+    """
+
+    stat = os.stat(file_path)
+    key = {"path": os.path.abspath(file_path), "size": stat.st_size, "mtime": stat.st_mtime}
+    sidecar_path = file_path + DNAC_CHECKSUM_SIDECAR_SUFFIX
+    try:
+        with open(sidecar_path) as sidecar_file:
+            cached = json.load(sidecar_file)
+        if isinstance(cached, dict) and cached.get("checksums") and all(cached.get(name) == value for (name, value) in key.items()):
+            return cached.get("checksums")
+    except (IOError, OSError, ValueError):
+        pass
+
+    digests = {"sha512": hashlib.sha512()}
+    try:
+        digests["md5"] = hashlib.md5()
+    except ValueError:
+        pass
+    with open(file_path, "rb") as image_file:
+        for chunk in iter(lambda: image_file.read(chunk_size), b""):
+            for digest in digests.values():
+                digest.update(chunk)
+    checksums = dict((name, digest.hexdigest()) for (name, digest) in digests.items())
+
+    key["checksums"] = checksums
+    try:
+        (handle, temp_path) = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(file_path)), prefix=".dnac_checksums")
+        with os.fdopen(handle, "w") as sidecar_file:
+            json.dump(key, sidecar_file)
+        os.rename(temp_path, sidecar_path)
+    except (IOError, OSError):
+        # The sidecar only saves reading the file again, failing to write it is not an error
+        pass
+
+    return checksums
@@ -11,3 +11,17 @@ class AnsibleDNACException(Exception):
 class InconsistentParameters(AnsibleDNACException):
     """Provided parameters are not consistent."""
     pass
+
+
+class DnacLookupError(AnsibleDNACException):
+    """A read of the current state found nothing usable, the module fails with 'msg' and 'response'."""
+
+    def __init__(self, msg, response=None):
+        super(DnacLookupError, self).__init__(msg)
+        self.msg = msg
+        self.response = response
+
+
+class DnacConnectionError(AnsibleDNACException):
+    """The request did not reach Catalyst Center or was cut short, it may be sent again."""
+    pass
@@ -706,7 +706,8 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
     validate_list_of_dicts,
-    get_dict_result,
+    IndexedResult,
+    dnac_intent_argument_spec,
 )
 
 
@@ -865,38 +866,39 @@ class DnacCredential(DnacBase):
         self.status = "success"
         return self
 
-    def get_site_id(self, site_name):
+    def get_all_global_credentials(self):
         """
-        Get the site id from the site name.
-        Use check_return_status() to check for failure
+        Read all the Global Device Credentials from Cisco DNA Center.
 
         Parameters:
-            site_name (str) - Site name
+            self - The current object details.
 
         Returns:
-            str or None - The Site Id if found, or None if not found or error
+            response (dict) - The response of 'get_all_global_credentials_v2'.
         """
 
-        try:
-            response = self.dnac._exec(
-                family="sites",
-                function='get_site',
-                params={"name": site_name},
-            )
-            self.log("Received API response from 'get_site': {0}".format(response), "DEBUG")
-            if not response:
-                self.log("Failed to retrieve the site ID for the site name: {0}"
-                         .format(site_name), "ERROR")
-                return None
-
-            _id = response.get("response")[0].get("id")
-            self.log("Site ID for the site name {0}: {1}".format(site_name, _id), "INFO")
-        except Exception as exec:
-            self.log("Exception occurred while getting site_id from the site_name: {0}"
-                     .format(exec), "CRITICAL")
-            return None
+        return self.dnac._exec(
+            family="discovery",
+            function='get_all_global_credentials_v2',
+        )
 
-        return _id
+    def get_plan_lookups(self, config):
+        """
+        Declare the reads of get_have and get_want for one playbook entry.
+
+        Parameters:
+            config (dict) - Playbook details containing Global Device
+            Credentials configurations and Device Credentials should
+            be assigned to a site.
+
+        Returns:
+            lookups (list) - The global device credentials, which all the entries share.
+        """
+
+        if config.get("global_credential_details") is None and not config.get("assign_credentials_to_site"):
+            return []
+
+        return [(("global_credentials",), lambda results: self.get_all_global_credentials())]
 
     def get_global_credentials_params(self):
         """
@@ -910,10 +912,7 @@ class DnacCredential(DnacBase):
         """
 
         try:
-            global_credentials = self.dnac._exec(
-                family="discovery",
-                function='get_all_global_credentials_v2',
-            )
+            global_credentials = self.get_planned(("global_credentials",), self.get_all_global_credentials)
             global_credentials = global_credentials.get("response")
             self.log("All global device credentials details: {0}"
                      .format(global_credentials), "DEBUG")
@@ -1108,6 +1107,7 @@ class DnacCredential(DnacBase):
         all_CLI = CredentialDetails.get("cli_credential")
         # All CLI details from Cisco DNA Center
         cli_details = global_credentials.get("cliCredential")
+        cli_index = IndexedResult(cli_details)
         # Cisco DNA Center details for the CLI Credential given in the playbook
         cliDetails = []
         if all_CLI and cli_details:
@@ -1115,7 +1115,7 @@ class DnacCredential(DnacBase):
                 cliDetail = None
                 cliId = cliCredential.get("id")
                 if cliId:
-                    cliDetail = get_dict_result(cli_details, "id", cliId)
+                    cliDetail = cli_index.get("id", cliId)
                     if not cliDetail:
                         self.msg = "CLI credential ID is invalid"
                         self.status = "failed"
@@ -1124,15 +1124,14 @@ class DnacCredential(DnacBase):
                 cliOldDescription = cliCredential.get("old_description")
                 cliOldUsername = cliCredential.get("old_username")
                 if cliOldDescription and cliOldUsername and (not cliDetail):
-                    for item in cli_details:
-                        if item.get("description") == cliOldDescription \
-                                and item.get("username") == cliOldUsername:
-                            if cliDetail:
-                                self.msg = "More than one CLI credential with same \
+                    matching_items = cli_index.find_all(("description", "username"), (cliOldDescription, cliOldUsername))
+                    if len(matching_items) > 1:
+                        self.msg = "More than one CLI credential with same \
                                             old_description and old_username. Pass ID."
-                                self.status = "failed"
-                                return self
-                            cliDetail = item
+                        self.status = "failed"
+                        return self
+                    if matching_items:
+                        cliDetail = matching_items[0]
                     if not cliDetail:
                         self.msg = "CLI credential old_description or old_username is invalid"
                         self.status = "failed"
@@ -1141,15 +1140,14 @@ class DnacCredential(DnacBase):
                 cliDescription = cliCredential.get("description")
                 cliUsername = cliCredential.get("username")
                 if cliDescription and cliUsername and (not cliDetail):
-                    for item in cli_details:
-                        if item.get("description") == cliDescription \
-                                and item.get("username") == cliUsername:
-                            if cliDetail:
-                                self.msg = "More than one CLI Credential with same \
+                    matching_items = cli_index.find_all(("description", "username"), (cliDescription, cliUsername))
+                    if len(matching_items) > 1:
+                        self.msg = "More than one CLI Credential with same \
                                             description and username. Pass ID."
-                                self.status = "failed"
-                                return self
-                            cliDetail = item
+                        self.status = "failed"
+                        return self
+                    if matching_items:
+                        cliDetail = matching_items[0]
                 cliDetails.append(cliDetail)
         return cliDetails
 
@@ -1171,6 +1169,7 @@ class DnacCredential(DnacBase):
         all_snmpV2cRead = CredentialDetails.get("snmp_v2c_read")
         # All snmpV2cRead details from the Cisco DNA Center
         snmpV2cRead_details = global_credentials.get("snmpV2cRead")
+        snmpV2cRead_index = IndexedResult(snmpV2cRead_details)
         # Cisco DNA Center details for the snmpV2cRead Credential given in the playbook
         snmpV2cReadDetails = []
         if all_snmpV2cRead and snmpV2cRead_details:
@@ -1178,7 +1177,7 @@ class DnacCredential(DnacBase):
                 snmpV2cReadDetail = None
                 snmpV2cReadId = snmpV2cReadCredential.get("id")
                 if snmpV2cReadId:
-                    snmpV2cReadDetail = get_dict_result(snmpV2cRead_details, "id", snmpV2cReadId)
+                    snmpV2cReadDetail = snmpV2cRead_index.get("id", snmpV2cReadId)
                     if not snmpV2cReadDetail:
                         self.msg = "snmpV2cRead credential ID is invalid"
                         self.status = "failed"
@@ -1186,8 +1185,7 @@ class DnacCredential(DnacBase):
 
                 snmpV2cReadOldDescription = snmpV2cReadCredential.get("old_description")
                 if snmpV2cReadOldDescription and (not snmpV2cReadDetail):
-                    snmpV2cReadDetail = get_dict_result(
-                        snmpV2cRead_details,
+                    snmpV2cReadDetail = snmpV2cRead_index.get(
                         "description",
                         snmpV2cReadOldDescription
                     )
@@ -1198,8 +1196,7 @@ class DnacCredential(DnacBase):
 
                 snmpV2cReadDescription = snmpV2cReadCredential.get("description")
                 if snmpV2cReadDescription and (not snmpV2cReadDetail):
-                    snmpV2cReadDetail = get_dict_result(
-                        snmpV2cRead_details,
+                    snmpV2cReadDetail = snmpV2cRead_index.get(
                         "description",
                         snmpV2cReadDescription
                     )
@@ -1224,6 +1221,7 @@ class DnacCredential(DnacBase):
         all_snmpV2cWrite = CredentialDetails.get("snmp_v2c_write")
         # All snmpV2cWrite details from the Cisco DNA Center
         snmpV2cWrite_details = global_credentials.get("snmpV2cWrite")
+        snmpV2cWrite_index = IndexedResult(snmpV2cWrite_details)
         # Cisco DNA Center details for the snmpV2cWrite Credential given in the playbook
         snmpV2cWriteDetails = []
         if all_snmpV2cWrite and snmpV2cWrite_details:
@@ -1231,7 +1229,7 @@ class DnacCredential(DnacBase):
                 snmpV2cWriteDetail = None
                 snmpV2cWriteId = snmpV2cWriteCredential.get("id")
                 if snmpV2cWriteId:
-                    snmpV2cWriteDetail = get_dict_result(snmpV2cWrite_details, "id", snmpV2cWriteId)
+                    snmpV2cWriteDetail = snmpV2cWrite_index.get("id", snmpV2cWriteId)
                     if not snmpV2cWriteDetail:
                         self.msg = "snmpV2cWrite credential ID is invalid"
                         self.status = "failed"
@@ -1239,8 +1237,7 @@ class DnacCredential(DnacBase):
 
                 snmpV2cWriteOldDescription = snmpV2cWriteCredential.get("old_description")
                 if snmpV2cWriteOldDescription and (not snmpV2cWriteDetail):
-                    snmpV2cWriteDetail = get_dict_result(
-                        snmpV2cWrite_details,
+                    snmpV2cWriteDetail = snmpV2cWrite_index.get(
                         "description",
                         snmpV2cWriteOldDescription
                     )
@@ -1251,8 +1248,7 @@ class DnacCredential(DnacBase):
 
                 snmpV2cWriteDescription = snmpV2cWriteCredential.get("description")
                 if snmpV2cWriteDescription and (not snmpV2cWriteDetail):
-                    snmpV2cWriteDetail = get_dict_result(
-                        snmpV2cWrite_details,
+                    snmpV2cWriteDetail = snmpV2cWrite_index.get(
                         "description",
                         snmpV2cWriteDescription
                     )
@@ -1277,6 +1273,7 @@ class DnacCredential(DnacBase):
         all_httpsRead = CredentialDetails.get("https_read")
         # All httpsRead details from the Cisco DNA Center
         httpsRead_details = global_credentials.get("httpsRead")
+        httpsRead_index = IndexedResult(httpsRead_details)
         # Cisco DNA Center details for the httpsRead Credential given in the playbook
         httpsReadDetails = []
         if all_httpsRead and httpsRead_details:
@@ -1284,7 +1281,7 @@ class DnacCredential(DnacBase):
                 httpsReadDetail = None
                 httpsReadId = httpsReadCredential.get("id")
                 if httpsReadId:
-                    httpsReadDetail = get_dict_result(httpsRead_details, "id", httpsReadId)
+                    httpsReadDetail = httpsRead_index.get("id", httpsReadId)
                     if not httpsReadDetail:
                         self.msg = "httpsRead credential Id is invalid"
                         self.status = "failed"
@@ -1293,15 +1290,14 @@ class DnacCredential(DnacBase):
                 httpsReadOldDescription = httpsReadCredential.get("old_description")
                 httpsReadOldUsername = httpsReadCredential.get("old_username")
                 if httpsReadOldDescription and httpsReadOldUsername and (not httpsReadDetail):
-                    for item in httpsRead_details:
-                        if item.get("description") == httpsReadOldDescription \
-                                and item.get("username") == httpsReadOldUsername:
-                            if httpsReadDetail:
-                                self.msg = "More than one httpsRead credential with same \
+                    matching_items = httpsRead_index.find_all(("description", "username"), (httpsReadOldDescription, httpsReadOldUsername))
+                    if len(matching_items) > 1:
+                        self.msg = "More than one httpsRead credential with same \
                                             old_description and old_username. Pass ID."
-                                self.status = "failed"
-                                return self
-                            httpsReadDetail = item
+                        self.status = "failed"
+                        return self
+                    if matching_items:
+                        httpsReadDetail = matching_items[0]
                     if not httpsReadDetail:
                         self.msg = "httpsRead credential old_description or old_username is invalid"
                         self.status = "failed"
@@ -1310,15 +1306,14 @@ class DnacCredential(DnacBase):
                 httpsReadDescription = httpsReadCredential.get("description")
                 httpsReadUsername = httpsReadCredential.get("username")
                 if httpsReadDescription and httpsReadUsername and (not httpsReadDetail):
-                    for item in httpsRead_details:
-                        if item.get("description") == httpsReadDescription \
-                                and item.get("username") == httpsReadUsername:
-                            if httpsReadDetail:
-                                self.msg = "More than one httpsRead credential with same \
+                    matching_items = httpsRead_index.find_all(("description", "username"), (httpsReadDescription, httpsReadUsername))
+                    if len(matching_items) > 1:
+                        self.msg = "More than one httpsRead credential with same \
                                             description and username. Pass ID."
-                                self.status = "failed"
-                                return self
-                            httpsReadDetail = item
+                        self.status = "failed"
+                        return self
+                    if matching_items:
+                        httpsReadDetail = matching_items[0]
                 httpsReadDetails.append(httpsReadDetail)
         return httpsReadDetails
 
@@ -1340,6 +1335,7 @@ class DnacCredential(DnacBase):
         all_httpsWrite = CredentialDetails.get("https_write")
         # All httpsWrite details from the Cisco DNA Center
         httpsWrite_details = global_credentials.get("httpsWrite")
+        httpsWrite_index = IndexedResult(httpsWrite_details)
         # Cisco DNA Center details for the httpsWrite Credential given in the playbook
         httpsWriteDetails = []
         if all_httpsWrite and httpsWrite_details:
@@ -1347,7 +1343,7 @@ class DnacCredential(DnacBase):
                 httpsWriteDetail = None
                 httpsWriteId = httpsWriteCredential.get("id")
                 if httpsWriteId:
-                    httpsWriteDetail = get_dict_result(httpsWrite_details, "id", httpsWriteId)
+                    httpsWriteDetail = httpsWrite_index.get("id", httpsWriteId)
                     if not httpsWriteDetail:
                         self.msg = "httpsWrite credential Id is invalid"
                         self.status = "failed"
@@ -1356,15 +1352,14 @@ class DnacCredential(DnacBase):
                 httpsWriteOldDescription = httpsWriteCredential.get("old_description")
                 httpsWriteOldUsername = httpsWriteCredential.get("old_username")
                 if httpsWriteOldDescription and httpsWriteOldUsername and (not httpsWriteDetail):
-                    for item in httpsWrite_details:
-                        if item.get("description") == httpsWriteOldDescription \
-                                and item.get("username") == httpsWriteOldUsername:
-                            if httpsWriteDetail:
-                                self.msg = "More than one httpsWrite credential with same \
+                    matching_items = httpsWrite_index.find_all(("description", "username"), (httpsWriteOldDescription, httpsWriteOldUsername))
+                    if len(matching_items) > 1:
+                        self.msg = "More than one httpsWrite credential with same \
                                             old_description and old_username. Pass ID"
-                                self.status = "failed"
-                                return self
-                            httpsWriteDetail = item
+                        self.status = "failed"
+                        return self
+                    if matching_items:
+                        httpsWriteDetail = matching_items[0]
                     if not httpsWriteDetail:
                         self.msg = "httpsWrite credential old_description or \
                                     old_username is invalid"
@@ -1374,10 +1369,9 @@ class DnacCredential(DnacBase):
                 httpsWriteDescription = httpsWriteCredential.get("description")
                 httpsWriteUsername = httpsWriteCredential.get("username")
                 if httpsWriteDescription and httpsWriteUsername and (not httpsWriteDetail):
-                    for item in httpsWrite_details:
-                        if item.get("description") == httpsWriteDescription \
-                                and item.get("username") == httpsWriteUsername:
-                            httpsWriteDetail = item
+                    matching_items = httpsWrite_index.find_all(("description", "username"), (httpsWriteDescription, httpsWriteUsername))
+                    if matching_items:
+                        httpsWriteDetail = matching_items[-1]
                 httpsWriteDetails.append(httpsWriteDetail)
         return httpsWriteDetails
 
@@ -1399,6 +1393,7 @@ class DnacCredential(DnacBase):
         all_snmpV3 = CredentialDetails.get("snmp_v3")
         # All snmpV3 details from the Cisco DNA Center
         snmpV3_details = global_credentials.get("snmpV3")
+        snmpV3_index = IndexedResult(snmpV3_details)
         # Cisco DNA Center details for the snmpV3 Credential given in the playbook
         snmpV3Details = []
         if all_snmpV3 and snmpV3_details:
@@ -1406,7 +1401,7 @@ class DnacCredential(DnacBase):
                 snmpV3Detail = None
                 snmpV3Id = snmpV3Credential.get("id")
                 if snmpV3Id:
-                    snmpV3Detail = get_dict_result(snmpV3_details, "id", snmpV3Id)
+                    snmpV3Detail = snmpV3_index.get("id", snmpV3Id)
                     if not snmpV3Detail:
                         self.msg = "snmpV3 credential id is invalid"
                         self.status = "failed"
@@ -1414,8 +1409,7 @@ class DnacCredential(DnacBase):
 
                 snmpV3OldDescription = snmpV3Credential.get("old_description")
                 if snmpV3OldDescription and (not snmpV3Detail):
-                    snmpV3Detail = get_dict_result(snmpV3_details,
-                                                   "description", snmpV3OldDescription)
+                    snmpV3Detail = snmpV3_index.get("description", snmpV3OldDescription)
                     if not snmpV3Detail:
                         self.msg = "snmpV3 credential old_description is invalid"
                         self.status = "failed"
@@ -1423,7 +1417,7 @@ class DnacCredential(DnacBase):
 
                 snmpV3Description = snmpV3Credential.get("description")
                 if snmpV3Description and (not snmpV3Detail):
-                    snmpV3Detail = get_dict_result(snmpV3_details, "description", snmpV3Description)
+                    snmpV3Detail = snmpV3_index.get("description", snmpV3Description)
                 snmpV3Details.append(snmpV3Detail)
         return snmpV3Details
 
@@ -1975,22 +1969,22 @@ class DnacCredential(DnacBase):
             if cliId or cliDescription and cliUsername:
                 # All CLI details from the Cisco DNA Center
                 cli_details = global_credentials.get("cliCredential")
+                cli_index = IndexedResult(cli_details)
                 if not cli_details:
                     self.msg = "Global CLI credential is not available"
                     self.status = "failed"
                     return self
                 cliDetail = None
                 if cliId:
-                    cliDetail = get_dict_result(cli_details, "id", cliId)
+                    cliDetail = cli_index.get("id", cliId)
                     if not cliDetail:
                         self.msg = "The ID for the CLI credential is not valid."
                         self.status = "failed"
                         return self
                 elif cliDescription and cliUsername:
-                    for item in cli_details:
-                        if item.get("description") == cliDescription and \
-                                item.get("username") == cliUsername:
-                            cliDetail = item
+                    matching_items = cli_index.find_all(("description", "username"), (cliDescription, cliUsername))
+                    if matching_items:
+                        cliDetail = matching_items[-1]
                     if not cliDetail:
                         self.msg = "The username and description of the CLI credential are invalid"
                         self.status = "failed"
@@ -2005,21 +1999,22 @@ class DnacCredential(DnacBase):
 
                 # All snmpV2cRead details from the Cisco DNA Center
                 snmpV2cRead_details = global_credentials.get("snmpV2cRead")
+                snmpV2cRead_index = IndexedResult(snmpV2cRead_details)
                 if not snmpV2cRead_details:
                     self.msg = "Global snmpV2cRead credential is not available"
                     self.status = "failed"
                     return self
                 snmpV2cReadDetail = None
                 if snmpV2cReadId:
-                    snmpV2cReadDetail = get_dict_result(snmpV2cRead_details, "id", snmpV2cReadId)
+                    snmpV2cReadDetail = snmpV2cRead_index.get("id", snmpV2cReadId)
                     if not snmpV2cReadDetail:
                         self.msg = "The ID of the snmpV2cRead credential is not valid."
                         self.status = "failed"
                         return self
                 elif snmpV2cReadDescription:
-                    for item in snmpV2cRead_details:
-                        if item.get("description") == snmpV2cReadDescription:
-                            snmpV2cReadDetail = item
+                    matching_items = snmpV2cRead_index.find_all(("description",), (snmpV2cReadDescription,))
+                    if matching_items:
+                        snmpV2cReadDetail = matching_items[-1]
                     if not snmpV2cReadDetail:
                         self.msg = "The username and description for the snmpV2cRead credential are invalid."
                         self.status = "failed"
@@ -2034,21 +2029,22 @@ class DnacCredential(DnacBase):
 
                 # All snmpV2cWrite details from the Cisco DNA Center
                 snmpV2cWrite_details = global_credentials.get("snmpV2cWrite")
+                snmpV2cWrite_index = IndexedResult(snmpV2cWrite_details)
                 if not snmpV2cWrite_details:
                     self.msg = "Global snmpV2cWrite Credential is not available"
                     self.status = "failed"
                     return self
                 snmpV2cWriteDetail = None
                 if snmpV2cWriteId:
-                    snmpV2cWriteDetail = get_dict_result(snmpV2cWrite_details, "id", snmpV2cWriteId)
+                    snmpV2cWriteDetail = snmpV2cWrite_index.get("id", snmpV2cWriteId)
                     if not snmpV2cWriteDetail:
                         self.msg = "The ID of the snmpV2cWrite credential is invalid."
                         self.status = "failed"
                         return self
                 elif snmpV2cWriteDescription:
-                    for item in snmpV2cWrite_details:
-                        if item.get("description") == snmpV2cWriteDescription:
-                            snmpV2cWriteDetail = item
+                    matching_items = snmpV2cWrite_index.find_all(("description",), (snmpV2cWriteDescription,))
+                    if matching_items:
+                        snmpV2cWriteDetail = matching_items[-1]
                     if not snmpV2cWriteDetail:
                         self.msg = "The username and description of the snmpV2cWrite credential are invalid."
                         self.status = "failed"
@@ -2064,22 +2060,22 @@ class DnacCredential(DnacBase):
 
                 # All httpRead details from the Cisco DNA Center
                 httpRead_details = global_credentials.get("httpsRead")
+                httpRead_index = IndexedResult(httpRead_details)
                 if not httpRead_details:
                     self.msg = "Global httpRead Credential is not available."
                     self.status = "failed"
                     return self
                 httpReadDetail = None
                 if httpReadId:
-                    httpReadDetail = get_dict_result(httpRead_details, "id", httpReadId)
+                    httpReadDetail = httpRead_index.get("id", httpReadId)
                     if not httpReadDetail:
                         self.msg = "The ID of the httpRead credential is not valid."
                         self.status = "failed"
                         return self
                 elif httpReadDescription and httpReadUsername:
-                    for item in httpRead_details:
-                        if item.get("description") == httpReadDescription and \
-                                item.get("username") == httpReadUsername:
-                            httpReadDetail = item
+                    matching_items = httpRead_index.find_all(("description", "username"), (httpReadDescription, httpReadUsername))
+                    if matching_items:
+                        httpReadDetail = matching_items[-1]
                     if not httpReadDetail:
                         self.msg = "The description and username for the httpRead credential are invalid."
                         self.status = "failed"
@@ -2095,22 +2091,22 @@ class DnacCredential(DnacBase):
 
                 # All httpWrite details from the Cisco DNA Center
                 httpWrite_details = global_credentials.get("httpsWrite")
+                httpWrite_index = IndexedResult(httpWrite_details)
                 if not httpWrite_details:
                     self.msg = "Global httpWrite credential is not available."
                     self.status = "failed"
                     return self
                 httpWriteDetail = None
                 if httpWriteId:
-                    httpWriteDetail = get_dict_result(httpWrite_details, "id", httpWriteId)
+                    httpWriteDetail = httpWrite_index.get("id", httpWriteId)
                     if not httpWriteDetail:
                         self.msg = "The ID of the httpWrite credential is not valid."
                         self.status = "failed"
                         return self
                 elif httpWriteDescription and httpWriteUsername:
-                    for item in httpWrite_details:
-                        if item.get("description") == httpWriteDescription and \
-                                item.get("username") == httpWriteUsername:
-                            httpWriteDetail = item
+                    matching_items = httpWrite_index.find_all(("description", "username"), (httpWriteDescription, httpWriteUsername))
+                    if matching_items:
+                        httpWriteDetail = matching_items[-1]
                     if not httpWriteDetail:
                         self.msg = "The description and username for the httpWrite credential are invalid."
                         self.status = "failed"
@@ -2125,21 +2121,22 @@ class DnacCredential(DnacBase):
 
                 # All snmpV3 details from the Cisco DNA Center
                 snmpV3_details = global_credentials.get("snmpV3")
+                snmpV3_index = IndexedResult(snmpV3_details)
                 if not snmpV3_details:
                     self.msg = "Global snmpV3 Credential is not available."
                     self.status = "failed"
                     return self
                 snmpV3Detail = None
                 if snmpV3Id:
-                    snmpV3Detail = get_dict_result(snmpV3_details, "id", snmpV3Id)
+                    snmpV3Detail = snmpV3_index.get("id", snmpV3Id)
                     if not snmpV3Detail:
                         self.msg = "The ID of the snmpV3 credential is not valid."
                         self.status = "failed"
                         return self
                 elif snmpV3Description:
-                    for item in snmpV3_details:
-                        if item.get("description") == snmpV3Description:
-                            snmpV3Detail = item
+                    matching_items = snmpV3_index.find_all(("description",), (snmpV3Description,))
+                    if matching_items:
+                        snmpV3Detail = matching_items[-1]
                     if not snmpV3Detail:
                         self.msg = "The username and description for the snmpV2cWrite credential are invalid."
                         self.status = "failed"
@@ -2214,6 +2211,7 @@ class DnacCredential(DnacBase):
         self.log("Received API response from 'create_global_credentials_v2': {0}"
                  .format(response), "DEBUG")
         validation_string = "global credential addition performed"
+        self.forget_planned(("global_credentials",))
         self.check_task_response_status(response, validation_string).check_return_status()
         self.log("Global credential created successfully", "INFO")
         result_global_credential.update({
@@ -2278,6 +2276,7 @@ class DnacCredential(DnacBase):
                 self.log("Received API response for 'update_global_credentials_v2': {0}"
                          .format(response), "DEBUG")
                 validation_string = "global credential update performed"
+                self.forget_planned(("global_credentials",))
                 self.check_task_response_status(response, validation_string).check_return_status()
         self.log("Updating device credential API input parameters: {0}"
                  .format(final_response), "DEBUG")
@@ -2388,7 +2387,7 @@ class DnacCredential(DnacBase):
         result_global_credential = self.result.get("response")[0].get("globalCredential")
         have_values = self.have.get("globalCredential")
         final_response = {}
-        self.log("Global device credentials to be deleted: {0}".format(have_values), "DEBUG")
+        self.log("Global device credentials to be deleted: {0}", "DEBUG", args=(have_values,))
         credential_mapping = {
             "cliCredential": "cli_credential",
             "snmpV2cRead": "snmp_v2c_read",
@@ -2402,7 +2401,7 @@ class DnacCredential(DnacBase):
             final_response.update({item: []})
             for value in have_values.get(item):
                 if value is None:
-                    self.log("Credential Name: {0}".format(item), "DEBUG")
+                    self.log("Credential Name: {0}", "DEBUG", args=(item,))
                     self.log("Credential Item: {0}".format(config.get("global_credential_details")
                              .get(credential_mapping.get(item))), "DEBUG")
                     final_response.get(item).append(
@@ -2419,6 +2418,7 @@ class DnacCredential(DnacBase):
                 self.log("Received API response for 'delete_global_credential_v2': {0}"
                          .format(response), "DEBUG")
                 validation_string = "global credential deleted successfully"
+                self.forget_planned(("global_credentials",))
                 self.check_task_response_status(response, validation_string).check_return_status()
                 final_response.get(item).append(_id)
                 config_itr = config_itr + 1
@@ -2587,6 +2587,7 @@ def main():
         "state": {"default": 'merged', "choices": ['merged', 'deleted']},
         "validate_response_schema": {"type": 'bool', "default": True},
     }
+    element_spec.update(dnac_intent_argument_spec())
 
     # Create an AnsibleModule object with argument specifications
     module = AnsibleModule(argument_spec=element_spec, supports_check_mode=False)
@@ -2600,6 +2601,7 @@ def main():
 
     dnac_credential.validate_input().check_return_status()
 
+    dnac_credential.plan(dnac_credential.config).check_return_status()
     for config in dnac_credential.config:
         dnac_credential.reset_values()
         dnac_credential.get_have(config).check_return_status()
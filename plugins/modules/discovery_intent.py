@@ -275,9 +275,9 @@ response_3:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
-    validate_list_of_dicts
+    validate_list_of_dicts,
+    dnac_intent_argument_spec,
 )
-import time
 import re
 
 
@@ -432,7 +432,7 @@ class DnacDiscovery(DnacBase):
         cli_len_inp = self.validated_config[0].get("cli_cred_len")
         if cli_len_inp > 5:
             cli_len_inp = 5
-        self.log("The Global credentials response from 'get all global credentials v2' API is {0}".format(str(response)), "DEBUG")
+        self.log("The Global credentials response from 'get all global credentials v2' API is {0}", "DEBUG", args=(response,))
         cli_len = 0
         for key in response.keys():
             if key == "cliCredential":
@@ -622,7 +622,7 @@ class DnacDiscovery(DnacBase):
             op_modifies=True,
         )
 
-        self.log("The response received post discovery creation API called is {0}".format(str(result)), "DEBUG")
+        self.log("The response received post discovery creation API called is {0}", "DEBUG", args=(result,))
 
         self.result.update(dict(discovery_result=result))
         self.log("Task Id of the API task created is {0}".format(result.response.get('taskId')), "INFO")
@@ -643,30 +643,26 @@ class DnacDiscovery(DnacBase):
         """
 
         result = False
-        params = dict(task_id=task_id)
-        while True:
-            response = self.dnac_apply['exec'](
-                family="task",
-                function='get_task_by_id',
-                params=params,
-            )
-            response = response.response
-            self.log("Task status for the task id {0} is {1}".format(str(task_id), str(response)), "INFO")
-            if response.get('isError') or re.search(
-                'failed', response.get('progress'), flags=re.IGNORECASE
-            ):
-                msg = 'Discovery task with id {0} has not completed - Reason: {1}'.format(
-                    task_id, response.get("failureReason"))
-                self.log(msg, "CRITICAL")
-                self.module.fail_json(msg=msg)
-                return False
-
-            if response.get('progress') != 'In Progress':
-                result = True
-                self.log("The Process is completed", "INFO")
-                break
-            time.sleep(3)
+        response = self.wait_for_task(
+            task_id,
+            lambda details: details.get('isError') or details.get('progress') != 'In Progress'
+        )
+        if response is None:
+            self.module.fail_json(msg=self.msg)
+            return False
+
+        self.log("Task status for the task id {0} is {1}", "INFO", args=(task_id, response))
+        if response.get('isError') or re.search(
+            'failed', response.get('progress'), flags=re.IGNORECASE
+        ):
+            msg = 'Discovery task with id {0} has not completed - Reason: {1}'.format(
+                task_id, response.get("failureReason"))
+            self.log(msg, "CRITICAL")
+            self.module.fail_json(msg=msg)
+            return False
 
+        result = True
+        self.log("The Process is completed", "INFO")
         self.result.update(dict(discovery_task=response))
         return result
 
@@ -692,7 +688,7 @@ class DnacDiscovery(DnacBase):
             params=params
         )
 
-        self.log("Response of the get discoveries via range API is {0}".format(str(response)), "DEBUG")
+        self.log("Response of the get discoveries via range API is {0}", "DEBUG", args=(response,))
 
         return next(
             filter(
@@ -722,13 +718,12 @@ class DnacDiscovery(DnacBase):
             self.log(msg, "INFO")
             self.module.fail_json(msg=msg)
 
-        while True:
-            discovery = self.lookup_discovery_by_range_via_name()
-            if discovery.get('discoveryCondition') == 'Complete':
-                result = True
-                break
-
-            time.sleep(3)
+        discovery = self.poll_until(
+            self.lookup_discovery_by_range_via_name,
+            lambda discovery: discovery.get('discoveryCondition') == 'Complete',
+            description="discovery '{0}' to complete".format(self.validated_config[0].get("discovery_name"))
+        )
+        result = discovery is not None
 
         if not result:
             msg = 'Cannot find any discovery task with name {0} -- Discovery result: {1}'.format(
@@ -759,26 +754,27 @@ class DnacDiscovery(DnacBase):
             task_id=task_id,
             headers=self.validated_config[0].get("headers"),
         )
-        result = False
-        count = 0
-        while True:
-            response = self.dnac_apply['exec'](
+
+        def get_devices():
+            devices = self.dnac_apply['exec'](
                 family="discovery",
                 function='get_discovered_network_devices_by_discovery_id',
                 params=params,
-            )
-            devices = response.response
-
-            self.log("Retrieved device details using the API 'get_discovered_network_devices_by_discovery_id': {0}".format(str(devices)), "DEBUG")
-            if all(res.get('reachabilityStatus') == 'Success' for res in devices):
-                result = True
-                break
-
-            count += 1
-            if count == 3:
-                break
-
-            time.sleep(3)
+            ).response
+            self.log("Retrieved device details using the API 'get_discovered_network_devices_by_discovery_id': {0}",
+                     "DEBUG", args=(devices,))
+            return devices
+
+        # Devices get a few seconds to become reachable before the discovery is reported as incomplete
+        devices = self.poll_until(
+            get_devices,
+            lambda devices: all(res.get('reachabilityStatus') == 'Success' for res in devices),
+            timeout=9,
+            poll_interval=3,
+            description="devices of discovery '{0}' to become reachable".format(discovery_id),
+            fail_on_timeout=False
+        )
+        result = devices is not None
 
         if not result:
             msg = 'Discovery network device with id {0} has not completed'.format(discovery_id)
@@ -827,7 +823,7 @@ class DnacDiscovery(DnacBase):
             params=params,
         )
 
-        self.log("Response collected from API 'delete_discovery_by_id': {0}".format(str(response)), "DEBUG")
+        self.log("Response collected from API 'delete_discovery_by_id': {0}", "DEBUG", args=(response,))
         self.result.update(dict(delete_discovery=response))
         self.log("Task Id of the deletion task is {0}".format(response.response.get('taskId')), "INFO")
         return response.response.get('taskId')
@@ -1004,6 +1000,7 @@ def main():
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
                     }
+    element_spec.update(dnac_intent_argument_spec())
 
     module = AnsibleModule(argument_spec=element_spec,
                            supports_check_mode=False)
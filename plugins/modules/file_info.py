@@ -35,6 +35,22 @@ options:
     description:
     - The filename used to save the download file.
     type: str
+  stream:
+    description:
+    - Write the download to 'dirPath' in chunks instead of holding it in memory.
+    - The result then only holds the path, size and SHA-256 checksum of the file, not its content.
+    type: bool
+    default: false
+  compress:
+    description:
+    - With 'stream', gzip compress the file while it is written, '.gz' is appended to its name.
+    type: bool
+    default: false
+  checksum:
+    description:
+    - With 'stream', the expected SHA-256 checksum of the content.
+    - When 'filename' is given and that file already has this content, nothing is downloaded.
+    type: str
 requirements:
 - dnacentersdk >= 2.5.5
 - python >= 3.5
@@ -68,6 +84,22 @@ EXAMPLES = r"""
     filename: string
   register: result
 
+- name: Stream File by id to disk
+  cisco.dnac.file_info:
+    dnac_host: "{{dnac_host}}"
+    dnac_username: "{{dnac_username}}"
+    dnac_password: "{{dnac_password}}"
+    dnac_verify: "{{dnac_verify}}"
+    dnac_port: "{{dnac_port}}"
+    dnac_version: "{{dnac_version}}"
+    dnac_debug: "{{dnac_debug}}"
+    fileId: string
+    dirPath: /tmp/downloads
+    filename: string
+    stream: true
+    compress: true
+  register: result
+
 """
 
 RETURN = r"""
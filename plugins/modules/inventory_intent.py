@@ -176,6 +176,17 @@ options:
         description: Make this as true needed for the updation of device credentials and other device details.
         type: bool
         default: false
+      update_batch_size:
+        description: Number of devices sent together in a single device update request when
+          'credential_update' is true. Only devices whose update parameters are identical apart from
+          their IP address are sent together, and every device of a request shares its outcome.
+        type: int
+        default: 50
+      update_max_concurrency:
+        description: Maximum number of device update tasks running at the same time on Cisco Catalyst Center
+          when 'credential_update' is true.
+        type: int
+        default: 10
       clean_config:
         description: Required if need to delete the Provisioned device by clearing current configuration.
         type: bool
@@ -215,6 +226,11 @@ options:
       site_name:
         description: Required for Provisioning of Wired and Wireless Devices.
         type: str
+      provision_max_concurrency:
+        description: Maximum number of provisioning tasks running at the same time on Cisco Catalyst Center
+          when Wired or Wireless Devices are provisioned.
+        type: int
+        default: 10
       operation_enum:
         description: enum(CREDENTIALDETAILS, DEVICEDETAILS) 0 to export Device Credential Details Or 1 to export Device Details.
         type: str
@@ -701,14 +717,29 @@ except ImportError:
     pyzipper = None
 
 import csv
+import json
 from datetime import datetime
-from io import BytesIO, StringIO
+from io import BytesIO, TextIOWrapper
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
     validate_list_of_dicts,
+    task_progress_contains,
+    is_task_finished,
+    dnac_intent_argument_spec,
 )
 
+# Device attributes the inventory index can be looked up by
+DEVICE_INDEX_FIELDS = ("managementIpAddress", "hostname", "serialNumber", "macAddress")
+# Default number of devices sent together in a single device update request
+INVENTORY_UPDATE_BATCH_SIZE = 50
+# Default number of device update tasks kept running at the same time
+INVENTORY_UPDATE_MAX_CONCURRENCY = 10
+# Default number of provisioning tasks kept running at the same time
+INVENTORY_PROVISION_MAX_CONCURRENCY = 10
+# Number of management IP addresses filtered on in a single inventory query
+INVENTORY_DEVICE_QUERY_SIZE = 50
+
 
 class DnacDevice(DnacBase):
     """Class containing member attributes for Inventory intent module"""
@@ -716,6 +747,7 @@ class DnacDevice(DnacBase):
     def __init__(self, module):
         super().__init__(module)
         self.supported_states = ["merged", "deleted"]
+        self.device_index = None
 
     def validate_input(self):
         """
@@ -771,6 +803,9 @@ class DnacDevice(DnacBase):
             'device_resync': {'type': 'bool'},
             'reboot_device': {'type': 'bool'},
             'credential_update': {'type': 'bool'},
+            'update_batch_size': {'default': INVENTORY_UPDATE_BATCH_SIZE, 'type': 'int'},
+            'update_max_concurrency': {'default': INVENTORY_UPDATE_MAX_CONCURRENCY, 'type': 'int'},
+            'provision_max_concurrency': {'default': INVENTORY_PROVISION_MAX_CONCURRENCY, 'type': 'int'},
             'force_sync': {'type': 'bool'},
             'clean_config': {'type': 'bool'},
             'add_user_defined_field': {
@@ -865,42 +900,105 @@ class DnacDevice(DnacBase):
         # If no information is available, return an empty list
         return []
 
-    def device_exists_in_dnac(self):
+    def get_device_index(self):
         """
-        Check which devices already exists in Cisco Catalyst Center and return both device_exist and device_not_exist in dnac.
+        Read the whole device inventory of Cisco Catalyst Center once and index it by the device attributes.
         Parameters:
-            self (object): An instance of a class used for interacting with Cisco Cisco Catalyst Center.
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
         Returns:
-            list: A list of devices that exist in Cisco Catalyst Center.
+            dict: For each field of 'DEVICE_INDEX_FIELDS', a dictionary mapping the field value to the device details.
         Description:
-            Queries Cisco Catalyst Center to check which devices are already present in Cisco Catalyst Center and store
-            its management IP address in the list of devices that exist.
-        Example:
-            To use this method, create an instance of the class and call 'device_exists_in_dnac' on it,
-            The method returns a list of management IP addressesfor devices that exist in Cisco Catalyst Center.
+            The inventory is read page by page with 'get_device_list' the first time it is needed and kept until
+            'reset_device_index' is called, so resolving any number of IP addresses, hostnames, serial numbers or
+            MAC addresses costs a handful of requests instead of one request per device. Hostnames and MAC
+            addresses are indexed in lower case and every serial number of a stacked device is indexed.
         """
 
-        device_in_dnac = []
+        if self.device_index is not None:
+            return self.device_index
 
+        device_index = dict((field, {}) for field in DEVICE_INDEX_FIELDS)
         try:
-            response = self.dnac._exec(
-                family="devices",
-                function='get_device_list',
-            )
-
+            for device in self.paginate("devices", "get_device_list", prefetch=True):
+                for field in DEVICE_INDEX_FIELDS:
+                    for value in self.get_device_index_keys(field, device.get(field)):
+                        device_index[field].setdefault(value, device)
         except Exception as e:
             error_message = "Error while fetching device from Cisco Catalyst Center: {0}".format(str(e))
             self.log(error_message, "CRITICAL")
             raise Exception(error_message)
 
-        if response:
-            self.log("Received API response from 'get_device_list': {0}".format(str(response)), "DEBUG")
-            response = response.get("response")
-            for ip in response:
-                device_ip = ip["managementIpAddress"]
-                device_in_dnac.append(device_ip)
+        self.log("Indexed {0} device(s) of Cisco Catalyst Center".format(len(device_index["managementIpAddress"])), "INFO")
+        self.device_index = device_index
+
+        return device_index
+
+    def get_device_index_keys(self, field, value):
+        """
+        Normalize a device attribute into the keys it is indexed under.
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            field (str): One of 'DEVICE_INDEX_FIELDS'.
+            value (str): The value of that field, either from a device or from the playbook.
+        Returns:
+            list: The index keys for the value, empty when there is no value.
+        """
+
+        if not value:
+            return []
+
+        if field == "serialNumber":
+            return [serial.strip() for serial in value.split(",") if serial.strip()]
+
+        if field in ("hostname", "macAddress"):
+            return [value.lower()]
+
+        return [value]
+
+    def get_indexed_device(self, field, value):
+        """
+        Look up a device of the inventory index by one of its attributes.
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            field (str): One of 'DEVICE_INDEX_FIELDS'.
+            value (str): The value to look up.
+        Returns:
+            dict: The device details, or None when no device matches.
+        """
 
-        return device_in_dnac
+        device_index = self.get_device_index()[field]
+        for key in self.get_device_index_keys(field, value):
+            if key in device_index:
+                return device_index[key]
+
+        self.log("No device found in Cisco Catalyst Center with {0} '{1}'", "DEBUG", args=(field, value))
+
+        return None
+
+    def reset_device_index(self):
+        """
+        Drop the inventory index so the next lookup reads the inventory again, to be called after devices were
+        added, deleted or updated.
+        """
+
+        self.device_index = None
+
+    def device_exists_in_dnac(self):
+        """
+        Check which devices already exists in Cisco Catalyst Center and return both device_exist and device_not_exist in dnac.
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Cisco Catalyst Center.
+        Returns:
+            set: The management IP addresses of the devices that exist in Cisco Catalyst Center.
+        Description:
+            Reads the management IP addresses of every device from the inventory index, which covers all pages of the
+            inventory. A set is returned so that checking many devices against a large inventory stays cheap.
+        Example:
+            To use this method, create an instance of the class and call 'device_exists_in_dnac' on it,
+            The method returns a set of management IP addresses for devices that exist in Cisco Catalyst Center.
+        """
+
+        return set(self.get_device_index()["managementIpAddress"])
 
     def is_udf_exist(self, field_name):
         """
@@ -922,7 +1020,7 @@ class DnacDevice(DnacBase):
             params={"name": field_name},
         )
 
-        self.log("Received API response from 'get_all_user_defined_fields': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'get_all_user_defined_fields': {0}", "DEBUG", args=(response,))
         udf = response.get("response")
 
         if (len(udf) == 1):
@@ -951,7 +1049,7 @@ class DnacDevice(DnacBase):
                 function='create_user_defined_field',
                 params=payload,
             )
-            self.log("Received API response from 'create_user_defined_field': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'create_user_defined_field': {0}", "DEBUG", args=(response,))
             response = response.get("response")
             field_name = self.config[0].get('add_user_defined_field').get('name')
             self.log("Global User Defined Field with name '{0}' created successfully".format(field_name), "INFO")
@@ -993,7 +1091,7 @@ class DnacDevice(DnacBase):
                     function='add_user_defined_field_to_device',
                     params=udf_param_dict,
                 )
-                self.log("Received API response from 'add_user_defined_field_to_device': {0}".format(str(response)), "DEBUG")
+                self.log("Received API response from 'add_user_defined_field_to_device': {0}", "DEBUG", args=(response,))
                 response = response.get("response")
                 self.status = "success"
                 self.result['changed'] = True
@@ -1026,26 +1124,28 @@ class DnacDevice(DnacBase):
             op_modifies=True,
             params=payload_params,
         )
-        self.log("Received API response from 'export_device_list': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'export_device_list': {0}", "DEBUG", args=(response,))
         response = response.get("response")
         task_id = response.get("taskId")
+        execution_details = self.wait_for_task(
+            task_id,
+            lambda details: details.get("isError") or details.get("additionalStatusURL")
+        )
+        if execution_details is None:
+            return response
 
-        while True:
-            execution_details = self.get_task_details(task_id)
+        if execution_details.get("isError"):
+            self.status = "failed"
+            failure_reason = execution_details.get("failureReason")
+            if failure_reason:
+                self.msg = "Could not get the File ID because of {0} so can't export device details in csv file".format(failure_reason)
+            else:
+                self.msg = "Could not get the File ID so can't export device details in csv file"
+            self.log(self.msg, "ERROR")
 
-            if execution_details.get("additionalStatusURL"):
-                file_id = execution_details.get("additionalStatusURL").split("/")[-1]
-                break
-            elif execution_details.get("isError"):
-                self.status = "failed"
-                failure_reason = execution_details.get("failureReason")
-                if failure_reason:
-                    self.msg = "Could not get the File ID because of {0} so can't export device details in csv file".format(failure_reason)
-                else:
-                    self.msg = "Could not get the File ID so can't export device details in csv file"
-                self.log(self.msg, "ERROR")
+            return response
 
-                return response
+        file_id = execution_details.get("additionalStatusURL").split("/")[-1]
 
         # With this File ID call the Download File by FileID API and process the response
         response = self.dnac._exec(
@@ -1054,7 +1154,7 @@ class DnacDevice(DnacBase):
             op_modifies=True,
             params={"file_id": file_id},
         )
-        self.log("Received API response from 'download_a_file_by_fileid': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'download_a_file_by_fileid': {0}", "DEBUG", args=(response,))
 
         return response
 
@@ -1065,13 +1165,13 @@ class DnacDevice(DnacBase):
             response (requests.Response): HTTP response object containing the encrypted CSV file.
             password (str): Password used for decrypting the CSV file.
         Returns:
-            csv.DictReader: A CSV reader object for the decrypted content, allowing iteration over rows as dictionaries.
+            generator: Yields the rows of the decrypted CSV file as dictionaries, one at a time.
         Description:
             Decrypts and reads a CSV-like file from the given HTTP response using the provided password.
+            The zip member is decrypted as a stream and parsed incrementally, so no full plaintext copy
+            of the export is ever held in memory.
         """
 
-        zip_data = BytesIO(response.data)
-
         if not HAS_PYZIPPER:
             self.msg = "pyzipper is required for this module. Install pyzipper to use this functionality."
             self.log(self.msg, "CRITICAL")
@@ -1098,25 +1198,36 @@ class DnacDevice(DnacBase):
             self.status = "failed"
             return self
 
+        return self.iter_decrypted_csv_rows(response.data, password, encryption_method)
+
+    def iter_decrypted_csv_rows(self, zip_content, password, encryption_method):
+        """
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            zip_content (bytes): The encrypted zip archive returned by the export API.
+            password (str): Password used for decrypting the CSV file.
+            encryption_method (str): The encryption method the archive was created with.
+        Returns:
+            generator: Yields the rows of the decrypted CSV file as dictionaries.
+        Description:
+            Opens the single member of the archive as a decrypting stream and feeds it through a text
+            wrapper into 'csv.DictReader', so only the current row is materialized at any time.
+        """
+
         # Create a PyZipper object with the password
-        with pyzipper.AESZipFile(zip_data, 'r', compression=pyzipper.ZIP_LZMA, encryption=encryption_method) as zip_ref:
+        with pyzipper.AESZipFile(BytesIO(zip_content), 'r', compression=pyzipper.ZIP_LZMA, encryption=encryption_method) as zip_ref:
             # Assuming there is a single file in the zip archive
             file_name = zip_ref.namelist()[0]
+            self.log("Streaming decrypted CSV member '{0}' ({1} bytes) of the export archive".format(
+                file_name, zip_ref.getinfo(file_name).file_size), "DEBUG")
 
-            # Extract the content of the file with the provided password
-            file_content_binary = zip_ref.read(file_name, pwd=password.encode('utf-8'))
-
-        # Now 'file_content_binary' contains the binary content of the decrypted file
-        # Since the content is text, so we can decode it
-        file_content_text = file_content_binary.decode('utf-8')
-
-        # Now 'file_content_text' contains the text content of the decrypted file
-        self.log("Text content of decrypted file: {0}".format(file_content_text), "DEBUG")
+            with zip_ref.open(file_name, pwd=password.encode('utf-8')) as member:
+                row_count = 0
+                for row in csv.DictReader(TextIOWrapper(member, encoding='utf-8', newline='')):
+                    row_count += 1
+                    yield row
 
-        # Parse the CSV-like string into a list of dictionaries
-        csv_reader = csv.DictReader(StringIO(file_content_text))
-
-        return csv_reader
+        self.log("Parsed {0} row(s) from the decrypted CSV file '{1}'".format(row_count, file_name), "DEBUG")
 
     def export_device_details(self):
         """
@@ -1179,25 +1290,25 @@ class DnacDevice(DnacBase):
                 csv_reader = self.decrypt_and_read_csv(response, password)
                 self.check_return_status()
             else:
-                decoded_resp = response.data.decode(encoding='utf-8')
-                self.log("Decoded response of Export Device Credential file: {0}".format(str(decoded_resp)), "DEBUG")
+                self.log("Received Export Device Credential file of {0} bytes".format(len(response.data)), "DEBUG")
 
-                # Parse the CSV-like string into a list of dictionaries
-                csv_reader = csv.DictReader(StringIO(decoded_resp))
+                # Parse the CSV content incrementally into dictionaries
+                csv_reader = csv.DictReader(TextIOWrapper(BytesIO(response.data), encoding='utf-8', newline=''))
                 current_date = datetime.now()
                 formatted_date = current_date.strftime("%m-%d-%Y")
                 output_file_name = "devices-" + str(formatted_date) + ".csv"
 
-            device_data = []
-            for row in csv_reader:
-                device_data.append(row)
-
-            # Write the data to a CSV file
+            # Write the data to a CSV file row by row as it is parsed
             with open(output_file_name, 'w', newline='') as csv_file:
-                fieldnames = device_data[0].keys()
-                csv_writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-                csv_writer.writeheader()
-                csv_writer.writerows(device_data)
+                csv_writer = None
+                for row in csv_reader:
+                    if csv_writer is None:
+                        csv_writer = csv.DictWriter(csv_file, fieldnames=row.keys())
+                        csv_writer.writeheader()
+                    csv_writer.writerow(row)
+
+            if csv_writer is None:
+                raise ValueError("The exported CSV file contains no device rows")
 
             self.msg = "Device Details Exported Successfully to the CSV file: {0}".format(output_file_name)
             self.log(self.msg, "INFO")
@@ -1226,20 +1337,9 @@ class DnacDevice(DnacBase):
 
         ap_device_list = []
         for device_ip in device_ips:
-            try:
-                response = self.dnac._exec(
-                    family="devices",
-                    function='get_device_list',
-                    params={"managementIpAddress": device_ip}
-                )
-                response = response.get('response', [])
-
-                if response and response[0].get('family', '') == "Unified AP":
-                    ap_device_list.append(device_ip)
-            except Exception as e:
-                error_message = "Error while getting the response of device from Cisco Catalyst Center: {0}".format(str(e))
-                self.log(error_message, "CRITICAL")
-                raise Exception(error_message)
+            device = self.get_indexed_device("managementIpAddress", device_ip)
+            if device and device.get('family', '') == "Unified AP":
+                ap_device_list.append(device_ip)
 
         return ap_device_list
 
@@ -1262,16 +1362,14 @@ class DnacDevice(DnacBase):
         input_device_ips = device_ips.copy()
         device_in_dnac = self.device_exists_in_dnac()
 
-        for device_ip in input_device_ips:
-            if device_ip not in device_in_dnac:
-                input_device_ips.remove(device_ip)
+        input_device_ips = [device_ip for device_ip in input_device_ips if device_ip in device_in_dnac]
 
         ap_devices = self.get_ap_devices(input_device_ips)
         self.log("AP Devices from the playbook input are: {0}".format(str(ap_devices)), "INFO")
 
         if ap_devices:
-            for ap_ip in ap_devices:
-                input_device_ips.remove(ap_ip)
+            ap_devices_set = set(ap_devices)
+            input_device_ips = [device_ip for device_ip in input_device_ips if device_ip not in ap_devices_set]
             self.log("Following devices {0} are AP, so can't perform resync operation.".format(str(ap_devices)), "WARNING")
 
         if not input_device_ips:
@@ -1295,30 +1393,28 @@ class DnacDevice(DnacBase):
                 op_modifies=True,
                 params=resync_param_dict,
             )
-            self.log("Received API response from 'sync_devices_using_forcesync': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'sync_devices_using_forcesync': {0}", "DEBUG", args=(response,))
 
             if response and isinstance(response, dict):
                 task_id = response.get('response').get('taskId')
+                execution_details = self.wait_for_task(task_id, task_progress_contains('Synced'))
+                if execution_details is None:
+                    return self
 
-                while True:
-                    execution_details = self.get_task_details(task_id)
-
-                    if 'Synced' in execution_details.get("progress"):
-                        self.status = "success"
-                        self.result['changed'] = True
-                        self.result['response'] = execution_details
-                        self.msg = "Devices have been successfully resynced. Devices resynced: {0}".format(str(input_device_ips))
-                        self.log(self.msg, "INFO")
-                        break
-                    elif execution_details.get("isError"):
-                        self.status = "failed"
-                        failure_reason = execution_details.get("failureReason")
-                        if failure_reason:
-                            self.msg = "Device resynced get failed because of {0}".format(failure_reason)
-                        else:
-                            self.msg = "Device resynced get failed."
-                        self.log(self.msg, "ERROR")
-                        break
+                if execution_details.get("isError"):
+                    self.status = "failed"
+                    failure_reason = execution_details.get("failureReason")
+                    if failure_reason:
+                        self.msg = "Device resynced get failed because of {0}".format(failure_reason)
+                    else:
+                        self.msg = "Device resynced get failed."
+                    self.log(self.msg, "ERROR")
+                else:
+                    self.status = "success"
+                    self.result['changed'] = True
+                    self.result['response'] = execution_details
+                    self.msg = "Devices have been successfully resynced. Devices resynced: {0}".format(str(input_device_ips))
+                    self.log(self.msg, "INFO")
 
         except Exception as e:
             self.status = "failed"
@@ -1346,9 +1442,8 @@ class DnacDevice(DnacBase):
         if input_device_ips:
             ap_devices = self.get_ap_devices(input_device_ips)
             self.log("AP Devices from the playbook input are: {0}".format(str(ap_devices)), "INFO")
-            for device_ip in input_device_ips:
-                if device_ip not in ap_devices:
-                    input_device_ips.remove(device_ip)
+            ap_devices_set = set(ap_devices)
+            input_device_ips = [device_ip for device_ip in input_device_ips if device_ip in ap_devices_set]
 
         if not input_device_ips:
             self.msg = "No AP Devices IP given in the playbook so can't perform reboot operation"
@@ -1361,16 +1456,10 @@ class DnacDevice(DnacBase):
         # Get and store the apEthernetMacAddress of given devices
         ap_mac_address_list = []
         for device_ip in input_device_ips:
-            response = self.dnac._exec(
-                family="devices",
-                function='get_device_list',
-                params={"managementIpAddress": device_ip}
-            )
-            response = response.get('response')
+            response = self.get_indexed_device("managementIpAddress", device_ip)
             if not response:
                 continue
 
-            response = response[0]
             ap_mac_address = response.get('apEthernetMacAddress')
 
             if ap_mac_address is not None:
@@ -1398,29 +1487,43 @@ class DnacDevice(DnacBase):
 
         if response and isinstance(response, dict):
             task_id = response.get('response').get('taskId')
+            execution_details = self.wait_for_task(task_id, task_progress_contains('url'))
+            if execution_details is None:
+                return self
 
-            while True:
-                execution_details = self.get_task_details(task_id)
-
-                if 'url' in execution_details.get("progress"):
-                    self.status = "success"
-                    self.result['changed'] = True
-                    self.result['response'] = execution_details
-                    self.msg = "AP Device(s) {0} successfully rebooted!".format(str(input_device_ips))
-                    self.log(self.msg, "INFO")
-                    break
-                elif execution_details.get("isError"):
-                    self.status = "failed"
-                    failure_reason = execution_details.get("failureReason")
-                    if failure_reason:
-                        self.msg = "AP Device Rebooting get failed because of {0}".format(failure_reason)
-                    else:
-                        self.msg = "AP Device Rebooting get failed"
-                    self.log(self.msg, "ERROR")
-                    break
+            if execution_details.get("isError"):
+                self.status = "failed"
+                failure_reason = execution_details.get("failureReason")
+                if failure_reason:
+                    self.msg = "AP Device Rebooting get failed because of {0}".format(failure_reason)
+                else:
+                    self.msg = "AP Device Rebooting get failed"
+                self.log(self.msg, "ERROR")
+            else:
+                self.status = "success"
+                self.result['changed'] = True
+                self.result['response'] = execution_details
+                self.msg = "AP Device(s) {0} successfully rebooted!".format(str(input_device_ips))
+                self.log(self.msg, "INFO")
 
         return self
 
+    def is_device_managed(self, device_response):
+        """
+        Check whether a device has reached the Managed state in Cisco Catalyst Center.
+        Parameters:
+            - self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            - device_response (dict): Device details as returned by 'get_device_response'.
+        Return:
+            bool: True if both the management and collection state are 'Managed' and the hostname is known.
+        """
+
+        return (
+            device_response.get('managementState') == "Managed"
+            and device_response.get('collectionStatus') == "Managed"
+            and bool(device_response.get("hostname"))
+        )
+
     def handle_successful_provisioning(self, device_ip, execution_details, device_type):
         """
         Handle successful provisioning of Wired/Wireless device.
@@ -1545,6 +1648,136 @@ class DnacDevice(DnacBase):
         self.result['changed'] = True
         self.log("{0} Devices provisioned successfully partially for {1} devices".format(device_type, provision_count), "INFO")
 
+    def get_devices_by_ip(self, device_ips):
+        """
+        Read the current details of several devices with as few inventory queries as possible.
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            device_ips (list): The management IP addresses of the devices.
+        Returns:
+            dict: The device details keyed by management IP address, without the devices that were not found.
+        Description:
+            Unlike the inventory index, which is cached, the details are always read fresh from 'get_device_list',
+            filtering on up to INVENTORY_DEVICE_QUERY_SIZE management IP addresses per request.
+        """
+
+        devices = {}
+        for i in range(0, len(device_ips), INVENTORY_DEVICE_QUERY_SIZE):
+            device_ip_chunk = device_ips[i:i + INVENTORY_DEVICE_QUERY_SIZE]
+            try:
+                response = self.dnac._exec(
+                    family="devices",
+                    function='get_device_list',
+                    params={"managementIpAddress": device_ip_chunk}
+                )
+            except Exception as e:
+                error_message = "Error while getting the response of device from Cisco Catalyst Center: {0}".format(str(e))
+                self.log(error_message, "ERROR")
+                raise Exception(error_message)
+
+            for device in response.get('response') or []:
+                devices[device.get('managementIpAddress')] = device
+
+        return devices
+
+    def provision_devices(self, device_ips, get_params, family, function, device_type):
+        """
+        Provision devices once they are managed, with a bounded number of provisioning tasks in flight.
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            device_ips (list): The management IP addresses of the devices to provision.
+            get_params (callable): Called with the IP address of a managed device, returns the parameters of its
+                                   provisioning request.
+            family (str): The SDK family of the provisioning function.
+            function (str): The SDK function that triggers the provisioning of one device.
+            device_type (str): The type or category of the provisioned devices(Wired/Wireless).
+        Returns:
+            tuple: The number of devices provisioned successfully and the number of devices already provisioned.
+        Description:
+            The managed state of all the pending devices is read with one bulk inventory query. The devices that
+            are managed are provisioned together, at most 'provision_max_concurrency' tasks at a time, and the
+            result of each device is handled as soon as its task finishes. Only the devices that are not managed
+            yet are queried again, once that batch of tasks finished, backing off the same way as 'poll_until',
+            until they are managed or 'dnac_task_timeout' expires. A device becoming managed while a batch runs
+            is thus provisioned with the next batch. A failed query is retried on the next poll as well.
+        """
+
+        max_concurrency = max(int(self.config[0].get("provision_max_concurrency") or INVENTORY_PROVISION_MAX_CONCURRENCY), 1)
+        pending_device_ips = list(device_ips)
+        counts = {"provisioned": 0, "already_provisioned": 0}
+
+        def submit(device_ip):
+            try:
+                response = self.dnac._exec(
+                    family=family,
+                    function=function,
+                    op_modifies=True,
+                    params=get_params(device_ip),
+                )
+            except Exception as e:
+                # Not failing here as there might be possiblity that for some devices it comes into exception
+                # but for others it gets provision successfully or If some devices are already provsioned
+                self.handle_provisioning_exception(device_ip, e, device_type)
+                if "already provisioned" in str(e):
+                    self.log("Device '{0}' already provisioned".format(device_ip), "INFO")
+                    counts["already_provisioned"] += 1
+                return None
+
+            if response.get("status") == "failed":
+                description = response.get("description")
+                error_msg = "Cannot do Provisioning for {0} device {1} beacuse of {2}".format(device_type, device_ip, description)
+                self.log(error_msg, "ERROR")
+                return None
+
+            return response.get("taskId")
+
+        def on_complete(device_ip, execution_details):
+            if execution_details.get("isError"):
+                self.handle_failed_provisioning(device_ip, execution_details, device_type)
+            else:
+                self.handle_successful_provisioning(device_ip, execution_details, device_type)
+                counts["provisioned"] += 1
+
+        def provision_managed_devices():
+            try:
+                devices = self.get_devices_by_ip(pending_device_ips)
+            except Exception as e:
+                # Logged by get_devices_by_ip, the pending devices are queried again on the next poll
+                self.log("Managed state of {0} pending {1} device(s) not known yet: {2}"
+                         .format(len(pending_device_ips), device_type, str(e)), "WARNING")
+                return pending_device_ips
+
+            managed_device_ips = [device_ip for device_ip in pending_device_ips
+                                  if device_ip in devices and self.is_device_managed(devices[device_ip])]
+            if not managed_device_ips:
+                return pending_device_ips
+
+            for device_ip in managed_device_ips:
+                pending_device_ips.remove(device_ip)
+
+            self.log("Provisioning {0} managed {1} device(s), at most {2} at a time, {3} device(s) not managed yet"
+                     .format(len(managed_device_ips), device_type, max_concurrency, len(pending_device_ips)), "INFO")
+            task_results = self.run_tasks(managed_device_ips, submit, task_progress_contains('TASK_PROVISION'),
+                                          max_concurrency=max_concurrency, on_complete=on_complete)
+            for device_ip, execution_details in task_results.items():
+                if execution_details is None:
+                    self.log("Provisioning of {0} device {1} was not started or did not complete in time".format(device_type, device_ip), "WARNING")
+
+            return pending_device_ips
+
+        self.poll_until(
+            provision_managed_devices,
+            lambda remaining_device_ips: not remaining_device_ips,
+            description="{0} device(s) to reach the Managed state".format(device_type),
+            fail_on_timeout=False
+        )
+
+        for device_ip in pending_device_ips:
+            self.log("Device {0} is not transitioning to the managed state, so provisioning operation cannot be performed."
+                     .format(device_ip), "WARNING")
+
+        return (counts["provisioned"], counts["already_provisioned"])
+
     def provisioned_wired_device(self):
         """
         Provision wired devices in Cisco Catalyst Center.
@@ -1555,7 +1788,7 @@ class DnacDevice(DnacBase):
         Description:
             This function provisions wired devices in Cisco Catalyst Center based on the configuration provided.
             It retrieves the site name and IP addresses of the devices from the configuration,
-            attempts to provision each device, and monitors the provisioning process.
+            and provisions the devices concurrently through 'provision_devices'.
         """
 
         site_name = self.config[0]['provision_wired_device']['site_name']
@@ -1563,12 +1796,9 @@ class DnacDevice(DnacBase):
         device_ips = self.get_device_ips_from_config_priority()
         input_device_ips = device_ips.copy()
 
-        for device_ip in input_device_ips:
-            if device_ip not in device_in_dnac:
-                input_device_ips.remove(device_ip)
+        input_device_ips = [device_ip for device_ip in input_device_ips if device_ip in device_in_dnac]
 
         device_type = "Wired"
-        provision_count, already_provision_count = 0, 0
 
         if not site_name and not input_device_ips:
             self.status = "failed"
@@ -1577,72 +1807,14 @@ class DnacDevice(DnacBase):
             self.result['response'] = self.msg
             return self
 
-        provision_wired_params = {
-            'siteNameHierarchy': site_name
-        }
-
-        for device_ip in input_device_ips:
-            try:
-                provision_wired_params['deviceManagementIpAddress'] = device_ip
-                count = 1
-                managed_flag = True
-
-                # Check till device comes into managed state
-                while True:
-                    response = self.get_device_response(device_ip)
-                    self.log("Device is in {0} state waiting for Managed State.".format(response['managementState']), "DEBUG")
-
-                    if (
-                        response.get('managementState') == "Managed"
-                        and response.get('collectionStatus') == "Managed"
-                        and response.get("hostname")
-                    ):
-                        break
-                    count = count + 1
-                    if count > 400:
-                        managed_flag = False
-                        break
-
-                if not managed_flag:
-                    self.log("Device {0} is not transitioning to the managed state, so provisioning operation cannot be performed."
-                             .format(device_ip), "WARNING")
-                    continue
-
-                response = self.dnac._exec(
-                    family="sda",
-                    function='provision_wired_device',
-                    op_modifies=True,
-                    params=provision_wired_params,
-                )
-
-                if response.get("status") == "failed":
-                    description = response.get("description")
-                    error_msg = "Cannot do Provisioning for device {0} beacuse of {1}".format(device_ip, description)
-                    self.log(error_msg)
-                    continue
-
-                task_id = response.get("taskId")
-
-                while True:
-                    execution_details = self.get_task_details(task_id)
-                    progress = execution_details.get("progress")
-                    self.log(progress)
-
-                    if 'TASK_PROVISION' in progress:
-                        self.handle_successful_provisioning(device_ip, execution_details, device_type)
-                        provision_count += 1
-                        break
-                    elif execution_details.get("isError"):
-                        self.handle_failed_provisioning(device_ip, execution_details, device_type)
-                        break
+        def get_params(device_ip):
+            return {
+                'siteNameHierarchy': site_name,
+                'deviceManagementIpAddress': device_ip
+            }
 
-            except Exception as e:
-                # Not returning from here as there might be possiblity that for some devices it comes into exception
-                # but for others it gets provision successfully or If some devices are already provsioned
-                self.handle_provisioning_exception(device_ip, e, device_type)
-                if "already provisioned" in str(e):
-                    self.log(str(e), "INFO")
-                    already_provision_count += 1
+        provision_count, already_provision_count = self.provision_devices(
+            input_device_ips, get_params, "sda", "provision_wired_device", device_type)
 
         # Check If all the devices are already provsioned, return from here only
         if already_provision_count == len(device_ips):
@@ -1720,48 +1892,6 @@ class DnacDevice(DnacBase):
 
         return self
 
-    def get_site_type(self, site_name):
-        """
-        Get the type of a site in Cisco Catalyst Center.
-        Parameters:
-            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
-            site_name (str): The name of the site for which to retrieve the type.
-        Returns:
-            site_type (str or None): The type of the specified site, or None if the site is not found.
-        Description:
-            This function queries Cisco Catalyst Center to retrieve the type of a specified site. It uses the
-            get_site API with the provided site name, extracts the site type from the response, and returns it.
-            If the specified site is not found, the function returns None, and an appropriate log message is generated.
-        """
-
-        try:
-            site_type = None
-            response = self.dnac_apply['exec'](
-                family="sites",
-                function='get_site',
-                params={"name": site_name},
-            )
-
-            if not response:
-                self.msg = "Site '{0}' not found".format(site_name)
-                self.log(self.msg, "INFO")
-                return site_type
-
-            self.log("Received API response from 'get_site': {0}".format(str(response)), "DEBUG")
-            site = response.get("response")
-            site_additional_info = site[0].get("additionalInfo")
-
-            for item in site_additional_info:
-                if item["nameSpace"] == "Location":
-                    site_type = item.get("attributes").get("type")
-
-        except Exception as e:
-            self.msg = "Error while fetching the site '{0}'.".format(site_name)
-            self.log(self.msg, "ERROR")
-            self.module.fail_json(msg="Site not found", response=[])
-
-        return site_type
-
     def provisioned_wireless_devices(self, device_ips):
         """
         Provision Wireless devices in Cisco Catalyst Center.
@@ -1772,88 +1902,26 @@ class DnacDevice(DnacBase):
             self (object): An instance of the class with updated result, status, and log.
         Description:
             This function performs wireless provisioning for the provided list of device IP addresses.
-            It iterates through each device, retrieves provisioning parameters using the get_wireless_param function,
-            and then calls the Cisco Catalyst Center API for wireless provisioning. If all devices are already provisioned,
-            it returns success with a relevant message.
+            The devices are handed to 'provision_devices', which retrieves the provisioning parameters of each managed
+            device using the get_wireless_param function and calls the Cisco Catalyst Center API for wireless provisioning.
+            If all devices are already provisioned, it returns success with a relevant message.
         """
 
-        provision_count, already_provision_count = 0, 0
         device_type = "Wireless"
 
         device_in_dnac = self.device_exists_in_dnac()
         device_ips = self.get_device_ips_from_config_priority()
         input_device_ips = device_ips.copy()
 
-        for device_ip in input_device_ips:
-            if device_ip not in device_in_dnac:
-                input_device_ips.remove(device_ip)
-
-        for device_ip in input_device_ips:
-            try:
-                # Collect the device parameters from the playbook to perform wireless provisioing
-                self.get_wireless_param(device_ip).check_return_status()
-                provisioning_params = self.wireless_param
-                count = 1
-                managed_flag = True
-
-                # Check till device comes into managed state
-                while True:
-                    response = self.get_device_response(device_ip)
-                    self.log("Device is in {0} state waiting for Managed State.".format(response['managementState']), "DEBUG")
-
-                    if (
-                        response.get('managementState') == "Managed"
-                        and response.get('collectionStatus') == "Managed"
-                        and response.get("hostname")
-                    ):
-                        break
-
-                    count = count + 1
-                    if count > 200:
-                        managed_flag = False
-                        break
-
-                if not managed_flag:
-                    self.log("Device {0} is not transitioning to the managed state, so provisioning operation cannot be performed."
-                             .format(device_ip), 'WARNING')
-                    continue
-
-                # Now we have provisioning_param so we can do wireless provisioning
-                response = self.dnac_apply['exec'](
-                    family="wireless",
-                    function="provision",
-                    op_modifies=True,
-                    params=provisioning_params,
-                )
+        input_device_ips = [device_ip for device_ip in input_device_ips if device_ip in device_in_dnac]
 
-                if response.get("status") == "failed":
-                    description = response.get("description")
-                    error_msg = "Cannot do Provisioning for Wireless device {0} beacuse of {1}".format(device_ip, description)
-                    self.log(error_msg, "ERROR")
-                    continue
-
-                task_id = response.get("taskId")
-
-                while True:
-                    execution_details = self.get_task_details(task_id)
-                    progress = execution_details.get("progress")
-                    self.log(progress)
-                    if 'TASK_PROVISION' in progress:
-                        self.handle_successful_provisioning(device_ip, execution_details, device_type)
-                        provision_count += 1
-                        break
-                    elif execution_details.get("isError"):
-                        self.handle_failed_provisioning(device_ip, execution_details, device_type)
-                        break
+        def get_params(device_ip):
+            # Collect the device parameters from the playbook to perform wireless provisioing
+            self.get_wireless_param(device_ip).check_return_status()
+            return self.wireless_param
 
-            except Exception as e:
-                # Not returning from here as there might be possiblity that for some devices it comes into exception
-                # but for others it gets provision successfully or If some devices are already provsioned
-                self.handle_provisioning_exception(device_ip, e, device_type)
-                if "already provisioned" in str(e):
-                    self.msg = "Device '{0}' already provisioned".format(device_ip)
-                    self.log(self.msg, "INFO")
-                    already_provision_count += 1
+        provision_count, already_provision_count = self.provision_devices(
+            input_device_ips, get_params, "wireless", "provision", device_type)
 
         # Check If all the devices are already provsioned, return from here only
         if already_provision_count == len(device_ips):
@@ -1887,7 +1955,7 @@ class DnacDevice(DnacBase):
                 function='get_all_user_defined_fields',
                 params={"name": field_name},
             )
-            self.log("Received API response from 'get_all_user_defined_fields': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_all_user_defined_fields': {0}", "DEBUG", args=(response,))
             udf = response.get("response")
             udf_id = udf[0].get("id")
 
@@ -1948,11 +2016,12 @@ class DnacDevice(DnacBase):
         Description:
             This function checks the specified devices in the playbook against the devices existing in Cisco Catalyst Center with following keys:
             - "want_device": A list of devices specified in the playbook.
-            - "device_in_dnac": A list of devices that already exist in Cisco Catalyst Center.
+            - "device_in_dnac": The set of devices that already exist in Cisco Catalyst Center.
             - "device_not_in_dnac": A list of devices that are not present in Cisco Catalyst Center.
         """
 
         have = {}
+        self.reset_device_index()
         want_device = self.get_device_ips_from_config_priority()
 
         # Get the list of device that are present in Cisco Catalyst Center
@@ -2037,33 +2106,36 @@ class DnacDevice(DnacBase):
         Returns:
             list: The list of unique device IDs for the specified devices.
         Description:
-            Queries Cisco Catalyst Center to retrieve the unique device ID associated with a device having the specified
-            IP address. If the device is not found in Cisco Catalyst Center, then print the log message with error severity.
+            Looks up the unique device ID associated with a device having the specified IP address in the inventory
+            index. If the device is not found in Cisco Catalyst Center, it is left out of the result.
         """
 
         device_ids = []
-
         for device_ip in device_ips:
-            try:
-                response = self.dnac._exec(
-                    family="devices",
-                    function='get_device_list',
-                    params={"managementIpAddress": device_ip}
-                )
+            device = self.get_indexed_device("managementIpAddress", device_ip)
+            if device:
+                device_ids.append(device["id"])
 
-                if response:
-                    self.log("Received API response from 'get_device_list': {0}".format(str(response)), "DEBUG")
-                    response = response.get("response")
-                    if not response:
-                        continue
-                    device_id = response[0]["id"]
-                    device_ids.append(device_id)
+        return device_ids
 
-            except Exception as e:
-                error_message = "Error while fetching device '{0}' from Cisco Catalyst Center: {1}".format(device_ip, str(e))
-                self.log(error_message, "ERROR")
+    def get_device_ips_from_field(self, field, value_list):
+        """
+        Get the list of unique device IPs for a list of values of one device attribute in Cisco Catalyst Center.
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            field (str): The device attribute the values belong to, one of 'DEVICE_INDEX_FIELDS'.
+            value_list (list): The values of devices for which you want to retrieve the device IPs.
+        Returns:
+            list: The list of unique device IPs for the specified values.
+        """
 
-        return device_ids
+        device_ips = []
+        for value in value_list:
+            device = self.get_indexed_device(field, value)
+            if device and device.get("managementIpAddress"):
+                device_ips.append(device["managementIpAddress"])
+
+        return device_ips
 
     def get_device_ips_from_hostname(self, hostname_list):
         """
@@ -2074,30 +2146,11 @@ class DnacDevice(DnacBase):
         Returns:
             list: The list of unique device IPs for the specified devices hostname list.
         Description:
-            Queries Cisco Catalyst Center to retrieve the unique device IP's associated with a device having the specified
-            list of hostnames. If a device is not found in Cisco Catalyst Center, an error log message is printed.
+            Looks up the devices having the specified hostnames in the inventory index. If a device is not found
+            in Cisco Catalyst Center, it is left out of the result.
         """
 
-        device_ips = []
-        for hostname in hostname_list:
-            try:
-                response = self.dnac._exec(
-                    family="devices",
-                    function='get_device_list',
-                    params={"hostname": hostname}
-                )
-                if response:
-                    self.log("Received API response from 'get_device_list': {0}".format(str(response)), "DEBUG")
-                    response = response.get("response")
-                    if response:
-                        device_ip = response[0]["managementIpAddress"]
-                        if device_ip:
-                            device_ips.append(device_ip)
-            except Exception as e:
-                error_message = "Exception occurred while fetching device from Cisco Catalyst Center: {0}".format(str(e))
-                self.log(error_message, "ERROR")
-
-        return device_ips
+        return self.get_device_ips_from_field("hostname", hostname_list)
 
     def get_device_ips_from_serial_number(self, serial_number_list):
         """
@@ -2108,30 +2161,11 @@ class DnacDevice(DnacBase):
         Returns:
             list: The list of unique device IPs for the specified devices with serial numbers.
         Description:
-            Queries Cisco Catalyst Center to retrieve the unique device IPs associated with a device having the specified
-            serial numbers.If a device is not found in Cisco Catalyst Center, an error log message is printed.
+            Looks up the devices having the specified serial numbers in the inventory index. If a device is not found
+            in Cisco Catalyst Center, it is left out of the result.
         """
 
-        device_ips = []
-        for serial_number in serial_number_list:
-            try:
-                response = self.dnac._exec(
-                    family="devices",
-                    function='get_device_list',
-                    params={"serialNumber": serial_number}
-                )
-                if response:
-                    self.log("Received API response from 'get_device_list': {0}".format(str(response)), "DEBUG")
-                    response = response.get("response")
-                    if response:
-                        device_ip = response[0]["managementIpAddress"]
-                        if device_ip:
-                            device_ips.append(device_ip)
-            except Exception as e:
-                error_message = "Exception occurred while fetching device from Cisco Catalyst Center - {0}".format(str(e))
-                self.log(error_message, "ERROR")
-
-        return device_ips
+        return self.get_device_ips_from_field("serialNumber", serial_number_list)
 
     def get_device_ips_from_mac_address(self, mac_address_list):
         """
@@ -2142,30 +2176,11 @@ class DnacDevice(DnacBase):
         Returns:
             list: The list of unique device IPs for the specified devices.
         Description:
-            Queries Cisco Catalyst Center to retrieve the unique device IPs associated with a device having the specified
-            mac addresses. If a device is not found in Cisco Catalyst Center, an error log message is printed.
+            Looks up the devices having the specified MAC addresses in the inventory index. If a device is not found
+            in Cisco Catalyst Center, it is left out of the result.
         """
 
-        device_ips = []
-        for mac_address in mac_address_list:
-            try:
-                response = self.dnac._exec(
-                    family="devices",
-                    function='get_device_list',
-                    params={"macAddress": mac_address}
-                )
-                if response:
-                    self.log("Received API response from 'get_device_list': {0}".format(str(response)), "DEBUG")
-                    response = response.get("response")
-                    if response:
-                        device_ip = response[0]["managementIpAddress"]
-                        if device_ip:
-                            device_ips.append(device_ip)
-            except Exception as e:
-                error_message = "Exception occurred while fetching device from Cisco Catalyst Center - {0}".format(str(e))
-                self.log(error_message, "ERROR")
-
-        return device_ips
+        return self.get_device_ips_from_field("macAddress", mac_address_list)
 
     def get_interface_from_id_and_name(self, device_id, interface_name):
         """
@@ -2192,7 +2207,7 @@ class DnacDevice(DnacBase):
                 function='get_interface_details',
                 params=interface_detail_params
             )
-            self.log("Received API response from 'get_interface_details': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_interface_details': {0}", "DEBUG", args=(response,))
             response = response.get("response")
 
             if response:
@@ -2229,7 +2244,7 @@ class DnacDevice(DnacBase):
                     function='get_interface_by_ip',
                     params={"ip_address": device_ip}
                 )
-                self.log("Received API response from 'get_interface_by_ip': {0}".format(str(response)), "DEBUG")
+                self.log("Received API response from 'get_interface_by_ip': {0}", "DEBUG", args=(response,))
                 response = response.get("response")
 
                 if response:
@@ -2321,7 +2336,7 @@ class DnacDevice(DnacBase):
             function='get_interface_details',
             params=interface_detail_params
         )
-        self.log("Received API response from 'get_interface_details': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'get_interface_details': {0}", "DEBUG", args=(response,))
         response = response.get("response")
 
         if not response:
@@ -2373,6 +2388,7 @@ class DnacDevice(DnacBase):
         csv_reader = self.decrypt_and_read_csv(response, password)
         self.check_return_status()
         device_data = next(csv_reader, None)
+        csv_reader.close()
 
         if not device_data:
             return False
@@ -2471,30 +2487,28 @@ class DnacDevice(DnacBase):
                     op_modifies=True,
                     params=update_interface_params,
                 )
-                self.log("Received API response from 'update_interface_details': {0}".format(str(response)), "DEBUG")
+                self.log("Received API response from 'update_interface_details': {0}", "DEBUG", args=(response,))
 
                 if response and isinstance(response, dict):
                     task_id = response.get('response').get('taskId')
+                    execution_details = self.wait_for_task(task_id, task_progress_contains('SUCCESS'))
+                    if execution_details is None:
+                        return self
 
-                    while True:
-                        execution_details = self.get_task_details(task_id)
-
-                        if 'SUCCESS' in execution_details.get("progress"):
-                            self.status = "success"
-                            self.result['changed'] = True
-                            self.result['response'] = execution_details
-                            self.msg = "Updated Interface Details for device '{0}' successfully".format(device_ip)
-                            self.log(self.msg, "INFO")
-                            break
-                        elif execution_details.get("isError"):
-                            self.status = "failed"
-                            failure_reason = execution_details.get("failureReason")
-                            if failure_reason:
-                                self.msg = "Interface Updation get failed because of {0}".format(failure_reason)
-                            else:
-                                self.msg = "Interface Updation get failed"
-                            self.log(self.msg, "ERROR")
-                            break
+                    if execution_details.get("isError"):
+                        self.status = "failed"
+                        failure_reason = execution_details.get("failureReason")
+                        if failure_reason:
+                            self.msg = "Interface Updation get failed because of {0}".format(failure_reason)
+                        else:
+                            self.msg = "Interface Updation get failed"
+                        self.log(self.msg, "ERROR")
+                    else:
+                        self.status = "success"
+                        self.result['changed'] = True
+                        self.result['response'] = execution_details
+                        self.msg = "Updated Interface Details for device '{0}' successfully".format(device_ip)
+                        self.log(self.msg, "INFO")
 
             except Exception as e:
                 error_message = "Error while updating interface details in Cisco Catalyst Center: {0}".format(str(e))
@@ -2506,6 +2520,74 @@ class DnacDevice(DnacBase):
 
         return self
 
+    def get_device_update_params(self, device_ip, device_data):
+        """
+        Build the 'sync_devices' parameters for updating the details and credentials of one device.
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            device_ip (str): The management IP address of the device to update.
+            device_data (dict): The row of the device in the exported device details.
+        Returns:
+            dict: The update parameters of the device, where every credential missing from the playbook
+                  is taken from the exported device details.
+        """
+
+        playbook_params = self.want.get("device_params").copy()
+        playbook_params['ipAddress'] = [device_ip]
+
+        if not playbook_params['cliTransport']:
+            if device_data['protocol'] == "ssh2":
+                playbook_params['cliTransport'] = "ssh"
+            else:
+                playbook_params['cliTransport'] = device_data['protocol']
+        if not playbook_params['snmpPrivProtocol']:
+            playbook_params['snmpPrivProtocol'] = device_data['snmpv3_privacy_type']
+
+        csv_data_dict = {
+            'username': device_data['cli_username'],
+            'password': device_data['cli_password'],
+            'enable_password': device_data['cli_enable_password'],
+            'netconf_port': device_data['netconf_port'],
+        }
+
+        if device_data['snmp_version'] == '3':
+            csv_data_dict['snmp_username'] = device_data['snmpv3_user_name']
+            if device_data['snmpv3_privacy_password']:
+                csv_data_dict['snmp_auth_passphrase'] = device_data['snmpv3_auth_password']
+                csv_data_dict['snmp_priv_passphrase'] = device_data['snmpv3_privacy_password']
+
+        device_key_mapping = {
+            'username': 'userName',
+            'password': 'password',
+            'enable_password': 'enablePassword',
+            'snmp_username': 'snmpUserName',
+            'netconf_port': 'netconfPort'
+        }
+        device_update_key_list = ["username", "password", "enable_password", "snmp_username", "netconf_port"]
+
+        for key in device_update_key_list:
+            mapped_key = device_key_mapping[key]
+
+            if playbook_params[mapped_key] is None:
+                if playbook_params['snmpMode'] == "AUTHPRIV":
+                    playbook_params['snmpAuthPassphrase'] = csv_data_dict['snmp_auth_passphrase']
+                    playbook_params['snmpPrivPassphrase'] = csv_data_dict['snmp_priv_passphrase']
+                playbook_params[mapped_key] = csv_data_dict[key]
+
+        if playbook_params['snmpMode'] == "NOAUTHNOPRIV":
+            playbook_params.pop('snmpAuthPassphrase', None)
+            playbook_params.pop('snmpPrivPassphrase', None)
+            playbook_params.pop('snmpPrivProtocol', None)
+            playbook_params.pop('snmpAuthProtocol', None)
+        elif playbook_params['snmpMode'] == "AUTHNOPRIV":
+            playbook_params.pop('snmpPrivPassphrase', None)
+            playbook_params.pop('snmpPrivProtocol', None)
+
+        if playbook_params['netconfPort'] == " ":
+            playbook_params['netconfPort'] = None
+
+        return playbook_params
+
     def check_managementip_execution_response(self, response, device_ip, new_mgmt_ipaddress):
         """
         Check the execution response of a management IP update task.
@@ -2524,66 +2606,115 @@ class DnacDevice(DnacBase):
         """
 
         task_id = response.get('response').get('taskId')
+        execution_details = self.wait_for_task(task_id, is_task_finished)
+        if execution_details is None:
+            return self
 
-        while True:
-            execution_details = self.get_task_details(task_id)
-            if execution_details.get("isError"):
-                self.status = "failed"
-                failure_reason = execution_details.get("failureReason")
-                if failure_reason:
-                    self.msg = "Device new management IP updation for device '{0}' get failed due to {1}".format(device_ip, failure_reason)
-                else:
-                    self.msg = "Device new management IP updation for device '{0}' get failed".format(device_ip)
-                self.log(self.msg, "ERROR")
-                break
-            elif execution_details.get("endTime"):
-                self.status = "success"
-                self.result['changed'] = True
-                self.result['response'] = execution_details
-                self.msg = """Device '{0}' present in Cisco Catalyst Center and new management ip '{1}' have been
-                            updated successfully""".format(device_ip, new_mgmt_ipaddress)
-                self.log(self.msg, "INFO")
-                break
+        if execution_details.get("isError"):
+            self.status = "failed"
+            failure_reason = execution_details.get("failureReason")
+            if failure_reason:
+                self.msg = "Device new management IP updation for device '{0}' get failed due to {1}".format(device_ip, failure_reason)
+            else:
+                self.msg = "Device new management IP updation for device '{0}' get failed".format(device_ip)
+            self.log(self.msg, "ERROR")
+        else:
+            self.status = "success"
+            self.result['changed'] = True
+            self.result['response'] = execution_details
+            self.msg = """Device '{0}' present in Cisco Catalyst Center and new management ip '{1}' have been
+                        updated successfully""".format(device_ip, new_mgmt_ipaddress)
+            self.log(self.msg, "INFO")
 
         return self
 
-    def check_device_update_execution_response(self, response, device_ip):
+    def update_devices_in_batches(self, device_params_list):
         """
-        Check the execution response of a device update task.
+        Update the details and credentials of several devices with as few 'sync_devices' requests as possible.
         Parameters:
             self (object): An instance of a class used for interacting with Cisco Catalyst Center.
-            response (dict): The response received after initiating the device update task.
-            device_ip (str): The IP address of the device for which the update is performed.
+            device_params_list (list): The update parameters of every device, as built by 'get_device_update_params'.
         Returns:
             self (object): An instance of a class used for interacting with Cisco Catalyst Center.
         Description:
-            This method checks the execution response of a device update task in Cisco Catalyst Center.
-            It continuously queries the task details until the task is completed or an error occurs.
-            If the task is successful, it sets the status to 'success' and logs an informational message.
-            If the task fails, it sets the status to 'failed' and logs an error message with the failure reason, if available.
-        """
+            Devices whose update parameters are identical apart from their IP address share the same target
+            credentials, so they are grouped and sent together in requests of at most 'update_batch_size' devices.
+            At most 'update_max_concurrency' of the resulting tasks are kept running on Cisco Catalyst Center at
+            the same time and all of them are awaited in a single polling loop. Every device takes the outcome of
+            the task created for its request.
+        """
+
+        batch_size = max(int(self.config[0].get("update_batch_size") or INVENTORY_UPDATE_BATCH_SIZE), 1)
+        max_concurrency = max(int(self.config[0].get("update_max_concurrency") or INVENTORY_UPDATE_MAX_CONCURRENCY), 1)
+
+        device_groups = {}
+        for playbook_params in device_params_list:
+            shared_params = dict((key, value) for key, value in playbook_params.items() if key != 'ipAddress')
+            group_key = json.dumps(shared_params, sort_keys=True, default=str)
+            device_groups.setdefault(group_key, (shared_params, []))[1].extend(playbook_params['ipAddress'])
+
+        batches = []
+        for group_key, (shared_params, device_ips) in device_groups.items():
+            for i in range(0, len(device_ips), batch_size):
+                batches.append((group_key, tuple(device_ips[i:i + batch_size])))
+
+        self.log("Updating {0} device(s) with {1} distinct set(s) of parameters in {2} request(s), at most {3} task(s) at a time"
+                 .format(len(device_params_list), len(device_groups), len(batches), max_concurrency), "INFO")
+
+        def submit(batch):
+            group_key, device_ips = batch
+            playbook_params = dict(device_groups[group_key][0], ipAddress=list(device_ips))
+            self.log("Playbook parameter for updating devices: {0}", "DEBUG", args=(playbook_params,))
+            try:
+                response = self.dnac._exec(
+                    family="devices",
+                    function='sync_devices',
+                    op_modifies=True,
+                    params=playbook_params,
+                )
+            except Exception as e:
+                error_message = "Error while updating device in Cisco Catalyst Center: {0}".format(str(e))
+                self.log(error_message, "ERROR")
+                raise Exception(error_message)
 
-        task_id = response.get('response').get('taskId')
+            self.log("Received API response from 'sync_devices': {0}", "DEBUG", args=(response,))
+            if response and isinstance(response, dict):
+                return response.get('response').get('taskId')
 
-        while True:
-            execution_details = self.get_task_details(task_id)
+            return None
 
-            if execution_details.get("isError"):
-                self.status = "failed"
-                failure_reason = execution_details.get("failureReason")
-                if failure_reason:
-                    self.msg = "Device Updation for device '{0}' get failed due to {1}".format(device_ip, failure_reason)
-                else:
-                    self.msg = "Device Updation for device '{0}' get failed".format(device_ip)
-                self.log(self.msg, "ERROR")
-                break
-            elif execution_details.get("endTime"):
-                self.status = "success"
-                self.result['changed'] = True
+        task_results = self.run_tasks(batches, submit, is_task_finished, max_concurrency=max_concurrency)
+        self.reset_device_index()
+
+        updated_device_ips = []
+        failed_devices = []
+        for (group_key, device_ips), execution_details in task_results.items():
+            if execution_details and not execution_details.get("isError"):
+                updated_device_ips.extend(device_ips)
                 self.result['response'] = execution_details
-                self.msg = "Device '{0}' present in Cisco Catalyst Center and have been updated successfully".format(device_ip)
-                self.log(self.msg, "INFO")
-                break
+                continue
+
+            if execution_details is None:
+                failure_reason = "the update task was not created or did not complete in time"
+            else:
+                failure_reason = execution_details.get("failureReason") or "an unknown error"
+
+            for device_ip in device_ips:
+                self.log("Device Updation for device '{0}' get failed due to {1}".format(device_ip, failure_reason), "ERROR")
+                failed_devices.append("{0} ({1})".format(device_ip, failure_reason))
+
+        if updated_device_ips:
+            self.result['changed'] = True
+
+        if failed_devices:
+            self.status = "failed"
+            self.msg = "Device Updation get failed for device(s): {0}".format(", ".join(failed_devices))
+            self.log(self.msg, "ERROR")
+            return self
+
+        self.status = "success"
+        self.msg = "Device(s) '{0}' present in Cisco Catalyst Center and have been updated successfully".format(str(updated_device_ips))
+        self.log(self.msg, "INFO")
 
         return self
 
@@ -2704,64 +2835,20 @@ class DnacDevice(DnacBase):
                     ip_address = row['ip_address']
                     device_details[ip_address] = row
 
+                device_params_list = []
                 for device_ip in device_to_update:
-                    playbook_params = self.want.get("device_params").copy()
-                    playbook_params['ipAddress'] = [device_ip]
-                    device_data = device_details[device_ip]
-
-                    if not playbook_params['cliTransport']:
-                        if device_data['protocol'] == "ssh2":
-                            playbook_params['cliTransport'] = "ssh"
-                        else:
-                            playbook_params['cliTransport'] = device_data['protocol']
-                    if not playbook_params['snmpPrivProtocol']:
-                        playbook_params['snmpPrivProtocol'] = device_data['snmpv3_privacy_type']
-
-                    csv_data_dict = {
-                        'username': device_data['cli_username'],
-                        'password': device_data['cli_password'],
-                        'enable_password': device_data['cli_enable_password'],
-                        'netconf_port': device_data['netconf_port'],
-                    }
-
-                    if device_data['snmp_version'] == '3':
-                        csv_data_dict['snmp_username'] = device_data['snmpv3_user_name']
-                        if device_data['snmpv3_privacy_password']:
-                            csv_data_dict['snmp_auth_passphrase'] = device_data['snmpv3_auth_password']
-                            csv_data_dict['snmp_priv_passphrase'] = device_data['snmpv3_privacy_password']
-
-                    device_key_mapping = {
-                        'username': 'userName',
-                        'password': 'password',
-                        'enable_password': 'enablePassword',
-                        'snmp_username': 'snmpUserName',
-                        'netconf_port': 'netconfPort'
-                    }
-                    device_update_key_list = ["username", "password", "enable_password", "snmp_username", "netconf_port"]
-
-                    for key in device_update_key_list:
-                        mapped_key = device_key_mapping[key]
-
-                        if playbook_params[mapped_key] is None:
-                            if playbook_params['snmpMode'] == "AUTHPRIV":
-                                playbook_params['snmpAuthPassphrase'] = csv_data_dict['snmp_auth_passphrase']
-                                playbook_params['snmpPrivPassphrase'] = csv_data_dict['snmp_priv_passphrase']
-                            playbook_params[mapped_key] = csv_data_dict[key]
-
-                    if playbook_params['snmpMode'] == "NOAUTHNOPRIV":
-                        playbook_params.pop('snmpAuthPassphrase', None)
-                        playbook_params.pop('snmpPrivPassphrase', None)
-                        playbook_params.pop('snmpPrivProtocol', None)
-                        playbook_params.pop('snmpAuthProtocol', None)
-                    elif playbook_params['snmpMode'] == "AUTHNOPRIV":
-                        playbook_params.pop('snmpPrivPassphrase', None)
-                        playbook_params.pop('snmpPrivProtocol', None)
+                    device_data = device_details.get(device_ip)
+                    if device_data is None:
+                        self.log("Device '{0}' is not present in the exported device details, so it is not updated".format(device_ip), "WARNING")
+                        continue
 
-                    if playbook_params['netconfPort'] == " ":
-                        playbook_params['netconfPort'] = None
+                    device_params_list.append(self.get_device_update_params(device_ip, device_data))
 
-                    try:
-                        if playbook_params['updateMgmtIPaddressList']:
+                if self.want.get("device_params").get('updateMgmtIPaddressList'):
+                    # A new management IP address belongs to a single device, so these updates stay one by one
+                    for playbook_params in device_params_list:
+                        device_ip = playbook_params['ipAddress'][0]
+                        try:
                             new_mgmt_ipaddress = playbook_params['updateMgmtIPaddressList'][0]['newMgmtIpAddress']
                             if new_mgmt_ipaddress in self.have['device_in_dnac']:
                                 self.status = "failed"
@@ -2769,37 +2856,26 @@ class DnacDevice(DnacBase):
                                 self.log(self.msg, "ERROR")
                                 self.result['response'] = self.msg
                             else:
-                                self.log("Playbook parameter for updating device new management ip address: {0}".format(str(playbook_params)), "DEBUG")
+                                self.log("Playbook parameter for updating device new management ip address: {0}", "DEBUG", args=(playbook_params,))
                                 response = self.dnac._exec(
                                     family="devices",
                                     function='sync_devices',
                                     op_modifies=True,
                                     params=playbook_params,
                                 )
-                                self.log("Received API response from 'sync_devices': {0}".format(str(response)), "DEBUG")
+                                self.log("Received API response from 'sync_devices': {0}", "DEBUG", args=(response,))
+                                self.reset_device_index()
 
                                 if response and isinstance(response, dict):
                                     self.check_managementip_execution_response(response, device_ip, new_mgmt_ipaddress)
                                     self.check_return_status()
 
-                        else:
-                            self.log("Playbook parameter for updating devices: {0}".format(str(playbook_params)), "DEBUG")
-                            response = self.dnac._exec(
-                                family="devices",
-                                function='sync_devices',
-                                op_modifies=True,
-                                params=playbook_params,
-                            )
-                            self.log("Received API response from 'sync_devices': {0}".format(str(response)), "DEBUG")
-
-                            if response and isinstance(response, dict):
-                                self.check_device_update_execution_response(response, device_ip)
-                                self.check_return_status()
-
-                    except Exception as e:
-                        error_message = "Error while updating device in Cisco Catalyst Center: {0}".format(str(e))
-                        self.log(error_message, "ERROR")
-                        raise Exception(error_message)
+                        except Exception as e:
+                            error_message = "Error while updating device in Cisco Catalyst Center: {0}".format(str(e))
+                            self.log(error_message, "ERROR")
+                            raise Exception(error_message)
+                else:
+                    self.update_devices_in_batches(device_params_list).check_return_status()
 
             if self.config[0].get('update_interface_details'):
                 self.update_interface_detail_of_device(device_to_update).check_return_status()
@@ -2816,12 +2892,7 @@ class DnacDevice(DnacBase):
                         return self
 
                     # Check if the same role of device is present in dnac then no need to change the state
-                    response = self.dnac._exec(
-                        family="devices",
-                        function='get_device_list',
-                        params={"managementIpAddress": device_ip}
-                    )
-                    response = response.get('response')[0]
+                    response = self.get_indexed_device("managementIpAddress", device_ip)
 
                     if response.get('role') == device_role_args.get('role'):
                         self.status = "success"
@@ -2843,30 +2914,29 @@ class DnacDevice(DnacBase):
                             op_modifies=True,
                             params=device_role_params,
                         )
-                        self.log("Received API response from 'update_device_role': {0}".format(str(response)), "DEBUG")
+                        self.log("Received API response from 'update_device_role': {0}", "DEBUG", args=(response,))
+                        self.reset_device_index()
 
                         if response and isinstance(response, dict):
                             task_id = response.get('response').get('taskId')
+                            execution_details = self.wait_for_task(task_id, task_progress_contains('successfully'))
+                            if execution_details is None:
+                                return self
 
-                            while True:
-                                execution_details = self.get_task_details(task_id)
-
-                                if 'successfully' in execution_details.get("progress"):
-                                    self.status = "success"
-                                    self.result['changed'] = True
-                                    self.result['response'] = execution_details
-                                    self.msg = "Device(s) '{0}' role updated successfully".format(str(device_to_update))
-                                    self.log(self.msg, "INFO")
-                                    break
-                                elif execution_details.get("isError"):
-                                    self.status = "failed"
-                                    failure_reason = execution_details.get("failureReason")
-                                    if failure_reason:
-                                        self.msg = "Device role updation get failed because of {0}".format(failure_reason)
-                                    else:
-                                        self.msg = "Device role updation get failed"
-                                    self.log(self.msg, "ERROR")
-                                    break
+                            if execution_details.get("isError"):
+                                self.status = "failed"
+                                failure_reason = execution_details.get("failureReason")
+                                if failure_reason:
+                                    self.msg = "Device role updation get failed because of {0}".format(failure_reason)
+                                else:
+                                    self.msg = "Device role updation get failed"
+                                self.log(self.msg, "ERROR")
+                            else:
+                                self.status = "success"
+                                self.result['changed'] = True
+                                self.result['response'] = execution_details
+                                self.msg = "Device(s) '{0}' role updated successfully".format(str(device_to_update))
+                                self.log(self.msg, "INFO")
 
                     except Exception as e:
                         error_message = "Error while updating device role in Cisco Catalyst Center: {0}".format(str(e))
@@ -2901,38 +2971,35 @@ class DnacDevice(DnacBase):
                     op_modifies=True,
                     params=device_params,
                 )
-                self.log("Received API response from 'add_device': {0}".format(str(response)), "DEBUG")
+                self.log("Received API response from 'add_device': {0}", "DEBUG", args=(response,))
+                self.reset_device_index()
 
                 if response and isinstance(response, dict):
                     task_id = response.get('response').get('taskId')
+                    execution_details = self.wait_for_task(task_id, task_progress_contains('/task/'))
+                    if execution_details is None:
+                        return self
 
-                    while True:
-                        execution_details = self.get_task_details(task_id)
-
-                        if '/task/' in execution_details.get("progress"):
-                            self.status = "success"
-                            self.result['response'] = execution_details
+                    if execution_details.get("isError"):
+                        self.status = "failed"
+                        failure_reason = execution_details.get("failureReason")
+                        if failure_reason:
+                            self.msg = "Device addition get failed because of {0}".format(failure_reason)
+                        else:
+                            self.msg = "Device addition get failed"
+                        self.log(self.msg, "ERROR")
+                        self.result['msg'] = self.msg
+                    else:
+                        self.status = "success"
+                        self.result['response'] = execution_details
 
-                            if len(devices_to_add) > 0:
-                                self.result['changed'] = True
-                                self.msg = "Device(s) '{0}' added to Cisco Catalyst Center".format(str(devices_to_add))
-                                self.log(self.msg, "INFO")
-                                self.result['msg'] = self.msg
-                                break
+                        if len(devices_to_add) > 0:
+                            self.result['changed'] = True
+                            self.msg = "Device(s) '{0}' added to Cisco Catalyst Center".format(str(devices_to_add))
+                        else:
                             self.msg = "Device(s) '{0}' already present in Cisco Catalyst Center".format(str(self.config[0].get("ip_address")))
-                            self.log(self.msg, "INFO")
-                            self.result['msg'] = self.msg
-                            break
-                        elif execution_details.get("isError"):
-                            self.status = "failed"
-                            failure_reason = execution_details.get("failureReason")
-                            if failure_reason:
-                                self.msg = "Device addition get failed because of {0}".format(failure_reason)
-                            else:
-                                self.msg = "Device addition get failed"
-                            self.log(self.msg, "ERROR")
-                            self.result['msg'] = self.msg
-                            break
+                        self.log(self.msg, "INFO")
+                        self.result['msg'] = self.msg
 
             except Exception as e:
                 error_message = "Error while adding device in Cisco Catalyst Center: {0}".format(str(e))
@@ -3031,28 +3098,26 @@ class DnacDevice(DnacBase):
                     params={"id": udf_id},
                 )
                 if response and isinstance(response, dict):
-                    self.log("Received API response from 'delete_user_defined_field': {0}".format(str(response)), "DEBUG")
+                    self.log("Received API response from 'delete_user_defined_field': {0}", "DEBUG", args=(response,))
                     task_id = response.get('response').get('taskId')
+                    execution_details = self.wait_for_task(task_id, task_progress_contains('success'))
+                    if execution_details is None:
+                        return self
 
-                    while True:
-                        execution_details = self.get_task_details(task_id)
-
-                        if 'success' in execution_details.get("progress"):
-                            self.status = "success"
-                            self.msg = "Global UDF '{0}' deleted successfully from Cisco Catalyst Center".format(field_name)
-                            self.log(self.msg, "INFO")
-                            self.result['changed'] = True
-                            self.result['response'] = execution_details
-                            break
-                        elif execution_details.get("isError"):
-                            self.status = "failed"
-                            failure_reason = execution_details.get("failureReason")
-                            if failure_reason:
-                                self.msg = "Failed to delete Global User Defined Field(UDF) due to: {0}".format(failure_reason)
-                            else:
-                                self.msg = "Global UDF deletion get failed."
-                            self.log(self.msg, "ERROR")
-                            break
+                    if execution_details.get("isError"):
+                        self.status = "failed"
+                        failure_reason = execution_details.get("failureReason")
+                        if failure_reason:
+                            self.msg = "Failed to delete Global User Defined Field(UDF) due to: {0}".format(failure_reason)
+                        else:
+                            self.msg = "Global UDF deletion get failed."
+                        self.log(self.msg, "ERROR")
+                    else:
+                        self.status = "success"
+                        self.msg = "Global UDF '{0}' deleted successfully from Cisco Catalyst Center".format(field_name)
+                        self.log(self.msg, "INFO")
+                        self.result['changed'] = True
+                        self.result['response'] = execution_details
 
             except Exception as e:
                 error_message = "Error while deleting Global UDF from Cisco Catalyst Center: {0}".format(str(e))
@@ -3087,19 +3152,18 @@ class DnacDevice(DnacBase):
                         params=provision_params,
                     )
                     executionid = response.get("executionId")
+                    execution_details = self.wait_for_execution(executionid)
+                    if execution_details is None:
+                        continue
 
-                    while True:
-                        execution_details = self.get_execution_details(executionid)
-                        if execution_details.get("status") == "SUCCESS":
-                            self.result['changed'] = True
-                            self.msg = execution_details.get("bapiName")
-                            self.log(self.msg, "INFO")
-                            self.result['response'] = self.msg
-                            break
-                        elif execution_details.get("bapiError"):
-                            self.msg = execution_details.get("bapiError")
-                            self.log(self.msg, "ERROR")
-                            break
+                    if execution_details.get("status") == "SUCCESS":
+                        self.result['changed'] = True
+                        self.msg = execution_details.get("bapiName")
+                        self.log(self.msg, "INFO")
+                        self.result['response'] = self.msg
+                    else:
+                        self.msg = execution_details.get("bapiError")
+                        self.log(self.msg, "ERROR")
             except Exception as e:
                 device_id = self.get_device_ids([device_ip])
                 delete_params = {
@@ -3114,26 +3178,23 @@ class DnacDevice(DnacBase):
 
                 if response and isinstance(response, dict):
                     task_id = response.get('response').get('taskId')
+                    execution_details = self.wait_for_task(task_id, task_progress_contains('success'))
 
-                    while True:
-                        execution_details = self.get_task_details(task_id)
-
-                        if 'success' in execution_details.get("progress"):
-                            self.status = "success"
-                            self.msg = "Device '{0}' was successfully deleted from Cisco Catalyst Center".format(device_ip)
-                            self.log(self.msg, "INFO")
-                            self.result['changed'] = True
-                            self.result['response'] = execution_details
-                            break
-                        elif execution_details.get("isError"):
-                            self.status = "failed"
-                            failure_reason = execution_details.get("failureReason")
-                            if failure_reason:
-                                self.msg = "Device '{0}' deletion get failed due to: {1}".format(device_ip, failure_reason)
-                            else:
-                                self.msg = "Device '{0}' deletion get failed.".format(device_ip)
-                            self.log(self.msg, "ERROR")
-                            break
+                    # On timeout poll_until already set 'status' and 'msg'
+                    if execution_details is not None and execution_details.get("isError"):
+                        self.status = "failed"
+                        failure_reason = execution_details.get("failureReason")
+                        if failure_reason:
+                            self.msg = "Device '{0}' deletion get failed due to: {1}".format(device_ip, failure_reason)
+                        else:
+                            self.msg = "Device '{0}' deletion get failed.".format(device_ip)
+                        self.log(self.msg, "ERROR")
+                    elif execution_details is not None:
+                        self.status = "success"
+                        self.msg = "Device '{0}' was successfully deleted from Cisco Catalyst Center".format(device_ip)
+                        self.log(self.msg, "INFO")
+                        self.result['changed'] = True
+                        self.result['response'] = execution_details
                     self.result['msg'] = self.msg
 
         return self
@@ -3324,6 +3385,7 @@ def main():
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
                     }
+    element_spec.update(dnac_intent_argument_spec())
 
     module = AnsibleModule(argument_spec=element_spec,
                            supports_check_mode=False)
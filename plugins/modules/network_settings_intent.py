@@ -411,7 +411,9 @@ from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
     validate_list_of_dicts,
     get_dict_result,
-    dnac_compare_equality,
+    IndexedResult,
+    dnac_compare_difference,
+    dnac_intent_argument_spec,
 )
 
 
@@ -585,12 +587,17 @@ class NetworkSettings(DnacBase):
 
         current_obj = have
         requested_obj = want
-        self.log("Current State (have): {0}".format(current_obj), "DEBUG")
-        self.log("Desired State (want): {0}".format(requested_obj), "DEBUG")
+        self.log("Current State (have): {0}", "DEBUG", args=(current_obj,))
+        self.log("Desired State (want): {0}", "DEBUG", args=(requested_obj,))
 
-        return any(not dnac_compare_equality(current_obj.get(dnac_param),
-                                             requested_obj.get(ansible_param))
-                   for (dnac_param, ansible_param) in obj_params)
+        for (dnac_param, ansible_param) in obj_params:
+            difference = dnac_compare_difference(current_obj.get(dnac_param),
+                                                 requested_obj.get(ansible_param))
+            if difference is not None:
+                self.log("Parameter '{0}' differs at {1}", "DEBUG", args=(dnac_param, list(difference)))
+                return True
+
+        return False
 
     def get_obj_params(self, get_object):
         """
@@ -638,39 +645,6 @@ class NetworkSettings(DnacBase):
 
         return obj_params
 
-    def get_site_id(self, site_name):
-        """
-        Get the site id from the site name.
-        Use check_return_status() to check for failure
-
-        Parameters:
-            site_name (str) - Site name
-
-        Returns:
-            str or None - The Site Id if found, or None if not found or error
-        """
-
-        try:
-            response = self.dnac._exec(
-                family="sites",
-                function='get_site',
-                params={"name": site_name},
-            )
-            self.log("Received API response from 'get_site': {0}".format(response), "DEBUG")
-            if not response:
-                self.log("Failed to retrieve the site ID for the site name: {0}"
-                         .format(site_name), "ERROR")
-                return None
-
-            _id = response.get("response")[0].get("id")
-            self.log("Site ID for site name '{0}': {1}".format(site_name, _id), "DEBUG")
-        except Exception as msg:
-            self.log("Exception occurred while retrieving site_id from the site_name: {0}"
-                     .format(msg), "CRITICAL")
-            return None
-
-        return _id
-
     def get_global_pool_params(self, pool_info):
         """
         Process Global Pool params from playbook data for Global Pool config in Cisco DNA Center
@@ -687,7 +661,7 @@ class NetworkSettings(DnacBase):
             self.log("Global Pool is empty", "INFO")
             return None
 
-        self.log("Global Pool Details: {0}".format(pool_info), "DEBUG")
+        self.log("Global Pool Details: {0}", "DEBUG", args=(pool_info,))
         global_pool = {
             "settings": {
                 "ippool": [{
@@ -699,14 +673,14 @@ class NetworkSettings(DnacBase):
                 }]
             }
         }
-        self.log("Formated global pool details: {0}".format(global_pool), "DEBUG")
+        self.log("Formated global pool details: {0}", "DEBUG", args=(global_pool,))
         global_ippool = global_pool.get("settings").get("ippool")[0]
         if pool_info.get("ipv6") is False:
             global_ippool.update({"IpAddressSpace": "IPv4"})
         else:
             global_ippool.update({"IpAddressSpace": "IPv6"})
 
-        self.log("ip_address_space: {0}".format(global_ippool.get("IpAddressSpace")), "DEBUG")
+        self.log("ip_address_space: {0}", "DEBUG", args=(global_ippool.get("IpAddressSpace"),))
         if not pool_info["gateways"]:
             global_ippool.update({"gateway": ""})
         else:
@@ -785,7 +759,7 @@ class NetworkSettings(DnacBase):
                 else:
                     reserve_pool.update({"ipv4GateWay": ""})
         reserve_pool.update({"slaacSupport": True})
-        self.log("Formatted reserve pool details: {0}".format(reserve_pool), "DEBUG")
+        self.log("Formatted reserve pool details: {0}", "DEBUG", args=(reserve_pool,))
         return reserve_pool
 
     def get_network_params(self, site_id):
@@ -807,7 +781,7 @@ class NetworkSettings(DnacBase):
             function='get_network_v2',
             params={"site_id": site_id}
         )
-        self.log("Received API response from 'get_network_v2': {0}".format(response), "DEBUG")
+        self.log("Received API response from 'get_network_v2': {0}", "DEBUG", args=(response,))
         if not isinstance(response, dict):
             self.log("Failed to retrieve the network details - "
                      "Response is not a dictionary", "ERROR")
@@ -815,23 +789,22 @@ class NetworkSettings(DnacBase):
 
         # Extract various network-related details from the response
         all_network_details = response.get("response")
-        dhcp_details = get_dict_result(all_network_details, "key", "dhcp.server")
-        dns_details = get_dict_result(all_network_details, "key", "dns.server")
-        snmp_details = get_dict_result(all_network_details, "key", "snmp.trap.receiver")
-        syslog_details = get_dict_result(all_network_details, "key", "syslog.server")
-        netflow_details = get_dict_result(all_network_details, "key", "netflow.collector")
-        ntpserver_details = get_dict_result(all_network_details, "key", "ntp.server")
-        timezone_details = get_dict_result(all_network_details, "key", "timezone.site")
-        messageoftheday_details = get_dict_result(all_network_details, "key", "device.banner")
-        network_aaa = get_dict_result(all_network_details, "key", "aaa.network.server.1")
-        network_aaa2 = get_dict_result(all_network_details, "key", "aaa.network.server.2")
-        network_aaa_pan = get_dict_result(all_network_details, "key", "aaa.server.pan.network")
-        clientAndEndpoint_aaa = get_dict_result(all_network_details, "key", "aaa.endpoint.server.1")
-        clientAndEndpoint_aaa2 = get_dict_result(all_network_details,
-                                                 "key",
-                                                 "aaa.endpoint.server.2")
+        network_details_index = IndexedResult(all_network_details)
+        dhcp_details = network_details_index.get("key", "dhcp.server")
+        dns_details = network_details_index.get("key", "dns.server")
+        snmp_details = network_details_index.get("key", "snmp.trap.receiver")
+        syslog_details = network_details_index.get("key", "syslog.server")
+        netflow_details = network_details_index.get("key", "netflow.collector")
+        ntpserver_details = network_details_index.get("key", "ntp.server")
+        timezone_details = network_details_index.get("key", "timezone.site")
+        messageoftheday_details = network_details_index.get("key", "device.banner")
+        network_aaa = network_details_index.get("key", "aaa.network.server.1")
+        network_aaa2 = network_details_index.get("key", "aaa.network.server.2")
+        network_aaa_pan = network_details_index.get("key", "aaa.server.pan.network")
+        clientAndEndpoint_aaa = network_details_index.get("key", "aaa.endpoint.server.1")
+        clientAndEndpoint_aaa2 = network_details_index.get("key", "aaa.endpoint.server.2")
         clientAndEndpoint_aaa_pan = \
-            get_dict_result(all_network_details, "key", "aaa.server.pan.endpoint")
+            network_details_index.get("key", "aaa.server.pan.endpoint")
 
         # Prepare the network details for Cisco DNA Center configuration
         network_details = {
@@ -932,9 +905,83 @@ class NetworkSettings(DnacBase):
                     }
                 })
 
-        self.log("Formatted playbook network details: {0}".format(network_details), "DEBUG")
+        self.log("Formatted playbook network details: {0}", "DEBUG", args=(network_details,))
         return network_details
 
+    def get_all_global_pools(self):
+        """
+        Read all the Global Pools from Cisco DNA Center
+
+        Parameters:
+            None
+
+        Returns:
+            response (dict) - The response of 'get_global_pool'.
+        """
+
+        return self.dnac._exec(
+            family="network_settings",
+            function="get_global_pool",
+        )
+
+    def get_all_reserve_pools(self, site_id):
+        """
+        Read all the Reserved pools of a site from Cisco DNA Center
+
+        Parameters:
+            site_id (str) - The Site ID of the Reserved pools.
+
+        Returns:
+            response (dict) - The response of 'get_reserve_ip_subpool'.
+        """
+
+        return self.dnac._exec(
+            family="network_settings",
+            function="get_reserve_ip_subpool",
+            params={"siteId": site_id}
+        )
+
+    def get_plan_lookups(self, config):
+        """
+        Declare the reads of get_have for one playbook entry
+
+        Parameters:
+            config (dict) - Playbook details containing Global Pool,
+            Reserved Pool, and Network Management configuration.
+
+        Returns:
+            lookups (list) - The global pools, which all the entries share, and the reserved pools
+            and network details of the sites named in the entry, which wait for the site hierarchy.
+        """
+
+        lookups = []
+        if config.get("global_pool_details") is not None:
+            lookups.append((("global_pool",), lambda results: self.get_all_global_pools()))
+
+        site_names = []
+        reserve_pool_details = config.get("reserve_pool_details")
+        if reserve_pool_details is not None and reserve_pool_details.get("site_name"):
+            site_names.append(("reserve_pool", reserve_pool_details.get("site_name"), self.get_all_reserve_pools))
+
+        network_management_details = config.get("network_management_details")
+        if network_management_details is not None and network_management_details.get("site_name"):
+            site_names.append(("network", network_management_details.get("site_name"), self.get_network_params))
+
+        if site_names:
+            lookups.append((("site_tree",), lambda results: self.get_site_tree()))
+
+        for (name, site_name, fetch) in site_names:
+            def read(results, site_name=site_name, fetch=fetch):
+                site_id = self.get_site_id(site_name)
+                if not site_id:
+                    raise ValueError("Site '{0}' not found".format(site_name))
+
+                return fetch(site_id)
+
+            lookups.append(((name, site_name), read, (("site_tree",),)))
+
+        return lookups
+
     def global_pool_exists(self, name):
         """
         Check if the Global Pool with the given name exists
@@ -954,10 +1001,7 @@ class NetworkSettings(DnacBase):
             "details": None,
             "id": None
         }
-        response = self.dnac._exec(
-            family="network_settings",
-            function="get_global_pool",
-        )
+        response = self.get_planned(("global_pool",), self.get_all_global_pools)
         if not isinstance(response, dict):
             self.log("Failed to retrieve the global pool details - "
                      "Response is not a dictionary", "CRITICAL")
@@ -965,8 +1009,8 @@ class NetworkSettings(DnacBase):
 
         all_global_pool_details = response.get("response")
         global_pool_details = get_dict_result(all_global_pool_details, "ipPoolName", name)
-        self.log("Global ip pool name: {0}".format(name), "DEBUG")
-        self.log("Global pool details: {0}".format(global_pool_details), "DEBUG")
+        self.log("Global ip pool name: {0}", "DEBUG", args=(name,))
+        self.log("Global pool details: {0}", "DEBUG", args=(global_pool_details,))
         if not global_pool_details:
             self.log("Global pool {0} does not exist".format(name), "INFO")
             return global_pool
@@ -974,7 +1018,7 @@ class NetworkSettings(DnacBase):
         global_pool.update({"id": global_pool_details.get("id")})
         global_pool["details"] = self.get_global_pool_params(global_pool_details)
 
-        self.log("Formatted global pool details: {0}".format(global_pool), "DEBUG")
+        self.log("Formatted global pool details: {0}", "DEBUG", args=(global_pool,))
         return global_pool
 
     def reserve_pool_exists(self, name, site_name):
@@ -1000,18 +1044,14 @@ class NetworkSettings(DnacBase):
             "success": True
         }
         site_id = self.get_site_id(site_name)
-        self.log("Site ID for the site name {0}: {1}".format(site_name, site_id), "DEBUG")
+        self.log("Site ID for the site name {0}: {1}", "DEBUG", args=(site_name, site_id))
         if not site_id:
             reserve_pool.update({"success": False})
             self.msg = "Failed to get the site id from the site name {0}".format(site_name)
             self.status = "failed"
             return reserve_pool
 
-        response = self.dnac._exec(
-            family="network_settings",
-            function="get_reserve_ip_subpool",
-            params={"siteId": site_id}
-        )
+        response = self.get_planned(("reserve_pool", site_name), lambda: self.get_all_reserve_pools(site_id))
         if not isinstance(response, dict):
             reserve_pool.update({"success": False})
             self.msg = "Error in getting reserve pool - Response is not a dictionary"
@@ -1029,8 +1069,8 @@ class NetworkSettings(DnacBase):
         reserve_pool.update({"id": reserve_pool_details.get("id")})
         reserve_pool.update({"details": self.get_reserve_pool_params(reserve_pool_details)})
 
-        self.log("Reserved pool details: {0}".format(reserve_pool.get("details")), "DEBUG")
-        self.log("Reserved pool id: {0}".format(reserve_pool.get("id")), "DEBUG")
+        self.log("Reserved pool details: {0}", "DEBUG", args=(reserve_pool.get("details"),))
+        self.log("Reserved pool id: {0}", "DEBUG", args=(reserve_pool.get("id"),))
         return reserve_pool
 
     def get_have_global_pool(self, config):
@@ -1072,7 +1112,7 @@ class NetworkSettings(DnacBase):
         # If the Global Pool doesn't exist and a previous name is provided
         # Else try using the previous name
         global_pool = self.global_pool_exists(name)
-        self.log("Global pool details: {0}".format(global_pool), "DEBUG")
+        self.log("Global pool details: {0}", "DEBUG", args=(global_pool,))
         prev_name = global_pool_ippool[0].get("prev_name")
         if global_pool.get("exists") is False and \
                 prev_name is not None:
@@ -1082,8 +1122,8 @@ class NetworkSettings(DnacBase):
                 self.status = "failed"
                 return self
 
-        self.log("Global pool exists: {0}".format(global_pool.get("exists")), "DEBUG")
-        self.log("Current Site: {0}".format(global_pool.get("details")), "DEBUG")
+        self.log("Global pool exists: {0}", "DEBUG", args=(global_pool.get("exists"),))
+        self.log("Current Site: {0}", "DEBUG", args=(global_pool.get("details"),))
         self.have.update({"globalPool": global_pool})
         self.msg = "Collecting the global pool details from the Cisco DNA Center"
         self.status = "success"
@@ -1115,7 +1155,7 @@ class NetworkSettings(DnacBase):
             return self
 
         site_name = reserve_pool_details.get("site_name")
-        self.log("Site Name: {0}".format(site_name), "DEBUG")
+        self.log("Site Name: {0}", "DEBUG", args=(site_name,))
         if site_name is None:
             self.msg = "Missing parameter 'site_name' in reserve_pool_details"
             self.status = "failed"
@@ -1126,7 +1166,7 @@ class NetworkSettings(DnacBase):
         reserve_pool = self.reserve_pool_exists(name, site_name)
         if not reserve_pool.get("success"):
             return self.check_return_status()
-        self.log("Reserved pool details: {0}".format(reserve_pool), "DEBUG")
+        self.log("Reserved pool details: {0}", "DEBUG", args=(reserve_pool,))
 
         # If the Reserved Pool doesn't exist and a previous name is provided
         # Else try using the previous name
@@ -1143,8 +1183,8 @@ class NetworkSettings(DnacBase):
                 self.status = "failed"
                 return self
 
-        self.log("Reserved pool exists: {0}".format(reserve_pool.get("exists")), "DEBUG")
-        self.log("Reserved pool: {0}".format(reserve_pool.get("details")), "DEBUG")
+        self.log("Reserved pool exists: {0}", "DEBUG", args=(reserve_pool.get("exists"),))
+        self.log("Reserved pool: {0}", "DEBUG", args=(reserve_pool.get("details"),))
 
         # If reserve pool exist, convert ipv6AddressSpace to the required format (boolean)
         if reserve_pool.get("exists"):
@@ -1154,7 +1194,7 @@ class NetworkSettings(DnacBase):
             else:
                 reserve_pool_details.update({"ipv6AddressSpace": True})
 
-        self.log("Reserved pool details: {0}".format(reserve_pool), "DEBUG")
+        self.log("Reserved pool details: {0}", "DEBUG", args=(reserve_pool,))
         self.have.update({"reservePool": reserve_pool})
         self.msg = "Collecting the reserve pool details from the Cisco DNA Center"
         self.status = "success"
@@ -1185,8 +1225,8 @@ class NetworkSettings(DnacBase):
             return self
 
         network["site_id"] = site_id
-        network["net_details"] = self.get_network_params(site_id)
-        self.log("Network details from the Catalyst Center: {0}".format(network), "DEBUG")
+        network["net_details"] = self.get_planned(("network", site_name), lambda: self.get_network_params(site_id))
+        self.log("Network details from the Catalyst Center: {0}", "DEBUG", args=(network,))
         self.have.update({"network": network})
         self.msg = "Collecting the network details from the Cisco DNA Center"
         self.status = "success"
@@ -1278,7 +1318,7 @@ class NetworkSettings(DnacBase):
                 if want_ippool.get(key) is None and have_ippool.get(key) is not None:
                     want_ippool[key] = have_ippool[key]
 
-        self.log("Global pool playbook details: {0}".format(want_global), "DEBUG")
+        self.log("Global pool playbook details: {0}", "DEBUG", args=(want_global,))
         self.want.update({"wantGlobal": want_global})
         self.msg = "Collecting the global pool details from the playbook"
         self.status = "success"
@@ -1342,7 +1382,7 @@ class NetworkSettings(DnacBase):
                 self.status = "failed"
                 return self
 
-        self.log("Reserved IP pool playbook details: {0}".format(want_reserve), "DEBUG")
+        self.log("Reserved IP pool playbook details: {0}", "DEBUG", args=(want_reserve,))
 
         # If there are no existing Reserved Pool details, validate and set defaults
         if not self.have.get("reservePool").get("details"):
@@ -1425,7 +1465,7 @@ class NetworkSettings(DnacBase):
             }
         }
         want_network_settings = want_network.get("settings")
-        self.log("Current state (have): {0}".format(self.have), "DEBUG")
+        self.log("Current state (have): {0}", "DEBUG", args=(self.have,))
         if network_management_details.get("dhcp_server") is not None:
             want_network_settings.update({
                 "dhcpServer": network_management_details.get("dhcp_server")
@@ -1628,7 +1668,7 @@ class NetworkSettings(DnacBase):
         else:
             del want_network_settings["clientAndEndpoint_aaa"]
 
-        self.log("Network playbook details: {0}".format(want_network), "DEBUG")
+        self.log("Network playbook details: {0}", "DEBUG", args=(want_network,))
         self.want.update({"wantNetwork": want_network})
         self.msg = "Collecting the network details from the playbook"
         self.status = "success"
@@ -1682,12 +1722,13 @@ class NetworkSettings(DnacBase):
         # Check pool exist, if not create and return
         if not self.have.get("globalPool").get("exists"):
             pool_params = self.want.get("wantGlobal")
-            self.log("Desired State for global pool (want): {0}".format(pool_params), "DEBUG")
+            self.log("Desired State for global pool (want): {0}", "DEBUG", args=(pool_params,))
             response = self.dnac._exec(
                 family="network_settings",
                 function="create_global_pool",
                 params=pool_params,
             )
+            self.forget_planned(("global_pool",))
             self.check_execution_response_status(response).check_return_status()
             self.log("Successfully created global pool '{0}'.".format(name), "INFO")
             result_global_pool.get("response").get(name) \
@@ -1716,7 +1757,7 @@ class NetworkSettings(DnacBase):
         pool_params = copy.deepcopy(self.want.get("wantGlobal"))
         pool_params_ippool = pool_params.get("settings").get("ippool")[0]
         pool_params_ippool.update({"id": self.have.get("globalPool").get("id")})
-        self.log("Desired State for global pool (want): {0}".format(pool_params), "DEBUG")
+        self.log("Desired State for global pool (want): {0}", "DEBUG", args=(pool_params,))
         keys_to_remove = ["IpAddressSpace", "ipPoolCidr", "type"]
         for key in keys_to_remove:
             del pool_params["settings"]["ippool"][0][key]
@@ -1727,12 +1768,13 @@ class NetworkSettings(DnacBase):
             if pool_params_ippool.get(key) is None:
                 pool_params_ippool[key] = have_ippool.get(key)
 
-        self.log("Desired global pool details (want): {0}".format(pool_params), "DEBUG")
+        self.log("Desired global pool details (want): {0}", "DEBUG", args=(pool_params,))
         response = self.dnac._exec(
             family="network_settings",
             function="update_global_pool",
             params=pool_params,
         )
+        self.forget_planned(("global_pool",))
 
         self.check_execution_response_status(response).check_return_status()
         self.log("Global pool '{0}' updated successfully".format(name), "INFO")
@@ -1770,12 +1812,13 @@ class NetworkSettings(DnacBase):
         site_id = self.get_site_id(site_name)
         reserve_params.update({"site_id": site_id})
         if not self.have.get("reservePool").get("exists"):
-            self.log("Desired reserved pool details (want): {0}".format(reserve_params), "DEBUG")
+            self.log("Desired reserved pool details (want): {0}", "DEBUG", args=(reserve_params,))
             response = self.dnac._exec(
                 family="network_settings",
                 function="reserve_ip_subpool",
                 params=reserve_params,
             )
+            self.forget_planned(("reserve_pool", site_name))
             self.check_execution_response_status(response).check_return_status()
             self.log("Successfully created IP subpool reservation '{0}'.".format(name), "INFO")
             result_reserve_pool.get("response").get(name) \
@@ -1796,7 +1839,7 @@ class NetworkSettings(DnacBase):
                 .update({name: "Reserve ip subpool doesn't require an update"})
             return
 
-        self.log("Reserved ip pool '{0}' requires an update".format(name), "DEBUG")
+        self.log("Reserved ip pool '{0}' requires an update", "DEBUG", args=(name,))
         # Pool Exists
         self.log("Current reserved ip pool '{0}' details in Catalyst Center: {1}"
                  .format(name, self.have.get("reservePool")), "DEBUG")
@@ -1808,6 +1851,7 @@ class NetworkSettings(DnacBase):
             function="update_reserve_ip_subpool",
             params=reserve_params,
         )
+        self.forget_planned(("reserve_pool", site_name))
         self.check_execution_response_status(response).check_return_status()
         self.log("Reserved ip subpool '{0}' updated successfully.".format(name), "INFO")
         result_reserve_pool['msg'] = "Reserved Ip Subpool Updated Successfully"
@@ -1846,7 +1890,7 @@ class NetworkSettings(DnacBase):
         self.log("Network in site '{0}' requires update.".format(site_name), "INFO")
         self.log("Current State of network in Catalyst Center: {0}"
                  .format(self.have.get("network")), "DEBUG")
-        self.log("Desired State of network: {0}".format(self.want.get("wantNetwork")), "DEBUG")
+        self.log("Desired State of network: {0}", "DEBUG", args=(self.want.get("wantNetwork"),))
 
         net_params = copy.deepcopy(self.want.get("wantNetwork"))
         net_params.update({"site_id": self.have.get("network").get("site_id")})
@@ -1855,7 +1899,8 @@ class NetworkSettings(DnacBase):
             function='update_network_v2',
             params=net_params,
         )
-        self.log("Received API response of 'update_network_v2': {0}".format(response), "DEBUG")
+        self.forget_planned(("network", site_name))
+        self.log("Received API response of 'update_network_v2': {0}", "DEBUG", args=(response,))
         validation_string = "desired common settings operation successful"
         self.check_task_response_status(response, validation_string).check_return_status()
         self.log("Network has been changed successfully", "INFO")
@@ -1912,12 +1957,13 @@ class NetworkSettings(DnacBase):
         self.log("Reserved IP pool scheduled for deletion: {0}"
                  .format(self.have.get("reservePool").get("name")), "INFO")
         _id = self.have.get("reservePool").get("id")
-        self.log("Reserved pool {0} id: {1}".format(name, _id), "DEBUG")
+        self.log("Reserved pool {0} id: {1}", "DEBUG", args=(name, _id))
         response = self.dnac._exec(
             family="network_settings",
             function="release_reserve_ip_subpool",
             params={"id": _id},
         )
+        self.forget_planned(("reserve_pool",))
         self.check_execution_response_status(response).check_return_status()
         executionid = response.get("executionId")
         result_reserve_pool = self.result.get("response")[1].get("reservePool")
@@ -1954,6 +2000,7 @@ class NetworkSettings(DnacBase):
             function="delete_global_ip_pool",
             params={"id": self.have.get("globalPool").get("id")},
         )
+        self.forget_planned(("global_pool",))
 
         # Check the execution status
         self.check_execution_response_status(response).check_return_status()
@@ -2132,6 +2179,7 @@ def main():
         "state": {"default": 'merged', "choices": ['merged', 'deleted']},
         "validate_response_schema": {"type": 'bool', "default": True},
     }
+    element_spec.update(dnac_intent_argument_spec())
 
     # Create an AnsibleModule object with argument specifications
     module = AnsibleModule(argument_spec=element_spec, supports_check_mode=False)
@@ -2145,6 +2193,7 @@ def main():
 
     dnac_network.validate_input().check_return_status()
 
+    dnac_network.plan(dnac_network.config).check_return_status()
     for config in dnac_network.config:
         dnac_network.reset_values()
         dnac_network.get_have(config).check_return_status()
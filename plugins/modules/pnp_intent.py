@@ -217,7 +217,8 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
     validate_list_of_dicts,
-    get_dict_result
+    get_dict_result,
+    dnac_intent_argument_spec,
 )
 
 
@@ -307,70 +308,23 @@ class DnacPnp(DnacBase):
           site_id and checks whether the site exists or not
         """
 
-        site_exists = False
-        site_id = None
-        response = None
+        if not isinstance(self.want.get("site_name"), str):
+            return (False, None)
 
+        site_id = None
         try:
-            response = self.dnac_apply['exec'](
-                family="sites",
-                function='get_site',
-                params={"name": self.want.get("site_name")},
-            )
+            site_id = self.get_site_tree().get_id(self.want.get("site_name"))
         except Exception:
+            pass
+
+        if site_id is None:
             self.log("Exception occurred as site \
                 '{0}' was not found".format(self.want.get("site_name")), "CRITICAL")
             self.module.fail_json(msg="Site not found", response=[])
 
-        if response:
-            self.log("Received site details \
-                for '{0}': {1}".format(self.want.get("site_name"), str(response)), "DEBUG")
-            site = response.get("response")
-            if len(site) == 1:
-                site_id = site[0].get("id")
-                site_exists = True
-                self.log("Site Name: {1}, Site ID: {0}".format(site_id, self.want.get("site_name")), "INFO")
+        self.log("Site Name: {1}, Site ID: {0}".format(site_id, self.want.get("site_name")), "INFO")
 
-        return (site_exists, site_id)
-
-    def get_site_type(self):
-        """
-        Fetches the type of site
-
-        Parameters:
-          - self: The instance of the class containing the 'config' attribute
-                  to be validated.
-        Returns:
-          The method returns an instance of the class with updated attributes:
-          - site_type: A string indicating the type of the
-                       site (area/building/floor).
-        Example:
-          Post creation of the validated input, we this method gets the
-          type of the site.
-        """
-
-        try:
-            response = self.dnac_apply['exec'](
-                family="sites",
-                function='get_site',
-                params={"name": self.want.get("site_name")},
-            )
-        except Exception:
-            self.log("Exception occurred as \
-                site '{0}' was not found".format(self.want.get("site_name")), "CRITICAL")
-            self.module.fail_json(msg="Site not found", response=[])
-
-        if response:
-            self.log("Received site details\
-                for '{0}': {1}".format(self.want.get("site_name"), str(response)), "DEBUG")
-            site = response.get("response")
-            site_additional_info = site[0].get("additionalInfo")
-            for item in site_additional_info:
-                if item["nameSpace"] == "Location":
-                    site_type = item.get("attributes").get("type")
-                    self.log("Site type for site name '{1}' : {0}".format(site_type, self.want.get("site_name")), "INFO")
-
-        return site_type
+        return (True, site_id)
 
     def get_pnp_params(self, params):
         """
@@ -532,6 +486,95 @@ class DnacPnp(DnacBase):
         self.log("Paramters used for resetting from errored state:{0}".format(str(reset_params)), "INFO")
         return reset_params
 
+    def get_have_lookups(self):
+        """
+        Declare the independent reads of get_have for 'fetch_concurrently'.
+
+        Parameters:
+          - self: The instance of the class containing the 'config'
+                  attribute to be validated.
+        Returns:
+          A list of (name, fetch, depends_on) lookups. The device is read first, the image,
+          template, device details and site hierarchy reads then run together, and only
+          when the device exists in the PnP inventory.
+        """
+
+        def get_device_response(results):
+            device_response = self.dnac_apply['exec'](
+                family="device_onboarding_pnp",
+                function='get_device_list',
+                params={"serial_number": self.want.get("serial_number")}
+            )
+            self.log("Device details for the device with serial \
+                number '{0}': {1}".format(self.want.get("serial_number"), str(device_response)), "DEBUG")
+            return device_response
+
+        def get_device_id(results):
+            device_response = results.get("device_response")
+            if device_response and len(device_response) == 1:
+                return device_response[0].get("id")
+            return None
+
+        def get_image_response(results):
+            if get_device_id(results) is None:
+                return None
+
+            # check if given image exists, if exists store image_id
+            image_response = self.dnac_apply['exec'](
+                family="software_image_management_swim",
+                function='get_software_image_details',
+                params=self.want.get("image_params"),
+            )
+            self.log("Image details obtained from the API 'get_software_image_details': {0}", "DEBUG", args=(image_response,))
+            return image_response
+
+        def get_template_list(results):
+            if get_device_id(results) is None:
+                return None
+
+            # check if project has templates or not
+            template_list = self.dnac_apply['exec'](
+                family="configuration_templates",
+                function='gets_the_templates_available',
+                params={"project_names": self.want.get("project_name")},
+            )
+            self.log("List of templates under the project '{0}': {1}", "DEBUG", args=(self.want.get("project_name"), template_list))
+            return template_list
+
+        def get_dev_details_response(results):
+            device_id = get_device_id(results)
+            if device_id is None:
+                return None
+
+            dev_details_response = self.dnac_apply['exec'](
+                family="device_onboarding_pnp",
+                function="get_device_by_id",
+                params={"id": device_id}
+            )
+            self.log("Device details retrieved after calling the 'get_device_by_id' API: {0}", "DEBUG", args=(dev_details_response,))
+            return dev_details_response
+
+        def load_site_tree(results):
+            if get_device_id(results) is None or not isinstance(self.want.get("site_name"), str):
+                return None
+
+            try:
+                return self.get_site_tree()
+            except Exception:
+                # get_site_details reports the site as not found
+                return None
+
+        lookups = [("device_response", get_device_response)]
+        if self.params.get("state") == "merged":
+            lookups.extend([
+                ("image_response", get_image_response, ("device_response",)),
+                ("template_list", get_template_list, ("device_response",)),
+                ("dev_details_response", get_dev_details_response, ("device_response",)),
+                ("site_tree", load_site_tree, ("device_response",)),
+            ])
+
+        return lookups
+
     def get_have(self):
         """
         Get the current image, template and site details from the DNAC.
@@ -552,15 +595,18 @@ class DnacPnp(DnacBase):
 
         # Claiming is only allowed for single addition of devices
         if len(self.want.get('pnp_params')) == 1:
-            # check if given device exists in pnp inventory, store device Id
-            device_response = self.dnac_apply['exec'](
-                family="device_onboarding_pnp",
-                function='get_device_list',
-                params={"serial_number": self.want.get("serial_number")}
-            )
-            self.log("Device details for the device with serial \
-                number '{0}': {1}".format(self.want.get("serial_number"), str(device_response)), "DEBUG")
+            lookups = self.get_have_lookups()
+            try:
+                results = self.fetch_concurrently(lookups)
+            except Exception as e:
+                # The lookups run on worker threads, the module fails from here
+                self.msg = "Failed to read the current state of the device '{0}': {1}".format(self.want.get("serial_number"), str(e))
+                self.log(self.msg, "ERROR")
+                self.status = "failed"
+                return self
 
+            # check if given device exists in pnp inventory, store device Id
+            device_response = results.get("device_response")
             if not (device_response and (len(device_response) == 1)):
                 self.log("Device with with serial number {0} is not found in the inventory".format(self.want.get("serial_number")), "WARNING")
                 self.msg = "Adding the device to database"
@@ -574,29 +620,9 @@ class DnacPnp(DnacBase):
             self.log("Device Id: " + str(have["device_id"]))
 
             if self.params.get("state") == "merged":
-                # check if given image exists, if exists store image_id
-                image_response = self.dnac_apply['exec'](
-                    family="software_image_management_swim",
-                    function='get_software_image_details',
-                    params=self.want.get("image_params"),
-                )
-                image_list = image_response.get("response")
-                self.log("Image details obtained from the API 'get_software_image_details': {0}".format(str(image_response)), "DEBUG")
-
-                # check if project has templates or not
-                template_list = self.dnac_apply['exec'](
-                    family="configuration_templates",
-                    function='gets_the_templates_available',
-                    params={"project_names": self.want.get("project_name")},
-                )
-                self.log("List of templates under the project '{0}': {1}".format(self.want.get("project_name"), str(template_list)), "DEBUG")
-
-                dev_details_response = self.dnac_apply['exec'](
-                    family="device_onboarding_pnp",
-                    function="get_device_by_id",
-                    params={"id": device_response[0].get("id")}
-                )
-                self.log("Device details retrieved after calling the 'get_device_by_id' API: {0}".format(str(dev_details_response)), "DEBUG")
+                image_list = results.get("image_response").get("response")
+                template_list = results.get("template_list")
+                dev_details_response = results.get("dev_details_response")
                 install_mode = dev_details_response.get("deviceInfo").get("mode")
                 self.log("Installation mode of the device with the serial no. '{0}':{1}".format(self.want.get("serial_number"), install_mode), "INFO")
 
@@ -616,7 +642,7 @@ class DnacPnp(DnacBase):
                     have["site_id"] = site_id
                     self.log("Site Exists: {0}\nSite Name: {1}\nSite ID: {2}".format(site_exists, site_name, site_id), "INFO")
                     if self.want.get("pnp_type") == "access_point":
-                        if self.get_site_type() != "floor":
+                        if self.get_site_type(site_name) != "floor":
                             self.msg = "The site type must be specified as 'floor'\
                                 for claiming an AP"
                             self.log(str(self.msg), "ERROR")
@@ -774,7 +800,7 @@ class DnacPnp(DnacBase):
                 params={"payload": bulk_list},
                 op_modifies=True,
             )
-            self.log("Response from API 'import_devices_in_bulk' for imported devices: {0}".format(bulk_params), "DEBUG")
+            self.log("Response from API 'import_devices_in_bulk' for imported devices: {0}", "DEBUG", args=(bulk_params,))
             if len(bulk_params.get("successList")) > 0:
                 self.result['msg'] = "{0} device(s) imported successfully".format(
                     len(bulk_params.get("successList")))
@@ -816,7 +842,7 @@ class DnacPnp(DnacBase):
                 )
 
                 self.have["deviceInfo"] = dev_add_response.get("deviceInfo")
-                self.log("Response from API 'add device' for a single device addition: {0}".format(str(dev_add_response)), "DEBUG")
+                self.log("Response from API 'add device' for a single device addition: {0}", "DEBUG", args=(dev_add_response,))
                 if self.have["deviceInfo"]:
                     self.result['msg'] = "Only Device Added Successfully"
                     self.log(self.result['msg'], "INFO")
@@ -840,7 +866,7 @@ class DnacPnp(DnacBase):
                     op_modifies=True,
                 )
                 self.have["deviceInfo"] = dev_add_response.get("deviceInfo")
-                self.log("Response from API 'add device' for single device addition: {0}".format(str(dev_add_response)), "DEBUG")
+                self.log("Response from API 'add device' for single device addition: {0}", "DEBUG", args=(dev_add_response,))
                 claim_params = self.get_claim_params()
                 claim_params["deviceId"] = dev_add_response.get("id")
                 claim_response = self.dnac_apply['exec'](
@@ -850,7 +876,7 @@ class DnacPnp(DnacBase):
                     params=claim_params,
                 )
 
-                self.log("Response from API 'claim a device to a site' for a single claiming: {0}".format(str(dev_add_response)), "DEBUG")
+                self.log("Response from API 'claim a device to a site' for a single claiming: {0}", "DEBUG", args=(dev_add_response,))
                 if claim_response.get("response") == "Device Claimed" \
                         and self.have["deviceInfo"]:
                     self.result['msg'] = "Device Added and Claimed Successfully"
@@ -872,7 +898,7 @@ class DnacPnp(DnacBase):
             op_modifies=True,
             params=provisioned_count_params,
         )
-        self.log("Response from 'get device count' API for provisioned devices: {0}".format(str(prov_dev_response)), "DEBUG")
+        self.log("Response from 'get device count' API for provisioned devices: {0}", "DEBUG", args=(prov_dev_response,))
 
         plan_dev_response = self.dnac_apply['exec'](
             family="device_onboarding_pnp",
@@ -880,14 +906,14 @@ class DnacPnp(DnacBase):
             op_modifies=True,
             params=planned_count_params,
         )
-        self.log("Response from 'get_device_count' API for devices in planned state: {0}".format(str(plan_dev_response)), "DEBUG")
+        self.log("Response from 'get_device_count' API for devices in planned state: {0}", "DEBUG", args=(plan_dev_response,))
 
         dev_details_response = self.dnac_apply['exec'](
             family="device_onboarding_pnp",
             function="get_device_by_id",
             params={"id": self.have["device_id"]}
         )
-        self.log("Response from 'get_device_by_id' API for device details: {0}".format(str(dev_details_response)), "DEBUG")
+        self.log("Response from 'get_device_by_id' API for device details: {0}", "DEBUG", args=(dev_details_response,))
 
         pnp_state = dev_details_response.get("deviceInfo").get("state")
         self.log("PnP state of the device: {0}".format(pnp_state), "INFO")
@@ -906,7 +932,7 @@ class DnacPnp(DnacBase):
                     "payload": update_payload},
             op_modifies=True,
         )
-        self.log("Response from 'update_device' API for device's config update: {0}".format(str(update_response)), "DEBUG")
+        self.log("Response from 'update_device' API for device's config update: {0}", "DEBUG", args=(update_response,))
 
         if pnp_state == "Error":
             reset_paramters = self.get_reset_params()
@@ -916,7 +942,7 @@ class DnacPnp(DnacBase):
                 params={"payload": reset_paramters},
                 op_modifies=True,
             )
-            self.log("Response from 'update_device' API for errored state resolution: {0}".format(str(reset_response)), "DEBUG")
+            self.log("Response from 'update_device' API for errored state resolution: {0}", "DEBUG", args=(reset_response,))
             self.result['msg'] = "Device reset done Successfully"
             self.log(self.result['msg'], "INFO")
             self.result['response'] = reset_response
@@ -936,7 +962,7 @@ class DnacPnp(DnacBase):
                 return self
 
         claim_params = self.get_claim_params()
-        self.log("Parameters for claiming the device: {0}".format(str(claim_params)), "DEBUG")
+        self.log("Parameters for claiming the device: {0}", "DEBUG", args=(claim_params,))
 
         claim_response = self.dnac_apply['exec'](
             family="device_onboarding_pnp",
@@ -944,7 +970,7 @@ class DnacPnp(DnacBase):
             op_modifies=True,
             params=claim_params,
         )
-        self.log("Response from 'claim_a_device_to_a_site' API for claiming: {0}".format(str(claim_response)), "DEBUG")
+        self.log("Response from 'claim_a_device_to_a_site' API for claiming: {0}", "DEBUG", args=(claim_response,))
         if claim_response.get("response") == "Device Claimed":
             self.result['msg'] = "Only Device Claimed Successfully"
             self.log(self.result['msg'], "INFO")
@@ -978,7 +1004,7 @@ class DnacPnp(DnacBase):
                 function='get_device_list',
                 params={"serial_number": device["deviceInfo"]["serialNumber"]}
             )
-            self.log("Response from 'get_device_list' API for claiming: {0}".format(str(multi_device_response)), "DEBUG")
+            self.log("Response from 'get_device_list' API for claiming: {0}", "DEBUG", args=(multi_device_response,))
             if multi_device_response and len(multi_device_response) == 1:
                 device_id = multi_device_response[0].get("id")
 
@@ -1113,6 +1139,7 @@ def main():
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
                     }
+    element_spec.update(dnac_intent_argument_spec())
 
     module = AnsibleModule(argument_spec=element_spec,
                            supports_check_mode=False)
@@ -160,12 +160,14 @@ response_3:
       "msg": String
     }
 """
-import time
 import re
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
-    validate_list_of_dicts
+    validate_list_of_dicts,
+    DNAC_LONG_TASK_TIMEOUT,
+    DNAC_LONG_POLL_MAX_INTERVAL,
+    dnac_intent_argument_spec,
 )
 
 
@@ -174,6 +176,9 @@ class Dnacprovision(DnacBase):
     """
     Class containing member attributes for provision intent module
     """
+    task_timeout = DNAC_LONG_TASK_TIMEOUT
+    poll_max_interval = DNAC_LONG_POLL_MAX_INTERVAL
+
     def __init__(self, module):
         super().__init__(module)
 
@@ -276,65 +281,27 @@ class Dnacprovision(DnacBase):
 
         """
         result = False
-        params = {"task_id": task_id}
-        while True:
-            response = self.dnac_apply['exec'](
-                family="task",
-                function='get_task_by_id',
-                params=params,
-            )
-            response = response.response
-            if response.get('isError') or re.search(
-                'failed', response.get('progress'), flags=re.IGNORECASE
-            ):
-                msg = 'Discovery task with id {0} has not completed - Reason: {1}'.format(
-                    task_id, response.get("failureReason"))
-                self.module.fail_json(msg=msg)
-                return False
-
-            if response.get('progress') != 'In Progress':
-                result = True
-                break
-
-            time.sleep(3)
+        response = self.wait_for_task(
+            task_id,
+            lambda details: details.get('isError') or details.get('progress') != 'In Progress'
+        )
+        if response is None:
+            self.module.fail_json(msg=self.msg)
+            return False
+
+        self.log("Task status for the task id {0} is {1}", "DEBUG", args=(task_id, response))
+        if response.get('isError') or re.search(
+            'failed', response.get('progress'), flags=re.IGNORECASE
+        ):
+            msg = 'Discovery task with id {0} has not completed - Reason: {1}'.format(
+                task_id, response.get("failureReason"))
+            self.module.fail_json(msg=msg)
+            return False
+
+        result = True
         self.result.update(dict(discovery_task=response))
         return result
 
-    def get_site_type(self, site_name=None):
-        """
-        Fetches the type of site
-
-        Parameters:
-          - self: The instance of the class containing the 'config' attribute
-                  to be validated.
-        Returns:
-          The method returns an instance of the class with updated attributes:
-          - site_type: A string indicating the type of the
-                       site (area/building/floor).
-        Example:
-          Post creation of the validated input, we this method gets the
-          type of the site.
-        """
-
-        try:
-            response = self.dnac_apply['exec'](
-                family="sites",
-                function='get_site',
-                params={"name": site_name},
-            )
-        except Exception:
-            self.module.fail_json(msg="Site not found", response=[])
-
-        if response:
-            self.log(str(response))
-            site = response.get("response")
-            site_additional_info = site[0].get("additionalInfo")
-            for item in site_additional_info:
-                if item["nameSpace"] == "Location":
-                    site_type = item.get("attributes").get("type")
-
-        return site_type
-
     def get_wired_params(self):
         """
         Prepares the payload for provisioning of the wired devices
@@ -594,6 +561,7 @@ def main():
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
                     }
+    element_spec.update(dnac_intent_argument_spec())
     module = AnsibleModule(argument_spec=element_spec,
                            supports_check_mode=False)
     dnac_provision = Dnacprovision(module)
@@ -311,6 +311,7 @@ from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
     validate_list_of_dicts,
     get_dict_result,
+    dnac_intent_argument_spec,
 )
 
 floor_plan = {
@@ -462,30 +463,27 @@ class DnacSite(DnacBase):
                    - dict: Contains information about the existing site. If the
                            site doesn't exist, this dictionary is empty.
         Description:
-            Checks the existence of a site in Cisco Catalyst Center by querying the
-          'get_site' function in the 'sites' family. It utilizes the
+            Checks the existence of a site in Cisco Catalyst Center by looking it up
+          in the site hierarchy, which is loaded once per run. It utilizes the
           'site_name' parameter from the 'want' attribute to identify the site.
         """
 
         site_exists = False
         current_site = {}
-        response = None
+        site = None
         try:
-            response = self.dnac._exec(
-                family="sites",
-                function='get_site',
-                params={"name": self.want.get("site_name")},
-            )
-
+            site = self.get_site_tree().get(self.want.get("site_name"))
         except Exception as e:
-            self.log("The provided site name '{0}' is either invalid or not present in the Cisco Catalyst Center."
-                     .format(self.want.get("site_name")), "WARNING")
-        if response:
-            response = response.get("response")
-            self.log("Received API response from 'get_site': {0}".format(str(response)), "DEBUG")
-            current_site = self.get_current_site(response)
+            self.log("The site hierarchy could not be read from the Cisco Catalyst Center: {0}", "WARNING", args=(e,))
+
+        if not site:
+            self.log("The provided site name '{0}' is either invalid or not present in the Cisco Catalyst Center.",
+                     "WARNING", args=(self.want.get("site_name"),))
+        else:
+            self.log("Site details of '{0}' from the site hierarchy: {1}", "DEBUG", args=(self.want.get("site_name"), site))
+            current_site = self.get_current_site([site])
             site_exists = True
-            self.log("Site '{0}' exists in Cisco Catalyst Center".format(self.want.get("site_name")), "INFO")
+            self.log("Site '{0}' exists in Cisco Catalyst Center", "INFO", args=(self.want.get("site_name"),))
 
         return (site_exists, current_site)
 
@@ -545,7 +543,7 @@ class DnacSite(DnacBase):
             type=typeinfo,
             site=site_info,
         )
-        self.log("Site parameters: {0}".format(str(site_params)), "DEBUG")
+        self.log("Site parameters: {0}", "DEBUG", args=(site_params,))
 
         return site_params
 
@@ -709,7 +707,7 @@ class DnacSite(DnacBase):
         # check if given site exits, if exists store current site info
         (site_exists, current_site) = self.site_exists()
 
-        self.log("Current Site details (have): {0}".format(str(current_site)), "DEBUG")
+        self.log("Current Site details (have): {0}", "DEBUG", args=(current_site,))
 
         if site_exists:
             have["site_id"] = current_site.get("siteId")
@@ -798,23 +796,23 @@ class DnacSite(DnacBase):
                 op_modifies=True,
                 params=self.want.get("site_params"),
             )
-            self.log("Received API response from 'create_site': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'create_site': {0}", "DEBUG", args=(response,))
             site_created = True
 
         if site_created or site_updated:
             if response and isinstance(response, dict):
                 executionid = response.get("executionId")
-                while True:
-                    execution_details = self.get_execution_details(executionid)
-                    if execution_details.get("status") == "SUCCESS":
-                        self.result['changed'] = True
-                        self.result['response'] = execution_details
-                        break
-
-                    elif execution_details.get("bapiError"):
-                        self.module.fail_json(msg=execution_details.get("bapiError"),
-                                              response=execution_details)
-                        break
+                execution_details = self.wait_for_execution(executionid)
+                if execution_details is None:
+                    self.module.fail_json(msg=self.msg, response=response)
+
+                if execution_details.get("status") != "SUCCESS":
+                    self.module.fail_json(msg=execution_details.get("bapiError") or execution_details.get("status"),
+                                          response=execution_details)
+
+                self.result['changed'] = True
+                self.result['response'] = execution_details
+                self.refresh_site(self.want.get("site_name"))
 
                 if site_updated:
                     log_msg = "Site - {0} Updated Successfully".format(self.want.get("site_name"))
@@ -829,7 +827,7 @@ class DnacSite(DnacBase):
                     if site_exists:
                         log_msg = "Site '{0}' created successfully".format(self.want.get("site_name"))
                         self.log(log_msg, "INFO")
-                        self.log("Current site (have): {0}".format(str(current_site)), "DEBUG")
+                        self.log("Current site (have): {0}", "DEBUG", args=(current_site,))
                         self.result['msg'] = log_msg
                         self.result['response'].update({"siteId": current_site.get('site_id')})
 
@@ -859,22 +857,23 @@ class DnacSite(DnacBase):
             )
 
             if response and isinstance(response, dict):
-                self.log("Received API response from 'delete_site': {0}".format(str(response)), "DEBUG")
+                self.log("Received API response from 'delete_site': {0}", "DEBUG", args=(response,))
                 executionid = response.get("executionId")
-
-                while True:
-                    execution_details = self.get_execution_details(executionid)
-                    if execution_details.get("status") == "SUCCESS":
-                        self.msg = "Site '{0}' deleted successfully".format(site_name)
-                        self.result['changed'] = True
-                        self.result['response'] = self.msg
-                        self.status = "success"
-                        self.log(self.msg, "INFO")
-                        break
-                    elif execution_details.get("bapiError"):
-                        self.log("Error response for 'delete_site' execution: {0}".format(execution_details.get("bapiError")), "ERROR")
-                        self.module.fail_json(msg=execution_details.get("bapiError"), response=execution_details)
-                        break
+                execution_details = self.wait_for_execution(executionid)
+                if execution_details is None:
+                    return self
+
+                if execution_details.get("status") == "SUCCESS":
+                    self.get_site_tree().remove(site_id)
+                    self.msg = "Site '{0}' deleted successfully".format(site_name)
+                    self.result['changed'] = True
+                    self.result['response'] = self.msg
+                    self.status = "success"
+                    self.log(self.msg, "INFO")
+                else:
+                    error_message = execution_details.get("bapiError") or execution_details.get("status")
+                    self.log("Error response for 'delete_site' execution: {0}".format(error_message), "ERROR")
+                    self.module.fail_json(msg=error_message, response=execution_details)
 
         except Exception as e:
             self.status = "failed"
@@ -913,26 +912,18 @@ class DnacSite(DnacBase):
 
             return self
 
-        # Check here if the site have the childs then fetch it using get membership API and then sort it
-        # in reverse order and start deleting from bottom to top
+        # Check here if the site have the childs then take them from the site hierarchy, and start
+        # deleting from bottom to top
         site_id = self.have.get("site_id")
-        mem_response = self.dnac._exec(
-            family="sites",
-            function="get_membership",
-            params={"site_id": site_id},
-        )
-        site_response = mem_response.get("site").get("response")
-        self.log("Site {0} response along with it's child sites: {1}".format(site_name, str(site_response)), "DEBUG")
+        child_sites = self.get_site_tree().get_descendants(site_id)
+        self.log("Child sites of site {0}: {1}", "DEBUG", args=(site_name, [item.get("siteNameHierarchy") for item in child_sites]))
 
-        if len(site_response) == 0:
+        if len(child_sites) == 0:
             self.delete_single_site(site_id, site_name)
             return self
 
-        # Sorting the response in reverse order based on hierarchy levels
-        sorted_site_resp = sorted(site_response, key=lambda x: x.get("groupHierarchy"), reverse=True)
-
         # Deleting each level in reverse order till topmost parent site
-        for item in sorted_site_resp:
+        for item in reversed(child_sites):
             self.delete_single_site(item['id'], item['name'])
 
         # Delete the final parent site
@@ -957,9 +948,11 @@ class DnacSite(DnacBase):
             site exists in the Catalyst Center configuration.
         """
 
+        # This run edited the cached site hierarchy, read it again so the check reflects Cisco Catalyst Center
+        self.get_site_tree(refresh=True)
         self.get_have(config)
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Current State (have): {0}", "INFO", args=(self.have,))
+        self.log("Desired State (want): {0}", "INFO", args=(self.want,))
 
         # Code to validate dnac config for merged state
         site_exist = self.have.get("site_exists")
@@ -995,9 +988,11 @@ class DnacSite(DnacBase):
             It validates whether the specified site exists in the Catalyst Center configuration.
         """
 
+        # This run edited the cached site hierarchy, read it again so the check reflects Cisco Catalyst Center
+        self.get_site_tree(refresh=True)
         self.get_have(config)
-        self.log("Current State (have): {0}".format(str(self.have)), "INFO")
-        self.log("Desired State (want): {0}".format(str(self.want)), "INFO")
+        self.log("Current State (have): {0}", "INFO", args=(self.have,))
+        self.log("Desired State (want): {0}", "INFO", args=(self.want,))
 
         # Code to validate dnac config for delete state
         site_exist = self.have.get("site_exists")
@@ -1034,6 +1029,7 @@ def main():
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
                     }
+    element_spec.update(dnac_intent_argument_spec())
 
     module = AnsibleModule(argument_spec=element_spec,
                            supports_check_mode=False)
@@ -81,4 +81,21 @@ dnac_response:
       },
       "version": "string"
     }
+dnac_uploads:
+  description:
+  - Details of the files uploaded by the task, with the time the upload took, its average throughput
+    in bytes per second and the SHA-256 checksum of the file computed while it was sent.
+  returned: always
+  type: list
+  sample: >
+    [
+      {
+        "file_name": "string",
+        "size": 0,
+        "bytes_sent": 0,
+        "seconds": 0,
+        "throughput": 0,
+        "sha256": "string"
+      }
+    ]
 """
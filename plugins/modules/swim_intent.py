@@ -53,7 +53,11 @@ options:
             description: The source of import, supports url import or local import.
             type: str
           local_image_details:
-            description: Details of the local path of the image to be imported.
+            description:
+            - Details of the local path of the image to be imported.
+            - The image is not uploaded when Cisco Catalyst Center already has an image with the same MD5 or SHA-512 checksum,
+              whatever its name. The checksums are cached in a '.dnac_checksums.json' file next to the image.
+            - An upload interrupted by a connection error or a timeout is started over, up to three attempts.
             type: dict
             suboptions:
               file_path:
@@ -162,6 +166,16 @@ options:
           device_mac_address:
             description: Device MAC address where the image needs to be distributed
             type: str
+          batch_size:
+            description: Number of devices of the site sent together in a single distribution request.
+              Every device of a batch shares the outcome of the task created for that request.
+            type: int
+            default: 1
+          max_concurrency:
+            description: Maximum number of distribution tasks running at the same time on Cisco Catalyst Center
+              when the image is distributed to the devices of a site.
+            type: int
+            default: 20
       image_activation_details:
         description: Details for SWIM image activation. Device on which the image needs to activated
           can be speciifed using any of the following parameters - deviceSerialNumber,
@@ -202,6 +216,16 @@ options:
           device_mac_address:
             description: Device MAC address where the image needs to be activated
             type: str
+          batch_size:
+            description: Number of devices of the site sent together in a single activation request.
+              Every device of a batch shares the outcome of the task created for that request.
+            type: int
+            default: 1
+          max_concurrency:
+            description: Maximum number of activation tasks running at the same time on Cisco Catalyst Center
+              when the image is activated to the devices of a site.
+            type: int
+            default: 20
           schedule_validate:
             description: ScheduleValidate query parameter. ScheduleValidate, validates data
               before schedule (Optional).
@@ -403,17 +427,47 @@ from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
     validate_list_of_dicts,
     get_dict_result,
+    DNAC_LONG_TASK_TIMEOUT,
+    DNAC_LONG_POLL_MAX_INTERVAL,
+    DNAC_POLL_BACKOFF,
+    DNAC_POLL_JITTER,
+    dnac_intent_argument_spec,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.exceptions import (
+    DnacConnectionError,
+    DnacLookupError,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.dnac_session import (
+    DNAC_UPLOAD_PROGRESS_INTERVAL,
+    UploadFile,
+    get_file_checksums,
 )
 from ansible.module_utils.basic import AnsibleModule
-import os
+import random
+import time
+
+# Default number of distribution or activation tasks kept running at the same time
+SWIM_MAX_CONCURRENCY = 20
+# Attempts made to upload a local image whose upload is interrupted
+SWIM_UPLOAD_ATTEMPTS = 3
+
+
+def swim_task_finished(task_details):
+    """Return True once a SWIM import, distribution or activation task has failed or completed successfully."""
+    return bool(task_details.get("isError")) or \
+        "completed successfully" in (task_details.get("progress") or "").lower()
 
 
 class DnacSwims(DnacBase):
     """Class containing member attributes for Swim intent module"""
 
+    task_timeout = DNAC_LONG_TASK_TIMEOUT
+    poll_max_interval = DNAC_LONG_POLL_MAX_INTERVAL
+
     def __init__(self, module):
         super().__init__(module)
         self.supported_states = ["merged"]
+        self.device_ips = {}
 
     def validate_input(self):
         """
@@ -475,31 +529,22 @@ class DnacSwims(DnacBase):
             - site_exists (bool): A boolean indicating whether the site exists (True) or not (False).
             - site_id (str or None): The ID of the site if it exists, or None if the site is not found.
         Description:
-            This method checks the existence of a site in the Catalyst Center. If the site is found,it sets 'site_exists' to True,
-            retrieves the site's ID, and returns both values in a tuple. If the site does not exist, 'site_exists' is set
-            to False, and 'site_id' is None. If an exception occurs during the site lookup, an exception is raised.
+            This method checks the existence of a site in the site hierarchy of the Catalyst Center, which is loaded once
+            per run. If the site is found, it returns True along with the site's ID. If the site does not exist, the
+            module fails.
         """
 
-        site_exists = False
         site_id = None
-        response = None
         try:
-            response = self.dnac._exec(
-                family="sites",
-                function='get_site',
-                params={"name": site_name},
-            )
-        except Exception as e:
+            site_id = self.get_site_tree().get_id(site_name)
+        except Exception:
+            pass
+
+        if site_id is None:
             self.log("An exception occurred: Site '{0}' does not exist in the Cisco Catalyst Center".format(site_name), "ERROR")
             self.module.fail_json(msg="Site not found")
 
-        if response:
-            self.log("Received API response from 'get_site': {0}".format(str(response)), "DEBUG")
-            site = response.get("response")
-            site_id = site[0].get("id")
-            site_exists = True
-
-        return (site_exists, site_id)
+        return (True, site_id)
 
     def get_image_id(self, name):
         """
@@ -510,7 +555,7 @@ class DnacSwims(DnacBase):
         Returns:
             str: The unique image ID (UUID) corresponding to the given image name.
         Raises:
-            AnsibleFailJson: If the image is not found in the response.
+            DnacLookupError: If the image is not found in the response.
         Description:
             This function sends a request to Cisco Catalyst Center to retrieve details about a software image based on its name.
             It extracts and returns the image ID if a single matching image is found. If no image or multiple
@@ -522,7 +567,7 @@ class DnacSwims(DnacBase):
             function='get_software_image_details',
             params={"image_name": name},
         )
-        self.log("Received API response from 'get_software_image_details': {0}".format(str(image_response)), "DEBUG")
+        self.log("Received API response from 'get_software_image_details': {0}", "DEBUG", args=(image_response,))
         image_list = image_response.get("response")
 
         if (len(image_list) == 1):
@@ -531,7 +576,7 @@ class DnacSwims(DnacBase):
         else:
             error_message = "SWIM image '{0}' could not be found".format(name)
             self.log(error_message, "ERROR")
-            self.module.fail_json(msg=error_message, response=image_response)
+            raise DnacLookupError(error_message, image_response)
 
         return image_id
 
@@ -556,7 +601,7 @@ class DnacSwims(DnacBase):
             function='get_software_image_details',
             params={"image_uuid": image_id},
         )
-        self.log("Received API response from 'get_software_image_details': {0}".format(str(image_response)), "DEBUG")
+        self.log("Received API response from 'get_software_image_details': {0}", "DEBUG", args=(image_response,))
         image_list = image_response.get("response")
 
         if (len(image_list) == 1):
@@ -591,7 +636,7 @@ class DnacSwims(DnacBase):
             function='get_software_image_details',
             params={"image_name": name},
         )
-        self.log("Received API response from 'get_software_image_details': {0}".format(str(image_response)), "DEBUG")
+        self.log("Received API response from 'get_software_image_details': {0}", "DEBUG", args=(image_response,))
         image_list = image_response.get("response")
 
         if (len(image_list) == 1):
@@ -599,6 +644,88 @@ class DnacSwims(DnacBase):
 
         return image_exist
 
+    def get_image_by_checksum(self, file_path):
+        """
+        Find the image of Cisco Catalyst Center with the same content as a local image file.
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            file_path (str): The path of the local image file.
+        Returns:
+            dict: The details of the matching image from 'get_software_image_details', None when there is none.
+        Description:
+            The MD5 and SHA-512 checksums of the file, cached next to it between runs, are compared with the
+            'md5Checksum' and 'shaCheckSum' of every image of Cisco Catalyst Center. This finds an image already
+            imported under a different name, so it does not have to be uploaded again.
+        """
+
+        checksums = get_file_checksums(file_path)
+        self.log("Checksums of the image file {0}: {1}", "DEBUG", args=(file_path, checksums))
+        image_checksums = (
+            ("md5Checksum", checksums.get("md5")),
+            ("shaCheckSum", checksums.get("sha512")),
+        )
+
+        for image in self.paginate("software_image_management_swim", "get_software_image_details"):
+            for (field, checksum) in image_checksums:
+                if checksum and (image.get(field) or "").lower() == checksum:
+                    self.log("Image {0} has the same {1} as the file {2}", "INFO", args=(image.get("name"), field, file_path))
+                    return image
+
+        return None
+
+    def import_local_image(self, file_path, import_params):
+        """
+        Upload a local image to Cisco Catalyst Center, starting over when the upload is interrupted.
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            file_path (str): The path of the local image file.
+            import_params (dict): The parameters of 'import_local_software_image', without the file.
+        Returns:
+            tuple: The response of 'import_local_software_image' and None, or None and the details of the
+                   image when an interrupted upload turns out to have imported it anyway.
+        Description:
+            Cisco Catalyst Center does not resume partial uploads, so an upload failing on a connection
+            error or a timeout is sent again from the beginning of the file, with a new multipart body,
+            up to SWIM_UPLOAD_ATTEMPTS times in total. The import is not idempotent, so before each new
+            attempt the images are searched by checksum, and the delay between attempts backs off the
+            same way as task polling. The HTTP session never sends a body twice itself. Any other error
+            is raised.
+        """
+
+        interval = self.dnac_poll_interval
+
+        for attempt in range(1, SWIM_UPLOAD_ATTEMPTS + 1):
+            upload = UploadFile(file_path, callback=self.log_upload_progress)
+            params = dict(import_params)
+            params["multipart_fields"] = {'file': (upload.file_name, upload, 'application/octet-stream')}
+            params["multipart_monitor_callback"] = None
+            try:
+                response = self.dnac._exec(
+                    family="software_image_management_swim",
+                    function='import_local_software_image',
+                    op_modifies=True,
+                    params=params,
+                )
+            except DnacConnectionError as e:
+                if attempt == SWIM_UPLOAD_ATTEMPTS:
+                    raise
+                self.log("Upload of the image {0} interrupted after {1} bytes ({2}), attempt {3} of {4}",
+                         "WARNING", args=(file_path, upload.bytes_read, e, attempt, SWIM_UPLOAD_ATTEMPTS))
+            else:
+                self.result['upload'] = upload.summary()
+                self.log("Upload of the image {0} completed: {1}", "INFO", args=(file_path, self.result['upload']))
+                return (response, None)
+            finally:
+                upload.close()
+
+            time.sleep(interval * random.uniform(1 - DNAC_POLL_JITTER, 1 + DNAC_POLL_JITTER))
+            interval = min(interval * DNAC_POLL_BACKOFF, DNAC_LONG_POLL_MAX_INTERVAL)
+            image = self.get_image_by_checksum(file_path)
+            if image:
+                self.log("The interrupted upload of the image {0} was imported as {1}", "INFO",
+                         args=(file_path, image.get("name")))
+                return (None, image)
+
     def get_device_id(self, params):
         """
         Retrieve the unique device ID based on the provided parameters.
@@ -618,7 +745,7 @@ class DnacSwims(DnacBase):
             function='get_device_list',
             params=params,
         )
-        self.log("Received API response from 'get_device_list': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'get_device_list': {0}", "DEBUG", args=(response,))
 
         device_list = response.get("response")
         if (len(device_list) == 1):
@@ -663,7 +790,7 @@ class DnacSwims(DnacBase):
             op_modifies=True,
             params=site_params,
         )
-        self.log("Received API response from 'get_membership': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'get_membership': {0}", "DEBUG", args=(response,))
         response = response['device'][0]['response']
 
         if len(response) > 0:
@@ -672,31 +799,31 @@ class DnacSwims(DnacBase):
                     continue
                 if "role" in item and (device_role is None or item["role"] == device_role.upper() or device_role.upper() == "ALL"):
                     device_uuid_list.append(item["instanceUuid"])
+                    self.device_ips[item["instanceUuid"]] = item.get("managementIpAddress")
 
         return device_uuid_list
 
     def get_device_family_identifier(self, family_name):
         """
-        Retrieve and store the device family identifier based on the provided family name.
+        Retrieve the device family identifier based on the provided family name.
         Parameters:
             self (object): An instance of a class used for interacting with Cisco Catalyst Center.
             family_name (str): The name of the device family for which to retrieve the identifier.
         Returns:
-            None
+            str or None: The device family identifier, None when no device family is known at all.
         Raises:
-            AnsibleFailJson: If the family name is not found in the response.
+            DnacLookupError: If the family name is not found in the response.
         Description:
             This function sends a request to Cisco Catalyst Center to retrieve a list of device family identifiers.It then
-            searches for a specific family name within the response and stores its associated identifier. If the family
-            name is found, the identifier is stored; otherwise, an exception is raised.
+            searches for a specific family name within the response and returns its associated identifier. If the family
+            name is not found, an exception is raised. It runs as a lookup of get_have, which stores the identifier.
         """
 
-        have = {}
         response = self.dnac._exec(
             family="software_image_management_swim",
             function='get_device_family_identifiers',
         )
-        self.log("Received API response from 'get_device_family_identifiers': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'get_device_family_identifiers': {0}", "DEBUG", args=(response,))
         device_family_db = response.get("response")
 
         if device_family_db:
@@ -704,12 +831,66 @@ class DnacSwims(DnacBase):
 
             if device_family_details:
                 device_family_identifier = device_family_details.get("deviceFamilyIdentifier")
-                have["device_family_identifier"] = device_family_identifier
-                self.log("Family device indentifier: {0}".format(str(device_family_identifier)), "INFO")
-            else:
-                self.log("Device Family: {0} not found".format(str(family_name)), "ERROR")
-                self.module.fail_json(msg="Family Device Name not found", response=[])
-            self.have.update(have)
+                self.log("Family device indentifier: {0}", "INFO", args=(device_family_identifier,))
+                return device_family_identifier
+
+            self.log("Device Family: {0} not found", "ERROR", args=(family_name,))
+            raise DnacLookupError("Family Device Name not found", [])
+
+        return None
+
+    def get_have_lookups(self):
+        """
+        Declare the reads of get_have for 'fetch_concurrently'.
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+        Returns:
+            list: The (name, fetch) lookups of the image IDs, the site hierarchy, the device family identifier and the
+                  distribution and activation device IDs requested in the playbook.
+        Description:
+            None of these reads depends on another, so they all run at the same time. An image named by several of
+            the tagging, distribution and activation details is looked up once. The lookups are declared in the
+            order get_have used to issue them, so a missing image fails the module with the same message as before.
+            A lookup finding nothing raises DnacLookupError rather than failing the module from its worker thread.
+        """
+
+        lookups = []
+        image_names = []
+        sections = [self.want.get(key) or {} for key in ("tagging_details", "distribution_details", "activation_details")]
+        for details in sections:
+            if details.get("image_name"):
+                name = details.get("image_name").split("/")[-1]
+                if name not in image_names:
+                    image_names.append(name)
+                    lookups.append((("image_id", name), lambda results, name=name: self.get_image_id(name)))
+
+        if any(details.get("site_name") for details in sections):
+            def load_site_tree(results):
+                try:
+                    return self.get_site_tree()
+                except Exception:
+                    # site_exists reports the site as not found
+                    return None
+
+            lookups.append(("site_tree", load_site_tree))
+
+        if self.want.get("tagging_details"):
+            family_name = self.want.get("tagging_details").get("device_type")
+            lookups.append(("device_family_identifier", lambda results: self.get_device_family_identifier(family_name)))
+
+        for (key, details) in (("distribution_device_id", sections[1]), ("activation_device_id", sections[2])):
+            if not details:
+                continue
+
+            device_params = dict(
+                hostname=details.get("device_hostname"),
+                serialNumber=details.get("device_serial_number"),
+                managementIpAddress=details.get("device_ip_address"),
+                macAddress=details.get("device_mac_address"),
+            )
+            lookups.append((key, lambda results, device_params=device_params: self.get_device_id(device_params)))
+
+        return lookups
 
     def get_have(self):
         """
@@ -724,20 +905,36 @@ class DnacSwims(DnacBase):
             It validates and retrieves the necessary information from Cisco Catalyst Center to support later actions.
         """
 
+        # Missing image details are reported before anything is read from Cisco Catalyst Center
+        for (key, action) in (("tagging_details", "tagging"), ("distribution_details", "distribution"),
+                              ("activation_details", "activation")):
+            details = self.want.get(key)
+            if details and not details.get("image_name") and not self.have.get("imported_image_id"):
+                if action == "tagging":
+                    self.msg = "Image details for tagging not provided"
+                    self.log(self.msg, "CRITICAL")
+                else:
+                    self.msg = "Image details required for {0} have not been provided".format(action)
+                    self.log(self.msg, "ERROR")
+                self.module.fail_json(msg=self.msg, response=[])
+
+        try:
+            results = self.fetch_concurrently(self.get_have_lookups())
+        except DnacLookupError as e:
+            self.module.fail_json(msg=e.msg, response=e.response)
+
         if self.want.get("tagging_details"):
             have = {}
             tagging_details = self.want.get("tagging_details")
             if tagging_details.get("image_name"):
                 name = tagging_details.get("image_name").split("/")[-1]
-                image_id = self.get_image_id(name)
-                have["tagging_image_id"] = image_id
+                have["tagging_image_id"] = results.get(("image_id", name))
 
-            elif self.have.get("imported_image_id"):
+            else:
                 have["tagging_image_id"] = self.have.get("imported_image_id")
 
-            else:
-                self.log("Image details for tagging not provided", "CRITICAL")
-                self.module.fail_json(msg="Image details for tagging not provided", response=[])
+            if results.get("device_family_identifier") is not None:
+                have["device_family_identifier"] = results.get("device_family_identifier")
 
             # check if given site exists, store siteid
             # if not then use global site
@@ -747,16 +944,13 @@ class DnacSwims(DnacBase):
                 (site_exists, site_id) = self.site_exists(site_name)
                 if site_exists:
                     have["site_id"] = site_id
-                    self.log("Site {0} exists having the site id: {1}".format(site_name, str(site_id)), "DEBUG")
+                    self.log("Site {0} exists having the site id: {1}", "DEBUG", args=(site_name, site_id))
             else:
                 # For global site, use -1 as siteId
                 have["site_id"] = "-1"
                 self.log("Site Name not given by user. Using global site.", "WARNING")
 
             self.have.update(have)
-            # check if given device family name exists, store indentifier value
-            family_name = tagging_details.get("device_type")
-            self.get_device_family_identifier(family_name)
 
         if self.want.get("distribution_details"):
             have = {}
@@ -768,28 +962,17 @@ class DnacSwims(DnacBase):
 
                 if site_exists:
                     have["site_id"] = site_id
-                    self.log("Site '{0}' exists and has the site ID: {1}".format(site_name, str(site_id)), "DEBUG")
+                    self.log("Site '{0}' exists and has the site ID: {1}", "DEBUG", args=(site_name, site_id))
 
             # check if image for distributon is available
             if distribution_details.get("image_name"):
                 name = distribution_details.get("image_name").split("/")[-1]
-                image_id = self.get_image_id(name)
-                have["distribution_image_id"] = image_id
-
-            elif self.have.get("imported_image_id"):
-                have["distribution_image_id"] = self.have.get("imported_image_id")
+                have["distribution_image_id"] = results.get(("image_id", name))
 
             else:
-                self.log("Image details required for distribution have not been provided", "ERROR")
-                self.module.fail_json(msg="Image details required for distribution have not been provided", response=[])
+                have["distribution_image_id"] = self.have.get("imported_image_id")
 
-            device_params = dict(
-                hostname=distribution_details.get("device_hostname"),
-                serialNumber=distribution_details.get("device_serial_number"),
-                managementIpAddress=distribution_details.get("device_ip_address"),
-                macAddress=distribution_details.get("device_mac_address"),
-            )
-            device_id = self.get_device_id(device_params)
+            device_id = results.get("distribution_device_id")
             if device_id is not None:
                 have["distribution_device_id"] = device_id
             self.have.update(have)
@@ -800,14 +983,10 @@ class DnacSwims(DnacBase):
             # check if image for activation is available
             if activation_details.get("image_name"):
                 name = activation_details.get("image_name").split("/")[-1]
-                image_id = self.get_image_id(name)
-                have["activation_image_id"] = image_id
+                have["activation_image_id"] = results.get(("image_id", name))
 
-            elif self.have.get("imported_image_id"):
-                have["activation_image_id"] = self.have.get("imported_image_id")
             else:
-                self.log("Image details required for activation have not been provided", "ERROR")
-                self.module.fail_json(msg="Image details required for activation have not been provided", response=[])
+                have["activation_image_id"] = self.have.get("imported_image_id")
 
             site_name = activation_details.get("site_name")
             if site_name:
@@ -817,14 +996,7 @@ class DnacSwims(DnacBase):
                     have["site_id"] = site_id
                     self.log("The site '{0}' exists and has the site ID '{1}'".format(site_name, str(site_id)), "INFO")
 
-            device_params = dict(
-                hostname=activation_details.get("device_hostname"),
-                serialNumber=activation_details.get("device_serial_number"),
-                managementIpAddress=activation_details.get("device_ip_address"),
-                macAddress=activation_details.get("device_mac_address"),
-            )
-            device_id = self.get_device_id(device_params)
-
+            device_id = results.get("activation_device_id")
             if device_id is not None:
                 have["activation_device_id"] = device_id
             self.have.update(have)
@@ -869,6 +1041,27 @@ class DnacSwims(DnacBase):
 
         return self
 
+    def log_upload_progress(self, upload):
+        """
+        Log the progress of a local image upload.
+
+        Args:
+            self: An instance of a class used for interacting with Cisco Catalyst Center.
+            upload (UploadFile): The image being uploaded.
+        Description:
+            Called after every chunk sent to Cisco Catalyst Center, it logs the bytes sent and the
+            average throughput at most once every DNAC_UPLOAD_PROGRESS_INTERVAL seconds, and once
+            the whole image is sent.
+        """
+
+        now = time.time()
+        if upload.len and now - upload.reported < DNAC_UPLOAD_PROGRESS_INTERVAL:
+            return
+
+        upload.reported = now
+        self.log("Uploaded {0} of {1} bytes of the image {2} ({3:.1f} MiB/s)", "INFO",
+                 args=(upload.bytes_read, upload.size, upload.file_name, upload.throughput() / (1024 * 1024)))
+
     def get_diff_import(self):
         """
         Check the image import type and fetch the image ID for the imported image for further use.
@@ -921,6 +1114,17 @@ class DnacSwims(DnacBase):
                 self.result['changed'] = False
                 return self
 
+            if import_type != "url":
+                image = self.get_image_by_checksum(image_name)
+                if image:
+                    self.have["imported_image_id"] = image.get("imageUuid")
+                    self.msg = "Image '{0}' already exists in the Cisco Catalyst Center as '{1}'".format(name, image.get("name"))
+                    self.result['msg'] = self.msg
+                    self.log(self.msg, "INFO")
+                    self.status = "success"
+                    self.result['changed'] = False
+                    return self
+
             if self.want.get("import_type") == "url":
                 import_payload_dict = {}
                 temp_payload = self.want.get("url_import_details").get("payload")[0]
@@ -946,49 +1150,56 @@ class DnacSwims(DnacBase):
                     third_party_vendor=self.want.get("local_import_details").get("third_party_vendor"),
                     third_party_image_family=self.want.get("local_import_details").get("third_party_image_family"),
                     third_party_application_type=self.want.get("local_import_details").get("third_party_application_type"),
-                    multipart_fields={'file': (os.path.basename(file_path), open(file_path, 'rb'), 'application/octet-stream')},
-                    multipart_monitor_callback=None
                 )
                 import_function = 'import_local_software_image'
 
-            response = self.dnac._exec(
-                family="software_image_management_swim",
-                function=import_function,
-                op_modifies=True,
-                params=import_params,
-            )
-            self.log("Received API response from {0}: {1}".format(import_function, str(response)), "DEBUG")
+            if import_function == 'import_local_software_image':
+                (response, image) = self.import_local_image(file_path, import_params)
+                if image:
+                    self.have["imported_image_id"] = image.get("imageUuid")
+                    self.msg = "Swim Image {0} imported successfully".format(image.get("name"))
+                    self.result['msg'] = self.msg
+                    self.log(self.msg, "INFO")
+                    self.status = "success"
+                    self.result['changed'] = True
+                    self.result['response'] = image
+                    return self
+            else:
+                response = self.dnac._exec(
+                    family="software_image_management_swim",
+                    function=import_function,
+                    op_modifies=True,
+                    params=import_params,
+                )
+            self.log("Received API response from {0}: {1}", "DEBUG", args=(import_function, response))
 
-            task_details = {}
             task_id = response.get("response").get("taskId")
+            task_details = self.wait_for_task(task_id, swim_task_finished)
+            name = image_name.split('/')[-1]
 
-            while (True):
-                task_details = self.get_task_details(task_id)
-                name = image_name.split('/')[-1]
+            if task_details is None:
+                self.result['response'] = self.msg
+                return self
 
-                if task_details and \
-                        ("completed successfully" in task_details.get("progress").lower()):
-                    self.result['changed'] = True
-                    self.status = "success"
-                    self.msg = "Swim Image {0} imported successfully".format(name)
+            if task_details.get("isError"):
+                if "already exists" in task_details.get("failureReason", ""):
+                    self.msg = "SWIM Image {0} already exists in the Cisco Catalyst Center".format(name)
                     self.result['msg'] = self.msg
                     self.log(self.msg, "INFO")
-                    break
-
-                if task_details and task_details.get("isError"):
-                    if "already exists" in task_details.get("failureReason", ""):
-                        self.msg = "SWIM Image {0} already exists in the Cisco Catalyst Center".format(name)
-                        self.result['msg'] = self.msg
-                        self.log(self.msg, "INFO")
-                        self.status = "success"
-                        self.result['changed'] = False
-                        break
-                    else:
-                        self.status = "failed"
-                        self.msg = task_details.get("failureReason", "SWIM Image {0} seems to be invalid".format(image_name))
-                        self.log(self.msg, "WARNING")
-                        self.result['response'] = self.msg
-                        return self
+                    self.status = "success"
+                    self.result['changed'] = False
+                else:
+                    self.status = "failed"
+                    self.msg = task_details.get("failureReason", "SWIM Image {0} seems to be invalid".format(image_name))
+                    self.log(self.msg, "WARNING")
+                    self.result['response'] = self.msg
+                    return self
+            else:
+                self.result['changed'] = True
+                self.status = "success"
+                self.msg = "Swim Image {0} imported successfully".format(name)
+                self.result['msg'] = self.msg
+                self.log(self.msg, "INFO")
 
             self.result['response'] = task_details if task_details else response
 
@@ -999,6 +1210,8 @@ class DnacSwims(DnacBase):
 
             return self
 
+        except DnacLookupError as e:
+            self.module.fail_json(msg=e.msg, response=e.response)
         except Exception as e:
             self.status = "failed"
             self.msg = """Error: Import image details are not provided in the playbook, or the Import Image API was not
@@ -1040,7 +1253,7 @@ class DnacSwims(DnacBase):
             op_modifies=True,
             params=image_params
         )
-        self.log("Received API response from 'get_golden_tag_status_of_an_image': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'get_golden_tag_status_of_an_image': {0}", "DEBUG", args=(response,))
 
         response = response.get('response')
         if response:
@@ -1076,7 +1289,7 @@ class DnacSwims(DnacBase):
                 op_modifies=True,
                 params=image_params
             )
-            self.log("Received API response from 'tag_as_golden_image': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'tag_as_golden_image': {0}", "DEBUG", args=(response,))
 
         else:
             self.log("Parameters for un-tagging the image as golden: {0}".format(str(image_params)), "INFO")
@@ -1087,7 +1300,7 @@ class DnacSwims(DnacBase):
                 op_modifies=True,
                 params=image_params
             )
-            self.log("Received API response from 'remove_golden_tag_for_image': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'remove_golden_tag_for_image': {0}", "DEBUG", args=(response,))
 
         if response:
             task_details = {}
@@ -1139,7 +1352,7 @@ class DnacSwims(DnacBase):
                 function='get_device_list',
                 params={"id": device_id}
             )
-            self.log("Received API response from 'get_device_list': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_device_list': {0}", "DEBUG", args=(response,))
             response = response.get('response')[0]
             device_ip = response.get("managementIpAddress")
 
@@ -1149,6 +1362,64 @@ class DnacSwims(DnacBase):
             self.log(error_message, "ERROR")
             raise Exception(error_message)
 
+    def trigger_device_tasks(self, function, device_uuid_list, get_params, details):
+        """
+        Trigger a SWIM operation on the devices of a site and wait for all the resulting tasks.
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            function (str): The 'software_image_management_swim' function that triggers the operation.
+            device_uuid_list (list): The unique identifiers of the devices the operation applies to.
+            get_params (callable): Called with a list of device IDs, returns the parameters of one trigger request.
+            details (dict): The distribution or activation details from the playbook, providing
+                            'batch_size' and 'max_concurrency'.
+        Returns:
+            tuple: The number of devices on which the operation succeeded, the management IP addresses of the
+                   devices on which it failed and the task details of the last failed task.
+        Description:
+            Devices are grouped into batches of 'batch_size' devices, one trigger request per batch, and at most
+            'max_concurrency' of the resulting tasks are kept running on Cisco Catalyst Center at the same time.
+            Each device takes the outcome of the task created for its batch.
+        """
+
+        batch_size = max(int(details.get("batch_size") or 1), 1)
+        max_concurrency = max(int(details.get("max_concurrency") or SWIM_MAX_CONCURRENCY), 1)
+        batches = [tuple(device_uuid_list[i:i + batch_size]) for i in range(0, len(device_uuid_list), batch_size)]
+        self.log("Triggering '{0}' for {1} device(s) in {2} batch(es), at most {3} task(s) at a time"
+                 .format(function, len(device_uuid_list), len(batches), max_concurrency), "INFO")
+
+        def submit(batch):
+            params = get_params(list(batch))
+            self.log("Parameters for '{0}': {1}".format(function, str(params)), "INFO")
+            response = self.dnac._exec(
+                family="software_image_management_swim",
+                function=function,
+                op_modifies=True,
+                params=params,
+            )
+            self.log("Received API response from '{0}': {1}", "DEBUG", args=(function, response))
+            if response:
+                return response.get("response").get("taskId")
+
+            return None
+
+        task_results = self.run_tasks(batches, submit, swim_task_finished, max_concurrency=max_concurrency)
+
+        success_count = 0
+        failed_device_ips = []
+        failed_task_details = None
+        for batch, task_details in task_results.items():
+            if task_details and not task_details.get("isError"):
+                success_count += len(batch)
+                continue
+
+            failed_task_details = task_details
+            for device_uuid in batch:
+                device_ip = self.device_ips.get(device_uuid) or self.get_device_ip_from_id(device_uuid)
+                self.log("'{0}' failed for device '{1}'".format(function, device_ip), "WARNING")
+                failed_device_ips.append(device_ip)
+
+        return (success_count, failed_device_ips, failed_task_details)
+
     def get_diff_distribution(self):
         """
         Get image distribution parameters from the playbook and trigger image distribution.
@@ -1185,31 +1456,24 @@ class DnacSwims(DnacBase):
                 op_modifies=True,
                 params=distribution_params,
             )
-            self.log("Received API response from 'trigger_software_image_distribution': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'trigger_software_image_distribution': {0}", "DEBUG", args=(response,))
 
             if response:
-                task_details = {}
                 task_id = response.get("response").get("taskId")
+                task_details = self.wait_for_task(task_id, swim_task_finished)
+                if task_details is None:
+                    return self
 
-                while (True):
-                    task_details = self.get_task_details(task_id)
-
-                    if not task_details.get("isError") and \
-                            ("completed successfully" in task_details.get("progress")):
-                        self.result['changed'] = True
-                        self.status = "success"
-                        self.single_device_distribution = True
-                        self.result['msg'] = "Image with Id {0} Distributed Successfully".format(image_id)
-                        break
-
-                    if task_details.get("isError"):
-                        self.status = "failed"
-                        self.msg = "Image with Id {0} Distribution Failed".format(image_id)
-                        self.log(self.msg, "WARNING")
-                        self.result['response'] = task_details
-                        break
-
-                    self.result['response'] = task_details if task_details else response
+                if task_details.get("isError"):
+                    self.status = "failed"
+                    self.msg = "Image with Id {0} Distribution Failed".format(image_id)
+                    self.log(self.msg, "WARNING")
+                    self.result['response'] = task_details
+                else:
+                    self.result['changed'] = True
+                    self.status = "success"
+                    self.single_device_distribution = True
+                    self.result['msg'] = "Image with Id {0} Distributed Successfully".format(image_id)
 
             return self
 
@@ -1222,49 +1486,22 @@ class DnacSwims(DnacBase):
 
         self.log("Device UUIDs involved in Image Distribution: {0}".format(str(device_uuid_list)), "INFO")
 
-        device_distribution_count = 0
-        device_ips_list = []
         self.complete_successful_distribution = False
         self.partial_successful_distribution = False
 
-        for device_uuid in device_uuid_list:
-            device_management_ip = self.get_device_ip_from_id(device_uuid)
-            distribution_params = dict(
+        def get_distribution_params(device_uuids):
+            return dict(
                 payload=[dict(
                     deviceUuid=device_uuid,
                     imageUuid=image_id
-                )]
+                ) for device_uuid in device_uuids]
             )
-            self.log("Distribution Params: {0}".format(str(distribution_params)), "INFO")
-            response = self.dnac._exec(
-                family="software_image_management_swim",
-                function='trigger_software_image_distribution',
-                op_modifies=True,
-                params=distribution_params,
-            )
-            self.log("Received API response from 'trigger_software_image_distribution': {0}".format(str(response)), "DEBUG")
 
-            if response:
-                task_details = {}
-                task_id = response.get("response").get("taskId")
-
-                while (True):
-                    task_details = self.get_task_details(task_id)
-
-                    if not task_details.get("isError") and \
-                            ("completed successfully" in task_details.get("progress")):
-                        self.result['changed'] = True
-                        self.status = "success"
-                        self.result['msg'] = "Image with Id '{0}' Distributed successfully".format(image_id)
-                        device_distribution_count += 1
-                        break
-
-                    if task_details.get("isError"):
-                        error_msg = "Image with Id '{0}' Distribution failed".format(image_id)
-                        self.log(error_msg, "WARNING")
-                        self.result['response'] = task_details
-                        device_ips_list.append(device_management_ip)
-                        break
+        (device_distribution_count, device_ips_list, failed_task_details) = self.trigger_device_tasks(
+            'trigger_software_image_distribution', device_uuid_list, get_distribution_params, distribution_details
+        )
+        if device_ips_list:
+            self.result['response'] = failed_task_details
 
         if device_distribution_count == 0:
             self.status = "failed"
@@ -1328,29 +1565,25 @@ class DnacSwims(DnacBase):
                 op_modifies=True,
                 params=activation_params,
             )
-            self.log("Received API response from 'trigger_software_image_activation': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'trigger_software_image_activation': {0}", "DEBUG", args=(response,))
 
-            task_details = {}
             task_id = response.get("response").get("taskId")
+            task_details = self.wait_for_task(task_id, swim_task_finished)
+            if task_details is None:
+                return self
 
-            while (True):
-                task_details = self.get_task_details(task_id)
-
-                if not task_details.get("isError") and \
-                        ("completed successfully" in task_details.get("progress")):
-                    self.result['changed'] = True
-                    self.result['msg'] = "Image Activated successfully"
-                    self.status = "success"
-                    self.single_device_activation = True
-                    break
+            if task_details.get("isError"):
+                error_msg = "Activation for Image with Id '{0}' gets failed".format(image_id)
+                self.status = "failed"
+                self.result['response'] = task_details
+                self.msg = error_msg
+                self.log(error_msg, "WARNING")
+                return self
 
-                if task_details.get("isError"):
-                    error_msg = "Activation for Image with Id '{0}' gets failed".format(image_id)
-                    self.status = "failed"
-                    self.result['response'] = task_details
-                    self.msg = error_msg
-                    self.log(error_msg, "WARNING")
-                    return self
+            self.result['changed'] = True
+            self.result['msg'] = "Image Activated successfully"
+            self.status = "success"
+            self.single_device_activation = True
 
             self.result['response'] = task_details if task_details else response
 
@@ -1364,56 +1597,26 @@ class DnacSwims(DnacBase):
             return self
 
         self.log("Device UUIDs involved in Image Activation: {0}".format(str(device_uuid_list)), "INFO")
-        device_activation_count = 0
-        device_ips_list = []
         self.complete_successful_activation = False
         self.partial_successful_activation = False
 
-        for device_uuid in device_uuid_list:
-            device_management_ip = self.get_device_ip_from_id(device_uuid)
-            payload = [dict(
-                activateLowerImageVersion=activation_details.get("activate_lower_image_version"),
-                deviceUpgradeMode=activation_details.get("device_upgrade_mode"),
-                distributeIfNeeded=activation_details.get("distribute_if_needed"),
-                deviceUuid=device_uuid,
-                imageUuidList=[image_id]
-            )]
-
-            activation_params = dict(
+        def get_activation_params(device_uuids):
+            return dict(
                 schedule_validate=activation_details.get("scehdule_validate"),
-                payload=payload
-            )
-            self.log("Activation Params: {0}".format(str(activation_params)), "INFO")
-
-            response = self.dnac._exec(
-                family="software_image_management_swim",
-                function='trigger_software_image_activation',
-                op_modifies=True,
-                params=activation_params,
+                payload=[dict(
+                    activateLowerImageVersion=activation_details.get("activate_lower_image_version"),
+                    deviceUpgradeMode=activation_details.get("device_upgrade_mode"),
+                    distributeIfNeeded=activation_details.get("distribute_if_needed"),
+                    deviceUuid=device_uuid,
+                    imageUuidList=[image_id]
+                ) for device_uuid in device_uuids]
             )
-            self.log("Received API response from 'trigger_software_image_activation': {0}".format(str(response)), "DEBUG")
 
-            if response:
-                task_details = {}
-                task_id = response.get("response").get("taskId")
-
-                while (True):
-                    task_details = self.get_task_details(task_id)
-
-                    if not task_details.get("isError") and \
-                            ("completed successfully" in task_details.get("progress")):
-                        self.result['changed'] = True
-                        self.status = "success"
-                        self.result['msg'] = "Image with Id '{0}' activated successfully".format(image_id)
-                        device_activation_count += 1
-                        break
-
-                    if task_details.get("isError"):
-                        error_msg = "Image with Id '{0}' activation failed".format(image_id)
-                        self.log(error_msg, "WARNING")
-                        self.result['response'] = task_details
-                        device_ips_list.append(device_management_ip)
-                        break
+        (device_activation_count, device_ips_list, failed_task_details) = self.trigger_device_tasks(
+            'trigger_software_image_activation', device_uuid_list, get_activation_params, activation_details
+        )
+        if device_ips_list:
+            self.result['response'] = failed_task_details
 
         if device_activation_count == 0:
             self.status = "failed"
@@ -1529,7 +1732,7 @@ class DnacSwims(DnacBase):
             op_modifies=True,
             params=image_params
         )
-        self.log("Received API response from 'get_golden_tag_status_of_an_image': {0}".format(str(response)), "DEBUG")
+        self.log("Received API response from 'get_golden_tag_status_of_an_image': {0}", "DEBUG", args=(response,))
 
         response = response.get('response')
         if response:
@@ -1687,6 +1890,7 @@ def main():
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged']}
                     }
+    element_spec.update(dnac_intent_argument_spec())
 
     module = AnsibleModule(argument_spec=element_spec,
                            supports_check_mode=False)
@@ -556,7 +556,12 @@ options:
             description: Current version of template.
             type: str
           version_description:
-            description: Template version comments.
+            description:
+            - Template version comments.
+            - The module appends a fingerprint of the template parameters to the comments of the versions
+              it commits. On later runs a template whose latest version carries the fingerprint of the
+              playbook template, and which was not saved since that version, is reported unchanged
+              without reading its details.
             type: str
       export:
         description: Export the project/template details.
@@ -1101,6 +1106,69 @@ options:
                 description: ProjectName path parameter. Project name to create template under the
                   project.
                 type: str
+      sync:
+        description:
+        - Bring the templates of one project in line with a directory or a list of templates, in merged state.
+        - New templates are imported in batches and changed ones are updated, then all of them are versioned.
+          Unchanged templates are left alone and templates of the project that are not listed are not deleted.
+        - The outcome of every template, created, updated, unchanged or failed, is returned in 'sync'.
+        type: dict
+        suboptions:
+          project_name:
+            description: Name of the project to sync the templates into. It is created when it does not exist.
+            type: str
+            required: true
+          project_description:
+            description: Description of the project, used when the project is created.
+            type: str
+          template_dir:
+            description:
+            - Directory of template files. Every file is a template named after the file without its extension.
+            - Files ending with .j2, .jinja or .jinja2 are JINJA templates, files ending with .vm or .vtl are
+              VELOCITY templates, others take 'language'.
+            type: str
+          templates:
+            description:
+            - Templates to sync, besides the ones in 'template_dir'.
+            - Each one takes the suboptions of 'configuration_templates', at least 'template_name' and 'template_content'.
+            type: list
+            elements: dict
+          language:
+            description: Language of the templates that do not set one.
+            choices:
+              - JINJA
+              - VELOCITY
+            type: str
+          device_types:
+            description: Device types of the templates that do not set them, as in 'configuration_templates'.
+            type: list
+            elements: dict
+          software_type:
+            description: Software type of the templates that do not set one.
+            type: str
+          software_variant:
+            description: Software variant of the templates that do not set one.
+            type: str
+          software_version:
+            description: Software version of the templates that do not set one.
+            type: str
+          failure_policy:
+            description: Failure policy of the templates that do not set one.
+            type: str
+          author:
+            description: Author of the templates that do not set one.
+            type: str
+          version_description:
+            description: Comments of the template versions committed by the sync.
+            type: str
+          batch_size:
+            description: Number of new templates sent together in a single import request.
+            type: int
+            default: 50
+          max_concurrency:
+            description: Maximum number of template update and version tasks running at the same time.
+            type: int
+            default: 10
 
 requirements:
 - dnacentersdk == 2.4.5
@@ -1114,6 +1182,7 @@ notes:
     configuration_templates.ConfigurationTemplates.export_templates,
     configuration_templates.ConfigurationTemplates.imports_the_projects_provided,
     configuration_templates.ConfigurationTemplates.imports_the_templates_provided,
+    configuration_templates.ConfigurationTemplates.version_template,
 
   - Paths used are
     post /dna/intent/api/v1/template-programmer/project/{projectId}/template,
@@ -1123,6 +1192,7 @@ notes:
     post /dna/intent/api/v1/template-programmer/template/exporttemplates,
     post /dna/intent/api/v1/template-programmer/project/importprojects,
     post /dna/intent/api/v1/template-programmer/project/name/{projectName}/template/importtemplates,
+    post /dna/intent/api/v1/template-programmer/template/version,
 
 """
 
@@ -1222,6 +1292,28 @@ EXAMPLES = r"""
                 - id: string
             project_name: string
 
+- name: Sync a directory of templates into a project
+  cisco.dnac.template_intent:
+    dnac_host: "{{dnac_host}}"
+    dnac_username: "{{dnac_username}}"
+    dnac_password: "{{dnac_password}}"
+    dnac_verify: "{{dnac_verify}}"
+    dnac_port: "{{dnac_port}}"
+    dnac_version: "{{dnac_version}}"
+    dnac_debug: "{{dnac_debug}}"
+    dnac_log: True
+    state: merged
+    config:
+    - sync:
+        project_name: Onboarding Configuration
+        template_dir: templates/onboarding
+        language: VELOCITY
+        software_type: IOS-XE
+        device_types:
+        - product_family: Switches and Hubs
+        version_description: Synced from git
+        batch_size: 50
+
 
 """
 
@@ -1262,7 +1354,11 @@ response_2:
 
 # Case_3: Given template already exists and requires no update
 response_3:
-  description: A dictionary with the exisiting template deatails as returned by the Cisco DNAC Python SDK
+  description: >
+    A dictionary with the exisiting template deatails as returned by the Cisco DNAC Python SDK.
+    When the template matches the fingerprint of its latest committed version, its details are not read
+    and its entry in the committed templates list is returned instead, with the name, projectName,
+    projectId, templateId and versionsInfo of the template.
   returned: always
   type: dict
   sample: >
@@ -1293,17 +1389,54 @@ response_5:
       "msg": String
     }
 
+# Case_6: Templates synced into a project
+sync:
+  description: Outcome of every template of the sync section, by template name
+  returned: when sync is given
+  type: dict
+  sample: >
+    {
+      "sync": {
+        "access-vlans": "created",
+        "uplinks": "updated",
+        "banner": "unchanged"
+      },
+      "msg": String
+    }
+
 """
 
 import copy
+import hashlib
+import json
+import os
+import re
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
     validate_list_of_dicts,
     get_dict_result,
-    dnac_compare_equality,
+    IndexedResult,
+    dnac_compare_difference,
+    dnac_intent_argument_spec,
 )
 
+# Template parameters set by DNAC rather than by the playbook, left out of the template fingerprint
+TEMPLATE_FINGERPRINT_IGNORED = ("id", "project_id", "projectId", "createTime", "lastUpdateTime",
+                                "latestVersionTime", "version", "validationErrors")
+# Fingerprint of the playbook template recorded in the comments of the version committed by the module
+TEMPLATE_FINGERPRINT_FORMAT = "fingerprint sha256:{0}"
+TEMPLATE_FINGERPRINT_PATTERN = re.compile(r"fingerprint sha256:([0-9a-f]{64})")
+# Default number of templates sent together in a single template import request
+TEMPLATE_SYNC_BATCH_SIZE = 50
+# Default number of template update and version tasks kept running at the same time
+TEMPLATE_SYNC_MAX_CONCURRENCY = 10
+# Template language of the files read from the sync template directory, by file extension
+TEMPLATE_LANGUAGE_EXTENSIONS = {".j2": "JINJA", ".jinja": "JINJA", ".jinja2": "JINJA", ".vm": "VELOCITY", ".vtl": "VELOCITY"}
+# Parameters of the sync section applied to every synced template that does not set them
+TEMPLATE_SYNC_DEFAULTS = ("language", "device_types", "software_type", "software_variant", "software_version",
+                          "failure_policy", "author")
+
 
 class DnacTemplate(DnacBase):
     """Class containing member attributes for template intent module"""
@@ -1439,6 +1572,23 @@ class DnacTemplate(DnacBase):
                         'version': {'type': 'str'}
                     }
                 }
+            },
+            'sync': {
+                'type': 'dict',
+                'project_name': {'type': 'str'},
+                'project_description': {'type': 'str'},
+                'template_dir': {'type': 'str'},
+                'templates': {'type': 'list', 'elements': 'dict'},
+                'language': {'type': 'str'},
+                'device_types': {'type': 'list', 'elements': 'dict'},
+                'software_type': {'type': 'str'},
+                'software_variant': {'type': 'str'},
+                'software_version': {'type': 'str'},
+                'failure_policy': {'type': 'str'},
+                'author': {'type': 'str'},
+                'version_description': {'type': 'str'},
+                'batch_size': {'type': 'int', 'default': TEMPLATE_SYNC_BATCH_SIZE},
+                'max_concurrency': {'type': 'int', 'default': TEMPLATE_SYNC_MAX_CONCURRENCY}
             }
         }
         # Validate template params
@@ -1602,9 +1752,9 @@ class DnacTemplate(DnacBase):
 
         templateParams = []
         i = 0
-        self.log("Template params details: {0}".format(template_params), "DEBUG")
+        self.log("Template params details: {0}", "DEBUG", args=(template_params,))
         for item in template_params:
-            self.log("Template params items: {0}".format(item), "DEBUG")
+            self.log("Template params items: {0}", "DEBUG", args=(item,))
             templateParams.append({})
             binding = item.get("binding")
             if binding is not None:
@@ -1684,11 +1834,11 @@ class DnacTemplate(DnacBase):
                 templateParams[i].update({"required": required})
 
             range = item.get("range")
-            self.log("Template params range list: {0}".format(range), "DEBUG")
+            self.log("Template params range list: {0}", "DEBUG", args=(range,))
             if range is not None:
                 templateParams[i].update({"range": []})
                 _range = templateParams[i].get("range")
-                self.log("Template params range: {0}".format(_range), "DEBUG")
+                self.log("Template params range: {0}", "DEBUG", args=(_range,))
                 j = 0
                 for value in range:
                     _range.append({})
@@ -1711,9 +1861,9 @@ class DnacTemplate(DnacBase):
                         return self.check_return_status()
                     j = j + 1
 
-            self.log("Template params details: {0}".format(templateParams), "DEBUG")
+            self.log("Template params details: {0}", "DEBUG", args=(templateParams,))
             selection = item.get("selection")
-            self.log("Template params selection: {0}".format(selection), "DEBUG")
+            self.log("Template params selection: {0}", "DEBUG", args=(selection,))
             if selection is not None:
                 templateParams[i].update({"selection": {}})
                 _selection = templateParams[i].get("selection")
@@ -1837,7 +1987,7 @@ class DnacTemplate(DnacBase):
             temp_params (dict) - Organized template parameters.
         """
 
-        self.log("Template params playbook details: {0}".format(params), "DEBUG")
+        self.log("Template params playbook details: {0}", "DEBUG", args=(params,))
         temp_params = {
             "tags": self.get_tags(params.get("template_tag")),
             "author": params.get("author"),
@@ -1872,14 +2022,118 @@ class DnacTemplate(DnacBase):
             "version": params.get("version"),
             "project_id": params.get("project_id")
         }
-        self.log("Formatted template params details: {0}".format(temp_params), "DEBUG")
+        self.log("Formatted template params details: {0}", "DEBUG", args=(temp_params,))
         copy_temp_params = copy.deepcopy(temp_params)
         for item in copy_temp_params:
             if temp_params[item] is None:
                 del temp_params[item]
-        self.log("Formatted template params details: {0}".format(temp_params), "DEBUG")
+        self.log("Formatted template params details: {0}", "DEBUG", args=(temp_params,))
         return temp_params
 
+    def get_template_fingerprint(self, template_params):
+        """
+        Get the fingerprint of the template parameters given in the playbook.
+
+        Parameters:
+            template_params (dict) - Template parameters as returned by get_template_params.
+
+        Returns:
+            fingerprint (str) - SHA-256 of the canonical JSON of the parameters. Line endings and
+            trailing whitespace of the template content are normalized, and the parameters set by
+            DNAC, such as the IDs and timestamps, are left out.
+        """
+
+        canonical = dict((key, value) for (key, value) in template_params.items()
+                         if key not in TEMPLATE_FINGERPRINT_IGNORED)
+        for key in ("templateContent", "rollbackTemplateContent"):
+            if isinstance(canonical.get(key), str):
+                lines = canonical.get(key).replace("\r\n", "\n").split("\n")
+                canonical[key] = "\n".join(line.rstrip() for line in lines).strip("\n")
+
+        payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_version_comments(self, comments, fingerprint):
+        """
+        Get the comments of a template version committed by the module.
+
+        Parameters:
+            comments (str) - Version comments given in the playbook.
+            fingerprint (str) - Fingerprint of the committed template parameters.
+
+        Returns:
+            comments (str) - The playbook comments followed by the fingerprint.
+        """
+
+        fingerprint = TEMPLATE_FINGERPRINT_FORMAT.format(fingerprint)
+        return "{0} ({1})".format(comments, fingerprint) if comments else fingerprint
+
+    def get_committed_fingerprint(self, template_list, project_name, template_name, last_update_time):
+        """
+        Get the fingerprint recorded when the module committed the latest version of a template.
+
+        Parameters:
+            template_list (list) - The committed templates, as returned by get_templates_available.
+            project_name (str) - Name of the project of the template.
+            template_name (str) - Name of the template.
+            last_update_time (int) - The 'lastUpdateTime' of the template in the project details.
+
+        Returns:
+            fingerprint (str) - The fingerprint found in the comments of the latest version,
+            None when the template is not committed, was last committed without one, or its
+            working copy was saved after the latest version, e.g. from the UI.
+        """
+
+        if not isinstance(template_list, list):
+            return None
+
+        template_info = next((item for item in template_list if isinstance(item, dict)
+                              and item.get("name") == template_name
+                              and item.get("projectName") == project_name), None)
+        versions = template_info.get("versionsInfo") if template_info else None
+        if not versions:
+            return None
+
+        latest_version = max(versions, key=lambda version: version.get("versionTime") or 0)
+        # The fingerprint only describes the working copy as long as nobody saved it since
+        if last_update_time is None or last_update_time > (latest_version.get("versionTime") or 0):
+            return None
+
+        comments = latest_version.get("versionComment") or latest_version.get("description") or ""
+        match = TEMPLATE_FINGERPRINT_PATTERN.search(comments)
+        return match.group(1) if match else None
+
+    def is_template_unchanged(self, config, template_list, template_available):
+        """
+        Check, without reading the template details, whether the playbook template is the one last committed.
+
+        Parameters:
+            config (dict) - Playbook details containing Template information.
+            template_list (list) - The committed templates, as returned by get_templates_available.
+            template_available (list) - The templates of the project, as listed in the project details.
+
+        Returns:
+            bool - True if the latest committed version was made by the module from the same
+            template parameters as given in the playbook.
+        """
+
+        configuration_templates = config.get("configuration_templates")
+        if not configuration_templates.get("template_name") or not configuration_templates.get("language"):
+            return False
+
+        template_details = get_dict_result(template_available, "name", configuration_templates.get("template_name")) \
+            if isinstance(template_available, list) else None
+        if not template_details:
+            return False
+
+        committed_fingerprint = self.get_committed_fingerprint(template_list, configuration_templates.get("project_name"),
+                                                               configuration_templates.get("template_name"),
+                                                               template_details.get("lastUpdateTime"))
+        if not committed_fingerprint:
+            return False
+
+        return committed_fingerprint == self.get_template_fingerprint(self.get_template_params(configuration_templates))
+
     def get_template(self, config):
         """
         Get the template needed for updation or creation.
@@ -1900,16 +2154,17 @@ class DnacTemplate(DnacBase):
         if items:
             result = items
 
-        self.log("Received API response from 'get_template_details': {0}".format(items), "DEBUG")
+        self.log("Received API response from 'get_template_details': {0}", "DEBUG", args=(items,))
         self.result['response'] = items
         return result
 
-    def get_have_project(self, config):
+    def get_have_project(self, config, project_details=None):
         """
         Get the current project related information from DNAC.
 
         Parameters:
             config (dict) - Playbook details containing Project information.
+            project_details (list) - Project details already read from DNAC, read here when not given.
 
         Returns:
             template_available (list) - Current project information.
@@ -1920,7 +2175,8 @@ class DnacTemplate(DnacBase):
         template_available = None
 
         # Check if project exists.
-        project_details = self.get_project_details(given_projectName)
+        if project_details is None:
+            project_details = self.get_project_details(given_projectName)
         # DNAC returns project details even if the substring matches.
         # Hence check the projectName retrieved from DNAC.
         if not (project_details and isinstance(project_details, list)):
@@ -1942,13 +2198,17 @@ class DnacTemplate(DnacBase):
         self.have_project = have_project
         return template_available
 
-    def get_have_template(self, config, template_available):
+    def get_have_template(self, config, template_available, template_list=None, template=None, use_fingerprint=False):
         """
         Get the current template related information from DNAC.
 
         Parameters:
             config (dict) - Playbook details containing Template information.
             template_available (list) -  Current project information.
+            template_list (list) - Committed templates already read from DNAC, read here when not given.
+            template (dict) - Details of the template already read from DNAC, read here when not given.
+            use_fingerprint (bool) - Skip reading the template details when the latest committed
+            version was made from the same playbook template, see is_template_unchanged.
 
         Returns:
             self
@@ -1956,7 +2216,6 @@ class DnacTemplate(DnacBase):
 
         projectName = config.get("configuration_templates").get("project_name")
         templateName = config.get("configuration_templates").get("template_name")
-        template = None
         have_template = {}
 
         have_template["isCommitPending"] = False
@@ -1976,11 +2235,8 @@ class DnacTemplate(DnacBase):
         config["templateId"] = template_details.get("id")
         have_template["id"] = template_details.get("id")
         # Get available templates which are committed under the project
-        template_list = self.dnac_apply['exec'](
-            family="configuration_templates",
-            function="gets_the_templates_available",
-            params={"projectNames": config.get("projectName")},
-        )
+        if template_list is None:
+            template_list = self.get_templates_available(config)
         have_template["isCommitPending"] = True
         # This check will fail if specified template is there not committed in dnac
         if template_list and isinstance(template_list, list):
@@ -1988,7 +2244,13 @@ class DnacTemplate(DnacBase):
                                             "name",
                                             templateName)
             if template_info:
-                template = self.get_template(config)
+                if use_fingerprint and self.is_template_unchanged(config, template_list, template_available):
+                    self.log("Template {0} matches the fingerprint of its latest committed version"
+                             .format(templateName), "INFO")
+                    template = template_info
+                    have_template["fingerprint_matches"] = True
+                elif template is None:
+                    template = self.get_template(config)
                 have_template["template"] = template
                 have_template["isCommitPending"] = False
                 have_template["template_found"] = template is not None \
@@ -2006,6 +2268,91 @@ class DnacTemplate(DnacBase):
         self.status = "success"
         return self
 
+    def get_templates_available(self, config):
+        """
+        Get the templates which are committed, as listed by DNAC.
+
+        Parameters:
+            config (dict) - Playbook details containing Project/Template information.
+
+        Returns:
+            template_list (list) - The committed templates.
+        """
+
+        template_list = self.dnac_apply['exec'](
+            family="configuration_templates",
+            function="gets_the_templates_available",
+            params={"projectNames": config.get("projectName")},
+        )
+        self.log("Received API response from 'gets_the_templates_available': {0}", "DEBUG", args=(template_list,))
+        return template_list
+
+    def get_plan_lookups(self, config):
+        """
+        Declare the reads of get_have for one playbook entry.
+
+        Parameters:
+            config (dict) - Playbook details containing Project/Template information.
+
+        Returns:
+            lookups (list) - The project details and the committed templates, which the entries of one
+            project share, and the details of the template named in the playbook. The template details
+            wait for the project details, which give the template ID, and for the committed templates,
+            which make reading them unnecessary when the template is unchanged.
+        """
+
+        configuration_templates = config.get("configuration_templates")
+        if not (configuration_templates and configuration_templates.get("project_name")):
+            return []
+
+        project_name = configuration_templates.get("project_name")
+        template_name = configuration_templates.get("template_name")
+        project_key = ("project_details", project_name)
+        template_list_key = ("template_list", config.get("projectName"))
+
+        def get_template_details(results):
+            project_details = results.get(project_key)
+            if not (project_details and isinstance(project_details, list)) \
+                    or project_details[0].get('name') != project_name:
+                return None
+
+            if self.is_template_unchanged(config, results.get(template_list_key), project_details[0].get('templates')):
+                return None
+
+            template_details = get_dict_result(project_details[0].get('templates'), "name", template_name)
+            if not template_details:
+                return None
+
+            return self.get_template({"templateId": template_details.get("id")})
+
+        return [
+            (project_key, lambda results: self.get_project_details(project_name)),
+            (template_list_key, lambda results: self.get_templates_available(config)),
+            (("template", project_name, template_name), get_template_details, (project_key, template_list_key)),
+        ]
+
+    def get_have_lookups(self, config):
+        """
+        Declare the reads of get_have for 'fetch_concurrently', taken from the snapshot of 'plan'.
+
+        Parameters:
+            config (dict) - Playbook details containing Project/Template information.
+
+        Returns:
+            lookups (list) - The lookups of 'get_plan_lookups'. When the template was not planned or
+            was changed by an earlier entry, all of them are read again, since the planned project
+            details and committed templates do not show that change.
+        """
+
+        lookups = self.get_plan_lookups(config)
+        if lookups[-1][0] not in self.snapshot:
+            return lookups
+
+        def planned(key, fetch):
+            return lambda results: self.get_planned(key, lambda: fetch(results))
+
+        return [(lookup[0], planned(lookup[0], lookup[1])) + tuple(lookup[2:]) for lookup in lookups]
+
     def get_have(self, config):
         """
         Get the current project and template details from DNAC.
@@ -2022,9 +2369,13 @@ class DnacTemplate(DnacBase):
                 self.msg = "Mandatory Parameter project_name not available"
                 self.status = "failed"
                 return self
-            template_available = self.get_have_project(config)
+            lookups = self.get_have_lookups(config)
+            results = self.fetch_concurrently(lookups)
+            (project_key, template_list_key, template_key) = [lookup[0] for lookup in lookups]
+            template_available = self.get_have_project(config, results.get(project_key) or [])
             if template_available:
-                self.get_have_template(config, template_available)
+                self.get_have_template(config, template_available, results.get(template_list_key) or [],
+                                       results.get(template_key), use_fingerprint=True)
 
         self.msg = "Successfully collected all project and template \
                     parameters from dnac for comparison"
@@ -2069,6 +2420,7 @@ class DnacTemplate(DnacBase):
             template_params = self.get_template_params(configuration_templates)
             project_params = self.get_project_params(configuration_templates)
             version_comments = configuration_templates.get("version_description")
+            want["fingerprint"] = self.get_template_fingerprint(template_params)
 
             if self.params.get("state") == "merged":
                 self.update_mandatory_parameters(template_params)
@@ -2128,43 +2480,41 @@ class DnacTemplate(DnacBase):
             self.log("Task id {0} not found for '{1}'.".format(task_id, creation_value), "CRITICAL")
             return creation_id, created
 
-        while not created:
-            task_details = self.get_task_details(task_id)
-            if not task_details:
-                self.log("Failed to get task details of '{0}' for taskid: {1}"
-                         .format(creation_value, task_id), "CRITICAL")
-                return creation_id, created
-
-            self.log("Task details for {0}: {1}".format(creation_value, task_details), "DEBUG")
-            if task_details.get("isError"):
-                self.log("Error occurred for '{0}' with taskid: {1}"
-                         .format(creation_value, task_id), "ERROR")
-                return creation_id, created
-
-            if validation_string not in task_details.get("progress"):
-                self.log("'{0}' progress set to {1} for taskid: {2}"
-                         .format(creation_value, task_details.get('progress'), task_id), "DEBUG")
-                continue
+        task_details = self.wait_for_task(
+            task_id,
+            lambda details: details.get("isError") or
+            (validation_string in (details.get("progress") or "") and bool(details.get("data")))
+        )
+        if not task_details:
+            self.log("Failed to get task details of '{0}' for taskid: {1}"
+                     .format(creation_value, task_id), "CRITICAL")
+            return creation_id, created
 
-            task_details_data = task_details.get("data")
-            value = self.check_string_dictionary(task_details_data)
-            if value is None:
-                creation_id = task_details.get("data")
-            else:
-                creation_id = value.get("templateId")
-            if not creation_id:
-                self.log("Export data is not found for '{0}' with taskid : {1}"
-                         .format(creation_value, task_id), "DEBUG")
-                continue
+        self.log("Task details for {0}: {1}", "DEBUG", args=(creation_value, task_details))
+        if task_details.get("isError"):
+            self.log("Error occurred for '{0}' with taskid: {1}"
+                     .format(creation_value, task_id), "ERROR")
+            return creation_id, created
+
+        task_details_data = task_details.get("data")
+        value = self.check_string_dictionary(task_details_data)
+        if value is None:
+            creation_id = task_details.get("data")
+        else:
+            creation_id = value.get("templateId")
+        if not creation_id:
+            self.log("Export data is not found for '{0}' with taskid : {1}"
+                     .format(creation_value, task_id), "CRITICAL")
+            return creation_id, created
 
-            created = True
-            if is_create_project:
-                # ProjectId is required for creating a new template.
-                # Store it with other template parameters.
-                template_params["projectId"] = creation_id
-                template_params["project_id"] = creation_id
+        created = True
+        if is_create_project:
+            # ProjectId is required for creating a new template.
+            # Store it with other template parameters.
+            template_params["projectId"] = creation_id
+            template_params["project_id"] = creation_id
 
-        self.log("New {0} created with id {1}".format(name, creation_id), "DEBUG")
+        self.log("New {0} created with id {1}", "DEBUG", args=(name, creation_id))
         return creation_id, created
 
     def requires_update(self):
@@ -2185,24 +2535,40 @@ class DnacTemplate(DnacBase):
                      .format(self.have_template.get("template").get("name")), "DEBUG")
             return True
 
+        if self.have_template.get("fingerprint_matches"):
+            self.log("Template '{0}' is unchanged since the module committed it."
+                     .format(self.have_template.get("template").get("name")), "DEBUG")
+            return False
+
         current_obj = self.have_template.get("template")
         requested_obj = self.want.get("template_params")
         self.log("Current State (have): {0}".format(current_obj), "INFO")
         self.log("Desired State (want): {0}".format(requested_obj), "INFO")
+        return self.get_template_difference(current_obj, requested_obj) is not None
+
+    def get_template_difference(self, current_obj, requested_obj):
+        """
+        Get the first template parameter that differs between DNAC and the playbook.
+
+        Parameters:
+            current_obj (dict) - Template details from DNAC.
+            requested_obj (dict) - Template parameters from the playbook.
+
+        Returns:
+            dnac_param (str) - Name of the first parameter that differs, None if all are equal.
+        """
+
         obj_params = [
             ("tags", "tags", ""),
             ("author", "author", ""),
             ("composite", "composite", False),
             ("containingTemplates", "containingTemplates", []),
-            ("createTime", "createTime", ""),
             ("customParamsOrder", "customParamsOrder", False),
             ("description", "description", ""),
             ("deviceTypes", "deviceTypes", []),
             ("failurePolicy", "failurePolicy", ""),
             ("id", "id", ""),
             ("language", "language", "VELOCITY"),
-            ("lastUpdateTime", "lastUpdateTime", ""),
-            ("latestVersionTime", "latestVersionTime", ""),
             ("name", "name", ""),
             ("parentTemplateId", "parentTemplateId", ""),
             ("projectId", "projectId", ""),
@@ -2218,9 +2584,14 @@ class DnacTemplate(DnacBase):
             ("version", "version", ""),
         ]
 
-        return any(not dnac_compare_equality(current_obj.get(dnac_param, default),
-                                             requested_obj.get(ansible_param))
-                   for (dnac_param, ansible_param, default) in obj_params)
+        for (dnac_param, ansible_param, default) in obj_params:
+            difference = dnac_compare_difference(current_obj.get(dnac_param, default),
+                                                 requested_obj.get(ansible_param))
+            if difference is not None:
+                self.log("Parameter '{0}' differs at {1}", "DEBUG", args=(dnac_param, list(difference)))
+                return dnac_param
+
+        return None
 
     def update_mandatory_parameters(self, template_params):
         """
@@ -2301,23 +2672,23 @@ class DnacTemplate(DnacBase):
             family="configuration_templates",
             function='get_projects_details'
         )
+        template_details = template_details.get("response")
+        self.log("Template details: {0}", "DEBUG", args=(template_details,))
+        project_index = IndexedResult(template_details)
+        template_indexes = {}
         for values in export_values:
             project_name = values.get("project_name")
-            self.log("Project name for export template: {0}".format(project_name), "DEBUG")
-            template_details = template_details.get("response")
-            self.log("Template details: {0}".format(template_details), "DEBUG")
-            all_template_details = get_dict_result(template_details,
-                                                   "name",
-                                                   project_name)
+            self.log("Project name for export template: {0}", "DEBUG", args=(project_name,))
+            all_template_details = project_index.get("name", project_name)
             self.log("Template details under the project name {0}: {1}"
                      .format(project_name, all_template_details), "DEBUG")
             all_template_details = all_template_details.get("templates")
             self.log("Template details under the project name {0}: {1}"
                      .format(project_name, all_template_details), "DEBUG")
             template_name = values.get("template_name")
-            template_detail = get_dict_result(all_template_details,
-                                              "name",
-                                              template_name)
+            if project_name not in template_indexes:
+                template_indexes[project_name] = IndexedResult(all_template_details)
+            template_detail = template_indexes.get(project_name).get("name", template_name)
             self.log("Template details with template name {0}: {1}"
                      .format(template_name, template_detail), "DEBUG")
             if template_detail is None:
@@ -2348,7 +2719,8 @@ class DnacTemplate(DnacBase):
                 project_id, project_created = \
                     self.create_project_or_template(is_create_project=True)
                 if project_created:
-                    self.log("project created with projectId: {0}".format(project_id), "DEBUG")
+                    self.log("project created with projectId: {0}", "DEBUG", args=(project_id,))
+                    self.forget_planned(("project_details", configuration_templates.get("project_name")))
                 else:
                     self.status = "failed"
                     self.msg = "Project creation failed"
@@ -2356,8 +2728,8 @@ class DnacTemplate(DnacBase):
 
             is_template_found = self.have_template.get("template_found")
             template_params = self.want.get("template_params")
-            self.log("Desired template details: {0}".format(template_params), "DEBUG")
-            self.log("Current template details: {0}".format(self.have_template), "DEBUG")
+            self.log("Desired template details: {0}", "DEBUG", args=(template_params,))
+            self.log("Current template details: {0}", "DEBUG", args=(self.have_template,))
             template_id = None
             template_updated = False
             self.validate_input_merge(is_template_found).check_return_status()
@@ -2393,9 +2765,11 @@ class DnacTemplate(DnacBase):
                     return self
 
             if template_updated:
+                self.forget_planned(("template", configuration_templates.get("project_name"),
+                                     configuration_templates.get("template_name")))
                 # Template needs to be versioned
                 version_params = {
-                    "comments": self.want.get("comments"),
+                    "comments": self.get_version_comments(self.want.get("comments"), self.want.get("fingerprint")),
                     "templateId": template_id
                 }
                 response = self.dnac_apply['exec'](
@@ -2413,7 +2787,7 @@ class DnacTemplate(DnacBase):
                 self.result['changed'] = True
                 self.result['msg'] = task_details.get('progress')
                 self.result['diff'] = config.get("configuration_templates")
-                self.log("Task details for 'version_template': {0}".format(task_details), "DEBUG")
+                self.log("Task details for 'version_template': {0}", "DEBUG", args=(task_details,))
                 self.result['response'] = task_details if task_details else response
 
                 if not self.result.get('msg'):
@@ -2503,6 +2877,7 @@ class DnacTemplate(DnacBase):
                     params=_import_project,
                 )
                 validation_string = "successfully imported project"
+                self.forget_planned()
                 self.check_task_response_status(response, validation_string).check_return_status()
                 self.result['response'][0].update({"importProject": validation_string})
 
@@ -2531,11 +2906,265 @@ class DnacTemplate(DnacBase):
                     params=import_template,
                 )
                 validation_string = "successfully imported template"
+                self.forget_planned()
                 self.check_task_response_status(response, validation_string).check_return_status()
                 self.result['response'][0].update({"importTemplate": validation_string})
 
         return self
 
+    def get_sync_templates(self, sync):
+        """
+        Get the templates to sync from the template directory and the template list of the playbook.
+
+        Parameters:
+            sync (dict) - Playbook details of the sync section.
+
+        Returns:
+            templates (list) - Playbook template details, with the defaults of the sync section applied.
+            None when the template directory cannot be read.
+        """
+
+        defaults = dict((key, sync.get(key)) for key in TEMPLATE_SYNC_DEFAULTS if sync.get(key) is not None)
+        templates = []
+        template_dir = sync.get("template_dir")
+        if template_dir:
+            if not os.path.isdir(template_dir):
+                self.msg = "Template directory {0} under sync is not found".format(template_dir)
+                self.status = "failed"
+                return None
+
+            for file_name in sorted(os.listdir(template_dir)):
+                file_path = os.path.join(template_dir, file_name)
+                if file_name.startswith(".") or not os.path.isfile(file_path):
+                    continue
+
+                (template_name, extension) = os.path.splitext(file_name)
+                template = dict(defaults, template_name=template_name)
+                if extension.lower() in TEMPLATE_LANGUAGE_EXTENSIONS:
+                    template["language"] = TEMPLATE_LANGUAGE_EXTENSIONS.get(extension.lower())
+                with open(file_path, "r") as template_file:
+                    template["template_content"] = template_file.read()
+                templates.append(template)
+
+        for playbook_template in sync.get("templates") or []:
+            template = dict(defaults)
+            template.update((key, value) for (key, value) in playbook_template.items() if value is not None)
+            templates.append(template)
+
+        self.log("Templates to sync: {0}", "DEBUG", args=([template.get("template_name") for template in templates],))
+        return templates
+
+    def handle_sync(self, config):
+        """
+        Bring the templates of a project in line with the templates of the sync section.
+
+        Parameters:
+            config (dict) - Playbook details containing the sync section.
+
+        Returns:
+            self
+
+        Description:
+            The project details and its committed templates are read once. A template is unchanged when
+            its latest version carries the fingerprint of the playbook template; otherwise its details are
+            read, concurrently, and compared like in update_configuration_templates. New templates are
+            imported in batches of 'batch_size' with 'imports_the_templates_provided', changed ones are
+            updated with at most 'max_concurrency' tasks in flight, and both are then versioned the same way,
+            with the fingerprint in the version comments. Templates of the project that are not in the sync
+            section are left as they are. The outcome of every template is reported in 'self.result["sync"]'.
+        """
+
+        sync = config.get("sync")
+        if not sync:
+            return self
+
+        project_name = sync.get("project_name")
+        if not project_name:
+            self.msg = "Mandatory parameter project_name is not found under sync"
+            self.status = "failed"
+            return self
+
+        templates = self.get_sync_templates(sync)
+        if templates is None:
+            return self
+
+        template_names = [template.get("template_name") for template in templates]
+        duplicates = sorted(set(name for name in template_names if template_names.count(name) > 1))
+        if None in template_names or duplicates:
+            self.msg = "Every template under sync needs a unique template_name, found: {0}".format(duplicates or [None])
+            self.status = "failed"
+            return self
+
+        batch_size = max(int(sync.get("batch_size") or TEMPLATE_SYNC_BATCH_SIZE), 1)
+        max_concurrency = max(int(sync.get("max_concurrency") or TEMPLATE_SYNC_MAX_CONCURRENCY), 1)
+        report = {}
+        failures = {}
+
+        # One snapshot of the project for all the templates
+        project_details = self.get_project_details(project_name)
+        if project_details and isinstance(project_details, list) and project_details[0].get("name") == project_name:
+            project_id = project_details[0].get("id")
+            template_ids = dict((template.get("name"), template.get("id"))
+                                for template in project_details[0].get("templates") or [])
+            last_update_times = dict((template.get("name"), template.get("lastUpdateTime"))
+                                     for template in project_details[0].get("templates") or [])
+        else:
+            self.want = {"project_params": self.get_project_params(sync), "template_params": {}}
+            project_id, project_created = self.create_project_or_template(is_create_project=True)
+            if not project_created:
+                self.msg = "Project creation failed"
+                self.status = "failed"
+                return self
+
+            self.forget_planned(("project_details", project_name))
+            template_ids = {}
+            last_update_times = {}
+
+        template_list = self.get_templates_available({"projectName": project_name})
+        to_create = {}
+        to_check = {}
+        sync_params = {}
+        for template in templates:
+            template_name = template.get("template_name")
+            language = (template.get("language") or "").upper()
+            if language not in self.accepted_languages:
+                failures[template_name] = "language must be one of {0}".format(self.accepted_languages)
+                continue
+
+            template_params = self.get_template_params(dict(template, project_name=project_name))
+            template_params.pop("project_id", None)
+            template_params["projectId"] = project_id
+            sync_params[template_name] = (template_params, self.get_template_fingerprint(template_params))
+            if template_name not in template_ids:
+                if not template_params.get("deviceTypes") or not template_params.get("softwareType"):
+                    failures[template_name] = "device_types and software_type are required to create a template"
+                    continue
+                to_create[template_name] = template_params
+            elif self.get_committed_fingerprint(template_list, project_name, template_name,
+                                                last_update_times.get(template_name)) == sync_params[template_name][1]:
+                report[template_name] = "unchanged"
+            else:
+                to_check[template_name] = template_params
+
+        def get_template_details(template_name):
+            return lambda results: self.dnac_apply['exec'](
+                family="configuration_templates",
+                function="get_template_details",
+                params={"template_id": template_ids.get(template_name)}
+            )
+
+        template_details = self.fetch_concurrently([(template_name, get_template_details(template_name))
+                                                    for template_name in to_check])
+        to_update = {}
+        for (template_name, template_params) in to_check.items():
+            current_obj = template_details.get(template_name) or {}
+            is_committed = get_dict_result(template_list, "name", template_name) if isinstance(template_list, list) else None
+            if is_committed and self.get_template_difference(current_obj, template_params) is None:
+                report[template_name] = "unchanged"
+                continue
+
+            for key in ("language", "deviceTypes", "softwareType"):
+                if not template_params.get(key):
+                    template_params[key] = current_obj.get(key)
+            template_params["id"] = template_ids.get(template_name)
+            to_update[template_name] = template_params
+
+        self.log("Syncing {0} template(s) into project '{1}': {2} to create, {3} to update, {4} unchanged", "INFO",
+                 args=(len(templates), project_name, len(to_create), len(to_update), len(report)))
+
+        def get_task_id(response):
+            if response and isinstance(response, dict) and isinstance(response.get("response"), dict):
+                return response.get("response").get("taskId")
+            return None
+
+        def get_failure_reason(task_details, operation):
+            if task_details is None:
+                return "the {0} task was not created or did not complete in time".format(operation)
+            return task_details.get("failureReason") or task_details.get("progress") or "an unknown error"
+
+        created_names = list(to_create)
+        batches = [tuple(created_names[i:i + batch_size]) for i in range(0, len(created_names), batch_size)]
+
+        def submit_import(batch):
+            response = self.dnac._exec(
+                family="configuration_templates",
+                function='imports_the_templates_provided',
+                op_modifies=True,
+                params={"project_name": project_name, "do_version": False,
+                        "payload": [to_create.get(template_name) for template_name in batch]},
+            )
+            self.log("Received API response from 'imports_the_templates_provided': {0}", "DEBUG", args=(response,))
+            return get_task_id(response)
+
+        def submit_update(template_name):
+            response = self.dnac_apply['exec'](
+                family="configuration_templates",
+                function="update_template",
+                op_modifies=True,
+                params=to_update.get(template_name),
+            )
+            self.log("Received API response from 'update_template': {0}", "DEBUG", args=(response,))
+            return get_task_id(response)
+
+        to_version = []
+        for (batch, task_details) in self.run_tasks(batches, submit_import, max_concurrency=1).items():
+            for template_name in batch:
+                if task_details and not task_details.get("isError"):
+                    to_version.append(template_name)
+                else:
+                    failures[template_name] = get_failure_reason(task_details, "import")
+
+        for (template_name, task_details) in self.run_tasks(list(to_update), submit_update, max_concurrency=max_concurrency).items():
+            if task_details and not task_details.get("isError"):
+                to_version.append(template_name)
+            else:
+                failures[template_name] = get_failure_reason(task_details, "update")
+
+        for template_name in sync_params:
+            self.forget_planned(("template", project_name, template_name))
+        if to_create:
+            self.forget_planned(("project_details", project_name))
+            project_details = self.get_project_details(project_name)
+            if project_details and isinstance(project_details, list):
+                template_ids.update((template.get("name"), template.get("id"))
+                                    for template in project_details[0].get("templates") or [])
+
+        def submit_version(template_name):
+            template_id = template_ids.get(template_name)
+            if not template_id:
+                return None
+
+            response = self.dnac_apply['exec'](
+                family="configuration_templates",
+                function="version_template",
+                op_modifies=True,
+                params={"comments": self.get_version_comments(sync.get("version_description"), sync_params[template_name][1]),
+                        "templateId": template_id},
+            )
+            return get_task_id(response)
+
+        for (template_name, task_details) in self.run_tasks(to_version, submit_version, max_concurrency=max_concurrency).items():
+            if task_details and not task_details.get("isError"):
+                report[template_name] = "created" if template_name in to_create else "updated"
+                self.result['changed'] = True
+            else:
+                failures[template_name] = get_failure_reason(task_details, "version")
+
+        for (template_name, failure_reason) in failures.items():
+            report[template_name] = "failed: {0}".format(failure_reason)
+            self.log("Sync of template '{0}' failed due to {1}", "ERROR", args=(template_name, failure_reason))
+
+        self.result['sync'] = dict((template_name, report.get(template_name)) for template_name in template_names)
+        if failures:
+            self.msg = "Failed to sync template(s) into project {0}: {1}".format(
+                project_name, ", ".join("{0} ({1})".format(name, reason) for (name, reason) in failures.items()))
+            self.status = "failed"
+            return self
+
+        self.msg = "Successfully synced {0} template(s) into project {1}".format(len(templates), project_name)
+        self.status = "success"
+        return self
+
     def get_diff_merged(self, config):
         """
         Update/Create templates and projects in DNAC with fields provided in DNAC.
@@ -2562,6 +3191,10 @@ class DnacTemplate(DnacBase):
         if self.status == "failed":
             return self
 
+        self.handle_sync(config)
+        if self.status == "failed":
+            return self
+
         self.msg = "Successfully completed merged state execution"
         self.status = "success"
         return self
@@ -2595,12 +3228,17 @@ class DnacTemplate(DnacBase):
         )
         task_id = response.get("response").get("taskId")
         if task_id:
+            project_name = config.get("configuration_templates").get("project_name")
+            if is_delete_project:
+                self.forget_planned(("project_details", project_name), ("template", project_name))
+            else:
+                self.forget_planned(("template", project_name, config.get("configuration_templates").get("template_name")))
             task_details = self.get_task_details(task_id)
             self.result['changed'] = True
             self.result['msg'] = task_details.get('progress')
             self.result['diff'] = config.get("configuration_templates")
 
-            self.log("Task details for '{0}': {1}".format(deletion_value, task_details), "DEBUG")
+            self.log("Task details for '{0}': {1}", "DEBUG", args=(deletion_value, task_details))
             self.result['response'] = task_details if task_details else response
             if not self.result['msg']:
                 self.result['msg'] = "Error while deleting {name} : "
@@ -2769,6 +3407,7 @@ def main():
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
                     }
+    element_spec.update(dnac_intent_argument_spec())
     module = AnsibleModule(argument_spec=element_spec,
                            supports_check_mode=False)
     dnac_template = DnacTemplate(module)
@@ -2780,6 +3419,7 @@ def main():
         dnac_template.msg = "State {0} is invalid".format(state)
         dnac_template.check_return_status()
 
+    dnac_template.plan(dnac_template.validated_config).check_return_status()
     for config in dnac_template.validated_config:
         dnac_template.reset_values()
         dnac_template.get_have(config).check_return_status()
@@ -9,128 +9,277 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 try:
     from dnacentersdk import api, exceptions
+    from dnacentersdk.response_codes import EXPECTED_RESPONSE_CODE
 except ImportError:
     DNAC_SDK_IS_INSTALLED = False
 else:
     DNAC_SDK_IS_INSTALLED = True
 from ansible.module_utils.basic import env_fallback
 from ansible.module_utils._text import to_native
+from ansible.utils.display import Display
+from ansible_collections.cisco.dnac.plugins.module_utils.dnac_session import (
+    DNAC_UPLOAD_CHUNK_SIZE,
+    DNAC_UPLOAD_PROGRESS_INTERVAL,
+    RateLimiter,
+    TokenCache,
+    UploadFile,
+    build_requests_session,
+    enable_token_cache,
+)
+# The action plugins import the compare helpers and get_dict_result from here
+from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
+    dnac_compare_difference,
+    dnac_compare_equality,
+    get_dict_result,
+)
 try:
     from ansible.errors import AnsibleActionFail
 except ImportError:
     ANSIBLE_ERRORS_INSTALLED = False
 else:
     ANSIBLE_ERRORS_INSTALLED = True
+from ansible_collections.cisco.dnac.plugins.plugin_utils.exceptions import (
+    InconsistentParameters,
+)
 try:
     import logging
 except ImportError:
     LOGGING_IN_STANDARD = False
 else:
     LOGGING_IN_STANDARD = True
+from abc import ABCMeta, abstractmethod
+import gzip
+import hashlib
+import json
 import os.path
+import re
+import shutil
+import tempfile
+import time
 
+# Parent directory of the per-run response caches
+DNAC_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".ansible", "tmp")
+# Caches left behind by runs older than this many seconds are removed
+DNAC_CACHE_MAX_AGE = 86400
 
-def is_list_complex(x):
-    return isinstance(x[0], dict) or isinstance(x[0], list)
+display = Display()
 
 
-def has_diff_elem(ls1, ls2):
-    return any((elem not in ls1 for elem in ls2))
-
-
-def compare_list(list1, list2):
-    len_list1 = len(list1)
-    len_list2 = len(list2)
-    if len_list1 != len_list2:
-        return False
-
-    if len_list1 == 0:
-        return True
-
-    attempt_std_cmp = list1 == list2
-    if attempt_std_cmp:
+def dnac_compare_equality2(current_value, requested_value, is_query_param=False):
+    if is_query_param:
         return True
+    return dnac_compare_difference(current_value, requested_value, strict=True) is None
+
+
+class DNACObject(object):
+    """
+    Shared exists/requires_update/create/update/delete engine of the action plugins managing one object.
+
+    Subclasses build 'self.new_object' from the task parameters, list the compared parameters in
+    'obj_params' and implement get_object_by_name, get_object_by_id, create, update and delete.
+    Objects that cannot be changed once created set 'updatable' to False, a difference is then
+    reported as present and different instead of being updated.
+    The object found by name is only fetched again by id when it lacks one of the compared fields,
+    which saves one request per task for the APIs whose listing already returns full objects.
+    """
+
+    __metaclass__ = ABCMeta
+
+    # (Cisco DNA Center parameter, Ansible parameter) pairs compared by requires_update
+    obj_params = []
+    # Compare with dnac_compare_equality2, which also requires the parameters left out of the task to be unset
+    strict_compare = False
+    # Whether a different existing object is updated, or only reported as present and different
+    updatable = True
+
+    def __init__(self, params, dnac):
+        self.dnac = dnac
+        self.new_object = {}
+
+    @abstractmethod
+    def get_object_by_name(self, name):
+        pass
+
+    @abstractmethod
+    def get_object_by_id(self, id):
+        pass
+
+    @abstractmethod
+    def create(self):
+        pass
+
+    @abstractmethod
+    def update(self):
+        pass
+
+    @abstractmethod
+    def delete(self):
+        pass
+
+    def get_requested_id(self):
+        return self.new_object.get("id")
+
+    def get_requested_name(self):
+        return self.new_object.get("name")
+
+    def get_object_id(self, obj):
+        return obj.get("id")
+
+    def set_object_id(self, id):
+        self.new_object.update(dict(id=id))
+
+    def get_requested_object(self):
+        return self.new_object
+
+    def has_compared_fields(self, obj):
+        requested_obj = self.new_object
+        if not self.obj_params:
+            return False
+        return all(dnac_param in obj for (dnac_param, ansible_param) in self.obj_params
+                   if self.strict_compare or requested_obj.get(ansible_param) is not None)
+
+    def exists(self, compare=True):
+        id_exists = False
+        name_exists = False
+        prev_obj = None
+        o_id = self.get_requested_id()
+        name = self.get_requested_name()
+        if o_id:
+            prev_obj = self.get_object_by_id(o_id)
+            id_exists = prev_obj is not None and isinstance(prev_obj, dict)
+        if not id_exists and name:
+            prev_obj = self.get_object_by_name(name)
+            name_exists = prev_obj is not None and isinstance(prev_obj, dict)
+        if name_exists:
+            _id = self.get_object_id(prev_obj)
+            if id_exists and name_exists and o_id != _id:
+                raise InconsistentParameters("The 'id' and 'name' params don't refer to the same object")
+            if _id:
+                self.set_object_id(_id)
+            if _id and compare and not self.has_compared_fields(prev_obj):
+                prev_obj = self.get_object_by_id(_id)
+        it_exists = prev_obj is not None and isinstance(prev_obj, dict)
+        return (it_exists, prev_obj)
+
+    def requires_update(self, current_obj):
+        requested_obj = self.get_requested_object()
+        compare_equality = dnac_compare_equality2 if self.strict_compare else dnac_compare_equality
+        # Params present in request (Ansible) obj are the same as the current (DNAC) params
+        # If any does not have eq params, it requires update
+        return any(not compare_equality(current_obj.get(dnac_param),
+                                        requested_obj.get(ansible_param))
+                   for (dnac_param, ansible_param) in self.obj_params)
+
+    def apply_state(self, state):
+        """Bring the object to 'state', present or absent, and return the response of the last request."""
+
+        response = None
+        if state == "present":
+            (obj_exists, prev_obj) = self.exists()
+            if obj_exists:
+                if self.requires_update(prev_obj):
+                    if self.updatable:
+                        response = self.update()
+                        self.dnac.object_updated()
+                    else:
+                        response = prev_obj
+                        self.dnac.object_present_and_different()
+                else:
+                    response = prev_obj
+                    self.dnac.object_already_present()
+            else:
+                response = self.create()
+                self.dnac.object_created()
+
+        elif state == "absent":
+            (obj_exists, prev_obj) = self.exists(compare=False)
+            if obj_exists:
+                response = self.delete()
+                self.dnac.object_deleted()
+            else:
+                self.dnac.object_already_absent()
 
-    if not is_list_complex(list1) and not is_list_complex(list2):
-        return set(list1) == set(list2)
-
-    # Compare normally if it exceeds expected size * 2 (len_list1==len_list2)
-    MAX_SIZE_CMP = 100
-    # Fail fast if elem not in list, thanks to any and generators
-    if len_list1 > MAX_SIZE_CMP:
-        return attempt_std_cmp
-    else:
-        # not changes 'has diff elem' to list1 != list2 ':lists are not equal'
-        has_diff_1 = has_diff_elem(list1, list2)
-        has_diff_2 = has_diff_elem(list2, list1)
-        return not has_diff_1 or not has_diff_2
-
-
-def fn_comp_key(k, dict1, dict2):
-    return dnac_compare_equality(dict1.get(k), dict2.get(k))
-
+        return response
 
-def dnac_compare_equality(current_value, requested_value):
-    # print("dnac_compare_equality", current_value, requested_value)
-    if requested_value is None:
-        return True
-    if current_value is None:
-        return True
-    if isinstance(current_value, dict) and isinstance(requested_value, dict):
-        all_dict_params = list(current_value.keys()) + list(requested_value.keys())
-        return not any((not fn_comp_key(param, current_value, requested_value) for param in all_dict_params))
-    elif isinstance(current_value, list) and isinstance(requested_value, list):
-        return compare_list(current_value, requested_value)
-    else:
-        return current_value == requested_value
 
+def get_content_checksum(file_path, compressed=False):
+    """Return the SHA-256 of the content of a file, read in chunks and decompressed first when 'compressed'."""
+
+    digest = hashlib.sha256()
+    with (gzip.open(file_path, "rb") if compressed else open(file_path, "rb")) as content_file:
+        for chunk in iter(lambda: content_file.read(DNAC_UPLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResponseCache(object):
+    """
+    Read-through cache of 'get_*' responses shared by the tasks of one playbook run.
+
+    Ansible runs every task in a worker process forked from the ansible-playbook process, so the
+    cache lives in a directory named after that parent process, one file per response keyed by
+    host, user, family, function and parameters. Entries expire after 'ttl' seconds, and any other
+    call of a family drops the cached responses of the whole family, for this task and the
+    tasks that follow. The intent modules do not use this cache, so their changes only show
+    once the entries expire.
+    """
+
+    def __init__(self, host, username, ttl, path=None):
+        self.host = host
+        self.username = username
+        self.ttl = ttl
+        self.path = path or os.path.join(DNAC_CACHE_DIR, "cisco_dnac_cache_{0}".format(os.getppid()))
+        if not os.path.isdir(self.path):
+            self.remove_stale_caches()
+
+    def remove_stale_caches(self):
+        parent = os.path.dirname(self.path)
+        if not os.path.isdir(parent):
+            return
+        for name in os.listdir(parent):
+            cache_path = os.path.join(parent, name)
+            try:
+                if name.startswith("cisco_dnac_cache_") and time.time() - os.path.getmtime(cache_path) > DNAC_CACHE_MAX_AGE:
+                    shutil.rmtree(cache_path, ignore_errors=True)
+            except OSError:
+                pass
+
+    def entry_path(self, family, function, params):
+        key = json.dumps([self.host, self.username, function, params], sort_keys=True, default=str)
+        return os.path.join(self.path, family, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+    def get(self, family, function, params):
+        """Return (True, response) for a cached response still within its TTL, (False, None) otherwise."""
+
+        entry_path = self.entry_path(family, function, params)
+        try:
+            if time.time() - os.path.getmtime(entry_path) > self.ttl:
+                return (False, None)
+            with open(entry_path) as entry_file:
+                return (True, json.load(entry_file))
+        except (IOError, OSError, ValueError):
+            return (False, None)
+
+    def set(self, family, function, params, response):
+        entry_path = self.entry_path(family, function, params)
+        directory = os.path.dirname(entry_path)
+        try:
+            content = json.dumps(response)
+        except (TypeError, ValueError):
+            # Downloads and other non JSON responses are not cached
+            return
+        try:
+            if not os.path.isdir(directory):
+                os.makedirs(directory, 0o700)
+            (handle, temp_path) = tempfile.mkstemp(dir=directory)
+            with os.fdopen(handle, "w") as entry_file:
+                entry_file.write(content)
+            os.rename(temp_path, entry_path)
+        except (IOError, OSError):
+            pass
 
-def fn_comp_key2(k, dict1, dict2):
-    return dnac_compare_equality2(dict1.get(k), dict2.get(k))
-
-
-def dnac_compare_equality2(current_value, requested_value, is_query_param=False):
-    if is_query_param:
-        return True
-    if requested_value is None and current_value is None:
-        return True
-    if requested_value is None:
-        return False
-    if current_value is None:
-        return False
-    if isinstance(current_value, dict) and isinstance(requested_value, dict):
-        all_dict_params = list(current_value.keys()) + list(requested_value.keys())
-        return not any((not fn_comp_key2(param, current_value, requested_value) for param in all_dict_params))
-    elif isinstance(current_value, list) and isinstance(requested_value, list):
-        return compare_list(current_value, requested_value)
-    else:
-        return current_value == requested_value
-
-
-def simple_cmp(obj1, obj2):
-    return obj1 == obj2
-
-
-def get_dict_result(result, key, value, cmp_fn=simple_cmp):
-    if isinstance(result, list):
-        if len(result) == 1:
-            if isinstance(result[0], dict):
-                result = result[0]
-                if result.get(key) is not None and result.get(key) != value:
-                    result = None
-            else:
-                result = None
-        else:
-            for item in result:
-                if isinstance(item, dict) and (item.get(key) is None or item.get(key) == value):
-                    result = item
-                    return result
-            result = None
-    elif not isinstance(result, dict):
-        result = None
-    elif result.get(key) is not None and result.get(key) != value:
-        result = None
-    return result
+    def invalidate(self, family):
+        shutil.rmtree(os.path.join(self.path, family), ignore_errors=True)
 
 
 def dnac_argument_spec():
@@ -143,6 +292,15 @@ def dnac_argument_spec():
         dnac_version=dict(type="str", fallback=(env_fallback, ['DNAC_VERSION']), default="2.3.5.3"),
         dnac_debug=dict(type="bool", fallback=(env_fallback, ['DNAC_DEBUG']), default=False),
         validate_response_schema=dict(type="bool", fallback=(env_fallback, ['VALIDATE_RESPONSE_SCHEMA']), default=True),
+        dnac_token_cache=dict(type="bool", fallback=(env_fallback, ['DNAC_TOKEN_CACHE']), default=False),
+        dnac_pool_maxsize=dict(type="int", fallback=(env_fallback, ['DNAC_POOL_MAXSIZE']), default=10),
+        dnac_timeout=dict(type="int", fallback=(env_fallback, ['DNAC_TIMEOUT']), default=60),
+        dnac_max_retries=dict(type="int", fallback=(env_fallback, ['DNAC_MAX_RETRIES']), default=3),
+        dnac_retry_backoff=dict(type="float", fallback=(env_fallback, ['DNAC_RETRY_BACKOFF']), default=1.0),
+        dnac_api_rate_limit=dict(type="float", fallback=(env_fallback, ['DNAC_API_RATE_LIMIT'])),
+        dnac_api_family_rate_limits=dict(type="dict"),
+        dnac_cache=dict(type="bool", fallback=(env_fallback, ['DNAC_CACHE']), default=False),
+        dnac_cache_ttl=dict(type="int", fallback=(env_fallback, ['DNAC_CACHE_TTL']), default=300),
     )
     return argument_spec
 
@@ -151,6 +309,16 @@ class DNACSDK(object):
     def __init__(self, params):
         self.result = dict(changed=False, result="")
         self.validate_response_schema = params.get("validate_response_schema")
+        self.rate_limiter = RateLimiter(
+            params.get("dnac_host"),
+            params.get("dnac_port"),
+            rate=params.get("dnac_api_rate_limit"),
+            family_rates=params.get("dnac_api_family_rate_limits"),
+        )
+        self.api_calls = 0
+        self.cache = None
+        if params.get("dnac_cache"):
+            self.cache = ResponseCache(params.get("dnac_host"), params.get("dnac_username"), params.get("dnac_cache_ttl"))
         if DNAC_SDK_IS_INSTALLED:
             self.api = api.DNACenterAPI(
                 username=params.get("dnac_username"),
@@ -161,7 +329,21 @@ class DNACSDK(object):
                 version=params.get("dnac_version"),
                 verify=params.get("dnac_verify"),
                 debug=params.get("dnac_debug"),
+                single_request_timeout=params.get("dnac_timeout"),
+                session=build_requests_session(
+                    pool_maxsize=params.get("dnac_pool_maxsize"),
+                    max_retries=params.get("dnac_max_retries"),
+                    retry_backoff=params.get("dnac_retry_backoff"),
+                ),
             )
+            if params.get("dnac_token_cache"):
+                enable_token_cache(self.api, TokenCache(
+                    params.get("dnac_host"),
+                    params.get("dnac_port"),
+                    params.get("dnac_username"),
+                    params.get("dnac_password"),
+                    params.get("dnac_version"),
+                ))
             if params.get("dnac_debug") and LOGGING_IN_STANDARD:
                 logging.getLogger('dnacentersdk').addHandler(logging.StreamHandler())
         else:
@@ -203,13 +385,117 @@ class DNACSDK(object):
     def extract_file_name(self, file_path):
         return os.path.basename(file_path)
 
+    def download(self, family, resource_path, path_params, dirpath=None, filename=None, compress=False,
+                 checksum=None, headers=None):
+        """
+        Stream a file from Cisco DNA Center to 'dirpath' and return its metadata instead of its content.
+
+        The request goes through the SDK session like any other call: it authenticates first, uses the
+        configured 'dnac_timeout' and refreshes the token once on a 401 response.
+
+        The response is written in chunks to a temporary file renamed once complete, gzip compressed
+        when 'compress' is set, so the memory used does not depend on the size of the file. The SHA-256
+        of the content is computed on the way. When 'filename' and 'checksum' are given and the file
+        already holds content with that checksum, nothing is requested. A download identical to the file
+        it would replace leaves that file untouched.
+        """
+
+        dirpath = dirpath if dirpath and os.path.isdir(dirpath) else os.getcwd()
+        suffix = ".gz" if compress else ""
+        if filename and checksum:
+            path = os.path.join(dirpath, filename + suffix)
+            if os.path.isfile(path) and get_content_checksum(path, compress) == checksum.lower():
+                return dict(filename=filename + suffix, dirpath=dirpath, path=path, size=os.path.getsize(path),
+                            sha256=checksum.lower(), compressed=compress, downloaded=False)
+
+        if self.rate_limiter.enabled():
+            self.rate_limiter.acquire(family)
+
+        self.api_calls += 1
+        resource_path = resource_path.format(**path_params)
+        try:
+            response = self.api._session.request(
+                "GET",
+                resource_path,
+                EXPECTED_RESPONSE_CODE["GET"],
+                0,
+                stream=True,
+                **(dict(headers=headers) if headers else {})
+            )
+        except Exception as e:
+            self.fail_json(
+                msg=(
+                    "An error occured when executing operation."
+                    " The error was: {error}"
+                ).format(error=to_native(e))
+            )
+
+        if not filename:
+            match = re.search(r'filename="?([^";]+)"?', response.headers.get("Content-Disposition") or "")
+            filename = os.path.basename(match.group(1)) if match else os.path.basename(resource_path)
+        path = os.path.join(dirpath, filename + suffix)
+
+        digest = hashlib.sha256()
+        (handle, temp_path) = tempfile.mkstemp(dir=dirpath, prefix=".dnac_download")
+        try:
+            with os.fdopen(handle, "wb") as temp_file:
+                output = gzip.GzipFile(filename=filename, mode="wb", fileobj=temp_file) if compress else temp_file
+                for chunk in response.iter_content(chunk_size=DNAC_UPLOAD_CHUNK_SIZE):
+                    digest.update(chunk)
+                    output.write(chunk)
+                if compress:
+                    output.close()
+        except Exception as e:
+            os.remove(temp_path)
+            self.fail_json(msg="Failed to download {0}: {1}".format(path, to_native(e)))
+        finally:
+            response.close()
+
+        sha256 = digest.hexdigest()
+        downloaded = not (os.path.isfile(path) and get_content_checksum(path, compress) == sha256)
+        if downloaded:
+            # mkstemp creates the file readable by its owner only, apply the umask like a plain open() would
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_path, 0o666 & ~umask)
+            os.rename(temp_path, path)
+        else:
+            os.remove(temp_path)
+
+        return dict(filename=filename + suffix, dirpath=dirpath, path=path, size=os.path.getsize(path),
+                    sha256=sha256, compressed=compress, downloaded=downloaded)
+
+    def upload_progress(self, upload):
+        now = time.time()
+        if upload.len and now - upload.reported < DNAC_UPLOAD_PROGRESS_INTERVAL:
+            return
+        upload.reported = now
+        display.vvv("Uploaded {0} of {1} bytes of {2} ({3:.1f} MiB/s)".format(
+            upload.bytes_read, upload.size, upload.file_name, upload.throughput() / (1024 * 1024)))
+
     def exec(self, family, function, params=None, op_modifies=False, **kwargs):
+        family_name = family
         try:
             family = getattr(self.api, family)
             func = getattr(family, function)
         except Exception as e:
             self.fail_json(msg=e)
 
+        cacheable = self.cache is not None and function.startswith("get_") and not op_modifies and not kwargs
+        if cacheable:
+            (cached, response) = self.cache.get(family_name, function, params)
+            if cached:
+                return response
+        elif self.cache is not None:
+            # Deletes do not always set op_modifies, anything but a plain read may change the family.
+            # The family is dropped again once the call returned, in case a parallel task refilled it meanwhile.
+            self.cache.invalidate(family_name)
+
+        if self.rate_limiter.enabled():
+            self.rate_limiter.acquire(family_name)
+
+        self.api_calls += 1
+        uploads = []
         try:
             if params:
                 file_paths_params = kwargs.get('file_paths', [])
@@ -218,9 +504,9 @@ class DNACSDK(object):
                     multipart_fields = {}
                     for (key, value) in file_paths_params:
                         if isinstance(params.get(key), str) and self.is_file(params[key]):
-                            file_name = self.extract_file_name(params[key])
-                            file_path = params[key]
-                            multipart_fields[value] = (file_name, open(file_path, 'rb'))
+                            upload = UploadFile(params[key], callback=self.upload_progress)
+                            uploads.append(upload)
+                            multipart_fields[value] = (upload.file_name, upload)
 
                     params.setdefault("multipart_fields", multipart_fields)
                     params.setdefault("multipart_monitor_callback", None)
@@ -238,6 +524,15 @@ class DNACSDK(object):
                     " The error was: {error}"
                 ).format(error=to_native(e))
             )
+        finally:
+            for upload in uploads:
+                upload.close()
+        if uploads:
+            self.result.setdefault("dnac_uploads", []).extend(upload.summary() for upload in uploads)
+        if cacheable:
+            self.cache.set(family_name, function, params, response)
+        elif self.cache is not None:
+            self.cache.invalidate(family_name)
         return response
 
     def fail_json(self, msg, **kwargs):
@@ -245,6 +540,7 @@ class DNACSDK(object):
         raise AnsibleActionFail(msg, kwargs)
 
     def exit_json(self):
+        self.result["dnac_api_calls"] = self.api_calls
         return self.result
 
     def verify_array(self, verify_interface, **kwargs):
@@ -0,0 +1,66 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from unittest import TestCase
+
+from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
+    compare_list,
+    compare_list_difference,
+    dnac_compare_difference,
+    dnac_compare_equality,
+)
+
+
+class TestDnacCompare(TestCase):
+
+    def test_compare_list_ignores_order(self):
+        self.assertTrue(compare_list([1, 2, 3], [3, 1, 2]))
+        self.assertTrue(compare_list([{"a": 1, "b": 2}, {"c": [1, 2]}], [{"c": [1, 2]}, {"b": 2, "a": 1}]))
+        self.assertTrue(compare_list([[1, 2], [3]], [[3], [1, 2]]))
+        self.assertTrue(compare_list([{"a": 1}], [{"a": 1.0}]))
+        self.assertTrue(compare_list([], []))
+
+    def test_compare_list_counts_duplicates(self):
+        current = [{"a": 1}, {"a": 1}, {"b": 2}]
+
+        self.assertTrue(compare_list(current, [{"b": 2}, {"a": 1}, {"a": 1}]))
+        self.assertFalse(compare_list(current, [{"a": 1}, {"b": 2}, {"b": 2}]))
+        self.assertEqual(compare_list_difference(current, [{"a": 1}, {"b": 2}, {"b": 2}]), (2,))
+
+    def test_compare_list_difference_path(self):
+        self.assertEqual(compare_list_difference([1, 2], [1, 3]), (1,))
+        self.assertEqual(compare_list_difference([1, 2], [1, 2, 3]), ())
+        self.assertEqual(compare_list_difference([{"a": 1}], [{"a": [1]}], ("key",)), ("key", 0))
+        self.assertIsNone(compare_list_difference([{"a": 1}, {"b": 2}], [{"b": 2}, {"a": 1}]))
+
+    def test_dnac_compare_difference_path(self):
+        current = {"name": "edge", "settings": {"servers": [{"ip": "10.0.0.1"}, {"ip": "10.0.0.2"}]}}
+
+        self.assertIsNone(dnac_compare_difference(
+            current, {"settings": {"servers": [{"ip": "10.0.0.2"}, {"ip": "10.0.0.1"}]}, "name": "edge"}))
+        self.assertEqual(dnac_compare_difference(
+            current, {"name": "edge", "settings": {"servers": [{"ip": "10.0.0.2"}, {"ip": "10.0.0.3"}]}}),
+            ("settings", "servers", 1))
+        self.assertEqual(dnac_compare_difference(current, {"name": "core"}), ("name",))
+
+    def test_dnac_compare_difference_none(self):
+        self.assertTrue(dnac_compare_equality({"a": 1, "b": None}, {"a": 1, "b": 2}))
+        self.assertTrue(dnac_compare_equality({"a": 1}, {"a": 1, "b": 2}))
+        self.assertIsNone(dnac_compare_difference(None, None, strict=True))
+        self.assertEqual(dnac_compare_difference({"a": 1}, {"a": 1, "b": 2}, strict=True), ("b",))
@@ -0,0 +1,88 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.cisco.dnac.plugins.module_utils.dnac import DnacBase
+from ansible_collections.cisco.dnac.tests.unit.modules.dnac.dnac_module import TestDnacBase
+
+
+class TestDnacPlan(TestDnacBase):
+
+    dnac_class = DnacBase
+
+    def setUp(self):
+        super().setUp()
+        self.dnac.get_plan_lookups = self.get_plan_lookups
+        self.reads = []
+
+    def read(self, key):
+        self.reads.append(key)
+        if key == ("project_details", "Broken"):
+            raise Exception("Internal server error")
+        return {"key": list(key), "version": self.reads.count(key)}
+
+    def get_plan_lookups(self, config):
+        project_key = ("project_details", config.get("project"))
+        return [
+            (project_key, lambda results: self.read(project_key)),
+            (("template", config.get("project"), config.get("template")),
+             lambda results: self.read(("template", config.get("project"), config.get("template"))), (project_key,)),
+        ]
+
+    def test_plan_reads_shared_keys_once(self):
+        self.dnac.plan([{"project": "P", "template": "a"}, {"project": "P", "template": "b"},
+                        {"project": "PQ", "template": "a"}])
+
+        self.assertEqual(self.reads.count(("project_details", "P")), 1)
+        self.assertEqual(sorted(self.dnac.snapshot), [
+            ("project_details", "P"), ("project_details", "PQ"),
+            ("template", "P", "a"), ("template", "P", "b"), ("template", "PQ", "a")])
+
+        planned = self.dnac.get_planned(("template", "P", "a"), lambda: self.fail("read again"))
+        planned["key"].append("changed")
+        self.assertEqual(self.dnac.get_planned(("template", "P", "a"), lambda: None).get("key"), ["template", "P", "a"])
+
+    def test_plan_leaves_failed_reads_out(self):
+        self.dnac.plan([{"project": "Broken", "template": "a"}, {"project": "P", "template": "a"}])
+
+        self.assertNotIn(("project_details", "Broken"), self.dnac.snapshot)
+        # The template read waits for the failed project read and is not made
+        self.assertNotIn(("template", "Broken", "a"), self.reads)
+        self.assertIn(("template", "P", "a"), self.dnac.snapshot)
+
+    def test_forget_planned_drops_key_prefix(self):
+        self.dnac.plan([{"project": "P", "template": "a"}, {"project": "P", "template": "b"},
+                        {"project": "PQ", "template": "a"}])
+
+        self.dnac.forget_planned(("template", "P"))
+
+        self.assertEqual(sorted(self.dnac.snapshot), [
+            ("project_details", "P"), ("project_details", "PQ"), ("template", "PQ", "a")])
+
+        # A forgotten planned key is read again once and kept for the next entries
+        key = ("template", "P", "a")
+        self.assertEqual(self.dnac.get_planned(key, lambda: self.read(key)).get("version"), 2)
+        self.assertEqual(self.dnac.get_planned(key, lambda: self.read(key)).get("version"), 2)
+
+        # Keys that were never planned are not kept
+        key = ("template", "P", "c")
+        self.dnac.get_planned(key, lambda: self.read(key))
+        self.assertNotIn(key, self.dnac.snapshot)
+
+        self.dnac.forget_planned()
+        self.assertEqual(self.dnac.snapshot, {})
@@ -0,0 +1,126 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import errno
+import os
+import shutil
+import tempfile
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from ansible_collections.cisco.dnac.plugins.module_utils.dnac_session import RateLimiter
+
+
+class TestDnacRateLimiter(TestCase):
+
+    def setUp(self):
+        self.state_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.state_dir, "rate.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.state_dir)
+
+    def test_rate_limiter_disabled(self):
+        limiter = RateLimiter("dnac", 443, path=self.path)
+
+        self.assertFalse(limiter.enabled())
+        limiter.acquire("sites")
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_rate_limiter_burst_and_refill(self):
+        limiter = RateLimiter("dnac", 443, rate=2, path=self.path)
+        buckets = {}
+
+        self.assertEqual([limiter.take(buckets, [None], 100.0) for dummy in range(2)], [0, 0])
+        self.assertAlmostEqual(limiter.take(buckets, [None], 100.0), 0.5)
+        # Half a second later one token is back, an idle bucket never holds more than one second of tokens
+        self.assertEqual(limiter.take(buckets, [None], 100.5), 0)
+        self.assertEqual([limiter.take(buckets, [None], 200.0) for dummy in range(3)], [0, 0, 0.5])
+
+    def test_rate_limiter_family_rates(self):
+        limiter = RateLimiter("dnac", 443, rate=10, family_rates={"sites": 1, "devices": None}, path=self.path)
+        buckets = {}
+
+        self.assertEqual(limiter.take(buckets, [None, "sites"], 100.0), 0)
+        self.assertAlmostEqual(limiter.take(buckets, [None, "sites"], 100.0), 1.0)
+        # A request that has to wait takes no token from the buckets that had one
+        self.assertEqual(buckets["None"][0], 9)
+        self.assertEqual(limiter.take(buckets, [None], 100.0), 0)
+        self.assertNotIn("devices", limiter.rates)
+
+    def test_rate_limiter_acquire_waits(self):
+        limiter = RateLimiter("dnac", 443, rate=1, path=self.path)
+        clock = {"now": 100.0}
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            clock["now"] += seconds
+
+        with patch("ansible_collections.cisco.dnac.plugins.module_utils.dnac_session.time") as mock_time:
+            mock_time.time.side_effect = lambda: clock["now"]
+            mock_time.sleep.side_effect = sleep
+            limiter.acquire("sites")
+            limiter.acquire("sites")
+
+        self.assertEqual(len(sleeps), 1)
+        self.assertAlmostEqual(sleeps[0], 1.0)
+
+    def test_rate_limiter_shared_between_instances(self):
+        rate = 50
+        limiters = [RateLimiter("dnac", 443, rate=rate, path=self.path) for dummy in range(3)]
+
+        def acquire(limiter):
+            for dummy in range(25):
+                limiter.acquire("sites")
+
+        started = time.time()
+        threads = [threading.Thread(target=acquire, args=(limiter,)) for limiter in limiters]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 75 requests against one budget: a burst of 50, then 25 more at 50 per second
+        self.assertGreaterEqual(time.time() - started, 0.4)
+
+    def test_rate_limiter_corrupt_state_file(self):
+        with open(self.path, "w") as state_file:
+            state_file.write("{not json")
+        limiter = RateLimiter("dnac", 443, rate=1, path=self.path)
+
+        self.assertEqual(limiter.take_shared([None], 100.0), 0)
+        self.assertAlmostEqual(limiter.take_shared([None], 100.0), 1.0)
+
+    def test_rate_limiter_unwritable_state_file(self):
+        limiter = RateLimiter("dnac", 443, rate=1, path=self.path)
+
+        with patch("ansible_collections.cisco.dnac.plugins.module_utils.dnac_session.os.open",
+                   side_effect=OSError(errno.EROFS, "Read-only file system")):
+            self.assertEqual(limiter.take_shared([None], 100.0), 0)
+            self.assertAlmostEqual(limiter.take_shared([None], 100.0), 1.0)
+
+        # The budget was kept in the process
+        self.assertIn("None", limiter.buckets)
+
+        with patch("ansible_collections.cisco.dnac.plugins.module_utils.dnac_session.os.open",
+                   side_effect=OSError(errno.EIO, "Input/output error")):
+            self.assertRaises(OSError, limiter.take_shared, [None], 100.0)
@@ -0,0 +1,138 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from unittest.mock import patch
+
+from ansible_collections.cisco.dnac.plugins.module_utils.dnac import DnacBase
+from ansible_collections.cisco.dnac.tests.unit.modules.dnac.dnac_module import TestDnacBase
+
+
+class TestDnacRunTasks(TestDnacBase):
+
+    dnac_class = DnacBase
+    module_params = {"dnac_poll_interval": 2}
+
+    def setUp(self):
+        """
+        Build a DnacBase on a simulated clock, whose tasks finish after the number of polls given in 'task_polls'.
+        """
+
+        super().setUp()
+        self.now = 1000.0
+        self.mock_time = patch("ansible_collections.cisco.dnac.plugins.module_utils.dnac.time")
+        mock_time = self.mock_time.start()
+        mock_time.time.side_effect = lambda: self.now
+        mock_time.sleep.side_effect = self.sleep
+        self.dnac.get_task_details = self.get_task_details
+
+        self.task_polls = {}
+        self.polls = {}
+        self.submitted = []
+        self.completed = []
+        self.max_in_flight = 0
+        self.sleeps = []
+        self.poll_times = {}
+
+    def tearDown(self):
+        self.mock_time.stop()
+        super().tearDown()
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def submit(self, item):
+        if self.task_polls.get(item) == 0:
+            return None
+
+        self.submitted.append(item)
+        self.max_in_flight = max(self.max_in_flight, len(self.submitted) - len(self.completed))
+        return "task-" + item
+
+    def get_task_details(self, task_id):
+        item = task_id[len("task-"):]
+        self.polls[item] = self.polls.get(item, 0) + 1
+        self.poll_times.setdefault(item, []).append(self.now)
+        if self.polls[item] < self.task_polls.get(item):
+            return {"isError": False, "progress": "running"}
+
+        return {"isError": False, "progress": "done", "endTime": self.now}
+
+    def on_complete(self, item, task_details):
+        self.completed.append(item)
+
+    def test_run_tasks_bounded_concurrency(self):
+        self.task_polls = {"a": 3, "b": 1, "c": 2, "d": 1, "e": 4, "f": 1}
+        items = sorted(self.task_polls)
+
+        results = self.dnac.run_tasks(items, self.submit, max_concurrency=2, on_complete=self.on_complete)
+
+        self.assertEqual(self.max_in_flight, 2)
+        self.assertEqual(self.submitted, items)
+        self.assertEqual(sorted(self.completed), items)
+        self.assertTrue(all(results[item].get("progress") == "done" for item in items))
+        self.assertEqual(self.polls, self.task_polls)
+        self.assertEqual(self.dnac.poll_stats["tasks"], 6)
+        self.assertEqual(self.dnac.poll_stats["timeouts"], 0)
+
+    def test_run_tasks_polls_only_due_tasks(self):
+        self.task_polls = {"a": 1, "b": 1, "c": 1, "slow": 5}
+
+        self.dnac.run_tasks(["slow", "a", "b", "c"], self.submit, max_concurrency=2, on_complete=self.on_complete)
+
+        # A freed slot is filled without an extra polling round, and the slow task keeps its own backoff
+        self.assertTrue(all(seconds > 0 for seconds in self.sleeps))
+        poll_times = self.poll_times["slow"]
+        gaps = [later - earlier for (earlier, later) in zip(poll_times, poll_times[1:])]
+        self.assertTrue(all(later > earlier for (earlier, later) in zip(gaps, gaps[1:])), gaps)
+        self.assertEqual(self.polls, self.task_polls)
+        self.assertEqual(self.dnac.poll_stats["polls"], 8)
+
+    def test_run_tasks_unbounded_concurrency(self):
+        self.task_polls = {"a": 2, "b": 2, "c": 2}
+
+        self.dnac.run_tasks(["a", "b", "c", "a"], self.submit, on_complete=self.on_complete)
+
+        self.assertEqual(self.max_in_flight, 3)
+        self.assertEqual(self.submitted, ["a", "b", "c"])
+
+    def test_run_tasks_timeout(self):
+        self.task_polls = {"slow": 1000, "fast": 1, "skipped": 0}
+
+        results = self.dnac.run_tasks(["slow", "fast", "skipped"], self.submit, max_concurrency=1, timeout=30,
+                                      on_complete=self.on_complete)
+
+        self.assertIsNone(results["slow"])
+        self.assertIsNone(results["skipped"])
+        self.assertEqual(results["fast"].get("progress"), "done")
+        self.assertEqual(self.completed, ["fast"])
+        # The slow task is given up at its deadline, which frees the only slot for the next items
+        self.assertGreaterEqual(self.now, 1030.0)
+        self.assertLess(self.now, 1030.0 + self.dnac.poll_max_interval)
+        self.assertEqual(self.dnac.poll_stats["timeouts"], 1)
+        self.assertEqual(self.dnac.status, "success")
+
+    def test_run_tasks_fail_on_timeout(self):
+        self.task_polls = {"slow": 1000}
+
+        results = self.dnac.run_tasks(["slow"], self.submit, timeout=30, fail_on_timeout=True)
+
+        self.assertEqual(results, {"slow": None})
+        self.assertEqual(self.dnac.status, "failed")
+        self.assertIn("task-slow", self.dnac.msg)
@@ -0,0 +1,100 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from unittest import TestCase
+
+from ansible_collections.cisco.dnac.plugins.module_utils.dnac import DnacBase, SiteTree
+from ansible_collections.cisco.dnac.tests.unit.modules.dnac.dnac_module import TestDnacBase
+
+
+def get_site(site_id, parent_id, name, site_type):
+    return {"id": site_id, "parentId": parent_id, "siteNameHierarchy": name,
+            "additionalInfo": [{"nameSpace": "Location", "attributes": {"type": site_type}}]}
+
+
+SITES = [
+    get_site("global", None, "Global", None),
+    get_site("usa", "global", "Global/USA", "area"),
+    get_site("sjc", "usa", "Global/USA/San Jose", "area"),
+    get_site("bld23", "sjc", "Global/USA/San Jose/BLD23", "building"),
+    get_site("floor1", "bld23", "Global/USA/San Jose/BLD23/FLOOR1", "floor"),
+    get_site("floor2", "bld23", "Global/USA/San Jose/BLD23/FLOOR2", "floor"),
+    get_site("rtp", "usa", "Global/USA/RTP", "area"),
+]
+
+
+class TestDnacSiteTree(TestCase):
+
+    def setUp(self):
+        self.site_tree = SiteTree(SITES)
+
+    def test_site_tree_get_exact_and_case_insensitive(self):
+        self.assertEqual(self.site_tree.get_id("Global/USA/San Jose/BLD23"), "bld23")
+        self.assertEqual(self.site_tree.get_id("global/usa/san jose/bld23"), "bld23")
+        self.assertEqual(self.site_tree.get_type("GLOBAL/USA/SAN JOSE/BLD23/FLOOR1"), "floor")
+        self.assertIsNone(self.site_tree.get("Global/USA/Austin"))
+        self.assertIsNone(self.site_tree.get(None))
+
+    def test_site_tree_exact_match_wins(self):
+        self.site_tree.add(get_site("bld23-upper", "sjc", "Global/USA/San Jose/bld23", "building"))
+
+        self.assertEqual(self.site_tree.get_id("Global/USA/San Jose/BLD23"), "bld23")
+        self.assertEqual(self.site_tree.get_id("Global/USA/San Jose/bld23"), "bld23-upper")
+
+    def test_site_tree_ancestors_and_descendants(self):
+        self.assertEqual([site.get("id") for site in self.site_tree.get_ancestors("floor1")],
+                         ["bld23", "sjc", "usa", "global"])
+
+        descendants = [site.get("id") for site in self.site_tree.get_descendants("usa")]
+        self.assertEqual(sorted(descendants), ["bld23", "floor1", "floor2", "rtp", "sjc"])
+
+        # Deepest first: every site is visited before its parent, as needed to delete a subtree
+        deepest_first = list(reversed(descendants))
+        for site_id in deepest_first:
+            parent_id = self.site_tree.get_by_id(site_id).get("parentId")
+            if parent_id in deepest_first:
+                self.assertLess(deepest_first.index(site_id), deepest_first.index(parent_id))
+
+    def test_site_tree_remove(self):
+        removed = self.site_tree.remove("bld23")
+
+        self.assertEqual(sorted(site.get("id") for site in removed), ["bld23", "floor1", "floor2"])
+        self.assertIsNone(self.site_tree.get("Global/USA/San Jose/BLD23/FLOOR1"))
+        self.assertEqual(self.site_tree.get_children("sjc"), [])
+        self.assertEqual(len(self.site_tree), 4)
+
+
+class TestDnacBaseSiteTree(TestDnacBase):
+
+    dnac_class = DnacBase
+
+    def setUp(self):
+        super().setUp()
+        self.responses["get_site"] = self.get_site_page
+
+    def get_site_page(self, params):
+        offset = int(params.get("offset")) - 1
+        return {"response": SITES[offset:offset + int(params.get("limit"))]}
+
+    def test_site_tree_loaded_once(self):
+        self.assertEqual(self.dnac.get_site_id("Global/USA/RTP"), "rtp")
+        self.assertEqual(self.dnac.get_site_type("global/usa/san jose/bld23"), "building")
+        self.assertIsNone(self.dnac.get_site_id("Global/USA/Austin"))
+
+        self.assertEqual(self.run_dnac_exec.call_count, 1)
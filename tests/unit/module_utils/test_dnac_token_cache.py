@@ -0,0 +1,164 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import base64
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from ansible_collections.cisco.dnac.plugins.module_utils.dnac_session import (
+    DNAC_TOKEN_EXPIRY_MARGIN,
+    DNAC_TOKEN_LIFETIME,
+    TokenCache,
+    enable_token_cache,
+    get_token_expiry,
+)
+
+
+def make_token(expires):
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": expires}).encode("ascii")).decode("ascii").rstrip("=")
+    return "header.{0}.signature".format(payload)
+
+
+class TestDnacTokenCache(TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.cache_dir, "tokens.json")
+        self.cache = TokenCache("dnac", 443, "admin", "secret", "2.3.7.6", path=self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_token_expiry(self):
+        self.assertEqual(get_token_expiry(make_token(2000000000)), 2000000000.0)
+
+        before = time.time()
+        self.assertGreaterEqual(get_token_expiry("not-a-jwt"), before + DNAC_TOKEN_LIFETIME)
+
+    def test_token_cache_hit_and_expiry(self):
+        self.assertIsNone(self.cache.get())
+
+        valid_token = make_token(time.time() + 600)
+        self.cache.set(valid_token)
+        self.assertEqual(self.cache.get(), valid_token)
+
+        # A token about to expire is not handed out
+        self.cache.set(make_token(time.time() + DNAC_TOKEN_EXPIRY_MARGIN - 1))
+        self.assertIsNone(self.cache.get())
+
+    def test_token_cache_keyed_by_credentials(self):
+        token = make_token(time.time() + 600)
+        self.cache.set(token)
+
+        other_password = TokenCache("dnac", 443, "admin", "other", "2.3.7.6", path=self.path)
+        self.assertIsNone(other_password.get())
+        with open(self.path) as cache_file:
+            self.assertNotIn("secret", cache_file.read())
+
+    def test_token_cache_drops_expired_entries(self):
+        other = TokenCache("other-dnac", 443, "admin", "secret", "2.3.7.6", path=self.path)
+        other.set(make_token(time.time() - 10))
+
+        self.cache.set(make_token(time.time() + 600))
+
+        self.assertEqual(list(self.cache.load()), [self.cache.key])
+
+    def test_token_cache_corrupt_and_unwritable_file(self):
+        with open(self.path, "w") as cache_file:
+            cache_file.write("{not json")
+        self.assertIsNone(self.cache.get())
+
+        token = make_token(time.time() + 600)
+        self.cache.set(token)
+        self.assertEqual(self.cache.get(), token)
+
+        # The cache directory cannot be created below a regular file, the token is simply not cached
+        unwritable = TokenCache("dnac", 443, "admin", "secret", "2.3.7.6", path=os.path.join(self.path, "tokens.json"))
+        unwritable.set(token)
+        self.assertIsNone(unwritable.get())
+
+    def test_token_cache_concurrent_writers(self):
+        caches = [TokenCache("dnac-{0}".format(index), 443, "admin", "secret", "2.3.7.6", path=self.path)
+                  for index in range(8)]
+        tokens = [make_token(time.time() + 600 + index) for index in range(8)]
+
+        def write(cache, token):
+            for dummy in range(20):
+                cache.set(token)
+                cache.get()
+
+        threads = [threading.Thread(target=write, args=item) for item in zip(caches, tokens)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Writers replace the file atomically, it always holds a complete set of entries
+        entries = self.cache.load()
+        self.assertTrue(entries)
+        for (cache, token) in zip(caches, tokens):
+            self.assertIn(cache.get(), (token, None))
+        self.assertEqual([name for name in os.listdir(self.cache_dir) if name != "tokens.json"], [])
+
+
+class TestDnacEnableTokenCache(TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = TokenCache("dnac", 443, "admin", "secret", "2.3.7.6", path=os.path.join(self.cache_dir, "tokens.json"))
+        self.new_token = make_token(time.time() + 3600)
+        self.dnac_api = MagicMock()
+        self.authentication_api = self.dnac_api.authentication.authentication_api
+        self.authentication_api.return_value = MagicMock(Token=self.new_token)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_enable_token_cache_reuses_cached_token_once(self):
+        cached_token = make_token(time.time() + 600)
+        self.cache.set(cached_token)
+        enable_token_cache(self.dnac_api, self.cache)
+
+        self.assertEqual(self.dnac_api.authentication.authentication_api().Token, cached_token)
+        self.authentication_api.assert_not_called()
+
+        # Authenticating again means the cached token was rejected, a new token is requested and cached
+        self.assertEqual(self.dnac_api.authentication.authentication_api().Token, self.new_token)
+        self.authentication_api.assert_called_once_with()
+        self.assertEqual(self.cache.get(), self.new_token)
+
+    def test_enable_token_cache_without_cached_token(self):
+        enable_token_cache(self.dnac_api, self.cache)
+
+        self.assertEqual(self.dnac_api.authentication.authentication_api().Token, self.new_token)
+        self.assertEqual(self.cache.get(), self.new_token)
+
+    def test_enable_token_cache_authentication_error(self):
+        self.authentication_api.side_effect = Exception("401 Unauthorized")
+        enable_token_cache(self.dnac_api, self.cache)
+
+        with self.assertRaises(Exception):
+            self.dnac_api.authentication.authentication_api()
+        self.assertIsNone(self.cache.get())
@@ -0,0 +1,122 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.cisco.dnac.plugins.module_utils.dnac_session import (
+    DNAC_UPLOAD_PROGRESS_INTERVAL,
+    UploadFile,
+)
+from ansible_collections.cisco.dnac.plugins.modules.swim_intent import DnacSwims
+from ansible_collections.cisco.dnac.tests.unit.modules.dnac.dnac_module import TestDnacBase
+
+
+class TestDnacUploadFile(TestCase):
+
+    def setUp(self):
+        self.file_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.file_dir, "image.bin")
+        self.content = os.urandom(2500)
+        with open(self.file_path, "wb") as image_file:
+            image_file.write(self.content)
+
+    def tearDown(self):
+        shutil.rmtree(self.file_dir)
+
+    def test_upload_file_reads_bounded_chunks(self):
+        callback = MagicMock()
+        upload = UploadFile(self.file_path, chunk_size=1000, callback=callback)
+        self.addCleanup(upload.close)
+
+        self.assertEqual(upload.len, 2500)
+        chunks = [upload.read(), upload.read(None), upload.read(5000), upload.read(200), upload.read()]
+
+        self.assertEqual([len(chunk) for chunk in chunks], [1000, 1000, 500, 0, 0])
+        self.assertEqual(b"".join(chunks), self.content)
+        self.assertEqual(upload.len, 0)
+        self.assertEqual(callback.call_count, 5)
+        callback.assert_called_with(upload)
+
+    def test_upload_file_summary(self):
+        upload = UploadFile(self.file_path, chunk_size=1000)
+        self.addCleanup(upload.close)
+
+        upload.read()
+        summary = upload.summary()
+        self.assertEqual(summary["file_name"], "image.bin")
+        self.assertEqual((summary["size"], summary["bytes_sent"]), (2500, 1000))
+        # The checksum of a partial upload would not be the checksum of the file
+        self.assertNotIn("sha256", summary)
+
+        while upload.read():
+            pass
+        summary = upload.summary()
+        self.assertEqual(summary["bytes_sent"], 2500)
+        self.assertEqual(summary["sha256"], hashlib.sha256(self.content).hexdigest())
+        self.assertGreaterEqual(summary["throughput"], 0)
+
+    def test_upload_file_close(self):
+        upload = UploadFile(self.file_path)
+        upload.close()
+
+        self.assertRaises(ValueError, upload.read)
+
+    def test_upload_file_missing_file(self):
+        self.assertRaises(OSError, UploadFile, os.path.join(self.file_dir, "missing.bin"))
+
+
+class TestDnacSwimsUploadProgress(TestDnacBase):
+
+    dnac_class = DnacSwims
+
+    def setUp(self):
+        super().setUp()
+        self.file_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.file_dir, "image.bin")
+        with open(self.file_path, "wb") as image_file:
+            image_file.write(b"x" * 3000)
+        self.dnac.log = MagicMock()
+
+    def tearDown(self):
+        shutil.rmtree(self.file_dir)
+        super().tearDown()
+
+    def test_upload_progress_is_throttled(self):
+        now = {"time": 1000.0}
+        with patch("ansible_collections.cisco.dnac.plugins.module_utils.dnac_session.time") as session_time, \
+                patch("ansible_collections.cisco.dnac.plugins.modules.swim_intent.time") as swim_time:
+            session_time.time.side_effect = lambda: now["time"]
+            swim_time.time.side_effect = lambda: now["time"]
+            upload = UploadFile(self.file_path, chunk_size=1000, callback=self.dnac.log_upload_progress)
+            self.addCleanup(upload.close)
+
+            upload.read()
+            now["time"] += DNAC_UPLOAD_PROGRESS_INTERVAL
+            upload.read()
+            now["time"] += 1
+            upload.read()
+
+        # Nothing is logged before the interval elapsed, the last chunk is always logged
+        logged = [call.kwargs.get("args") for call in self.dnac.log.call_args_list]
+        self.assertEqual([args[0] for args in logged], [2000, 3000])
@@ -17,8 +17,11 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import copy
 import os
 import json
+import threading
+from unittest import TestCase
 
 from ansible_collections.ansible.netcommon.tests.unit.modules.utils import (
     AnsibleExitJson,
@@ -28,7 +31,7 @@ from ansible_collections.ansible.netcommon.tests.unit.modules.utils import (
 from ansible_collections.ansible.netcommon.tests.unit.modules.utils import (
     set_module_args as _set_module_args,
 )
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 
 def set_module_args(args):
@@ -131,6 +134,35 @@ class TestDnacModule(ModuleTestCase):
         self.mock_dnac_exec.stop()
         self.mock_dnac_init.stop()
 
+    def set_responses(self, responses):
+
+        """
+        Answer the SDK calls per SDK function rather than in one global order.
+
+        Parameters:
+            - responses (dict): The responses of each SDK function name, in the order that function is called.
+              A response that is an exception is raised instead of returned.
+
+        Description:
+            The intent modules read from Cisco Catalyst Center concurrently, so the relative order of calls to
+            different SDK functions is not fixed. Calls to the same function are answered in order.
+        """
+
+        queues = dict((function, list(items)) for (function, items) in responses.items())
+        lock = threading.Lock()
+
+        def dnac_exec(family=None, function=None, params=None, **kwargs):
+            with lock:
+                if not queues.get(function):
+                    raise AssertionError("Unexpected SDK call {0} {1}".format(function, params))
+                response = queues[function].pop(0)
+
+            if isinstance(response, Exception):
+                raise response
+            return copy.deepcopy(response)
+
+        self.run_dnac_exec.side_effect = dnac_exec
+
     def loadPlaybookData(self, module):
 
         """
@@ -269,3 +301,65 @@ class TestDnacModule(ModuleTestCase):
         result = exc.exception.args[0]
         self.assertEqual(result["changed"], changed, result)
         return result
+
+
+class TestDnacBase(TestCase):
+
+    """
+    Build one instance of 'dnac_class', a DnacBase subclass, to test its methods directly.
+
+    The Cisco DNA Center SDK is not initialized and every SDK call is answered from 'responses',
+    keyed by SDK function name. A response is either returned as it is, or called with the
+    parameters of the SDK call when it is a function. Every SDK call is recorded in 'calls'.
+    """
+
+    dnac_class = None
+    # Module parameters added to, or overriding, the defaults below
+    module_params = {}
+
+    def setUp(self):
+
+        """
+        Mock the initialization and the execution of the Cisco DNA Center SDK and build 'self.dnac'.
+        """
+
+        self.mock_dnac_init = patch(
+            "ansible_collections.cisco.dnac.plugins.module_utils.dnac.DNACSDK.__init__", return_value=None)
+        self.mock_dnac_init.start()
+        self.mock_dnac_exec = patch(
+            "ansible_collections.cisco.dnac.plugins.module_utils.dnac.DNACSDK._exec", side_effect=self.dnac_exec)
+        self.run_dnac_exec = self.mock_dnac_exec.start()
+
+        self.responses = {}
+        self.calls = []
+        module = MagicMock()
+        module.params = dict({"dnac_host": "dnac", "dnac_log": False, "state": "merged", "config": []},
+                             **self.module_params)
+        self.dnac = self.dnac_class(module)
+
+    def tearDown(self):
+
+        """
+        Stop the mocks of the Cisco DNA Center SDK.
+        """
+
+        self.mock_dnac_exec.stop()
+        self.mock_dnac_init.stop()
+
+    def dnac_exec(self, family, function, params=None, op_modifies=False, **kwargs):
+        self.calls.append((function, params))
+        if function not in self.responses:
+            raise AssertionError("Unexpected SDK call {0} {1}".format(function, params))
+
+        response = self.responses[function]
+        if callable(response):
+            return response(params)
+        return copy.deepcopy(response)
+
+    def get_calls(self, function):
+
+        """
+        Return the parameters of every call made to the SDK function 'function', in order.
+        """
+
+        return [params for (name, params) in self.calls if name == function]
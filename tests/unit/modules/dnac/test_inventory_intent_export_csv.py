@@ -0,0 +1,82 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from io import BytesIO
+from unittest import skipUnless
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.cisco.dnac.plugins.modules import inventory_intent
+from .dnac_module import TestDnacBase
+
+CSV_CONTENT = "ip_address,hostname\n10.0.0.1,edge-1\n10.0.0.2,edge-2\n10.0.0.3,edge-3\n"
+
+
+class TestDnacInventoryIntentExportCsv(TestDnacBase):
+
+    dnac_class = inventory_intent.DnacDevice
+
+    def setUp(self):
+        super().setUp()
+        self.dnac.config = [{"snmp_priv_protocol": "AES128"}]
+
+    def get_archive(self, members, password=b"Secret#123"):
+        archive = BytesIO()
+        with inventory_intent.pyzipper.AESZipFile(archive, "w", compression=inventory_intent.pyzipper.ZIP_LZMA,
+                                                  encryption=inventory_intent.pyzipper.WZ_AES) as zip_ref:
+            zip_ref.setpassword(password)
+            for (name, content) in members:
+                zip_ref.writestr(name, content)
+        return archive.getvalue()
+
+    def test_decrypt_and_read_csv_without_pyzipper(self):
+        with patch.object(inventory_intent, "HAS_PYZIPPER", False):
+            self.dnac.decrypt_and_read_csv(MagicMock(data=b""), "Secret#123")
+
+        self.assertEqual(self.dnac.status, "failed")
+        self.assertIn("pyzipper is required", self.dnac.msg)
+
+    def test_decrypt_and_read_csv_invalid_protocol(self):
+        self.dnac.config = [{"snmp_priv_protocol": "DES"}]
+
+        with patch.object(inventory_intent, "HAS_PYZIPPER", True):
+            self.dnac.decrypt_and_read_csv(MagicMock(data=b""), "Secret#123")
+
+        self.assertEqual(self.dnac.status, "failed")
+        self.assertEqual(self.dnac.msg, "Invalid SNMP protocol 'DES' specified for encryption.")
+
+    @skipUnless(inventory_intent.HAS_PYZIPPER, "pyzipper is not installed")
+    def test_decrypted_csv_rows_are_streamed(self):
+        response = MagicMock(data=self.get_archive([("devices.csv", CSV_CONTENT)]))
+
+        rows = self.dnac.decrypt_and_read_csv(response, "Secret#123")
+
+        # The rows are yielded one at a time as the member is decrypted
+        self.assertEqual(next(rows), {"ip_address": "10.0.0.1", "hostname": "edge-1"})
+        self.assertEqual([row["hostname"] for row in rows], ["edge-2", "edge-3"])
+
+    @skipUnless(inventory_intent.HAS_PYZIPPER, "pyzipper is not installed")
+    def test_decrypted_csv_rows_errors(self):
+        archive = self.get_archive([("devices.csv", CSV_CONTENT)])
+
+        with self.assertRaises(RuntimeError):
+            list(self.dnac.iter_decrypted_csv_rows(archive, "Wrong#123", inventory_intent.pyzipper.WZ_AES))
+        with self.assertRaises(inventory_intent.pyzipper.BadZipFile):
+            list(self.dnac.iter_decrypted_csv_rows(archive[:20], "Secret#123", inventory_intent.pyzipper.WZ_AES))
+        with self.assertRaises(IndexError):
+            list(self.dnac.iter_decrypted_csv_rows(self.get_archive([]), "Secret#123", inventory_intent.pyzipper.WZ_AES))
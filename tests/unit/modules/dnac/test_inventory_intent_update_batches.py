@@ -0,0 +1,124 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from unittest.mock import patch
+
+from ansible_collections.cisco.dnac.plugins.modules import inventory_intent
+from .dnac_module import TestDnacBase
+
+
+class TestDnacInventoryIntentUpdateBatches(TestDnacBase):
+
+    dnac_class = inventory_intent.DnacDevice
+
+    def setUp(self):
+        """
+        Answer 'sync_devices' with one task per request, which finishes after 'task_polls' polls and
+        fails for the devices in 'failing_ips', on a simulated clock.
+        """
+
+        super().setUp()
+        self.now = 1000.0
+        self.mock_time = patch("ansible_collections.cisco.dnac.plugins.module_utils.dnac.time")
+        mock_time = self.mock_time.start()
+        mock_time.time.side_effect = lambda: self.now
+        mock_time.sleep.side_effect = self.sleep
+        self.dnac.config = [{"update_batch_size": 2, "update_max_concurrency": 2}]
+        self.responses["sync_devices"] = self.sync_devices
+        self.responses["get_task_by_id"] = self.get_task_by_id
+
+        self.task_polls = 2
+        self.failing_ips = []
+        self.tasks = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def tearDown(self):
+        self.mock_time.stop()
+        super().tearDown()
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+    def sync_devices(self, params):
+        task_id = "task-{0}".format(len(self.tasks))
+        self.tasks[task_id] = {"ips": params["ipAddress"], "polls": 0}
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return {"response": {"taskId": task_id}}
+
+    def get_task_by_id(self, params):
+        task = self.tasks[params["task_id"]]
+        task["polls"] += 1
+        if task["polls"] < self.task_polls:
+            return {"response": {"isError": False, "progress": "running"}}
+
+        self.in_flight -= 1
+        if set(task["ips"]) & set(self.failing_ips):
+            return {"response": {"isError": True, "failureReason": "credentials rejected", "endTime": 1}}
+        return {"response": {"isError": False, "progress": "done", "endTime": 1}}
+
+    def get_params(self, device_ips, password="secret"):
+        return {"ipAddress": device_ips, "cliTransport": "ssh", "userName": "admin", "password": password}
+
+    def test_update_devices_grouped_by_parameters(self):
+        self.dnac.update_devices_in_batches([
+            self.get_params(["10.0.0.1", "10.0.0.2"]),
+            self.get_params(["10.0.0.3"], password="other"),
+            self.get_params(["10.0.0.4", "10.0.0.5", "10.0.0.6"]),
+        ])
+
+        requests = self.get_calls("sync_devices")
+        self.assertEqual(sorted(params["ipAddress"] for params in requests),
+                         [["10.0.0.1", "10.0.0.2"], ["10.0.0.3"], ["10.0.0.4", "10.0.0.5"], ["10.0.0.6"]])
+        self.assertEqual([params["password"] for params in requests if params["ipAddress"] == ["10.0.0.3"]], ["other"])
+        self.assertLessEqual(self.max_in_flight, 2)
+        self.assertEqual(self.dnac.status, "success")
+        self.assertTrue(self.dnac.result["changed"])
+
+    def test_update_devices_bounded_concurrency(self):
+        self.dnac.config = [{"update_batch_size": 1, "update_max_concurrency": 1}]
+        self.task_polls = 3
+
+        self.dnac.update_devices_in_batches([self.get_params(["10.0.0.1", "10.0.0.2", "10.0.0.3"])])
+
+        self.assertEqual(len(self.get_calls("sync_devices")), 3)
+        self.assertEqual(self.max_in_flight, 1)
+        self.assertEqual(self.dnac.status, "success")
+
+    def test_update_devices_failed_batch(self):
+        self.failing_ips = ["10.0.0.3"]
+
+        self.dnac.update_devices_in_batches([self.get_params(["10.0.0.1", "10.0.0.2", "10.0.0.3", "10.0.0.4"])])
+
+        # Every device of the failed request is reported, the devices of the other request are updated
+        self.assertEqual(self.dnac.status, "failed")
+        self.assertIn("10.0.0.3 (credentials rejected)", self.dnac.msg)
+        self.assertIn("10.0.0.4 (credentials rejected)", self.dnac.msg)
+        self.assertNotIn("10.0.0.1", self.dnac.msg)
+        self.assertTrue(self.dnac.result["changed"])
+
+    def test_update_devices_task_not_created(self):
+        self.responses["sync_devices"] = None
+
+        self.dnac.update_devices_in_batches([self.get_params(["10.0.0.1"])])
+
+        self.assertEqual(self.dnac.status, "failed")
+        self.assertIn("10.0.0.1 (the update task was not created or did not complete in time)", self.dnac.msg)
+        self.assertFalse(self.dnac.result.get("changed"))
@@ -42,65 +42,81 @@ class TestDnacPnPIntent(TestDnacModule):
         device (str, optional): The device for which to load fixtures. Defaults to an empty string.
         """
 
+        # The device is read first, then the image, template, device details and site hierarchy
+        # reads run concurrently, so the responses are given per SDK function
         if "site_not_found" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("image_exists_response"),
-                self.test_data.get("template_exists_response"),
-                Exception(),
-            ]
+            self.set_responses({
+                "get_device_list": [self.test_data.get("device_exists_response")],
+                "get_software_image_details": [self.test_data.get("image_exists_response")],
+                "gets_the_templates_available": [self.test_data.get("template_exists_response")],
+                "get_device_by_id": [self.test_data.get("device_details_response")],
+                "get_site": [Exception()],
+            })
 
         elif "add_new_device" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("image_exists_response"),
-                self.test_data.get("template_exists_response"),
-                self.test_data.get("site_exists_response"),
-                [],
-                self.test_data.get("add_device_response"),
-                self.test_data.get("claim_response")
-            ]
+            self.set_responses({
+                "get_device_list": [[]],
+                "get_site": [self.test_data.get("site_exists_response")],
+                "add_device": [self.test_data.get("add_device_response")],
+                "claim_a_device_to_a_site": [self.test_data.get("claim_response")],
+            })
 
         elif "device_exists" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("image_exists_response"),
-                self.test_data.get("template_exists_response"),
-                self.test_data.get("site_exists_response"),
-                self.test_data.get("device_exists_response"),
-                self.test_data.get("claim_response")
-            ]
+            self.set_responses({
+                "get_device_list": [self.test_data.get("device_exists_response")],
+                "get_software_image_details": [self.test_data.get("image_exists_response")],
+                "gets_the_templates_available": [self.test_data.get("template_exists_response")],
+                "get_device_by_id": [self.test_data.get("device_details_response")] * 2,
+                "get_site": [self.test_data.get("site_exists_response")],
+                "get_device_count": [self.test_data.get("device_count_response")] * 2,
+                "update_device": [self.test_data.get("device_details_response")],
+            })
 
         elif "delete_device" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("device_exists_response"),
-                self.test_data.get("delete_device_response")
-            ]
+            self.set_responses({
+                "get_device_list": [self.test_data.get("device_exists_response")] * 2,
+                "delete_device_by_id_from_pnp": [self.test_data.get("delete_device_response")],
+            })
 
         elif "deletion_error" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("device_exists_response"),
-                AnsibleActionFail("An error occured when executing operation." +
-                                  "The error was: [400] Bad Request - NCOB01313: Delete device(FJC2416U047) from Inventory"),
-            ]
+            self.set_responses({
+                "get_device_list": [self.test_data.get("device_exists_response")] * 2,
+                "delete_device_by_id_from_pnp": [
+                    AnsibleActionFail("An error occured when executing operation." +
+                                      "The error was: [400] Bad Request - NCOB01313: Delete device(FJC2416U047) from Inventory"),
+                ],
+            })
 
         elif "image_doesnot_exist" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("image_doesnot_exist_response")
-            ]
+            self.set_responses({
+                "get_device_list": [self.test_data.get("device_exists_response")],
+                "get_software_image_details": [self.test_data.get("image_doesnot_exist_response")],
+                "gets_the_templates_available": [self.test_data.get("template_exists_response")],
+                "get_device_by_id": [self.test_data.get("device_details_response")],
+                "get_site": [self.test_data.get("site_exists_response")],
+            })
 
         elif "template_doesnot_exist" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("image_exists_response"),
-                self.test_data.get("template_doesnot_exist_response")
-            ]
+            self.set_responses({
+                "get_device_list": [self.test_data.get("device_exists_response")],
+                "get_software_image_details": [self.test_data.get("image_exists_response")],
+                "gets_the_templates_available": [self.test_data.get("template_doesnot_exist_response")],
+                "get_device_by_id": [self.test_data.get("device_details_response")],
+                "get_site": [self.test_data.get("site_exists_response")],
+            })
 
         elif "project_not_found" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("image_exists_response"),
-                []
-            ]
+            self.set_responses({
+                "get_device_list": [self.test_data.get("device_exists_response")],
+                "get_software_image_details": [self.test_data.get("image_exists_response")],
+                "gets_the_templates_available": [[]],
+                "get_device_by_id": [self.test_data.get("device_details_response")],
+                "get_site": [self.test_data.get("site_exists_response")],
+            })
         elif "delete_nonexisting_device" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                []
-            ]
+            self.set_responses({
+                "get_device_list": [[]] * 2,
+            })
 
     def test_pnp_intent_site_not_found(self):
 
@@ -40,9 +40,11 @@ class TestDnacSiteIntent(TestDnacModule):
         device (str, optional): The device for which to load fixtures. Defaults to an empty string.
         """
 
+        # The site hierarchy is read page by page with 'get_site' before any site is looked up,
+        # a created or updated site is read again by name
         if "create_site" in self._testMethodName:
             self.run_dnac_exec.side_effect = [
-                Exception(),
+                self.test_data.get("get_sites_empty_response"),
                 self.test_data.get("create_site_response"),
                 self.test_data.get("get_business_api_execution_details_response"),
                 self.test_data.get("get_site_response")
@@ -57,7 +59,8 @@ class TestDnacSiteIntent(TestDnacModule):
             self.run_dnac_exec.side_effect = [
                 self.test_data.get("update_needed_get_site_response"),
                 self.test_data.get("update_needed_update_site_response"),
-                self.test_data.get("get_business_api_execution_details_response")
+                self.test_data.get("get_business_api_execution_details_response"),
+                self.test_data.get("update_needed_get_site_response")
             ]
         elif "delete_existing_site" in self._testMethodName:
             self.run_dnac_exec.side_effect = [
@@ -67,7 +70,7 @@ class TestDnacSiteIntent(TestDnacModule):
             ]
         elif "delete_non_existing_site" in self._testMethodName:
             self.run_dnac_exec.side_effect = [
-                Exception()
+                self.test_data.get("get_sites_empty_response")
             ]
         elif "error_delete" in self._testMethodName:
             self.run_dnac_exec.side_effect = [
@@ -77,7 +80,7 @@ class TestDnacSiteIntent(TestDnacModule):
             ]
         elif "error_create" in self._testMethodName:
             self.run_dnac_exec.side_effect = [
-                Exception(),
+                self.test_data.get("get_sites_empty_response"),
                 self.test_data.get("create_site_response"),
                 self.test_data.get("delete_execution_details_error")
             ]
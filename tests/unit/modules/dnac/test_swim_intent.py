@@ -40,73 +40,81 @@ class TestDnacSwimIntent(TestDnacModule):
         device (str, optional): The device for which to load fixtures. Defaults to an empty string.
         """
 
+        # The image, site hierarchy, device family and device reads of get_have run concurrently,
+        # so the responses are given per SDK function
         if "full_flow" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("task_info_response"),
-                self.test_data.get("image_imported_successfully_response"),
-                self.test_data.get("image_id_fetched_successfully_response"),
-                self.test_data.get("device_family_fetched_successfully"),
-                self.test_data.get("device_id_fetched_successfully_response"),
-                self.test_data.get("device_id_fetched_successfully_response"),
-                self.test_data.get("task_info_response"),
-                self.test_data.get("tagging_image_successful_response"),
-                self.test_data.get("task_info_response"),
-                self.test_data.get("image_distribution_successful_response"),
-                self.test_data.get("task_info_response"),
-                self.test_data.get("image_activation_successful_response")
-            ]
+            self.set_responses({
+                "import_software_image_via_url": [self.test_data.get("task_info_response")],
+                "get_software_image_details": [self.test_data.get("image_id_fetched_successfully_response")] * 4,
+                "get_device_family_identifiers": [self.test_data.get("device_family_fetched_successfully")],
+                "get_device_list": [self.test_data.get("device_id_fetched_successfully_response")] * 2,
+                "tag_as_golden_image": [self.test_data.get("task_info_response")],
+                "trigger_software_image_distribution": [self.test_data.get("task_info_response")],
+                "trigger_software_image_activation": [self.test_data.get("task_info_response")],
+                "get_task_by_id": [
+                    self.test_data.get("image_imported_successfully_response"),
+                    self.test_data.get("tagging_image_successful_response"),
+                    self.test_data.get("image_distribution_successful_response"),
+                    self.test_data.get("image_activation_successful_response"),
+                ],
+            })
         elif "swim_image_import" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("task_info_response"),
-                self.test_data.get("image_already_exists_response"),
-            ]
+            self.set_responses({
+                "get_software_image_details": [self.test_data.get("image_doesnot_exist_response")],
+                "import_software_image_via_url": [self.test_data.get("task_info_response")],
+                "get_task_by_id": [self.test_data.get("image_already_exists_response")],
+            })
         elif "swim_image_local_import" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("task_info_response"),
-                self.test_data.get("image_already_exists_response"),
-            ]
+            self.set_responses({
+                "get_software_image_details": [self.test_data.get("image_doesnot_exist_response")] * 2,
+                "import_local_software_image": [self.test_data.get("task_info_response")],
+                "get_task_by_id": [self.test_data.get("image_already_exists_response")],
+            })
         elif "untag_image" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("image_id_fetched_successfully_response"),
-                self.test_data.get("fetch_site_id_response"),
-                self.test_data.get("device_family_fetched_successfully"),
-                self.test_data.get("task_info_response"),
-                self.test_data.get("untagging_image_successful_response"),
-            ]
+            self.set_responses({
+                "get_software_image_details": [self.test_data.get("image_id_fetched_successfully_response")] * 2,
+                "get_site": [self.test_data.get("fetch_site_id_response")],
+                "get_device_family_identifiers": [self.test_data.get("device_family_fetched_successfully")],
+                "remove_golden_tag_for_image": [self.test_data.get("task_info_response")],
+                "get_task_by_id": [self.test_data.get("untagging_image_successful_response")],
+            })
         elif "incorrect_site_untag_golden_image" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("image_id_fetched_successfully_response"),
-                Exception()
-            ]
+            self.set_responses({
+                "get_software_image_details": [self.test_data.get("image_id_fetched_successfully_response")],
+                "get_site": [Exception()],
+                "get_device_family_identifiers": [self.test_data.get("device_family_fetched_successfully")],
+            })
         elif "image_doesnot_exist_response" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("image_doesnot_exist_response"),
-            ]
-        elif "tag_golden_incorrect_family_name" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("image_id_fetched_successfully_response"),
-                self.test_data.get("fetch_site_id_response"),
-                self.test_data.get("device_family_fetched_successfully"),
-            ]
+            self.set_responses({
+                "get_software_image_details": [self.test_data.get("image_doesnot_exist_response")],
+                "get_site": [self.test_data.get("fetch_site_id_response")],
+                "get_device_family_identifiers": [self.test_data.get("device_family_fetched_successfully")],
+            })
+        elif "tag_golden" in self._testMethodName:
+            self.set_responses({
+                "get_software_image_details": [self.test_data.get("image_id_fetched_successfully_response")],
+                "get_site": [self.test_data.get("fetch_site_id_response")],
+                "get_device_family_identifiers": [self.test_data.get("device_family_fetched_successfully")],
+            })
         elif "only_image_distribution" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("image_id_fetched_successfully_response"),
-                self.test_data.get("device_id_fetched_successfully_response"),
-                self.test_data.get("task_info_response"),
-                self.test_data.get("image_distribution_successful_response"),
-            ]
+            self.set_responses({
+                "get_software_image_details": [self.test_data.get("image_id_fetched_successfully_response")] * 2,
+                "get_device_list": [self.test_data.get("device_id_fetched_successfully_response")],
+                "trigger_software_image_distribution": [self.test_data.get("task_info_response")],
+                "get_task_by_id": [self.test_data.get("image_distribution_successful_response")],
+            })
         elif "only_image_activation" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("image_id_fetched_successfully_response"),
-                self.test_data.get("device_id_fetched_successfully_response"),
-                self.test_data.get("task_info_response"),
-                self.test_data.get("image_activation_successful_response"),
-            ]
+            self.set_responses({
+                "get_software_image_details": [self.test_data.get("image_id_fetched_successfully_response")] * 2,
+                "get_device_list": [self.test_data.get("device_id_fetched_successfully_response")],
+                "trigger_software_image_activation": [self.test_data.get("task_info_response")],
+                "get_task_by_id": [self.test_data.get("image_activation_successful_response")],
+            })
         elif "device_doesnot_exist" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("image_id_fetched_successfully_response"),
-                self.test_data.get("device_doesnot_exist_response"),
-            ]
+            self.set_responses({
+                "get_software_image_details": [self.test_data.get("image_id_fetched_successfully_response")],
+                "get_device_list": [self.test_data.get("device_doesnot_exist_response")],
+            })
 
     def test_swim_full_flow(self):
 
@@ -40,43 +40,52 @@ class TestDnacTemplateIntent(TestDnacModule):
         device (str, optional): The device for which to load fixtures. Defaults to an empty string.
         """
 
+        # The project details and the committed templates are read concurrently,
+        # so the responses are given per SDK function
         if "create_template" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("create_template_list_response"),
-                self.test_data.get("create_template_get_project_response"),
-                self.test_data.get("create_template_response"),
-                self.test_data.get("create_template_task_details_for_create"),
-                self.test_data.get("create_template_version_template_response"),
-                self.test_data.get("create_template_task_details_for_versioning")
-            ]
+            self.set_responses({
+                "gets_the_templates_available": [self.test_data.get("create_template_list_response")],
+                "get_projects": [self.test_data.get("create_template_get_project_response")],
+                "create_template": [self.test_data.get("create_template_response")],
+                "version_template": [self.test_data.get("create_template_version_template_response")],
+                "get_task_by_id": [
+                    self.test_data.get("create_template_task_details_for_create"),
+                    self.test_data.get("create_template_task_details_for_versioning"),
+                ],
+            })
         elif "update_not_needed" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("update_template_list"),
-                self.test_data.get("update_template_existing_template"),
-            ]
+            self.set_responses({
+                "gets_the_templates_available": [self.test_data.get("update_template_list")],
+                "get_projects": [self.test_data.get("update_template_get_project_response")],
+                "get_template_details": [self.test_data.get("update_template_existing_template")],
+            })
         elif "update_needed" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("update_template_list"),
-                self.test_data.get("update_template_existing_template_needs_update"),
-                self.test_data.get("update_template_response"),
-                self.test_data.get("update_template_version_template_response"),
-                self.test_data.get("update_template_task_details_for_versioning")
-            ]
+            self.set_responses({
+                "gets_the_templates_available": [self.test_data.get("update_template_list")],
+                "get_projects": [self.test_data.get("update_template_get_project_response")],
+                "get_template_details": [self.test_data.get("update_template_existing_template_needs_update")],
+                "update_template": [self.test_data.get("update_template_response")],
+                "version_template": [self.test_data.get("update_template_version_template_response")],
+                "get_task_by_id": [self.test_data.get("update_template_task_details_for_versioning")],
+            })
         elif "project_not_found" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                [],
-            ]
+            self.set_responses({
+                "gets_the_templates_available": [[]],
+                "get_projects": [[]],
+            })
         elif "delete_non_existing_template" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("create_template_list_response")
-            ]
+            self.set_responses({
+                "gets_the_templates_available": [self.test_data.get("create_template_list_response")],
+                "get_projects": [self.test_data.get("create_template_get_project_response")],
+            })
         elif "delete_template" in self._testMethodName:
-            self.run_dnac_exec.side_effect = [
-                self.test_data.get("update_template_list"),
-                self.test_data.get("update_template_existing_template_needs_update"),
-                self.test_data.get("delete_template_response"),
-                self.test_data.get("delete_template_task_details"),
-            ]
+            self.set_responses({
+                "gets_the_templates_available": [self.test_data.get("update_template_list")],
+                "get_projects": [self.test_data.get("update_template_get_project_response")],
+                "get_template_details": [self.test_data.get("update_template_existing_template_needs_update")],
+                "deletes_the_template": [self.test_data.get("delete_template_response")],
+                "get_task_by_id": [self.test_data.get("delete_template_task_details")],
+            })
 
     def test_template_intent_create_template(self):
 
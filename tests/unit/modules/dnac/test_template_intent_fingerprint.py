@@ -0,0 +1,63 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.cisco.dnac.plugins.modules import template_intent
+from .dnac_module import TestDnacBase
+
+
+class TestDnacTemplateIntentFingerprint(TestDnacBase):
+
+    dnac_class = template_intent.DnacTemplate
+
+    def get_config(self, template_content):
+        return {"configuration_templates": {"project_name": "Campus", "template_name": "banner", "language": "VELOCITY",
+                                            "template_content": template_content, "software_type": "IOS-XE",
+                                            "device_types": [{"product_family": "Switches and Hubs"}]}}
+
+    def get_fingerprint(self, template_content):
+        template_params = self.dnac.get_template_params(self.get_config(template_content).get("configuration_templates"))
+        return self.dnac.get_template_fingerprint(template_params)
+
+    def get_template_list(self, template_content):
+        comments = self.dnac.get_version_comments("synced", self.get_fingerprint(template_content))
+        return [{"name": "banner", "projectName": "Campus", "templateId": "banner-id",
+                 "versionsInfo": [{"versionTime": 100, "versionComment": "initial"},
+                                  {"versionTime": 200, "versionComment": comments}]}]
+
+    def test_template_intent_fingerprint_ignores_line_endings_and_trailing_whitespace(self):
+        fingerprint = self.get_fingerprint("hostname edge\nbanner motd #hi#")
+
+        self.assertEqual(self.get_fingerprint("hostname edge\r\nbanner motd #hi#\r\n"), fingerprint)
+        self.assertEqual(self.get_fingerprint("hostname edge  \nbanner motd #hi#\t\n\n"), fingerprint)
+        self.assertNotEqual(self.get_fingerprint("hostname  edge\nbanner motd #hi#"), fingerprint)
+        self.assertNotEqual(self.get_fingerprint("hostname core\nbanner motd #hi#"), fingerprint)
+
+    def test_template_intent_fingerprint_trusted_until_saved(self):
+        config = self.get_config("banner motd #hi#")
+        template_list = self.get_template_list("banner motd #hi#")
+
+        self.assertTrue(self.dnac.is_template_unchanged(
+            config, template_list, [{"name": "banner", "id": "banner-id", "lastUpdateTime": 200}]))
+        self.assertFalse(self.dnac.is_template_unchanged(
+            config, template_list, [{"name": "banner", "id": "banner-id", "lastUpdateTime": 300}]))
+        self.assertFalse(self.dnac.is_template_unchanged(
+            config, template_list, [{"name": "banner", "id": "banner-id"}]))
+        self.assertFalse(self.dnac.is_template_unchanged(
+            self.get_config("banner motd #bye#"), template_list,
+            [{"name": "banner", "id": "banner-id", "lastUpdateTime": 200}]))
@@ -0,0 +1,108 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.cisco.dnac.plugins.modules import template_intent
+from .dnac_module import TestDnacBase
+
+
+DEVICE_TYPES = [{"product_family": "Switches and Hubs"}]
+
+
+class TestDnacTemplateIntentSync(TestDnacBase):
+
+    dnac_class = template_intent.DnacTemplate
+    module_params = {"dnac_poll_interval": 1}
+
+    def setUp(self):
+        super().setUp()
+        self.imported = False
+        self.responses.update({
+            "get_projects": self.get_projects,
+            "gets_the_templates_available": self.get_templates,
+            "get_template_details": self.get_template_details,
+            "imports_the_templates_provided": self.import_templates,
+            "update_template": lambda params: {"response": {"taskId": "update-task-" + params.get("id")}},
+            "version_template": lambda params: {"response": {"taskId": "version-task-" + params.get("templateId")}},
+            "get_task_by_id": {"response": {"isError": False, "endTime": 1, "progress": "done"}},
+        })
+
+    def get_template_params(self, template_name, template_content):
+        configuration_templates = {"project_name": "Campus", "template_name": template_name, "language": "VELOCITY",
+                                   "template_content": template_content, "software_type": "IOS-XE",
+                                   "device_types": DEVICE_TYPES}
+        template_params = self.dnac.get_template_params(configuration_templates)
+        template_params.pop("project_id", None)
+        return template_params
+
+    def get_projects(self, params):
+        templates = [{"name": "uplinks", "id": "uplinks-id", "lastUpdateTime": 100},
+                     {"name": "banner", "id": "banner-id", "lastUpdateTime": 100}]
+        if self.imported:
+            templates.append({"name": "access-vlans", "id": "access-vlans-id", "lastUpdateTime": 300})
+        return [{"name": "Campus", "id": "campus-id", "templates": templates}]
+
+    def get_templates(self, params):
+        banner_fingerprint = self.dnac.get_template_fingerprint(self.get_template_params("banner", "banner motd #hi#"))
+        return [
+            {"name": "uplinks", "projectName": "Campus", "templateId": "uplinks-id",
+             "versionsInfo": [{"versionTime": 200, "versionComment": "initial"}]},
+            {"name": "banner", "projectName": "Campus", "templateId": "banner-id",
+             "versionsInfo": [{"versionTime": 200, "versionComment": "fingerprint sha256:" + banner_fingerprint}]},
+        ]
+
+    def get_template_details(self, params):
+        template_details = self.get_template_params("uplinks", "interface Gi1/0/48")
+        template_details.update({"id": "uplinks-id", "projectId": "campus-id", "projectName": "Campus"})
+        return template_details
+
+    def import_templates(self, params):
+        self.imported = True
+        return {"response": {"taskId": "import-task"}}
+
+    def test_template_intent_sync_create_update_unchanged(self):
+        config = {"sync": {
+            "project_name": "Campus",
+            "language": "VELOCITY",
+            "software_type": "IOS-XE",
+            "device_types": DEVICE_TYPES,
+            "version_description": "synced",
+            "templates": [
+                {"template_name": "access-vlans", "template_content": "vlan 10"},
+                {"template_name": "uplinks", "template_content": "interface Gi1/0/1"},
+                {"template_name": "banner", "template_content": "banner motd #hi#"},
+            ],
+        }}
+
+        self.dnac.handle_sync(config)
+
+        self.assertEqual(self.dnac.status, "success", self.dnac.msg)
+        self.assertTrue(self.dnac.result["changed"])
+        self.assertEqual(self.dnac.result["sync"],
+                         {"access-vlans": "created", "uplinks": "updated", "banner": "unchanged"})
+
+        self.assertEqual(len(self.get_calls("imports_the_templates_provided")), 1)
+        import_params = self.get_calls("imports_the_templates_provided")[0]
+        self.assertEqual(import_params["project_name"], "Campus")
+        self.assertFalse(import_params["do_version"])
+        self.assertEqual([template["name"] for template in import_params["payload"]], ["access-vlans"])
+        self.assertEqual([params["id"] for params in self.get_calls("update_template")], ["uplinks-id"])
+        self.assertEqual(sorted(params["templateId"] for params in self.get_calls("version_template")),
+                         ["access-vlans-id", "uplinks-id"])
+        self.assertTrue(all("fingerprint sha256:" in params["comments"] for params in self.get_calls("version_template")))
+        self.assertEqual([params["template_id"] for params in self.get_calls("get_template_details")], ["uplinks-id"])
@@ -0,0 +1,90 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import shutil
+import tempfile
+import time
+from unittest import TestCase
+
+from ansible_collections.cisco.dnac.plugins.plugin_utils.dnac import ResponseCache
+
+
+class TestDnacResponseCache(TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = ResponseCache("dnac", "admin", 300, path=os.path.join(self.cache_dir, "cisco_dnac_cache_1"))
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def age_entry(self, family, function, params, seconds):
+        entry_path = self.cache.entry_path(family, function, params)
+        mtime = time.time() - seconds
+        os.utime(entry_path, (mtime, mtime))
+
+    def test_response_cache_hit_and_miss(self):
+        self.assertEqual(self.cache.get("sites", "get_site", {"name": "Global"}), (False, None))
+
+        self.cache.set("sites", "get_site", {"name": "Global"}, {"response": [{"id": "global-id"}]})
+
+        self.assertEqual(self.cache.get("sites", "get_site", {"name": "Global"}), (True, {"response": [{"id": "global-id"}]}))
+        self.assertEqual(self.cache.get("sites", "get_site", {"name": "Global/USA"}), (False, None))
+        other_user = ResponseCache("dnac", "operator", 300, path=self.cache.path)
+        self.assertEqual(other_user.get("sites", "get_site", {"name": "Global"}), (False, None))
+
+    def test_response_cache_ttl(self):
+        self.cache.set("sites", "get_site", {"name": "Global"}, {"response": []})
+
+        self.age_entry("sites", "get_site", {"name": "Global"}, 200)
+        self.assertTrue(self.cache.get("sites", "get_site", {"name": "Global"})[0])
+        self.age_entry("sites", "get_site", {"name": "Global"}, 301)
+        self.assertEqual(self.cache.get("sites", "get_site", {"name": "Global"}), (False, None))
+
+    def test_response_cache_invalidate_family(self):
+        self.cache.set("sites", "get_site", {"name": "Global"}, {"response": []})
+        self.cache.set("devices", "get_device_list", {}, {"response": []})
+
+        self.cache.invalidate("sites")
+
+        self.assertEqual(self.cache.get("sites", "get_site", {"name": "Global"}), (False, None))
+        self.assertTrue(self.cache.get("devices", "get_device_list", {})[0])
+
+    def test_response_cache_skips_non_json_and_corrupt_entries(self):
+        self.cache.set("software_image_management_swim", "get_image", {}, b"binary image")
+        self.assertEqual(self.cache.get("software_image_management_swim", "get_image", {}), (False, None))
+
+        self.cache.set("sites", "get_site", {}, {"response": []})
+        with open(self.cache.entry_path("sites", "get_site", {}), "w") as entry_file:
+            entry_file.write("{not json")
+        self.assertEqual(self.cache.get("sites", "get_site", {}), (False, None))
+
+    def test_response_cache_removes_stale_caches(self):
+        stale_path = os.path.join(self.cache_dir, "cisco_dnac_cache_2")
+        recent_path = os.path.join(self.cache_dir, "cisco_dnac_cache_3")
+        for path in (stale_path, recent_path):
+            os.makedirs(path)
+        mtime = time.time() - 2 * 86400
+        os.utime(stale_path, (mtime, mtime))
+
+        ResponseCache("dnac", "admin", 300, path=os.path.join(self.cache_dir, "cisco_dnac_cache_4"))
+
+        self.assertFalse(os.path.isdir(stale_path))
+        self.assertTrue(os.path.isdir(recent_path))